@@ -70,7 +70,7 @@ async def login(
         HTTPException: If authentication fails
     """
     try:
-        return service.login(payload=payload)
+        return await service.login(payload=payload)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -109,7 +109,7 @@ async def phone_login(
         HTTPException: If authentication fails or OTP is invalid
     """
     try:
-        return service.phone_login(payload=payload)
+        return await service.phone_login(payload=payload)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
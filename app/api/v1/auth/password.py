@@ -78,7 +78,7 @@ async def change_password(
         HTTPException: If current password is incorrect or new password is invalid
     """
     try:
-        return service.change_password(user_id=current_user.id, payload=payload)
+        return await service.change_password(user_id=current_user.id, payload=payload)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -160,7 +160,7 @@ async def confirm_password_reset(
         HTTPException: If token is invalid, expired, or password is weak
     """
     try:
-        service.confirm_reset(payload=payload)
+        await service.confirm_reset(payload=payload)
         return {"message": "Password has been successfully reset"}
     except ValueError as e:
         raise HTTPException(
@@ -7,12 +7,14 @@ cache decorators, and intelligent cache invalidation strategies.
 
 import json
 import asyncio
+import bisect
 import hashlib
 import pickle
+from contextvars import ContextVar
 from typing import Any, Dict, List, Optional, Union, Callable
 from functools import wraps
 from datetime import datetime, timedelta
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 
 import redis.asyncio as redis
 from redis.asyncio import ConnectionPool
@@ -24,6 +26,38 @@ from .logging import get_logger
 logger = get_logger(__name__)
 
 
+# Cache namespace generations already read during the current request.
+# None outside a generation scope, in which case every lookup reads them.
+cache_generations: ContextVar[Optional[Dict[str, int]]] = ContextVar(
+    "cache_generations", default=None
+)
+
+
+@contextmanager
+def cache_generation_scope():
+    """
+    Read each cache namespace generation at most once inside this block.
+
+    Entered once per request by the core middleware so a request sees a
+    consistent view of namespace invalidations.
+    """
+    token = cache_generations.set({})
+    try:
+        yield
+    finally:
+        cache_generations.reset(token)
+
+
+def _prefix_pattern(pattern: str) -> Optional[str]:
+    """Return the literal prefix of a ``prefix*`` glob, or None for other globs"""
+    if not pattern.endswith("*"):
+        return None
+    prefix = pattern[:-1]
+    if any(c in prefix for c in "*?[]\\"):
+        return None
+    return prefix
+
+
 class CacheBackend:
     """Abstract cache backend interface"""
     
@@ -153,16 +187,23 @@ class RedisBackend(CacheBackend):
             logger.error(f"Cache exists check failed for key '{key}': {str(e)}")
             return False
     
-    async def clear(self, pattern: str = "*") -> int:
+    async def clear(self, pattern: str = "*", batch_size: int = 500) -> int:
         """Clear cache keys matching pattern"""
         if not self._initialized:
             await self.initialize()
         
         try:
-            keys = await self.redis.keys(pattern)
-            if keys:
-                return await self.redis.delete(*keys)
-            return 0
+            # SCAN + UNLINK in batches; KEYS would block the server
+            deleted = 0
+            batch: List[str] = []
+            async for key in self.redis.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += await self.redis.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += await self.redis.unlink(*batch)
+            return deleted
         except Exception as e:
             logger.error(f"Cache clear failed for pattern '{pattern}': {str(e)}")
             return 0
@@ -209,12 +250,28 @@ class RedisBackend(CacheBackend):
 
 
 class InMemoryBackend(CacheBackend):
-    """In-memory cache backend for development/testing"""
+    """
+    In-memory cache backend for development/testing.
+    
+    Keys are also kept in a sorted index so ``prefix*`` clears touch only
+    the matching range instead of every key.
+    """
     
     def __init__(self):
         self._cache: Dict[str, Dict[str, Any]] = {}
+        self._sorted_keys: List[str] = []
         self._lock = asyncio.Lock()
     
+    def _index_add(self, key: str) -> None:
+        position = bisect.bisect_left(self._sorted_keys, key)
+        if position == len(self._sorted_keys) or self._sorted_keys[position] != key:
+            self._sorted_keys.insert(position, key)
+    
+    def _index_remove(self, key: str) -> None:
+        position = bisect.bisect_left(self._sorted_keys, key)
+        if position < len(self._sorted_keys) and self._sorted_keys[position] == key:
+            del self._sorted_keys[position]
+    
     async def get(self, key: str) -> Optional[Any]:
         async with self._lock:
             if key not in self._cache:
@@ -225,6 +282,7 @@ class InMemoryBackend(CacheBackend):
             # Check expiration
             if entry.get("expires") and datetime.utcnow() > entry["expires"]:
                 del self._cache[key]
+                self._index_remove(key)
                 return None
             
             return entry["value"]
@@ -235,6 +293,8 @@ class InMemoryBackend(CacheBackend):
             if expire:
                 expires = datetime.utcnow() + timedelta(seconds=expire)
             
+            if key not in self._cache:
+                self._index_add(key)
             self._cache[key] = {
                 "value": value,
                 "expires": expires
@@ -245,6 +305,7 @@ class InMemoryBackend(CacheBackend):
         async with self._lock:
             if key in self._cache:
                 del self._cache[key]
+                self._index_remove(key)
                 return True
             return False
     
@@ -256,9 +317,21 @@ class InMemoryBackend(CacheBackend):
             if pattern == "*":
                 count = len(self._cache)
                 self._cache.clear()
+                self._sorted_keys.clear()
                 return count
             
-            # Simple pattern matching (only supports * wildcard)
+            prefix = _prefix_pattern(pattern)
+            if prefix is not None:
+                # Matching keys form one contiguous range of the sorted index
+                start = bisect.bisect_left(self._sorted_keys, prefix)
+                end = start
+                while end < len(self._sorted_keys) and self._sorted_keys[end].startswith(prefix):
+                    del self._cache[self._sorted_keys[end]]
+                    end += 1
+                del self._sorted_keys[start:end]
+                return end - start
+            
+            # General glob patterns fall back to a full scan
             import fnmatch
             matching_keys = [
                 key for key in self._cache.keys() 
@@ -267,6 +340,7 @@ class InMemoryBackend(CacheBackend):
             
             for key in matching_keys:
                 del self._cache[key]
+                self._index_remove(key)
             
             return len(matching_keys)
 
@@ -578,5 +652,7 @@ __all__ = [
     "invalidate_cache",
     "clear_cache_pattern",
     "cache_context",
+    "cache_generations",
+    "cache_generation_scope",
     "CacheError"
 ]
\ No newline at end of file
@@ -102,6 +102,11 @@ class SecuritySettings(BaseSettings):
     PASSWORD_REQUIRE_NUMBERS: bool = Field(default=True, env="PASSWORD_REQUIRE_NUMBERS")
     PASSWORD_REQUIRE_SPECIAL: bool = Field(default=True, env="PASSWORD_REQUIRE_SPECIAL")
     
+    # Password hashing
+    PASSWORD_HASH_ROUNDS: int = Field(default=12, env="PASSWORD_HASH_ROUNDS")
+    PASSWORD_HASH_WORKERS: int = Field(default=4, env="PASSWORD_HASH_WORKERS")
+    PASSWORD_HASH_MAX_PENDING: int = Field(default=64, env="PASSWORD_HASH_MAX_PENDING")
+    
     # Session settings
     SESSION_TIMEOUT_MINUTES: int = Field(default=60, env="SESSION_TIMEOUT_MINUTES")
     MAX_LOGIN_ATTEMPTS: int = Field(default=5, env="MAX_LOGIN_ATTEMPTS")
@@ -169,6 +174,13 @@ class LoggingSettings(BaseSettings):
     # External logging
     ENABLE_EXTERNAL_LOGGING: bool = Field(default=False, env="ENABLE_EXTERNAL_LOGGING")
     EXTERNAL_LOG_ENDPOINT: Optional[str] = Field(default=None, env="EXTERNAL_LOG_ENDPOINT")
+
+    # Audit log writer (flush interval bounds records lost on a crash)
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = Field(default=2.0, env="AUDIT_FLUSH_INTERVAL_SECONDS")
+    AUDIT_FLUSH_BATCH_SIZE: int = Field(default=500, env="AUDIT_FLUSH_BATCH_SIZE")
+    AUDIT_MAX_PENDING: int = Field(default=10000, env="AUDIT_MAX_PENDING")
+    AUDIT_MAX_WRITE_ATTEMPTS: int = Field(default=5, env="AUDIT_MAX_WRITE_ATTEMPTS")
+    AUDIT_ARCHIVE_DIR: str = Field(default="archive/audit", env="AUDIT_ARCHIVE_DIR")
     
     model_config = {
         "env_file": ".env",
@@ -223,6 +235,10 @@ class NotificationSettings(BaseSettings):
     SMTP_USERNAME: Optional[str] = Field(default=None, env="SMTP_USERNAME")
     SMTP_PASSWORD: Optional[str] = Field(default=None, env="SMTP_PASSWORD")
     SMTP_USE_TLS: bool = Field(default=True, env="SMTP_USE_TLS")
+    SMTP_TIMEOUT: float = Field(default=30.0, env="SMTP_TIMEOUT")
+    SMTP_POOL_SIZE: int = Field(default=5, env="SMTP_POOL_SIZE")
+    SMTP_MAX_MESSAGES_PER_CONNECTION: int = Field(default=100, env="SMTP_MAX_MESSAGES_PER_CONNECTION")
+    SMTP_MAX_IDLE_SECONDS: float = Field(default=60.0, env="SMTP_MAX_IDLE_SECONDS")
     
     # Email templates
     EMAIL_FROM_ADDRESS: str = Field(default="noreply@hostel.com", env="EMAIL_FROM_ADDRESS")
@@ -18,6 +18,12 @@ from datetime import datetime
 from .config import settings
 from .database import get_db
 from .security import verify_token, get_current_user
+from .security.principal_cache import (
+    compile_permission_check,
+    role_bits,
+    user_permission_bits,
+    user_role_bits,
+)
 from .exceptions import (
     AuthenticationError,
     AuthorizationError,
@@ -257,11 +263,12 @@ def require_permission(permission: str):
     """
     Create a dependency that requires a specific permission
     """
+    permission_mask = compile_permission_check(permission)
+    
     async def permission_dependency(
         current_user: Dict[str, Any] = Depends(get_current_active_user)
     ) -> Dict[str, Any]:
-        user_permissions = current_user.get("permissions", [])
-        if permission not in user_permissions and not current_user.get("is_superuser", False):
+        if not user_permission_bits(current_user) & permission_mask and not current_user.get("is_superuser", False):
             raise AuthorizationError(f"Permission '{permission}' required", required_permission=permission)
         return current_user
     
@@ -439,6 +446,13 @@ class AuthorizationDependency(BaseDependency):
         self.require_all_roles = require_all_roles
         self._user_function = get_current_active_user
         
+        # Compile requirements once so each request is a few bitwise ANDs
+        self._permission_masks = [
+            (permission, compile_permission_check(permission))
+            for permission in self.required_permissions
+        ]
+        self._role_mask = role_bits.compile(self.required_roles)
+        
         # Expose __call__ as multiple potential attribute names
         self.authorize_user = self.__call__
         self.check_permissions = self.__call__
@@ -459,14 +473,15 @@ class AuthorizationDependency(BaseDependency):
         if current_user.get("is_superuser", False):
             return current_user
         
-        user_permissions = current_user.get("permissions", [])
-        user_roles = current_user.get("roles", [])
+        permission_bits = user_permission_bits(current_user)
         
         # Check permissions
-        if self.required_permissions:
+        if self._permission_masks:
             if self.require_all_permissions:
                 # User must have ALL required permissions
-                missing_permissions = [p for p in self.required_permissions if p not in user_permissions]
+                missing_permissions = [
+                    p for p, mask in self._permission_masks if not permission_bits & mask
+                ]
                 if missing_permissions:
                     raise AuthorizationError(
                         f"Missing required permissions: {', '.join(missing_permissions)}",
@@ -474,22 +489,23 @@ class AuthorizationDependency(BaseDependency):
                     )
             else:
                 # User must have AT LEAST ONE required permission
-                if not any(p in user_permissions for p in self.required_permissions):
+                if not any(permission_bits & mask for _, mask in self._permission_masks):
                     raise AuthorizationError(
                         f"At least one of these permissions required: {', '.join(self.required_permissions)}",
                         required_permission=self.required_permissions[0]
                     )
         
         # Check roles
-        if self.required_roles:
+        if self._role_mask:
+            user_roles = user_role_bits(current_user)
             if self.require_all_roles:
                 # User must have ALL required roles
-                missing_roles = [r for r in self.required_roles if r not in user_roles]
-                if missing_roles:
+                if user_roles & self._role_mask != self._role_mask:
+                    missing_roles = [r for r in self.required_roles if not user_roles & role_bits.bit(r)]
                     raise AuthorizationError(f"Missing required roles: {', '.join(missing_roles)}")
             else:
                 # User must have AT LEAST ONE required role
-                if not any(r in user_roles for r in self.required_roles):
+                if not user_roles & self._role_mask:
                     raise AuthorizationError(f"At least one of these roles required: {', '.join(self.required_roles)}")
         
         return current_user
@@ -69,6 +69,39 @@ class EventBus:
         event = BaseEvent(event_type, data)
         await self.publish(event)
     
+    async def dispatch(self, event: BaseEvent) -> None:
+        """
+        Run all handlers for an event immediately, bypassing the queue.
+        
+        Used by callers that must know the handlers ran, such as the
+        outbox relay.
+        
+        Args:
+            event: The event to dispatch
+            
+        Raises:
+            Exception: The first error raised by a handler, after every
+                handler has run
+        """
+        handlers = self._registry.get_handlers(event.event_type)
+        
+        if not handlers:
+            logger.debug(f"No handlers found for event type: {event.event_type}")
+            return
+        
+        results = await asyncio.gather(
+            *(handler.handle(event) for handler in handlers),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            logger.error(
+                f"{len(errors)} of {len(handlers)} handlers failed for event {event}"
+            )
+            raise errors[0]
+        
+        event.processed = True
+    
     async def start(self) -> None:
         """Start the event bus worker."""
         if self._running:
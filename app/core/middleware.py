@@ -2,18 +2,20 @@
 """
 Core middleware registration for the FastAPI application.
 
-This module provides essential middleware components for request tracking,
-timing, error handling, and logging.
+This module provides a single pure ASGI middleware for request tracking,
+security headers, timing, error handling, and logging.
 """
 from __future__ import annotations
 
 import time
 import uuid
-from typing import Callable, Optional
+from typing import Optional
 
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from fastapi import FastAPI, Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import cache_generation_scope
 
 try:
     from app.core.logging import get_logger
@@ -23,185 +25,143 @@ except ImportError:
     logger = logging.getLogger(__name__)
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+}
+
+
+class CoreMiddleware:
     """
-    Middleware that adds a unique request ID to each incoming request.
-    
-    The request ID is:
-    - Stored in request.state.request_id
-    - Added to response headers as X-Request-ID
-    - Useful for tracking requests across logs and services
+    Pure ASGI middleware fusing the core per-request concerns in one layer.
+    
+    For every HTTP request it:
+    - Reuses the incoming X-Request-ID or generates one, stores it in
+      request.state.request_id and echoes it on the response
+    - Adds common security headers (optional)
+    - Adds X-Process-Time with the time to first response byte
+    - Logs request completion, error statuses and unhandled exceptions
+    - Opens a cache generation scope so namespace generations are read
+      once per request
+    
+    Unlike BaseHTTPMiddleware it does not wrap the response in a task and
+    memory stream, so streaming responses and background tasks pass
+    through untouched.
     """
     
-    def __init__(self, app: ASGIApp, header_name: str = "X-Request-ID"):
-        super().__init__(app)
+    def __init__(
+        self,
+        app: ASGIApp,
+        header_name: str = "X-Request-ID",
+        include_security: bool = True,
+    ):
+        self.app = app
         self.header_name = header_name
+        self._header_key = header_name.lower().encode("latin-1")
+        self.security_headers = SECURITY_HEADERS if include_security else {}
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Check if request ID already exists in headers (from upstream proxy/service)
-        request_id = request.headers.get(self.header_name)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # If not, generate a new UUID
+        start_time = time.perf_counter()
+        
+        # Reuse request ID from upstream proxy/service if present
+        request_id = None
+        for key, value in scope["headers"]:
+            if key == self._header_key:
+                request_id = value.decode("latin-1")
+                break
         if not request_id:
             request_id = str(uuid.uuid4())
         
         # Store in request state for access in route handlers
-        request.state.request_id = request_id
-        
-        # Process the request
-        response = await call_next(request)
-        
-        # Add request ID to response headers
-        response.headers[self.header_name] = request_id
-        
-        return response
-
-
-class TimingMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware that measures and logs request processing time.
-    
-    Adds X-Process-Time header to responses with the processing duration in seconds.
-    """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
+        scope.setdefault("state", {})["request_id"] = request_id
         
-        # Process the request
-        response = await call_next(request)
+        status_code = 500
+        process_time = 0.0
         
-        # Calculate processing time
-        process_time = time.time() - start_time
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, process_time
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time = time.perf_counter() - start_time
+                
+                headers = MutableHeaders(scope=message)
+                headers[self.header_name] = request_id
+                for name, value in self.security_headers.items():
+                    headers[name] = value
+                headers["X-Process-Time"] = f"{process_time:.4f}"
+            await send(message)
         
-        # Add processing time to response headers
-        response.headers["X-Process-Time"] = f"{process_time:.4f}"
-        
-        # Get request ID if available
-        request_id = getattr(request.state, "request_id", "unknown")
-        
-        # Log request completion with details
-        logger.info(
-            "Request completed",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "url": str(request.url.path),
-                "query_params": str(request.url.query) if request.url.query else None,
-                "status_code": response.status_code,
-                "process_time": f"{process_time:.4f}s",
-                "client_host": request.client.host if request.client else None,
-            }
-        )
-        
-        return response
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware that adds common security headers to all responses.
-    """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
-        
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        
-        return response
-
-
-class ErrorLoggingMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware that logs errors and exceptions during request processing.
-    """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
         try:
-            response = await call_next(request)
-            
-            # Log errors (4xx and 5xx status codes)
-            if response.status_code >= 400:
-                request_id = getattr(request.state, "request_id", "unknown")
-                logger.warning(
-                    f"Request returned error status {response.status_code}",
-                    extra={
-                        "request_id": request_id,
-                        "method": request.method,
-                        "url": str(request.url.path),
-                        "status_code": response.status_code,
-                        "client_host": request.client.host if request.client else None,
-                    }
-                )
-            
-            return response
-            
+            with cache_generation_scope():
+                await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            request_id = getattr(request.state, "request_id", "unknown")
             logger.error(
                 f"Request processing failed: {str(exc)}",
                 extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "url": str(request.url.path),
+                    **self._request_context(scope, request_id),
                     "error": str(exc),
                     "error_type": type(exc).__name__,
-                    "client_host": request.client.host if request.client else None,
                 },
                 exc_info=True
             )
             raise
+        
+        context = self._request_context(scope, request_id)
+        
+        # Log request completion with details
+        logger.info(
+            "Request completed",
+            extra={
+                **context,
+                "query_params": scope.get("query_string", b"").decode("latin-1") or None,
+                "status_code": status_code,
+                "process_time": f"{process_time:.4f}s",
+                "duration": f"{time.perf_counter() - start_time:.4f}s",
+            }
+        )
+        
+        # Log errors (4xx and 5xx status codes)
+        if status_code >= 400:
+            logger.warning(
+                f"Request returned error status {status_code}",
+                extra={**context, "status_code": status_code}
+            )
+    
+    @staticmethod
+    def _request_context(scope: Scope, request_id: str) -> dict:
+        client = scope.get("client")
+        return {
+            "request_id": request_id,
+            "method": scope["method"],
+            "url": scope["path"],
+            "client_host": client[0] if client else None,
+        }
 
 
 def register_middlewares(app: FastAPI, include_security: bool = True) -> None:
     """
-    Register all core middlewares to the FastAPI application.
+    Register the core middleware on the FastAPI application.
     
-    Middlewares are registered in reverse order of execution (LIFO).
-    The last middleware added is the first one to process the request.
+    Request ID, security headers, timing, completion logging and error
+    logging are handled by a single pure ASGI layer (CoreMiddleware).
     
     Args:
         app: The FastAPI application instance
-        include_security: Whether to include security headers middleware (default: True)
-    
-    Execution order:
-        1. ErrorLoggingMiddleware (catches all errors)
-        2. TimingMiddleware (measures total time)
-        3. SecurityHeadersMiddleware (adds security headers)
-        4. RequestIDMiddleware (adds request ID first)
+        include_security: Whether to add security headers (default: True)
     """
-    
-    # Add middlewares in reverse order of desired execution
-    
-    # 1. Error logging (outermost - catches everything)
-    app.add_middleware(ErrorLoggingMiddleware)
-    logger.info("Registered ErrorLoggingMiddleware")
-    
-    # 2. Timing middleware
-    app.add_middleware(TimingMiddleware)
-    logger.info("Registered TimingMiddleware")
-    
-    # 3. Security headers
-    if include_security:
-        app.add_middleware(SecurityHeadersMiddleware)
-        logger.info("Registered SecurityHeadersMiddleware")
-    
-    # 4. Request ID (innermost - runs first)
-    app.add_middleware(RequestIDMiddleware)
-    logger.info("Registered RequestIDMiddleware")
+    app.add_middleware(CoreMiddleware, include_security=include_security)
     
     logger.info(
-        "Core middlewares registered successfully",
+        "Core middleware registered successfully",
         extra={
-            "middlewares": [
-                "RequestIDMiddleware",
-                "SecurityHeadersMiddleware" if include_security else None,
-                "TimingMiddleware",
-                "ErrorLoggingMiddleware",
-            ],
-            "count": 4 if include_security else 3,
+            "middleware": "CoreMiddleware",
+            "security_headers": include_security,
         }
     )
 
@@ -221,10 +181,8 @@ def get_request_id(request: Request) -> Optional[str]:
 
 
 __all__ = [
-    "RequestIDMiddleware",
-    "TimingMiddleware",
-    "SecurityHeadersMiddleware",
-    "ErrorLoggingMiddleware",
+    "CoreMiddleware",
+    "SECURITY_HEADERS",
     "register_middlewares",
     "get_request_id",
 ]
\ No newline at end of file
@@ -12,7 +12,6 @@ from typing import Any, Dict, List, Optional, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
-from collections import defaultdict, deque
 from contextlib import asynccontextmanager
 
 import redis.asyncio as redis
@@ -23,6 +22,7 @@ from .config import settings
 from .exceptions import OperationError
 from .logging import get_logger
 from .cache import cache_manager
+from .request_metrics import RequestMetricsRecorder
 
 logger = get_logger(__name__)
 
@@ -66,19 +66,18 @@ class MetricData:
 
 
 class PerformanceTracker:
-    """Track API performance metrics"""
-    
-    def __init__(self, max_samples: int = 1000):
-        self.max_samples = max_samples
-        self.response_times: deque = deque(maxlen=max_samples)
-        self.request_counts = defaultdict(int)
-        self.error_counts = defaultdict(int)
-        self.endpoint_stats = defaultdict(lambda: {
-            'count': 0,
-            'total_time': 0.0,
-            'errors': 0,
-            'avg_time': 0.0
-        })
+    """Track API performance metrics
+    
+    Per-request work is O(1): requests are recorded into per-endpoint
+    latency sketches and rolling error windows (see RequestMetricsRecorder),
+    which report p50/p95/p99 and windowed error rates.
+    """
+    
+    def __init__(self, window_seconds: int = 60, max_endpoints: int = 500):
+        self.recorder = RequestMetricsRecorder(
+            window_seconds=window_seconds,
+            max_endpoints=max_endpoints
+        )
         
         # Prometheus metrics
         self.registry = CollectorRegistry()
@@ -109,9 +108,10 @@ class PerformanceTracker:
             
             self.error_rate = Gauge(
                 'http_error_rate',
-                'HTTP error rate percentage',
+                'HTTP error rate percentage over the rolling window',
                 registry=self.registry
             )
+            self.error_rate.set_function(self.recorder.error_rate)
     
     async def track_request(
         self,
@@ -123,21 +123,12 @@ class PerformanceTracker:
     ):
         """Track API request metrics"""
         try:
-            # Update internal tracking
-            self.response_times.append(response_time)
-            self.request_counts[f"{method}:{endpoint}"] += 1
-            
-            if error or status_code >= 400:
-                self.error_counts[f"{method}:{endpoint}"] += 1
-            
-            # Update endpoint statistics
-            stats = self.endpoint_stats[f"{method}:{endpoint}"]
-            stats['count'] += 1
-            stats['total_time'] += response_time
-            stats['avg_time'] = stats['total_time'] / stats['count']
-            
-            if error or status_code >= 400:
-                stats['errors'] += 1
+            self.recorder.record(
+                method,
+                endpoint,
+                response_time,
+                bool(error) or status_code >= 400
+            )
             
             # Update Prometheus metrics
             if settings.monitoring.PROMETHEUS_ENABLED:
@@ -152,47 +143,47 @@ class PerformanceTracker:
                     endpoint=endpoint
                 ).observe(response_time)
             
-            # Calculate and update error rate
-            await self._update_error_rate()
-            
         except Exception as e:
             logger.error(f"Failed to track request metrics: {str(e)}")
     
-    async def _update_error_rate(self):
-        """Update error rate metrics"""
-        try:
-            total_requests = sum(self.request_counts.values())
-            total_errors = sum(self.error_counts.values())
-            
-            if total_requests > 0:
-                error_rate = (total_errors / total_requests) * 100
-                
-                if settings.monitoring.PROMETHEUS_ENABLED:
-                    self.error_rate.set(error_rate)
-                    
-        except Exception as e:
-            logger.error(f"Failed to update error rate: {str(e)}")
-    
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics"""
-        response_times_list = list(self.response_times)
+        overall = self.recorder.endpoint_stats(self.recorder.overall)
         
         stats = {
-            "total_requests": sum(self.request_counts.values()),
-            "total_errors": sum(self.error_counts.values()),
-            "avg_response_time": sum(response_times_list) / len(response_times_list) if response_times_list else 0,
-            "min_response_time": min(response_times_list) if response_times_list else 0,
-            "max_response_time": max(response_times_list) if response_times_list else 0,
-            "error_rate": (sum(self.error_counts.values()) / sum(self.request_counts.values()) * 100) if sum(self.request_counts.values()) > 0 else 0,
-            "endpoints": dict(self.endpoint_stats)
+            "total_requests": overall["count"],
+            "total_errors": overall["errors"],
+            "avg_response_time": overall["avg_time"],
+            "min_response_time": overall["min_time"],
+            "max_response_time": overall["max_time"],
+            "p50_response_time": overall["p50"],
+            "p95_response_time": overall["p95"],
+            "p99_response_time": overall["p99"],
+            "error_rate": (overall["errors"] / overall["count"] * 100) if overall["count"] else 0,
+            "window_error_rate": overall["window_error_rate"],
+            "endpoints": {
+                key: self.recorder.endpoint_stats(metrics)
+                for key, metrics in self.recorder.endpoints.items()
+            }
         }
         
         return stats
     
+    def get_metrics_snapshot(self) -> Dict[str, Any]:
+        """Get mergeable latency sketches for cross-worker aggregation"""
+        return self.recorder.snapshot()
+    
+    def merge_metrics_snapshot(self, snapshot: Dict[str, Any]):
+        """Merge latency sketches exported by another worker"""
+        self.recorder.merge_snapshot(snapshot)
+    
     def get_prometheus_metrics(self) -> str:
         """Get Prometheus formatted metrics"""
         if settings.monitoring.PROMETHEUS_ENABLED:
-            return generate_latest(self.registry).decode('utf-8')
+            return (
+                generate_latest(self.registry).decode('utf-8')
+                + self.recorder.export_prometheus()
+            )
         return ""
 
 
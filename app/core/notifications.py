@@ -7,8 +7,6 @@ templates, scheduling, and delivery tracking.
 
 import asyncio
 import json
-import smtplib
-import ssl
 from typing import Any, Dict, List, Optional, Union
 from datetime import datetime, timedelta
 from enum import Enum
@@ -24,6 +22,7 @@ from jinja2 import DictLoader, Environment, FileSystemLoader, select_autoescape
 from .config import settings
 from .exceptions import NotificationError, EmailDeliveryError, SMSDeliveryError
 from .logging import get_logger
+from .smtp_transport import get_smtp_transport
 from .background_tasks import background_task, TaskPriority
 
 logger = get_logger(__name__)
@@ -125,6 +124,7 @@ class EmailProvider:
         self.use_tls = settings.notifications.SMTP_USE_TLS
         self.from_address = settings.notifications.EMAIL_FROM_ADDRESS
         self.from_name = settings.notifications.EMAIL_FROM_NAME
+        self.transport = get_smtp_transport()
     
     async def send_email(self, notification: Notification) -> bool:
         """Send email notification"""
@@ -132,25 +132,7 @@ class EmailProvider:
             if not all([self.smtp_server, self.username, self.password]):
                 raise EmailDeliveryError("Email configuration incomplete")
             
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = notification.subject
-            msg['From'] = formataddr((self.from_name, self.from_address))
-            msg['To'] = notification.recipient
-            
-            # Add content
-            if notification.content:
-                # Assume HTML content if contains HTML tags
-                if '<' in notification.content and '>' in notification.content:
-                    html_part = MIMEText(notification.content, 'html', 'utf-8')
-                    msg.attach(html_part)
-                else:
-                    text_part = MIMEText(notification.content, 'plain', 'utf-8')
-                    msg.attach(text_part)
-            
-            # Add attachments
-            for attachment in notification.attachments:
-                await self._add_attachment(msg, attachment)
+            msg = await self._build_message(notification)
             
             # Send email
             await self._send_smtp_message(msg)
@@ -163,6 +145,29 @@ class EmailProvider:
             logger.error(error_msg)
             raise EmailDeliveryError(error_msg)
     
+    async def _build_message(self, notification: Notification) -> MIMEMultipart:
+        """Build MIME message for a notification"""
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = notification.subject
+        msg['From'] = formataddr((self.from_name, self.from_address))
+        msg['To'] = notification.recipient
+        
+        # Add content
+        if notification.content:
+            # Assume HTML content if contains HTML tags
+            if '<' in notification.content and '>' in notification.content:
+                html_part = MIMEText(notification.content, 'html', 'utf-8')
+                msg.attach(html_part)
+            else:
+                text_part = MIMEText(notification.content, 'plain', 'utf-8')
+                msg.attach(text_part)
+        
+        # Add attachments
+        for attachment in notification.attachments:
+            await self._add_attachment(msg, attachment)
+        
+        return msg
+    
     async def _add_attachment(self, msg: MIMEMultipart, attachment: Dict[str, Any]):
         """Add attachment to email message"""
         try:
@@ -192,22 +197,14 @@ class EmailProvider:
             logger.warning(f"Failed to add attachment {attachment}: {str(e)}")
     
     async def _send_smtp_message(self, msg: MIMEMultipart):
-        """Send message via SMTP"""
-        try:
-            # Create SMTP connection
-            if self.use_tls:
-                context = ssl.create_default_context()
-                with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                    server.starttls(context=context)
-                    server.login(self.username, self.password)
-                    server.send_message(msg)
-            else:
-                with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                    server.login(self.username, self.password)
-                    server.send_message(msg)
-                    
-        except smtplib.SMTPException as e:
-            raise EmailDeliveryError(f"SMTP error: {str(e)}")
+        """Send message via the pooled SMTP transport"""
+        result = await self.transport.send_message(msg)
+        if not result.success:
+            raise EmailDeliveryError(
+                f"SMTP error: {result.error}",
+                recipient=result.recipient,
+                smtp_error=result.error
+            )
 
 
 class SMSProvider:
@@ -511,6 +508,8 @@ class NotificationManager:
             # Validate configuration
             if not settings.notifications.SMTP_HOST:
                 logger.warning("Email notifications not configured")
+            else:
+                await self.email_provider.transport.start()
             
             if not settings.notifications.SMS_PROVIDER:
                 logger.warning("SMS notifications not configured")
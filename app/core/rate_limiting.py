@@ -6,6 +6,7 @@ multiple algorithms, and flexible configuration.
 """
 
 import time
+import math
 import asyncio
 import hashlib
 from typing import Any, Dict, List, Optional, Union, Callable
@@ -53,6 +54,7 @@ class RateLimit:
     scope: RateLimitScope = RateLimitScope.IP
     burst_size: Optional[int] = None
     description: Optional[str] = None
+    lease_size: Optional[int] = None  # local quota lease per worker (token bucket only)
 
 
 @dataclass
@@ -67,15 +69,103 @@ class RateLimitResult:
     key: str
 
 
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local requested = tonumber(ARGV[4])
+local ttl = tonumber(ARGV[5])
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'last_refill')
+local tokens = tonumber(state[1]) or capacity
+local last_refill = tonumber(state[2]) or now
+
+if now > last_refill then
+    tokens = math.min(capacity, tokens + (now - last_refill) * refill_rate)
+    last_refill = now
+end
+
+local granted = math.min(math.floor(tokens), requested)
+if granted < 1 then
+    granted = 0
+else
+    tokens = tokens - granted
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'last_refill', last_refill)
+redis.call('EXPIRE', KEYS[1], ttl)
+return {granted, tostring(tokens)}
+"""
+
+
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+
+local window = math.floor(now / period)
+local elapsed = (now - window * period) / period
+local current_field = tostring(window)
+local previous_field = tostring(window - 1)
+
+local counts = redis.call('HMGET', KEYS[1], current_field, previous_field)
+local current = tonumber(counts[1]) or 0
+local previous = tonumber(counts[2]) or 0
+local estimated = previous * (1 - elapsed) + current
+
+if estimated + 1 > limit then
+    return {0, current, previous, tostring(estimated)}
+end
+
+current = redis.call('HINCRBY', KEYS[1], current_field, 1)
+if redis.call('HLEN', KEYS[1]) > 2 then
+    for _, field in ipairs(redis.call('HKEYS', KEYS[1])) do
+        if field ~= current_field and field ~= previous_field then
+            redis.call('HDEL', KEYS[1], field)
+        end
+    end
+end
+redis.call('EXPIRE', KEYS[1], period * 2)
+return {1, current, previous, tostring(estimated + 1)}
+"""
+
+
 class TokenBucketLimiter:
-    """Token bucket rate limiting algorithm"""
+    """Token bucket rate limiting algorithm
+    
+    Refill, check and consume run as one Lua script, so each check is a
+    single atomic round trip and concurrent requests cannot overspend.
+    """
     
     def __init__(self, redis_client: redis.Redis):
         self.redis = redis_client
+        self._script = redis_client.register_script(TOKEN_BUCKET_SCRIPT)
+    
+    async def acquire(
+        self,
+        key: str,
+        limit: int,
+        period: int,
+        burst_size: Optional[int] = None,
+        requested: int = 1
+    ) -> tuple[int, float]:
+        """
+        Atomically take up to ``requested`` tokens from the bucket.
+        
+        Returns:
+            Tuple of (tokens granted, tokens left in the bucket)
+        """
+        bucket_size = burst_size or limit
+        refill_rate = limit / period  # tokens per second
+        
+        granted, tokens = await self._script(
+            keys=[f"rate_limit:bucket:{key}"],
+            args=[bucket_size, refill_rate, time.time(), requested, period * 2]
+        )
+        return int(granted), float(tokens)
     
     async def check_limit(self, key: str, limit: int, period: int, burst_size: Optional[int] = None) -> RateLimitResult:
         """Check rate limit using token bucket algorithm"""
-        bucket_key = f"rate_limit:bucket:{key}"
         now = time.time()
         
         # Use burst_size if provided, otherwise use limit
@@ -83,55 +173,31 @@ class TokenBucketLimiter:
         refill_rate = limit / period  # tokens per second
         
         try:
-            async with self.redis.pipeline() as pipe:
-                pipe.multi()
-                
-                # Get current bucket state
-                bucket_data = await self.redis.hmget(bucket_key, "tokens", "last_refill")
-                
-                current_tokens = float(bucket_data[0] or bucket_size)
-                last_refill = float(bucket_data[1] or now)
-                
-                # Calculate tokens to add based on time passed
-                time_passed = now - last_refill
-                tokens_to_add = time_passed * refill_rate
-                
-                # Update token count (don't exceed bucket size)
-                new_tokens = min(bucket_size, current_tokens + tokens_to_add)
-                
-                if new_tokens >= 1:
-                    # Allow request and consume token
-                    remaining_tokens = new_tokens - 1
-                    
-                    await pipe.hmset(bucket_key, {
-                        "tokens": remaining_tokens,
-                        "last_refill": now
-                    })
-                    await pipe.expire(bucket_key, period * 2)  # Keep data longer than period
-                    await pipe.execute()
-                    
-                    return RateLimitResult(
-                        allowed=True,
-                        limit=limit,
-                        remaining=int(remaining_tokens),
-                        reset_time=datetime.fromtimestamp(now + (bucket_size - remaining_tokens) / refill_rate),
-                        retry_after=0,
-                        total_hits=bucket_size - int(remaining_tokens),
-                        key=key
-                    )
-                else:
-                    # Rate limit exceeded
-                    retry_after = int((1 - new_tokens) / refill_rate)
-                    
-                    return RateLimitResult(
-                        allowed=False,
-                        limit=limit,
-                        remaining=0,
-                        reset_time=datetime.fromtimestamp(now + retry_after),
-                        retry_after=retry_after,
-                        total_hits=bucket_size,
-                        key=key
-                    )
+            granted, remaining_tokens = await self.acquire(key, limit, period, burst_size)
+            
+            if granted:
+                return RateLimitResult(
+                    allowed=True,
+                    limit=limit,
+                    remaining=int(remaining_tokens),
+                    reset_time=datetime.fromtimestamp(now + (bucket_size - remaining_tokens) / refill_rate),
+                    retry_after=0,
+                    total_hits=bucket_size - int(remaining_tokens),
+                    key=key
+                )
+            
+            # Rate limit exceeded
+            retry_after = max(1, math.ceil((1 - remaining_tokens) / refill_rate))
+            
+            return RateLimitResult(
+                allowed=False,
+                limit=limit,
+                remaining=0,
+                reset_time=datetime.fromtimestamp(now + retry_after),
+                retry_after=retry_after,
+                total_hits=bucket_size,
+                key=key
+            )
                     
         except Exception as e:
             logger.error(f"Token bucket rate limit check failed: {str(e)}")
@@ -147,61 +213,164 @@ class TokenBucketLimiter:
             )
 
 
+@dataclass
+class QuotaLease:
+    """Tokens pre-claimed from a shared bucket by this worker"""
+    tokens: int
+    expires_at: float
+
+
+class QuotaLeaseLimiter:
+    """Token bucket with local quota leasing
+    
+    Each worker claims a slice of up to ``lease_size`` tokens from the
+    shared Redis bucket in one round trip and serves subsequent requests
+    from memory until the slice is spent or expires. Unspent leased tokens
+    are forfeited on expiry, so the global limit is never exceeded; the
+    trade-off is that a limit can be reached early when many workers hold
+    partially used leases.
+    """
+    
+    MAX_LEASES = 10000
+    
+    def __init__(self, bucket: TokenBucketLimiter, lease_size: int):
+        self.bucket = bucket
+        self.lease_size = lease_size
+        self._leases: Dict[str, QuotaLease] = {}
+    
+    async def check_limit(self, key: str, limit: int, period: int, burst_size: Optional[int] = None) -> RateLimitResult:
+        """Check rate limit, touching Redis only when the local lease is spent"""
+        now = time.time()
+        monotonic_now = time.monotonic()
+        
+        lease = self._leases.get(key)
+        if lease is None or lease.tokens <= 0 or lease.expires_at <= monotonic_now:
+            try:
+                lease = await self._claim(key, limit, period, burst_size, monotonic_now)
+            except Exception as e:
+                logger.error(f"Quota lease claim failed: {str(e)}")
+                # Fail open on errors
+                return RateLimitResult(
+                    allowed=True,
+                    limit=limit,
+                    remaining=limit,
+                    reset_time=datetime.fromtimestamp(now + period),
+                    retry_after=0,
+                    total_hits=0,
+                    key=key
+                )
+        
+        if lease is None:
+            retry_after = max(1, math.ceil(period / limit))
+            return RateLimitResult(
+                allowed=False,
+                limit=limit,
+                remaining=0,
+                reset_time=datetime.fromtimestamp(now + retry_after),
+                retry_after=retry_after,
+                total_hits=burst_size or limit,
+                key=key
+            )
+        
+        lease.tokens -= 1
+        return RateLimitResult(
+            allowed=True,
+            limit=limit,
+            remaining=lease.tokens,
+            reset_time=datetime.fromtimestamp(now + max(0.0, lease.expires_at - monotonic_now)),
+            retry_after=0,
+            total_hits=(burst_size or limit) - lease.tokens,
+            key=key
+        )
+    
+    async def _claim(
+        self,
+        key: str,
+        limit: int,
+        period: int,
+        burst_size: Optional[int],
+        monotonic_now: float
+    ) -> Optional[QuotaLease]:
+        granted, _ = await self.bucket.acquire(
+            key, limit, period, burst_size, requested=self.lease_size
+        )
+        if not granted:
+            self._leases.pop(key, None)
+            return None
+        
+        if len(self._leases) >= self.MAX_LEASES:
+            self._evict_expired(monotonic_now)
+        
+        # A lease lives as long as the bucket needs to refill the claimed tokens
+        ttl = min(period, granted * period / limit)
+        lease = QuotaLease(tokens=granted, expires_at=monotonic_now + ttl)
+        self._leases[key] = lease
+        return lease
+    
+    def _evict_expired(self, monotonic_now: float):
+        expired = [
+            key for key, lease in self._leases.items()
+            if lease.tokens <= 0 or lease.expires_at <= monotonic_now
+        ]
+        for key in expired:
+            del self._leases[key]
+        if len(self._leases) >= self.MAX_LEASES:
+            self._leases.clear()
+
+
 class SlidingWindowLimiter:
-    """Sliding window rate limiting algorithm"""
+    """Sliding window counter rate limiting algorithm
+    
+    Keeps one counter per fixed window and weights the previous window by
+    its overlap with the sliding window, so memory is constant per key
+    regardless of traffic. Evaluated atomically in a single Lua call.
+    """
     
     def __init__(self, redis_client: redis.Redis):
         self.redis = redis_client
+        self._script = redis_client.register_script(SLIDING_WINDOW_SCRIPT)
     
     async def check_limit(self, key: str, limit: int, period: int) -> RateLimitResult:
         """Check rate limit using sliding window algorithm"""
         window_key = f"rate_limit:sliding:{key}"
         now = time.time()
-        window_start = now - period
         
         try:
-            async with self.redis.pipeline() as pipe:
-                # Remove old entries
-                await pipe.zremrangebyscore(window_key, 0, window_start)
-                
-                # Count current entries
-                current_count = await pipe.zcard(window_key)
-                
-                if current_count < limit:
-                    # Allow request
-                    await pipe.zadd(window_key, {str(now): now})
-                    await pipe.expire(window_key, period)
-                    await pipe.execute()
-                    
-                    return RateLimitResult(
-                        allowed=True,
-                        limit=limit,
-                        remaining=limit - current_count - 1,
-                        reset_time=datetime.fromtimestamp(now + period),
-                        retry_after=0,
-                        total_hits=current_count + 1,
-                        key=key
-                    )
-                else:
-                    # Rate limit exceeded
-                    # Get oldest entry to determine reset time
-                    oldest_entries = await pipe.zrange(window_key, 0, 0, withscores=True)
-                    
-                    if oldest_entries:
-                        oldest_time = oldest_entries[0][1]
-                        retry_after = int(oldest_time + period - now)
-                    else:
-                        retry_after = period
-                    
-                    return RateLimitResult(
-                        allowed=False,
-                        limit=limit,
-                        remaining=0,
-                        reset_time=datetime.fromtimestamp(now + retry_after),
-                        retry_after=retry_after,
-                        total_hits=current_count,
-                        key=key
-                    )
+            allowed, current, previous, estimated = await self._script(
+                keys=[window_key],
+                args=[limit, period, now]
+            )
+            estimated = float(estimated)
+            window_end = (math.floor(now / period) + 1) * period
+            
+            if allowed:
+                return RateLimitResult(
+                    allowed=True,
+                    limit=limit,
+                    remaining=max(0, limit - math.ceil(estimated)),
+                    reset_time=datetime.fromtimestamp(window_end),
+                    retry_after=0,
+                    total_hits=math.ceil(estimated),
+                    key=key
+                )
+            
+            # Rate limit exceeded: wait until the previous window's weight decays enough
+            current, previous = int(current), int(previous)
+            if previous and current + 1 <= limit:
+                needed_elapsed = 1 - (limit - current - 1) / previous
+                retry_after = max(1, math.ceil(window_end - period + needed_elapsed * period - now))
+            else:
+                retry_after = max(1, math.ceil(window_end - now))
+            
+            return RateLimitResult(
+                allowed=False,
+                limit=limit,
+                remaining=0,
+                reset_time=datetime.fromtimestamp(now + retry_after),
+                retry_after=retry_after,
+                total_hits=math.ceil(estimated),
+                key=key
+            )
                     
         except Exception as e:
             logger.error(f"Sliding window rate limit check failed: {str(e)}")
@@ -285,6 +454,7 @@ class RateLimiter:
     def __init__(self):
         self.redis_client: Optional[redis.Redis] = None
         self.limiters = {}
+        self.lease_limiters: Dict[int, QuotaLeaseLimiter] = {}
         self.rate_limits: Dict[str, RateLimit] = {}
         self._initialized = False
     
@@ -527,7 +697,14 @@ class RateLimiter:
                 raise ValueError(f"Unsupported algorithm: {rate_limit.algorithm}")
             
             # Check rate limit based on algorithm
-            if rate_limit.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
+            if rate_limit.algorithm == RateLimitAlgorithm.TOKEN_BUCKET and rate_limit.lease_size:
+                result = await self._get_lease_limiter(rate_limit.lease_size).check_limit(
+                    rate_key,
+                    rate_limit.limit,
+                    rate_limit.period,
+                    rate_limit.burst_size
+                )
+            elif rate_limit.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
                 result = await limiter.check_limit(
                     rate_key,
                     rate_limit.limit,
@@ -560,6 +737,15 @@ class RateLimiter:
                 key=rate_key
             )
     
+    def _get_lease_limiter(self, lease_size: int) -> QuotaLeaseLimiter:
+        """Get the quota lease limiter for a lease size"""
+        if lease_size not in self.lease_limiters:
+            self.lease_limiters[lease_size] = QuotaLeaseLimiter(
+                self.limiters[RateLimitAlgorithm.TOKEN_BUCKET],
+                lease_size
+            )
+        return self.lease_limiters[lease_size]
+    
     def _generate_key(self, rate_limit: RateLimit, identifier: str) -> str:
         """Generate rate limit key"""
         key_parts = [rate_limit.key, rate_limit.scope.value]
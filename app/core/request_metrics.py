@@ -0,0 +1,297 @@
+"""
+Request Metrics
+
+Constant-time per-request metrics with mergeable latency sketches.
+
+Each endpoint keeps a log-linear (HDR-style) latency histogram with bounded
+relative error and a rolling time window of request/error counts. Recording
+a request is a handful of integer operations with no locks or per-request
+allocations beyond dict updates; sketches from different workers merge by
+adding bucket counts, so they can be combined in any order.
+"""
+
+import math
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram (HDR-style).
+
+    Values are recorded in microseconds. Below ``2**precision_bits`` every
+    microsecond has its own bucket; above that, each power of two is split
+    into ``2**(precision_bits - 1)`` equal buckets, bounding the relative
+    error of any reported quantile to about ``2**-(precision_bits - 1)``.
+    Buckets are stored sparsely, so memory is proportional to the number of
+    distinct latency ranges actually observed.
+    """
+
+    def __init__(self, precision_bits: int = 6, max_value_us: int = 3_600_000_000):
+        self.precision_bits = precision_bits
+        self.max_value_us = max_value_us
+        self._linear_limit = 1 << precision_bits
+        self._half = 1 << (precision_bits - 1)
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us: Optional[int] = None
+
+    def record(self, seconds: float):
+        """Record a latency in seconds"""
+        value = min(max(int(seconds * 1_000_000), 0), self.max_value_us)
+        index = self._bucket_index(value)
+        buckets = self.buckets
+        buckets[index] = buckets.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value
+        if self.min_us is None or value < self.min_us:
+            self.min_us = value
+        if self.max_us is None or value > self.max_us:
+            self.max_us = value
+
+    def _bucket_index(self, value: int) -> int:
+        if value < self._linear_limit:
+            return value
+        bits = value.bit_length()
+        mantissa = value >> (bits - self.precision_bits)
+        return (
+            self._linear_limit
+            + (bits - self.precision_bits - 1) * self._half
+            + (mantissa - self._half)
+        )
+
+    def _bucket_midpoint(self, index: int) -> float:
+        if index < self._linear_limit:
+            return float(index)
+        offset = index - self._linear_limit
+        octave, position = divmod(offset, self._half)
+        shift = octave + 1
+        lower = (self._half + position) << shift
+        upper = ((self._half + position + 1) << shift) - 1
+        return (lower + upper) / 2
+
+    def quantiles(self, qs: Iterable[float]) -> Dict[float, float]:
+        """Get latency quantiles in seconds with a single bucket scan"""
+        qs = sorted(qs)
+        result = {q: 0.0 for q in qs}
+        if not self.count:
+            return result
+
+        targets = [(q, max(1, math.ceil(q * self.count))) for q in qs]
+        cumulative = 0
+        target_pos = 0
+        for index in sorted(self.buckets):
+            cumulative += self.buckets[index]
+            while target_pos < len(targets) and cumulative >= targets[target_pos][1]:
+                q = targets[target_pos][0]
+                value = min(self._bucket_midpoint(index), self.max_us)
+                result[q] = max(value, self.min_us) / 1_000_000
+                target_pos += 1
+            if target_pos == len(targets):
+                break
+        return result
+
+    def merge(self, other: "LatencyHistogram"):
+        """Add another histogram's counts into this one"""
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None and (self.min_us is None or other.min_us < self.min_us):
+            self.min_us = other.min_us
+        if other.max_us is not None and (self.max_us is None or other.max_us > self.max_us):
+            self.max_us = other.max_us
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds"""
+        return self.total_us / self.count / 1_000_000 if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for cross-worker merging"""
+        return {
+            "precision_bits": self.precision_bits,
+            "buckets": {str(k): v for k, v in self.buckets.items()},
+            "count": self.count,
+            "total_us": self.total_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """Deserialize a histogram snapshot"""
+        histogram = cls(precision_bits=data["precision_bits"])
+        histogram.buckets = {int(k): v for k, v in data["buckets"].items()}
+        histogram.count = data["count"]
+        histogram.total_us = data["total_us"]
+        histogram.min_us = data["min_us"]
+        histogram.max_us = data["max_us"]
+        return histogram
+
+
+class RollingWindowCounter:
+    """Request and error counts over a rolling time window of fixed slots"""
+
+    def __init__(self, window_seconds: int = 60, slots: int = 12):
+        self.slot_seconds = window_seconds / slots
+        self.slots = slots
+        self._epochs: List[int] = [-1] * slots
+        self._requests: List[int] = [0] * slots
+        self._errors: List[int] = [0] * slots
+
+    def record(self, is_error: bool, now: Optional[float] = None):
+        """Count one request in the current slot"""
+        epoch = int((now if now is not None else time.monotonic()) / self.slot_seconds)
+        slot = epoch % self.slots
+        if self._epochs[slot] != epoch:
+            self._epochs[slot] = epoch
+            self._requests[slot] = 0
+            self._errors[slot] = 0
+        self._requests[slot] += 1
+        if is_error:
+            self._errors[slot] += 1
+
+    def totals(self, now: Optional[float] = None) -> Tuple[int, int]:
+        """Get (requests, errors) within the window"""
+        epoch = int((now if now is not None else time.monotonic()) / self.slot_seconds)
+        oldest = epoch - self.slots + 1
+        requests = errors = 0
+        for slot in range(self.slots):
+            if self._epochs[slot] >= oldest:
+                requests += self._requests[slot]
+                errors += self._errors[slot]
+        return requests, errors
+
+    def error_rate(self, now: Optional[float] = None) -> float:
+        """Error percentage within the window"""
+        requests, errors = self.totals(now)
+        return (errors / requests * 100) if requests else 0.0
+
+
+class EndpointMetrics:
+    """Latency sketch, lifetime totals and windowed error rate for one route"""
+
+    __slots__ = ("histogram", "window", "count", "errors")
+
+    def __init__(self, window_seconds: int):
+        self.histogram = LatencyHistogram()
+        self.window = RollingWindowCounter(window_seconds)
+        self.count = 0
+        self.errors = 0
+
+
+class RequestMetricsRecorder:
+    """
+    O(1) per-request metrics recorder.
+
+    Intended to be driven from the event loop, where updates are not
+    interleaved, so no locking is needed. Workers can export snapshots with
+    ``snapshot()`` and combine them with ``merge_snapshot()``.
+    """
+
+    QUANTILES = (0.5, 0.95, 0.99)
+    OVERFLOW_ENDPOINT = "__other__"
+
+    def __init__(self, window_seconds: int = 60, max_endpoints: int = 500):
+        self.window_seconds = window_seconds
+        self.max_endpoints = max_endpoints
+        self.endpoints: Dict[str, EndpointMetrics] = {}
+        self.overall = EndpointMetrics(window_seconds)
+
+    def record(self, method: str, endpoint: str, response_time: float, is_error: bool):
+        """Record one request"""
+        key = f"{method}:{endpoint}"
+        metrics = self.endpoints.get(key)
+        if metrics is None:
+            if len(self.endpoints) >= self.max_endpoints:
+                # Bound cardinality when paths carry unnormalized ids
+                key = self.OVERFLOW_ENDPOINT
+                metrics = self.endpoints.get(key)
+            if metrics is None:
+                metrics = self.endpoints[key] = EndpointMetrics(self.window_seconds)
+
+        now = time.monotonic()
+        for target in (metrics, self.overall):
+            target.histogram.record(response_time)
+            target.window.record(is_error, now)
+            target.count += 1
+            if is_error:
+                target.errors += 1
+
+    def error_rate(self) -> float:
+        """Overall windowed error rate percentage"""
+        return self.overall.window.error_rate()
+
+    def endpoint_stats(self, metrics: EndpointMetrics) -> Dict[str, Any]:
+        """Summarize one endpoint's metrics"""
+        histogram = metrics.histogram
+        quantiles = histogram.quantiles(self.QUANTILES)
+        return {
+            "count": metrics.count,
+            "errors": metrics.errors,
+            "avg_time": histogram.mean,
+            "min_time": (histogram.min_us or 0) / 1_000_000,
+            "max_time": (histogram.max_us or 0) / 1_000_000,
+            "p50": quantiles[0.5],
+            "p95": quantiles[0.95],
+            "p99": quantiles[0.99],
+            "window_error_rate": metrics.window.error_rate(),
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Serialize lifetime sketches for merging across workers"""
+        return {
+            key: {
+                "histogram": metrics.histogram.to_dict(),
+                "count": metrics.count,
+                "errors": metrics.errors,
+            }
+            for key, metrics in self.endpoints.items()
+        }
+
+    def merge_snapshot(self, snapshot: Dict[str, Any]):
+        """Merge another worker's snapshot into this recorder"""
+        for key, data in snapshot.items():
+            metrics = self.endpoints.get(key)
+            if metrics is None:
+                metrics = self.endpoints[key] = EndpointMetrics(self.window_seconds)
+            histogram = LatencyHistogram.from_dict(data["histogram"])
+            for target in (metrics, self.overall):
+                target.histogram.merge(histogram)
+                target.count += data["count"]
+                target.errors += data["errors"]
+
+    def export_prometheus(self) -> str:
+        """Render per-route quantiles and windowed error rates in Prometheus text format"""
+        lines = [
+            "# HELP http_request_latency_seconds Request latency quantiles per route",
+            "# TYPE http_request_latency_seconds summary",
+        ]
+        error_lines = [
+            "# HELP http_route_error_rate Windowed error rate percentage per route",
+            "# TYPE http_route_error_rate gauge",
+        ]
+        for key, metrics in sorted(self.endpoints.items()):
+            method, _, endpoint = key.partition(":")
+            labels = f'method="{method}",endpoint="{_escape_label(endpoint)}"'
+            quantiles = metrics.histogram.quantiles(self.QUANTILES)
+            for q in self.QUANTILES:
+                lines.append(
+                    f'http_request_latency_seconds{{{labels},quantile="{q}"}} {quantiles[q]:.6f}'
+                )
+            lines.append(
+                f"http_request_latency_seconds_sum{{{labels}}} "
+                f"{metrics.histogram.total_us / 1_000_000:.6f}"
+            )
+            lines.append(f"http_request_latency_seconds_count{{{labels}}} {metrics.count}")
+            error_lines.append(
+                f"http_route_error_rate{{{labels}}} {metrics.window.error_rate():.4f}"
+            )
+        return "\n".join(lines + error_lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
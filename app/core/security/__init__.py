@@ -5,6 +5,7 @@ from .password_hasher import PasswordHasher
 from .jwt_handler import JWTManager
 from .permission_validator import PermissionValidator, PermissionLevel, require_permissions
 from .two_factor import TwoFactorAuthentication  # Add this line
+from .principal_cache import PrincipalCache, principal_cache, compile_permission_check
 from .auth import (
     verify_token,
     get_current_user,
@@ -27,6 +28,9 @@ __all__ = [
     "PermissionLevel",
     "require_permissions",
     "TwoFactorAuthentication",  # Add this line
+    "PrincipalCache",
+    "principal_cache",
+    "compile_permission_check",
     "verify_token",
     "get_current_user",
     "create_access_token",
@@ -2,6 +2,7 @@
 Authentication utilities and standalone functions.
 """
 
+import hashlib
 import logging
 import re
 from typing import Dict, Any, Optional
@@ -12,6 +13,7 @@ from datetime import datetime, timezone, timedelta
 
 from .jwt_handler import JWTManager
 from .password_hasher import PasswordHasher
+from .principal_cache import principal_cache
 
 logger = logging.getLogger(__name__)
 
@@ -139,12 +141,17 @@ async def get_current_user(token: str, db: Session) -> Optional[Dict[str, Any]]:
     """
     Get current user from token.
     
+    The resolved principal is cached per token (jti) and user version, so
+    repeat requests with the same token skip the database entirely until
+    the cache TTL expires or the user's version is bumped.
+    
     Args:
         token: JWT token
         db: Database session
         
     Returns:
-        User data or None if invalid
+        User data or None if invalid. The returned dict is shared by
+        cached requests and must be treated as read-only.
     """
     try:
         payload = verify_token(token)
@@ -153,54 +160,22 @@ async def get_current_user(token: str, db: Session) -> Optional[Dict[str, Any]]:
         if not user_id:
             return None
         
-        # TODO: In a real implementation, you would fetch the user from database
-        # Example database query:
-        # from app.models.user import User
-        # user = db.query(User).filter(User.id == user_id).first()
-        # if not user or not user.is_active:
-        #     return None
-        # 
-        # return {
-        #     "id": str(user.id),
-        #     "username": user.username,
-        #     "email": user.email,
-        #     "is_active": user.is_active,
-        #     "is_admin": user.is_admin,
-        #     "is_superuser": user.is_superuser,
-        #     "is_verified": user.is_verified,
-        #     "roles": [role.name for role in user.roles],
-        #     "permissions": [perm.name for perm in user.permissions],
-        #     "last_login": user.last_login.isoformat() if user.last_login else None,
-        #     "hostel_id": user.hostel_id,
-        #     "tenant_id": user.tenant_id,
-        # }
-        
-        # For now, return mock user data based on token payload
-        user_data = {
-            "id": user_id,
-            "token_type": payload.get("token_type"),
-            "token_jti": payload.get("jti"),
-            "iat": payload.get("iat"),
-            "exp": payload.get("exp"),
-            "is_active": True,  # You'd check this in the database
-            "is_admin": False,  # You'd check this in the database
-            "is_superuser": False,  # You'd check this in the database
-            "is_verified": True,  # You'd check this in the database
-            "roles": ["user"],  # You'd fetch from database
-            "permissions": [],  # You'd fetch from database
-            "email": f"user{user_id}@example.com",  # You'd fetch from database
-            "username": f"user_{user_id}",  # You'd fetch from database
-            "last_login": datetime.now(timezone.utc).isoformat(),
-            "hostel_id": "main",  # You'd fetch from database
-            "tenant_id": "main",  # You'd fetch from database
-            "accessible_tenants": ["main"],  # You'd fetch from database
-        }
+        jti = payload.get("jti") or hashlib.sha256(token.encode()).hexdigest()
+        principal = principal_cache.get(jti, user_id)
+        if principal is not None:
+            return principal.user_data
         
-        # Add any additional claims from the token
-        additional_claims = {k: v for k, v in payload.items() 
-                           if k not in ["user_id", "token_type", "iat", "exp", "jti"]}
-        user_data.update(additional_claims)
+        user_data = _load_user_data(db, user_id, payload)
+        if user_data is None:
+            return None
         
+        principal_cache.put(
+            jti,
+            user_data,
+            permissions=user_data["permissions"],
+            roles=user_data["roles"],
+            token_expires_at=payload.get("exp")
+        )
         return user_data
         
     except HTTPException:
@@ -211,6 +186,68 @@ async def get_current_user(token: str, db: Session) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _load_user_data(db: Session, user_id: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Load a user and compile their effective roles and permissions.
+    
+    Args:
+        db: Database session
+        user_id: User identifier from the token
+        payload: Verified token payload
+        
+    Returns:
+        User data or None if the user does not exist
+    """
+    from app.models.user.user import User
+    from app.schemas.common.enums import UserRole
+    from .permission_validator import ROLE_PERMISSIONS
+    
+    user = db.query(User).filter(
+        User.id == user_id,
+        User.is_deleted == False
+    ).first()
+    if not user:
+        return None
+    
+    role = user.user_role.value if user.user_role else UserRole.STUDENT.value
+    is_superuser = user.user_role == UserRole.SUPER_ADMIN
+    is_admin = user.user_role in (UserRole.HOSTEL_ADMIN, UserRole.SUPER_ADMIN)
+    
+    permissions = set(ROLE_PERMISSIONS.get(role, ()))
+    if is_superuser:
+        permissions.add("*")
+    if is_admin:
+        permissions.add("admin:*")
+    
+    user_data = {
+        "id": str(user.id),
+        "token_type": payload.get("token_type"),
+        "token_jti": payload.get("jti"),
+        "iat": payload.get("iat"),
+        "exp": payload.get("exp"),
+        "is_active": user.is_active,
+        "is_admin": is_admin,
+        "is_superuser": is_superuser,
+        "is_verified": user.is_email_verified,
+        "roles": [role],
+        "permissions": sorted(permissions),
+        "email": user.email,
+        "username": user.email,
+        "full_name": user.full_name,
+        "last_login": user.last_login_at.isoformat() if user.last_login_at else None,
+        "hostel_id": payload.get("hostel_id"),
+        "tenant_id": payload.get("tenant_id"),
+        "accessible_tenants": payload.get("accessible_tenants", []),
+    }
+    
+    # Add any additional claims from the token without overriding stored data
+    for key, value in payload.items():
+        if key not in ["user_id", "token_type", "iat", "exp", "jti"] and key not in user_data:
+            user_data[key] = value
+    
+    return user_data
+
+
 def create_access_token(user_id: str, additional_claims: Optional[Dict[str, Any]] = None) -> str:
     """
     Create access token for user.
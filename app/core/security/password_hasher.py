@@ -2,44 +2,229 @@
 Password hashing and verification utilities.
 
 Provides secure password hashing using bcrypt with configurable rounds.
+
+bcrypt work runs on a dedicated, bounded thread pool (bcrypt releases the
+GIL) so login bursts cannot starve request workers or the event loop. When
+the pool's queue is full new work is rejected instead of piling up. The
+cost factor is pinned in configuration (PASSWORD_HASH_ROUNDS, never below
+12), and concurrent verifications of the same credential pair share one
+bcrypt computation.
 """
 
+import asyncio
 import bcrypt
+import hashlib
 import logging
-from typing import Union
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from app.core.exceptions import RateLimitExceededError
 
 logger = logging.getLogger(__name__)
 
 
+def _security_setting(name: str, default):
+    try:
+        from ..config import settings
+        return getattr(settings.security, name, default)
+    except Exception:
+        return default
+
+
+class _HashingPool:
+    """
+    Bounded executor shared by every PasswordHasher in the process.
+
+    ``max_pending`` caps queued plus running jobs; beyond that submissions
+    fail fast with RateLimitExceededError.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="password-hasher",
+        )
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._inflight: Dict[bytes, Future] = {}
+        self.rejected = 0
+        self.coalesced = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def submit(self, fn, *args) -> Future:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise RateLimitExceededError(
+                    "Too many concurrent password operations, retry shortly",
+                    limit=self.max_pending,
+                    identifier="password_hasher",
+                )
+            self._pending += 1
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def submit_coalesced(self, key: bytes, fn, *args) -> Future:
+        """Submit work, sharing the in-flight future of an identical job"""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future
+        future = self.submit(fn, *args)
+        with self._lock:
+            existing = self._inflight.setdefault(key, future)
+        if existing is future:
+            future.add_done_callback(lambda _f: self._forget(key, future))
+        return existing
+
+    def _forget(self, key: bytes, future: Future) -> None:
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+
+_pool: Optional[_HashingPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_hashing_pool() -> _HashingPool:
+    """Get the process-wide hashing pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                workers = _security_setting(
+                    "PASSWORD_HASH_WORKERS", max(2, (os.cpu_count() or 2) // 2)
+                )
+                _pool = _HashingPool(
+                    max_workers=workers,
+                    max_pending=_security_setting("PASSWORD_HASH_MAX_PENDING", workers * 16),
+                )
+    return _pool
+
+
+def configured_rounds() -> int:
+    """
+    Get the configured bcrypt cost, raised to the floor if set lower.
+
+    Returns:
+        Number of rounds new hashes are created with
+    """
+    rounds = _security_setting("PASSWORD_HASH_ROUNDS", PasswordHasher.DEFAULT_ROUNDS)
+    if rounds < PasswordHasher.MIN_CONFIGURED_ROUNDS:
+        logger.warning(
+            f"PASSWORD_HASH_ROUNDS={rounds} is below the floor, "
+            f"using {PasswordHasher.MIN_CONFIGURED_ROUNDS}"
+        )
+        rounds = PasswordHasher.MIN_CONFIGURED_ROUNDS
+    return rounds
+
+
 class PasswordHasher:
     """
     Handle password hashing and verification using bcrypt.
     
     Provides secure password hashing with salt generation and verification.
-    Uses bcrypt with configurable rounds for computational cost.
+    Uses bcrypt with configurable rounds for computational cost. Work is
+    executed on the shared bounded hashing pool.
     """
     
     DEFAULT_ROUNDS = 12
+    MIN_CONFIGURED_ROUNDS = 12
     MIN_ROUNDS = 4
     MAX_ROUNDS = 31
     
-    def __init__(self, rounds: int = DEFAULT_ROUNDS):
+    def __init__(self, rounds: Optional[int] = None):
         """
         Initialize password hasher.
         
         Args:
-            rounds: Number of bcrypt rounds (4-31, default 12)
+            rounds: Number of bcrypt rounds (4-31). Defaults to the
+                configured cost.
             
         Raises:
             ValueError: If rounds is outside valid range
         """
+        if rounds is None:
+            rounds = configured_rounds()
+        
         if not (self.MIN_ROUNDS <= rounds <= self.MAX_ROUNDS):
             raise ValueError(
                 f"Rounds must be between {self.MIN_ROUNDS} and {self.MAX_ROUNDS}, got {rounds}"
             )
         
         self.rounds = rounds
-        logger.info(f"PasswordHasher initialized with {rounds} rounds")
+        self._pool = get_hashing_pool()
+        logger.debug(f"PasswordHasher initialized with {rounds} rounds")
+    
+    # ------------------------------------------------------------------
+    # bcrypt primitives (run on the hashing pool)
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _hash_sync(password: bytes, rounds: int) -> str:
+        return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+    
+    @staticmethod
+    def _verify_sync(password: bytes, hashed_password: bytes) -> bool:
+        try:
+            return bcrypt.checkpw(password, hashed_password)
+        except Exception as e:
+            logger.warning(f"Error verifying password: {e}")
+            return False
+    
+    @staticmethod
+    def _validate_hash_input(password: str) -> None:
+        if not isinstance(password, str):
+            raise TypeError("Password must be a string")
+        
+        if not password:
+            raise ValueError("Password cannot be empty")
+    
+    @staticmethod
+    def _validate_verify_input(password: str, hashed_password: str) -> None:
+        if not isinstance(password, str) or not isinstance(hashed_password, str):
+            raise TypeError("Both password and hash must be strings")
+        
+        if not password or not hashed_password:
+            raise ValueError("Password and hash cannot be empty")
+    
+    @staticmethod
+    def _credential_key(password: str, hashed_password: str) -> bytes:
+        # Digest so plaintext passwords are never held as dict keys
+        return hashlib.sha256(
+            password.encode('utf-8') + b"\0" + hashed_password.encode('utf-8')
+        ).digest()
+    
+    def _submit_hash(self, password: str) -> Future:
+        self._validate_hash_input(password)
+        return self._pool.submit(self._hash_sync, password.encode('utf-8'), self.rounds)
+    
+    def _submit_verify(self, password: str, hashed_password: str) -> Future:
+        self._validate_verify_input(password, hashed_password)
+        return self._pool.submit_coalesced(
+            self._credential_key(password, hashed_password),
+            self._verify_sync,
+            password.encode('utf-8'),
+            hashed_password.encode('utf-8'),
+        )
+    
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
     
     def hash(self, password: str) -> str:
         """
@@ -54,24 +239,27 @@ class PasswordHasher:
         Raises:
             ValueError: If password is empty
             TypeError: If password is not a string
+            RateLimitExceededError: If the hashing pool is saturated
         """
-        if not isinstance(password, str):
-            raise TypeError("Password must be a string")
-        
-        if not password:
-            raise ValueError("Password cannot be empty")
-        
+        future = self._submit_hash(password)
         try:
-            # Generate salt and hash password
-            salt = bcrypt.gensalt(rounds=self.rounds)
-            hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-            
-            return hashed.decode('utf-8')
-            
+            return future.result()
         except Exception as e:
             logger.error(f"Error hashing password: {e}")
             raise
     
+    async def hash_async(self, password: str) -> str:
+        """
+        Hash a password without blocking the event loop.
+        
+        Args:
+            password: Plain text password to hash
+            
+        Returns:
+            Hashed password as string
+        """
+        return await asyncio.wrap_future(self._submit_hash(password))
+    
     def verify(self, password: str, hashed_password: str) -> bool:
         """
         Verify a password against its hash.
@@ -86,25 +274,99 @@ class PasswordHasher:
         Raises:
             ValueError: If either parameter is empty
             TypeError: If parameters are not strings
+            RateLimitExceededError: If the hashing pool is saturated
         """
-        if not isinstance(password, str) or not isinstance(hashed_password, str):
-            raise TypeError("Both password and hash must be strings")
+        return self._submit_verify(password, hashed_password).result()
+    
+    async def verify_async(self, password: str, hashed_password: str) -> bool:
+        """
+        Verify a password without blocking the event loop.
         
-        if not password or not hashed_password:
-            raise ValueError("Password and hash cannot be empty")
+        Args:
+            password: Plain text password to verify
+            hashed_password: Previously hashed password
+            
+        Returns:
+            True if password matches hash, False otherwise
+        """
+        return await asyncio.wrap_future(
+            self._submit_verify(password, hashed_password)
+        )
+    
+    def verify_and_update(
+        self,
+        password: str,
+        hashed_password: str,
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and produce an upgraded hash when its cost is
+        below the configured cost.
         
+        Args:
+            password: Plain text password to verify
+            hashed_password: Previously hashed password
+            
+        Returns:
+            Tuple of (matches, new_hash). ``new_hash`` is None unless the
+            password matched and the stored hash should be replaced.
+        """
+        if not self.verify(password, hashed_password):
+            return False, None
+        if not self.needs_rehash(hashed_password):
+            return True, None
         try:
-            return bcrypt.checkpw(
-                password.encode('utf-8'),
-                hashed_password.encode('utf-8')
-            )
-        except Exception as e:
-            logger.warning(f"Error verifying password: {e}")
-            return False
+            return True, self.hash(password)
+        except RateLimitExceededError:
+            # Upgrading is opportunistic; try again on the next login
+            return True, None
+    
+    async def verify_and_update_async(
+        self,
+        password: str,
+        hashed_password: str,
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and produce an upgraded hash without blocking the
+        event loop.
+        
+        Args:
+            password: Plain text password to verify
+            hashed_password: Previously hashed password
+            
+        Returns:
+            Tuple of (matches, new_hash), as for verify_and_update
+        """
+        if not await self.verify_async(password, hashed_password):
+            return False, None
+        if not self.needs_rehash(hashed_password):
+            return True, None
+        try:
+            return True, await self.hash_async(password)
+        except RateLimitExceededError:
+            return True, None
+    
+    @staticmethod
+    def get_rounds(hashed_password: str) -> Optional[int]:
+        """
+        Read the cost factor from a bcrypt hash.
+        
+        Args:
+            hashed_password: bcrypt hash (``$2b$<cost>$...``)
+            
+        Returns:
+            Cost factor, or None if the hash is not bcrypt
+        """
+        parts = hashed_password.split('$')
+        if len(parts) < 4 or not parts[1].startswith('2') or not parts[2].isdigit():
+            return None
+        return int(parts[2])
     
     def needs_rehash(self, hashed_password: str) -> bool:
         """
-        Check if a hash needs to be rehashed (different rounds).
+        Check if a hash needs to be rehashed (cost below current rounds).
+        
+        Hashes with a higher cost are kept, so lowering the configured cost
+        never downgrades stored hashes.
         
         Args:
             hashed_password: Previously hashed password
@@ -112,11 +374,26 @@ class PasswordHasher:
         Returns:
             True if hash should be regenerated with current rounds
         """
-        try:
-            return bcrypt.checkpw(b"test", hashed_password.encode('utf-8')) is False
-        except Exception:
-            # If we can't parse the hash, it should be rehashed
-            return True
+        stored_rounds = self.get_rounds(hashed_password)
+        # Unparseable hashes should be rehashed as well
+        return stored_rounds is None or stored_rounds < self.rounds
+    
+    @classmethod
+    def get_pool_stats(cls) -> Dict[str, int]:
+        """
+        Get hashing pool statistics.
+        
+        Returns:
+            Worker count, pending jobs, rejections and coalesced verifications
+        """
+        pool = get_hashing_pool()
+        return {
+            "workers": pool.max_workers,
+            "max_pending": pool.max_pending,
+            "pending": pool.pending,
+            "rejected": pool.rejected,
+            "coalesced": pool.coalesced,
+        }
     
     @classmethod
     def generate_secure_password(cls, length: int = 16) -> str:
@@ -11,9 +11,64 @@ from enum import Enum
 from fastapi import HTTPException, status
 from functools import wraps
 
+from .principal_cache import compile_permission_check, user_permission_bits
+
 logger = logging.getLogger(__name__)
 
 
+# Permissions of hostel administrators
+_ADMIN_PERMISSIONS = frozenset({
+    "admin:*",
+    "users:read",
+    "users:write",
+    "rooms:read",
+    "rooms:write",
+    "bookings:read",
+    "bookings:write",
+    "announcement:create",
+    "announcement:publish",
+    "announcement:unpublish",
+    "announcement:archive",
+    "announcement:unarchive",
+    "announcement:export",
+    "announcement:bulk_delete",
+    "announcement:analytics",
+})
+
+# Permissions granted by each role, built once at import
+ROLE_PERMISSIONS: Dict[str, frozenset] = {
+    "super_admin": frozenset({"*"}),
+    "superuser": frozenset({"*"}),
+    "admin": _ADMIN_PERMISSIONS,
+    "hostel_admin": _ADMIN_PERMISSIONS,
+    "warden": frozenset({
+        "rooms:read",
+        "rooms:write",
+        "students:read",
+        "students:write",
+        "bookings:read",
+        "reports:read",
+        "announcement:create",
+        "announcement:publish",
+        "announcement:unpublish",
+    }),
+    "supervisor": frozenset({
+        "rooms:read",
+        "students:read",
+        "bookings:read",
+        "reports:read",
+        "announcement:create",
+    }),
+    "student": frozenset({
+        "profile:read",
+        "profile:write",
+        "maintenance:create",
+    }),
+}
+
+ADMIN_ROLES = frozenset({"admin", "hostel_admin", "super_admin", "superuser"})
+
+
 class PermissionLevel(str, Enum):
     """Permission level enumeration"""
     NONE = "none"
@@ -131,25 +186,18 @@ class PermissionValidator:
             True if user has permission, False otherwise
         """
         try:
-            # Extract permissions from user data
-            user_permissions = user_data.get("permissions", [])
             user_roles = user_data.get("roles", [])
             
             # Check if user is super admin
             if user_data.get("is_superuser", False):
                 return True
             
-            # Check direct permission
-            if permission in user_permissions:
-                return True
-            
-            # Check wildcard permissions
-            if "*" in user_permissions:
+            # Direct, resource-wildcard and global-wildcard grants in one AND
+            if user_permission_bits(user_data) & compile_permission_check(permission):
                 return True
             
             # Check role-based permissions
-            admin_roles = {"admin", "super_admin", "superuser"}
-            if any(role in admin_roles for role in user_roles):
+            if not ADMIN_ROLES.isdisjoint(user_roles):
                 return True
             
             # Context-aware permission check
@@ -253,53 +301,7 @@ class PermissionValidator:
         Returns:
             Set of permissions for the role
         """
-        # Define role-based permissions
-        role_permissions_map = {
-            "super_admin": {"*"},
-            "superuser": {"*"},
-            "admin": {
-                "admin:*",
-                "users:read",
-                "users:write",
-                "rooms:read",
-                "rooms:write",
-                "bookings:read",
-                "bookings:write",
-                "announcement:create",
-                "announcement:publish",
-                "announcement:unpublish",
-                "announcement:archive",
-                "announcement:unarchive",
-                "announcement:export",
-                "announcement:bulk_delete",
-                "announcement:analytics",
-            },
-            "warden": {
-                "rooms:read",
-                "rooms:write",
-                "students:read",
-                "students:write",
-                "bookings:read",
-                "reports:read",
-                "announcement:create",
-                "announcement:publish",
-                "announcement:unpublish",
-            },
-            "supervisor": {
-                "rooms:read",
-                "students:read",
-                "bookings:read",
-                "reports:read",
-                "announcement:create",
-            },
-            "student": {
-                "profile:read",
-                "profile:write",
-                "maintenance:create",
-            },
-        }
-        
-        return role_permissions_map.get(role, set())
+        return ROLE_PERMISSIONS.get(role, frozenset())
     
     def validate_bulk_permissions(
         self,
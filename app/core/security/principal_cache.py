@@ -0,0 +1,235 @@
+"""
+Principal cache with compiled permission bitsets.
+
+Resolving a token into a principal (user data, roles and effective
+permissions) is done once per token and user version, then cached for a
+short TTL. Permissions and roles are compiled into integer bitsets so
+authorization checks are a bitwise AND instead of list scans.
+
+Bumping a user's version (on role, permission or status change) makes
+every cached principal of that user unreachable immediately in this
+process; the TTL bounds staleness across processes.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+WILDCARD_PERMISSION = "*"
+
+
+class BitRegistry:
+    """
+    Assigns a stable bit to every name seen (permissions or roles).
+
+    Bits are process-local and only ever appended, so compiled masks stay
+    valid for the lifetime of the process.
+    """
+
+    def __init__(self):
+        self._bits: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def bit(self, name: str) -> int:
+        """Get the bit for a name, assigning one on first use"""
+        bit = self._bits.get(name)
+        if bit is None:
+            with self._lock:
+                bit = self._bits.get(name)
+                if bit is None:
+                    bit = self._bits[name] = 1 << len(self._bits)
+        return bit
+
+    def compile(self, names: Iterable[str]) -> int:
+        """Compile names into a bitset"""
+        bits = 0
+        for name in names:
+            bits |= self.bit(name)
+        return bits
+
+    def names(self, bits: int) -> List[str]:
+        """Decode a bitset back into names"""
+        return [name for name, bit in self._bits.items() if bits & bit]
+
+
+permission_bits = BitRegistry()
+role_bits = BitRegistry()
+
+
+@lru_cache(maxsize=4096)
+def compile_permission_check(permission: str) -> int:
+    """
+    Compile a required permission into the mask of grants that satisfy it.
+
+    A user satisfies ``resource:action`` when holding the exact permission,
+    ``resource:*`` or ``*``, so the check is ``user_bits & mask != 0``.
+    """
+    mask = permission_bits.bit(permission) | permission_bits.bit(WILDCARD_PERMISSION)
+    resource, sep, _ = permission.partition(":")
+    if sep:
+        mask |= permission_bits.bit(f"{resource}:*")
+    return mask
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Resolved, immutable identity of an authenticated user"""
+    user_id: str
+    version: int
+    user_data: Dict[str, Any]
+    permissions: int
+    roles: int
+    expires_at: float
+    role_names: FrozenSet[str] = field(default_factory=frozenset)
+
+    @property
+    def is_superuser(self) -> bool:
+        return bool(self.user_data.get("is_superuser"))
+
+    def has_permission(self, mask: int) -> bool:
+        """Check one compiled permission mask"""
+        return self.is_superuser or bool(self.permissions & mask)
+
+    def has_all_permissions(self, masks: Iterable[int]) -> bool:
+        """Check every compiled permission mask"""
+        return self.is_superuser or all(self.permissions & mask for mask in masks)
+
+    def has_any_permission(self, masks: Iterable[int]) -> bool:
+        """Check at least one compiled permission mask"""
+        return self.is_superuser or any(self.permissions & mask for mask in masks)
+
+    def has_roles(self, mask: int, require_all: bool = False) -> bool:
+        """Check a compiled role mask"""
+        if require_all:
+            return self.roles & mask == mask
+        return bool(self.roles & mask)
+
+
+class PrincipalCache:
+    """
+    LRU + TTL cache of principals keyed by (token jti, user version).
+
+    Lookups on the hot path take no lock: a dict read plus an expiry
+    check. Writes and invalidation are serialized.
+    """
+
+    def __init__(self, ttl_seconds: int = 60, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, int], Principal]" = OrderedDict()
+        self._user_versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def user_version(self, user_id: str) -> int:
+        """Current cache version for a user"""
+        return self._user_versions.get(str(user_id), 0)
+
+    def get(self, jti: str, user_id: str) -> Optional[Principal]:
+        """Get a live principal for a token, if cached"""
+        key = (jti, self.user_version(user_id))
+        principal = self._entries.get(key)
+        if principal is None or principal.user_id != str(user_id):
+            self.misses += 1
+            return None
+        if principal.expires_at <= time.monotonic():
+            with self._lock:
+                self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return principal
+
+    def put(
+        self,
+        jti: str,
+        user_data: Dict[str, Any],
+        permissions: Iterable[str],
+        roles: Iterable[str],
+        token_expires_at: Optional[float] = None
+    ) -> Principal:
+        """
+        Compile and cache a principal for a token.
+
+        The compiled bitsets are also stored on ``user_data`` as
+        ``permission_bits`` and ``role_bits`` so dependencies working with
+        the plain user dict can authorize without recompiling.
+        """
+        user_id = str(user_data["id"])
+        role_names = frozenset(roles)
+        ttl = self.ttl_seconds
+        if token_expires_at is not None:
+            # Never outlive the token itself
+            ttl = max(0.0, min(ttl, token_expires_at - time.time()))
+
+        with self._lock:
+            version = self.user_version(user_id)
+            principal = Principal(
+                user_id=user_id,
+                version=version,
+                user_data=user_data,
+                permissions=permission_bits.compile(permissions),
+                roles=role_bits.compile(role_names),
+                expires_at=time.monotonic() + ttl,
+                role_names=role_names,
+            )
+            user_data["permission_bits"] = principal.permissions
+            user_data["role_bits"] = principal.roles
+            key = (jti, version)
+            self._entries[key] = principal
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return principal
+
+    def invalidate_user(self, user_id: Any) -> None:
+        """Bump a user's version so their cached principals are never served"""
+        user_id = str(user_id)
+        with self._lock:
+            self._user_versions[user_id] = self._user_versions.get(user_id, 0) + 1
+            stale = [key for key, p in self._entries.items() if p.user_id == user_id]
+            for key in stale:
+                del self._entries[key]
+        logger.debug(f"Invalidated cached principals for user {user_id}")
+
+    def invalidate_all(self) -> None:
+        """Drop every cached principal (e.g. after a role definition change)"""
+        with self._lock:
+            self._entries.clear()
+        logger.debug("Invalidated all cached principals")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups * 100) if lookups else 0.0,
+        }
+
+
+def user_permission_bits(user_data: Dict[str, Any]) -> int:
+    """Permission bitset of a user dict, compiling it if not cached"""
+    bits = user_data.get("permission_bits")
+    if bits is None:
+        bits = permission_bits.compile(user_data.get("permissions", []))
+    return bits
+
+
+def user_role_bits(user_data: Dict[str, Any]) -> int:
+    """Role bitset of a user dict, compiling it if not cached"""
+    bits = user_data.get("role_bits")
+    if bits is None:
+        bits = role_bits.compile(user_data.get("roles", []))
+    return bits
+
+
+principal_cache = PrincipalCache()
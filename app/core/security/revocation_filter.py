@@ -0,0 +1,351 @@
+"""
+Probabilistic revocation filter for token blacklist checks.
+
+Each process keeps a Bloom filter of revoked token JTIs so the common case
+(a token that was never revoked) is answered in memory. Only possible
+positives fall through to the authoritative blacklist table.
+
+The filter is rebuilt from the authoritative store periodically, sized
+from the current revocation count, so expired entries age out. Between
+rebuilds, revocations made by other processes arrive through a Redis
+stream. When the stream cannot be read the filter is treated as stale and
+every lookup falls through to the authoritative store.
+"""
+
+import hashlib
+import logging
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter using double hashing over one blake2b digest.
+
+    Args:
+        capacity: Expected number of entries
+        false_positive_rate: Target false positive rate at capacity
+        max_bits: Upper bound on the bit array size
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        false_positive_rate: float = 0.001,
+        max_bits: int = 64 * 1024 * 1024,
+    ):
+        capacity = max(capacity, 1)
+        bits = int(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+        self.num_bits = min(max(bits, 1024), max_bits)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.capacity = capacity
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> None:
+        """Add an item"""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._bits)
+
+    def estimated_false_positive_rate(self) -> float:
+        """Theoretical false positive rate at the current fill"""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+
+class RevocationFilter:
+    """
+    Per-process front-line filter for revoked token JTIs.
+
+    Args:
+        loader: Callable returning every currently revoked, unexpired JTI
+        redis_url: Redis URL for the revocation stream (None disables it)
+        stream_key: Redis stream carrying new revocations
+        false_positive_rate: Target false positive rate
+        rebuild_interval: Seconds between full rebuilds from the loader
+        poll_interval: Seconds between stream polls
+        headroom: Capacity multiplier over the current revocation count
+        max_bits: Upper bound on filter size
+    """
+
+    STREAM_MAXLEN = 100_000
+
+    _PENDING_KEY = "revocation_filter.pending_jtis"
+    _LISTENING_KEY = "revocation_filter.listening"
+
+    def __init__(
+        self,
+        loader: Optional[Callable[[], Iterable[str]]] = None,
+        redis_url: Optional[str] = None,
+        stream_key: str = "auth:revoked_jtis",
+        false_positive_rate: float = 0.001,
+        rebuild_interval: float = 600.0,
+        poll_interval: float = 1.0,
+        headroom: float = 2.0,
+        max_bits: int = 64 * 1024 * 1024,
+    ):
+        self.loader = loader
+        self.redis_url = redis_url
+        self.stream_key = stream_key
+        self.false_positive_rate = false_positive_rate
+        self.rebuild_interval = rebuild_interval
+        self.poll_interval = poll_interval
+        self.headroom = headroom
+        self.max_bits = max_bits
+
+        self._filter: Optional[BloomFilter] = None
+        self._stream_id = "0-0"
+        self._built_at = 0.0
+        self._polled_at = 0.0
+        self._stream_healthy = False
+        self._redis = None
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.lookups = 0
+        self.negatives = 0
+        self.fall_throughs = 0
+        self.false_positives = 0
+        self.true_positives = 0
+        self.rebuilds = 0
+
+    # ------------------------------------------------------------------
+    # Redis stream
+    # ------------------------------------------------------------------
+
+    def _get_redis(self):
+        if self._redis is None and self.redis_url:
+            import redis
+            self._redis = redis.Redis.from_url(
+                self.redis_url,
+                decode_responses=True,
+                socket_timeout=0.5,
+                socket_connect_timeout=0.5,
+            )
+        return self._redis
+
+    def _stream_tail_id(self) -> str:
+        client = self._get_redis()
+        if client is None:
+            return "0-0"
+        entries = client.xrevrange(self.stream_key, count=1)
+        return entries[0][0] if entries else "0-0"
+
+    def publish(self, jti: str) -> None:
+        """Add a revocation locally and announce it to other processes"""
+        current = self._filter
+        if current is not None:
+            current.add(jti)
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            client.xadd(
+                self.stream_key,
+                {"jti": jti},
+                maxlen=self.STREAM_MAXLEN,
+                approximate=True,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to publish token revocation: {e}")
+
+    def publish_on_commit(self, session: Session, jtis: Iterable[str]) -> None:
+        """
+        Publish revocations once the session's transaction commits.
+
+        Publishing before commit would advertise revocations that may still
+        roll back; publishing only from the service layer would miss every
+        revocation written directly through the repositories.
+
+        Args:
+            session: Database session the blacklist rows are written on
+            jtis: Revoked JWT IDs
+        """
+        pending = session.info.setdefault(self._PENDING_KEY, [])
+        if not session.info.get(self._LISTENING_KEY):
+            event.listen(session, "after_commit", self._after_commit)
+            event.listen(session, "after_rollback", self._after_rollback)
+            session.info[self._LISTENING_KEY] = True
+
+        pending.extend(jtis)
+
+    def _after_commit(self, session: Session) -> None:
+        for jti in session.info.pop(self._PENDING_KEY, ()):
+            self.publish(jti)
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(self._PENDING_KEY, None)
+
+    def _poll_stream(self) -> None:
+        client = self._get_redis()
+        if client is None:
+            self._stream_healthy = False
+            return
+        try:
+            response = client.xread({self.stream_key: self._stream_id}, count=1000)
+            current = self._filter
+            for _, entries in response or ():
+                for entry_id, fields in entries:
+                    jti = fields.get("jti")
+                    if jti and current is not None:
+                        current.add(jti)
+                    self._stream_id = entry_id
+            self._stream_healthy = True
+        except Exception as e:
+            if self._stream_healthy:
+                logger.warning(f"Revocation stream unavailable, filter bypassed: {e}")
+            self._stream_healthy = False
+
+    # ------------------------------------------------------------------
+    # Rebuild
+    # ------------------------------------------------------------------
+
+    def rebuild(self) -> None:
+        """Rebuild the filter from the authoritative store"""
+        if self.loader is None:
+            return
+        try:
+            # Remember the stream position first so revocations racing with
+            # the load are replayed afterwards rather than lost
+            stream_id = self._stream_tail_id()
+        except Exception as e:
+            logger.warning(f"Revocation stream unavailable during rebuild: {e}")
+            stream_id = None
+
+        jtis = list(self.loader())
+        bloom = BloomFilter(
+            capacity=int(max(len(jtis), 1000) * self.headroom),
+            false_positive_rate=self.false_positive_rate,
+            max_bits=self.max_bits,
+        )
+        for jti in jtis:
+            bloom.add(jti)
+
+        self._filter = bloom
+        self._built_at = time.monotonic()
+        self.rebuilds += 1
+        if stream_id is not None:
+            self._stream_id = stream_id
+            self._poll_stream()
+        else:
+            self._stream_healthy = False
+
+        logger.info(
+            f"Revocation filter rebuilt: {len(jtis)} entries, "
+            f"{bloom.memory_bytes} bytes, {bloom.num_hashes} hashes"
+        )
+
+    def _refresh_if_due(self) -> None:
+        now = time.monotonic()
+        rebuild_due = self._filter is None or now - self._built_at >= self.rebuild_interval
+        poll_due = now - self._polled_at >= self.poll_interval
+        if not (rebuild_due or poll_due):
+            return
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if rebuild_due:
+                self.rebuild()
+            else:
+                self._poll_stream()
+            self._polled_at = time.monotonic()
+        except Exception as e:
+            logger.error(f"Revocation filter refresh failed: {e}")
+        finally:
+            self._lock.release()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def might_contain(self, jti: str) -> bool:
+        """
+        Check the filter.
+
+        Returns False only when the JTI is definitely not revoked. Returns
+        True when it may be, or when the filter cannot currently be trusted.
+        """
+        self._refresh_if_due()
+        self.lookups += 1
+        current = self._filter
+        if current is None or not self._stream_healthy:
+            self.fall_throughs += 1
+            return True
+        if jti in current:
+            self.fall_throughs += 1
+            return True
+        self.negatives += 1
+        return False
+
+    def record_outcome(self, revoked: bool) -> None:
+        """Record the authoritative answer for a fall-through lookup"""
+        if revoked:
+            self.true_positives += 1
+        else:
+            self.false_positives += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Filter metrics"""
+        current = self._filter
+        checked_negatives = self.false_positives + self.negatives
+        return {
+            "entries": current.count if current else 0,
+            "capacity": current.capacity if current else 0,
+            "memory_bytes": current.memory_bytes if current else 0,
+            "hash_functions": current.num_hashes if current else 0,
+            "stream_healthy": self._stream_healthy,
+            "lookups": self.lookups,
+            "answered_in_memory": self.negatives,
+            "fall_throughs": self.fall_throughs,
+            "true_positives": self.true_positives,
+            "false_positives": self.false_positives,
+            "observed_false_positive_rate": (
+                self.false_positives / checked_negatives if checked_negatives else 0.0
+            ),
+            "estimated_false_positive_rate": (
+                current.estimated_false_positive_rate() if current else 0.0
+            ),
+            "rebuilds": self.rebuilds,
+        }
+
+
+def _load_revoked_jtis() -> List[str]:
+    """Load every unexpired revoked JTI using a dedicated session."""
+    from app.config.database import get_db_context
+    from app.repositories.auth.token_blacklist_repository import (
+        BlacklistedTokenRepository,
+    )
+
+    with get_db_context() as session:
+        return BlacklistedTokenRepository(session).get_active_jtis()
+
+
+# Per-process filter answering "definitely not revoked" in memory
+revocation_filter = RevocationFilter(
+    loader=_load_revoked_jtis,
+    redis_url=settings.redis.redis_url,
+)
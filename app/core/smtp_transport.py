@@ -0,0 +1,500 @@
+"""
+SMTP Transport
+
+Asynchronous SMTP delivery built on aiosmtplib with a bounded pool of
+authenticated, reusable connections. Connections are established lazily,
+recycled after a configurable number of messages or idle time, and
+transparently re-established when the server drops them.
+"""
+
+import asyncio
+import ssl
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from email.message import Message
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from email.utils import formataddr
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import aiosmtplib
+from jinja2 import Template
+
+from .config import settings
+from .exceptions import EmailDeliveryError
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class SMTPTransportConfig:
+    """SMTP transport configuration"""
+    host: str
+    port: int = 587
+    username: Optional[str] = None
+    password: Optional[str] = None
+    use_tls: bool = False
+    start_tls: bool = True
+    timeout: float = 30.0
+    pool_size: int = 5
+    max_messages_per_connection: int = 100
+    max_idle_seconds: float = 60.0
+    max_retries: int = 2
+
+    @classmethod
+    def from_settings(cls) -> "SMTPTransportConfig":
+        """Build configuration from notification settings"""
+        notifications = settings.notifications
+        return cls(
+            host=notifications.SMTP_HOST or "localhost",
+            port=notifications.SMTP_PORT,
+            username=notifications.SMTP_USERNAME,
+            password=notifications.SMTP_PASSWORD,
+            start_tls=notifications.SMTP_USE_TLS,
+            timeout=notifications.SMTP_TIMEOUT,
+            pool_size=notifications.SMTP_POOL_SIZE,
+            max_messages_per_connection=notifications.SMTP_MAX_MESSAGES_PER_CONNECTION,
+            max_idle_seconds=notifications.SMTP_MAX_IDLE_SECONDS,
+        )
+
+
+@dataclass
+class SMTPSendResult:
+    """Outcome of a single message delivery"""
+    recipient: str
+    success: bool
+    response: Optional[str] = None
+    error: Optional[str] = None
+    attempts: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            "recipient": self.recipient,
+            "success": self.success,
+            "response": self.response,
+            "error": self.error,
+            "attempts": self.attempts,
+        }
+
+
+@dataclass
+class _PooledConnection:
+    """Authenticated SMTP connection tracked by the pool"""
+    client: aiosmtplib.SMTP
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+    messages_sent: int = 0
+
+
+class SMTPConnectionPool:
+    """Bounded pool of authenticated aiosmtplib connections"""
+
+    def __init__(self, config: SMTPTransportConfig):
+        self.config = config
+        self._idle: asyncio.LifoQueue = asyncio.LifoQueue()
+        self._slots = asyncio.Semaphore(config.pool_size)
+        self._open_connections = 0
+        self._closed = False
+        self.stats = {
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "connections_recycled": 0,
+            "reconnects": 0,
+        }
+
+    async def acquire(self) -> _PooledConnection:
+        """Acquire a live connection, opening one if none are idle"""
+        if self._closed:
+            raise EmailDeliveryError("SMTP connection pool is closed")
+
+        await self._slots.acquire()
+        try:
+            while not self._idle.empty():
+                conn: _PooledConnection = self._idle.get_nowait()
+                if self.is_reusable(conn):
+                    self.stats["connections_reused"] += 1
+                    return conn
+                self.stats["connections_recycled"] += 1
+                await self._close_connection(conn)
+            return await self._open_connection()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, conn: _PooledConnection, discard: bool = False):
+        """Return a connection to the pool, or close it if unusable"""
+        try:
+            if discard or self._closed or not self.is_reusable(conn):
+                await self._close_connection(conn)
+            else:
+                conn.last_used_at = time.monotonic()
+                self._idle.put_nowait(conn)
+        finally:
+            self._slots.release()
+
+    async def close(self):
+        """Close every idle connection and reject further acquisitions"""
+        self._closed = True
+        while not self._idle.empty():
+            await self._close_connection(self._idle.get_nowait())
+
+    def is_reusable(self, conn: _PooledConnection) -> bool:
+        """Check whether a connection may serve another message"""
+        if not conn.client.is_connected:
+            return False
+        if conn.messages_sent >= self.config.max_messages_per_connection:
+            return False
+        return (time.monotonic() - conn.last_used_at) < self.config.max_idle_seconds
+
+    async def _open_connection(self) -> _PooledConnection:
+        client = aiosmtplib.SMTP(
+            hostname=self.config.host,
+            port=self.config.port,
+            use_tls=self.config.use_tls,
+            start_tls=self.config.start_tls and not self.config.use_tls,
+            timeout=self.config.timeout,
+            tls_context=ssl.create_default_context(),
+        )
+        try:
+            await client.connect()
+            if self.config.username and self.config.password:
+                await client.login(self.config.username, self.config.password)
+        except (aiosmtplib.SMTPException, OSError) as e:
+            if client.is_connected:
+                client.close()
+            raise EmailDeliveryError(
+                f"SMTP connection failed: {str(e)}", smtp_error=str(e)
+            )
+
+        self._open_connections += 1
+        self.stats["connections_opened"] += 1
+        return _PooledConnection(client=client)
+
+    async def _close_connection(self, conn: _PooledConnection):
+        self._open_connections = max(0, self._open_connections - 1)
+        if not conn.client.is_connected:
+            return
+        try:
+            await conn.client.quit()
+        except Exception:
+            conn.client.close()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get pool status"""
+        return {
+            "pool_size": self.config.pool_size,
+            "open_connections": self._open_connections,
+            "idle_connections": self._idle.qsize(),
+            "closed": self._closed,
+            **self.stats,
+        }
+
+
+class PooledSMTPTransport:
+    """
+    Async SMTP transport backed by a connection pool.
+
+    Single sends borrow a pooled connection; bulk sends fan out across up
+    to ``pool_size`` connections, each streaming its share of messages
+    back-to-back over one authenticated session.
+    """
+
+    _RETRYABLE_ERRORS = (
+        aiosmtplib.SMTPServerDisconnected,
+        aiosmtplib.SMTPConnectError,
+        aiosmtplib.SMTPTimeoutError,
+        ConnectionError,
+    )
+
+    def __init__(self, config: Optional[SMTPTransportConfig] = None):
+        self.config = config or SMTPTransportConfig.from_settings()
+        self._pool: Optional[SMTPConnectionPool] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_pool(self) -> SMTPConnectionPool:
+        loop = asyncio.get_running_loop()
+        if self._pool is None or self._loop is not loop:
+            # Pools are bound to the event loop that created them
+            self._pool = SMTPConnectionPool(self.config)
+            self._loop = loop
+        return self._pool
+
+    @property
+    def is_started(self) -> bool:
+        """Whether the transport is bound to a running event loop"""
+        return self._loop is not None and self._loop.is_running()
+
+    async def start(self):
+        """Bind the transport to the current event loop"""
+        self._get_pool()
+        logger.info(
+            f"SMTP transport started: {self.config.host}:{self.config.port} "
+            f"(pool_size={self.config.pool_size})"
+        )
+
+    async def close(self):
+        """Close pooled connections"""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+            self._loop = None
+
+    async def send_message(self, message: Message) -> SMTPSendResult:
+        """Send a single message, reconnecting on dropped connections"""
+        pool = self._get_pool()
+        return await self._send_with_retry(pool, message)
+
+    async def send_bulk(
+        self,
+        messages: Sequence[Message],
+        concurrency: Optional[int] = None,
+    ) -> List[SMTPSendResult]:
+        """
+        Send many messages over pooled connections.
+
+        Messages are partitioned across at most ``concurrency`` workers; each
+        worker holds one connection and sends its partition back-to-back,
+        avoiding a connect/STARTTLS/AUTH handshake per message.
+
+        Returns:
+            Results in the same order as ``messages``
+        """
+        if not messages:
+            return []
+
+        pool = self._get_pool()
+        workers = max(1, min(concurrency or self.config.pool_size, len(messages)))
+        results: List[Optional[SMTPSendResult]] = [None] * len(messages)
+
+        async def worker(offset: int):
+            conn: Optional[_PooledConnection] = None
+            try:
+                for index in range(offset, len(messages), workers):
+                    if conn is not None and not pool.is_reusable(conn):
+                        await pool.release(conn)
+                        conn = None
+                    if conn is None:
+                        conn = await pool.acquire()
+                    result, conn = await self._send_on_connection(
+                        pool, conn, messages[index]
+                    )
+                    results[index] = result
+            except EmailDeliveryError as e:
+                for index in range(offset, len(messages), workers):
+                    if results[index] is None:
+                        results[index] = SMTPSendResult(
+                            recipient=_recipient_of(messages[index]),
+                            success=False,
+                            error=str(e),
+                        )
+            finally:
+                if conn is not None:
+                    await pool.release(conn)
+
+        await asyncio.gather(*(worker(offset) for offset in range(workers)))
+
+        sent = sum(1 for r in results if r and r.success)
+        logger.info(f"SMTP bulk send completed: {sent}/{len(messages)} delivered")
+        return [
+            result if result is not None else SMTPSendResult(
+                recipient=_recipient_of(message),
+                success=False,
+                error="Message was not sent",
+            )
+            for message, result in zip(messages, results)
+        ]
+
+    def submit_bulk(
+        self,
+        messages: Sequence[Message],
+        on_complete: Optional[Callable[[List[SMTPSendResult]], None]] = None,
+    ) -> Optional[Future]:
+        """
+        Schedule a bulk send from synchronous code without blocking.
+
+        Safe to call from worker threads; the send runs on the event loop the
+        transport was started on. ``on_complete`` receives the results in
+        message order and runs in a worker thread, so it may block on the
+        database. Returns None if the transport has not been started, leaving
+        delivery to the background workers.
+        """
+        if not self.is_started:
+            return None
+        coro = self._send_bulk_and_report(messages, on_complete)
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            task = self._loop.create_task(coro)
+            future: Future = Future()
+            task.add_done_callback(lambda t: _copy_task_result(t, future))
+            return future
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    async def _send_bulk_and_report(
+        self,
+        messages: Sequence[Message],
+        on_complete: Optional[Callable[[List[SMTPSendResult]], None]],
+    ) -> List[SMTPSendResult]:
+        try:
+            results = await self.send_bulk(messages)
+        except Exception as e:
+            # Callers track claimed messages by their result; report every
+            # message as failed rather than leaving them unaccounted for
+            logger.error(f"SMTP bulk send failed: {str(e)}")
+            results = [
+                SMTPSendResult(recipient=_recipient_of(message), success=False, error=str(e))
+                for message in messages
+            ]
+        if on_complete is not None:
+            await asyncio.to_thread(on_complete, results)
+        return results
+
+    async def _send_with_retry(
+        self,
+        pool: SMTPConnectionPool,
+        message: Message,
+    ) -> SMTPSendResult:
+        conn = await pool.acquire()
+        try:
+            result, conn = await self._send_on_connection(pool, conn, message)
+            return result
+        finally:
+            if conn is not None:
+                await pool.release(conn)
+
+    async def _send_on_connection(
+        self,
+        pool: SMTPConnectionPool,
+        conn: _PooledConnection,
+        message: Message,
+    ):
+        """Send on ``conn``, swapping in a fresh connection if it was dropped"""
+        recipient = _recipient_of(message)
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                _, response = await conn.client.send_message(message)
+                conn.messages_sent += 1
+                return SMTPSendResult(
+                    recipient=recipient,
+                    success=True,
+                    response=response,
+                    attempts=attempts,
+                ), conn
+            except self._RETRYABLE_ERRORS as e:
+                await pool.release(conn, discard=True)
+                conn = None
+                if attempts > self.config.max_retries:
+                    return SMTPSendResult(
+                        recipient=recipient,
+                        success=False,
+                        error=str(e),
+                        attempts=attempts,
+                    ), None
+                pool.stats["reconnects"] += 1
+                logger.warning(f"SMTP connection lost, reconnecting: {str(e)}")
+                try:
+                    conn = await pool.acquire()
+                except EmailDeliveryError as reconnect_error:
+                    # The dropped connection is already released; hand back
+                    # None so callers do not release it a second time
+                    return SMTPSendResult(
+                        recipient=recipient,
+                        success=False,
+                        error=str(reconnect_error),
+                        attempts=attempts,
+                    ), None
+            except aiosmtplib.SMTPException as e:
+                # Recipient/message level rejection; the session is still usable
+                try:
+                    await conn.client.rset()
+                except aiosmtplib.SMTPException:
+                    await pool.release(conn, discard=True)
+                    conn = None
+                return SMTPSendResult(
+                    recipient=recipient,
+                    success=False,
+                    error=str(e),
+                    attempts=attempts,
+                ), conn
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get transport status"""
+        return {
+            "host": self.config.host,
+            "port": self.config.port,
+            "started": self.is_started,
+            "pool": self._pool.get_status() if self._pool else None,
+        }
+
+
+def build_bulk_messages(
+    recipients: Sequence[str],
+    subject: str,
+    html_body: str,
+    recipient_variables: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> List[MIMEMultipart]:
+    """
+    Build one MIME message per recipient.
+
+    Subject and body templates are compiled once and rendered for every
+    recipient when ``recipient_variables`` is supplied (recipients without an
+    entry render with no variables); otherwise they are sent verbatim.
+    """
+    sender = formataddr((
+        settings.notifications.EMAIL_FROM_NAME,
+        settings.notifications.EMAIL_FROM_ADDRESS,
+    ))
+    render = recipient_variables is not None
+    subject_template = Template(subject) if render else None
+    body_template = Template(html_body) if render else None
+
+    messages = []
+    for recipient in recipients:
+        variables = (recipient_variables or {}).get(recipient) or {}
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = subject_template.render(**variables) if render else subject
+        msg['From'] = sender
+        msg['To'] = str(recipient)
+        body = body_template.render(**variables) if render else html_body
+        msg.attach(MIMEText(body, 'html', 'utf-8'))
+        messages.append(msg)
+    return messages
+
+
+def _recipient_of(message: Message) -> str:
+    return message.get("To", "") or ""
+
+
+def _copy_task_result(task: asyncio.Task, future: Future):
+    if task.cancelled():
+        future.cancel()
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
+
+
+_smtp_transport: Optional[PooledSMTPTransport] = None
+
+
+def get_smtp_transport() -> PooledSMTPTransport:
+    """Get the process-wide SMTP transport"""
+    global _smtp_transport
+    if _smtp_transport is None:
+        _smtp_transport = PooledSMTPTransport()
+    return _smtp_transport
+
+
+async def close_smtp_transport():
+    """Close the process-wide SMTP transport"""
+    global _smtp_transport
+    if _smtp_transport is not None:
+        await _smtp_transport.close()
+        _smtp_transport = None
@@ -6,6 +6,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.router import router as api_v1_router  # This should now work
 from app.config.settings import settings
 from app.core.middleware import register_middlewares
+from app.core.notifications import notification_manager
+from app.core.smtp_transport import close_smtp_transport
 from app.db.init_db import init_db
 
 def create_app() -> FastAPI:
@@ -67,10 +69,17 @@ def create_app() -> FastAPI:
         if settings.ENVIRONMENT != "production":
             init_db()
         
+        # Binds the pooled SMTP transport to this loop for direct bulk sends
+        await notification_manager.initialize()
+        
         # Log router status on startup
         print(f"App started with {len(app.routes)} total routes")
         print(f"API v1 prefix: {settings.API_V1_STR}")
 
+    @app.on_event("shutdown")
+    async def on_shutdown() -> None:
+        await close_smtp_transport()
+
     return app
 
 app = create_app()
\ No newline at end of file
@@ -21,6 +21,7 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -178,6 +179,15 @@ class AnnouncementView(UUIDMixin, TimestampModel, BaseModel):
         Index("ix_announcement_views_device", "device_type"),
         Index("ix_announcement_views_source", "source"),
         Index("ix_announcement_views_announcement_student", "announcement_id", "student_id"),
+        # One row per session; repeat views in a session are upserted into it
+        Index(
+            "uq_announcement_views_announcement_student_session",
+            "announcement_id",
+            "student_id",
+            "session_id",
+            unique=True,
+            postgresql_where=text("session_id IS NOT NULL"),
+        ),
         CheckConstraint(
             "reading_time_seconds IS NULL OR (reading_time_seconds >= 0 AND reading_time_seconds <= 3600)",
             name="ck_announcement_views_reading_time",
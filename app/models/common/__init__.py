@@ -2,6 +2,8 @@
 Common models module.
 """
 from app.models.common.mixins import TimestampMixin, UUIDMixin, SoftDeleteMixin
+from app.models.common.outbox import OutboxMessage
+from app.models.common.cleanup_checkpoint import CleanupCheckpoint
 from app.models.common.enums import (
     LeaveStatus,
     LeaveType,
@@ -26,6 +28,9 @@ __all__ = [
     "TimestampMixin",
     "UUIDMixin", 
     "SoftDeleteMixin",
+    # Models
+    "OutboxMessage",
+    "CleanupCheckpoint",
     # Enums
     "LeaveStatus",
     "LeaveType",
@@ -0,0 +1,58 @@
+"""
+Resume points for chunked cleanup tasks.
+
+Each cleanup task records the last key it deleted in the same transaction
+as the chunk, so a cancelled or interrupted run resumes where it stopped
+instead of rescanning the rows it already walked past.
+"""
+
+from sqlalchemy import BigInteger, Column, DateTime, String
+
+from app.models.base.base_model import BaseModel
+from app.models.base.mixins import TimestampMixin
+
+
+class CleanupCheckpoint(BaseModel, TimestampMixin):
+    """
+    Progress of one cleanup target through its current pass.
+
+    ``cursor`` is the highest primary key deleted so far, or NULL when no
+    pass is in progress; it is cleared when a pass finds nothing left.
+    """
+
+    __tablename__ = "cleanup_checkpoints"
+
+    target = Column(
+        String(64),
+        nullable=False,
+        unique=True,
+        comment="Cleanup target (task and table)",
+    )
+
+    cursor = Column(
+        String(64),
+        nullable=True,
+        comment="Highest primary key deleted in the current pass",
+    )
+
+    rows_deleted = Column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        comment="Rows deleted in the current pass",
+    )
+
+    pass_started_at = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the current pass started",
+    )
+
+    last_completed_at = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the last pass finished",
+    )
+
+    def __repr__(self) -> str:
+        return f"<CleanupCheckpoint {self.target} cursor={self.cursor}>"
@@ -0,0 +1,101 @@
+"""
+Transactional outbox for side effects of committed transactions.
+
+Events, notification enqueues and outbound webhooks are recorded as outbox
+messages in the same transaction as the change that caused them, then
+delivered by the outbox relay after commit.
+"""
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from app.models.base.base_model import BaseModel
+from app.models.base.mixins import TimestampMixin
+
+
+class OutboxMessage(BaseModel, TimestampMixin):
+    """
+    Pending side effect awaiting delivery by the outbox relay.
+
+    ``available_at`` is when the message may next be claimed: creation
+    time for new messages, the retry time after a failure, or the lease
+    expiry while a relay worker holds it.
+    """
+
+    __tablename__ = "outbox_messages"
+
+    STATUS_PENDING = "pending"
+    STATUS_PROCESSING = "processing"
+    STATUS_DELIVERED = "delivered"
+    STATUS_DEAD = "dead"
+
+    CHANNEL_EVENT = "event"
+    CHANNEL_NOTIFICATION = "notification"
+    CHANNEL_WEBHOOK = "webhook"
+
+    channel = Column(
+        String(32),
+        nullable=False,
+        comment="Delivery channel (event, notification, webhook)",
+    )
+
+    topic = Column(
+        String(128),
+        nullable=False,
+        comment="Event type or routing key within the channel",
+    )
+
+    payload = Column(
+        JSONB,
+        nullable=False,
+        default=dict,
+        comment="Message payload",
+    )
+
+    status = Column(
+        String(20),
+        nullable=False,
+        default=STATUS_PENDING,
+        comment="Delivery status",
+    )
+
+    attempts = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Delivery attempts so far",
+    )
+
+    max_attempts = Column(
+        Integer,
+        nullable=False,
+        default=10,
+        comment="Attempts before the message is dead-lettered",
+    )
+
+    available_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Earliest time the message may be claimed",
+    )
+
+    delivered_at = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Successful delivery timestamp",
+    )
+
+    last_error = Column(
+        Text,
+        nullable=True,
+        comment="Error from the last failed attempt",
+    )
+
+    __table_args__ = (
+        Index("ix_outbox_messages_claim", "status", "available_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<OutboxMessage {self.channel}:{self.topic} {self.status}>"
@@ -42,7 +42,10 @@ from app.models.complaint.complaint_analytics import (
     ComplaintCategoryMetric,
     ComplaintStaffPerformance,
 )
-from app.models.complaint.complaint_assignment import ComplaintAssignment
+from app.models.complaint.complaint_assignment import (
+    ComplaintAssigneeWorkload,
+    ComplaintAssignment,
+)
 from app.models.complaint.complaint_comment import ComplaintComment
 from app.models.complaint.complaint_escalation import (
     AutoEscalationRule,
@@ -63,6 +66,7 @@ __all__ = [
     "ComplaintAnalyticSnapshot",
     "ComplaintCategoryMetric",
     "ComplaintStaffPerformance",
+    "ComplaintAssigneeWorkload",
     # Rules and configuration
     "AutoEscalationRule",
 ]
\ No newline at end of file
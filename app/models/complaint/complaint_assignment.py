@@ -10,11 +10,13 @@ from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import (
     CheckConstraint,
+    Float,
     ForeignKey,
     Index,
     Integer,
     String,
     Text,
+    UniqueConstraint,
     text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
@@ -27,7 +29,7 @@ if TYPE_CHECKING:
     from app.models.complaint.complaint import Complaint
     from app.models.user.user import User
 
-__all__ = ["ComplaintAssignment"]
+__all__ = ["ComplaintAssignment", "ComplaintAssigneeWorkload"]
 
 
 class ComplaintAssignment(BaseModel, TimestampMixin):
@@ -214,4 +216,138 @@ class ComplaintAssignment(BaseModel, TimestampMixin):
         """Calculate and update duration_hours."""
         if self.unassigned_at:
             delta = self.unassigned_at - self.assigned_at
-            self.duration_hours = int(delta.total_seconds() / 3600)
\ No newline at end of file
+            self.duration_hours = int(delta.total_seconds() / 3600)
+
+class ComplaintAssigneeWorkload(BaseModel, TimestampMixin):
+    """
+    Materialized open workload per assignee and hostel.
+    
+    Maintained by ComplaintAssignmentRepository in the same transaction as
+    the assignment, reassignment, resolution and reopen transitions, so
+    assignee selection reads one row per candidate instead of aggregating
+    complaint_assignments.
+    
+    Attributes:
+        assignee_id: User ID of assignee
+        hostel_id: Hostel the workload belongs to
+        
+        open_count: Current assignments on unresolved complaints
+        workload_score: Sum of workload scores of those assignments
+        
+        total_assignments: Assignments received (lifetime)
+        total_reassignments: Assignments taken away by reassignment (lifetime)
+        recent_assignments: Exponentially decayed assignments received
+        recent_reassignments: Exponentially decayed assignments taken away
+        decayed_at: Time the recent_* counters were last decayed to
+        
+        last_assigned_at: Most recent assignment timestamp
+    """
+
+    __tablename__ = "complaint_assignee_workloads"
+    __table_args__ = (
+        UniqueConstraint(
+            "assignee_id",
+            "hostel_id",
+            name="uq_complaint_assignee_workloads_assignee_hostel",
+        ),
+        Index(
+            "ix_complaint_assignee_workloads_hostel_score",
+            "hostel_id",
+            "workload_score",
+        ),
+        CheckConstraint(
+            "open_count >= 0",
+            name="check_workload_open_count_positive",
+        ),
+        CheckConstraint(
+            "workload_score >= 0",
+            name="check_workload_total_score_positive",
+        ),
+        
+        {"comment": "Materialized open workload per complaint assignee"},
+    )
+
+    assignee_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="User ID of assignee",
+    )
+    
+    hostel_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("hostels.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Hostel the workload belongs to",
+    )
+
+    # Open Workload
+    open_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+        comment="Current assignments on unresolved complaints",
+    )
+    
+    workload_score: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+        comment="Sum of workload scores of open assignments",
+    )
+
+    # Reassignment Tracking
+    total_assignments: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+        comment="Assignments received",
+    )
+    
+    total_reassignments: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+        comment="Assignments taken away by reassignment",
+    )
+    
+    recent_assignments: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        default=0.0,
+        server_default=text("0"),
+        comment="Exponentially decayed assignments received",
+    )
+    
+    recent_reassignments: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        default=0.0,
+        server_default=text("0"),
+        comment="Exponentially decayed assignments taken away",
+    )
+    
+    decayed_at: Mapped[datetime] = mapped_column(
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        comment="Time the recent counters were last decayed to",
+    )
+    
+    last_assigned_at: Mapped[Optional[datetime]] = mapped_column(
+        nullable=True,
+        comment="Most recent assignment timestamp",
+    )
+
+    def __repr__(self) -> str:
+        """String representation of ComplaintAssigneeWorkload."""
+        return (
+            f"<ComplaintAssigneeWorkload(assignee_id={self.assignee_id}, "
+            f"hostel_id={self.hostel_id}, "
+            f"open_count={self.open_count}, "
+            f"workload_score={self.workload_score})>"
+        )
@@ -21,8 +21,11 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    func,
+    literal_column,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import uuid
 
@@ -41,6 +44,8 @@ if TYPE_CHECKING:
     from app.models.leave.leave_approval import LeaveApproval
 
 __all__ = [
+    "ACTIVE_LEAVE_STATUSES",
+    "leave_period",
     "LeaveApplication",
     "LeaveCancellation",
     "LeaveDocument",
@@ -48,6 +53,19 @@ __all__ = [
     "LeaveStatusHistory",
 ]
 
+# Statuses that occupy a student's calendar; two of these may not overlap
+ACTIVE_LEAVE_STATUSES = (LeaveStatus.PENDING, LeaveStatus.APPROVED)
+
+
+def leave_period(from_date, to_date):
+    """
+    Build the inclusive daterange of a leave period.
+    
+    Overlap queries must use this same expression as the exclusion
+    constraint for PostgreSQL to answer them from its GiST index.
+    """
+    return func.daterange(from_date, to_date, literal_column("'[]'"))
+
 
 class LeaveApplication(BaseModel, TimestampModel, UUIDMixin, AuditMixin, SoftDeleteMixin):
     """
@@ -409,6 +427,10 @@ class LeaveApplication(BaseModel, TimestampModel, UUIDMixin, AuditMixin, SoftDel
             f"to={self.to_date}, status={self.status.value})>"
         )
 
+    def overlaps(self, from_date: Date, to_date: Date) -> bool:
+        """Check if this leave shares a day with an inclusive date range."""
+        return self.from_date <= to_date and from_date <= self.to_date
+
     @property
     def is_active(self) -> bool:
         """Check if leave is currently active."""
@@ -453,6 +475,31 @@ class LeaveApplication(BaseModel, TimestampModel, UUIDMixin, AuditMixin, SoftDel
         return (self.to_date - Date.today()).days + 1
 
 
+# No two pending/approved leaves of a student may overlap. Enforced by a GiST
+# exclusion constraint on PostgreSQL (requires the btree_gist extension for
+# the student_id equality); other dialects fall back to the in-memory check
+# in LeaveApplicationRepository.
+LeaveApplication.__table__.append_constraint(
+    ExcludeConstraint(
+        (LeaveApplication.__table__.c.student_id, "="),
+        (
+            leave_period(
+                LeaveApplication.__table__.c.from_date,
+                LeaveApplication.__table__.c.to_date,
+            ),
+            "&&",
+        ),
+        name="ex_leave_application_student_period",
+        using="gist",
+        where=text(
+            "deleted_at IS NULL AND status IN ("
+            + ", ".join(f"'{status.name}'" for status in ACTIVE_LEAVE_STATUSES)
+            + ")"
+        ),
+    ).ddl_if(dialect="postgresql")
+)
+
+
 class LeaveCancellation(BaseModel, TimestampModel, UUIDMixin):
     """
     Leave cancellation request tracking.
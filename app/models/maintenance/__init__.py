@@ -10,6 +10,8 @@ and analytics.
 from app.models.maintenance.maintenance_analytics import (
     CategoryPerformanceMetric,
     MaintenanceAnalytic,
+    MaintenanceDailyRollup,
+    MaintenanceRollupWatermark,
 )
 from app.models.maintenance.maintenance_approval import (
     ApprovalThreshold,
@@ -81,4 +83,6 @@ __all__ = [
     # Analytics models
     "MaintenanceAnalytic",
     "CategoryPerformanceMetric",
+    "MaintenanceDailyRollup",
+    "MaintenanceRollupWatermark",
 ]
\ No newline at end of file
@@ -20,6 +20,7 @@ from sqlalchemy import (
     Integer,
     Numeric,
     String,
+    UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship, validates
@@ -541,4 +542,131 @@ class CategoryPerformanceMetric(UUIDMixin, BaseModel):
         return round(
             self.total_cost / Decimal(self.completed_requests),
             2
-        )
\ No newline at end of file
+        )
+
+
+class MaintenanceDailyRollup(UUIDMixin, BaseModel):
+    """
+    Additive daily maintenance rollup per hostel and category.
+    
+    Every measure is a sum or count so any period can be derived by
+    adding daily rows. Medians are derived from log-bucketed histograms
+    (bucket -> count) which also merge by addition.
+    """
+    
+    __tablename__ = "maintenance_daily_rollups"
+    
+    hostel_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("hostels.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Hostel ID",
+    )
+    
+    rollup_date = Column(
+        Date,
+        nullable=False,
+        comment="Day of request creation",
+    )
+    
+    category = Column(
+        String(100),
+        nullable=False,
+        comment="Maintenance category",
+    )
+    
+    # Request counts
+    total_requests = Column(Integer, nullable=False, default=0)
+    completed_requests = Column(Integer, nullable=False, default=0)
+    pending_requests = Column(Integer, nullable=False, default=0)
+    cancelled_requests = Column(Integer, nullable=False, default=0)
+    critical_requests = Column(Integer, nullable=False, default=0)
+    urgent_requests = Column(Integer, nullable=False, default=0)
+    high_requests = Column(Integer, nullable=False, default=0)
+    
+    # Completion time
+    completion_hours_sum = Column(
+        Numeric(14, 2),
+        nullable=False,
+        default=Decimal("0.00"),
+        comment="Sum of completion times (hours) of completed requests",
+    )
+    completion_count = Column(Integer, nullable=False, default=0)
+    on_time_count = Column(Integer, nullable=False, default=0)
+    completion_hours_histogram = Column(
+        JSONB,
+        nullable=False,
+        default={},
+        comment="Log-bucketed completion hours histogram",
+    )
+    
+    # Costs
+    cost_total = Column(
+        Numeric(14, 2),
+        nullable=False,
+        default=Decimal("0.00"),
+        comment="Sum of actual costs",
+    )
+    cost_count = Column(Integer, nullable=False, default=0, comment="Cost records with actual cost")
+    cost_variance_sum = Column(Numeric(14, 2), nullable=False, default=Decimal("0.00"))
+    cost_variance_count = Column(Integer, nullable=False, default=0)
+    within_budget_count = Column(Integer, nullable=False, default=0)
+    cost_histogram = Column(
+        JSONB,
+        nullable=False,
+        default={},
+        comment="Log-bucketed per-request cost histogram",
+    )
+    
+    # Quality
+    completions_count = Column(Integer, nullable=False, default=0)
+    quality_checked_count = Column(Integer, nullable=False, default=0)
+    quality_rating_sum = Column(Numeric(10, 2), nullable=False, default=Decimal("0.00"))
+    quality_rating_count = Column(Integer, nullable=False, default=0)
+    rework_count = Column(Integer, nullable=False, default=0)
+    
+    refreshed_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=datetime.utcnow,
+        comment="When this rollup row was computed",
+    )
+    
+    __table_args__ = (
+        UniqueConstraint(
+            "hostel_id", "rollup_date", "category",
+            name="uq_maintenance_rollup_hostel_date_category"
+        ),
+        Index("idx_maintenance_rollup_hostel_date", "hostel_id", "rollup_date"),
+        {"comment": "Daily additive maintenance rollups"}
+    )
+    
+    def __repr__(self) -> str:
+        return f"<MaintenanceDailyRollup {self.hostel_id} {self.rollup_date} {self.category}>"
+
+
+class MaintenanceRollupWatermark(UUIDMixin, BaseModel):
+    """
+    High-water mark of source updated_at already folded into rollups.
+    
+    Scope is "all" for system-wide refreshes or a hostel ID for
+    single-hostel refreshes.
+    """
+    
+    __tablename__ = "maintenance_rollup_watermarks"
+    
+    scope = Column(
+        String(64),
+        nullable=False,
+        unique=True,
+        comment="Refresh scope ('all' or hostel ID)",
+    )
+    
+    high_water_mark = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Latest source updated_at folded into rollups",
+    )
+    
+    def __repr__(self) -> str:
+        return f"<MaintenanceRollupWatermark {self.scope} {self.high_water_mark}>"
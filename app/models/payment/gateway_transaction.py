@@ -659,6 +659,7 @@ class GatewayTransaction(UUIDMixin, TimestampModel, SoftDeleteMixin):
         Index("idx_gateway_type", "transaction_type"),
         Index("idx_gateway_name_status", "gateway_name", "transaction_status"),
         Index("idx_gateway_name_type", "gateway_name", "transaction_type"),
+        Index("idx_gateway_name_updated_at", "gateway_name", "updated_at"),
         Index("idx_gateway_verified", "is_verified"),
         Index("idx_gateway_reconciled", "is_reconciled"),
         Index("idx_gateway_webhook_event", "webhook_event_type"),
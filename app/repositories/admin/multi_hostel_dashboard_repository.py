@@ -7,7 +7,7 @@ performance comparisons, and portfolio-wide insights.
 
 from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, time, timedelta
 from decimal import Decimal
 from sqlalchemy import select, and_, or_, func, desc, asc, case
 from sqlalchemy.orm import Session, selectinload, joinedload
@@ -21,12 +21,18 @@ from app.models.admin.multi_hostel_dashboard import (
     DashboardSnapshot
 )
 from app.models.admin.admin_user import AdminUser
+from app.models.admin.admin_hostel_assignment import AdminHostelAssignment
+from app.models.admin.hostel_selector import HostelQuickStats
 from app.models.hostel.hostel import Hostel
+from app.models.maintenance.maintenance_request import MaintenanceRequest
+from app.models.payment.payment import Payment
+from app.models.user.user import User
 from app.repositories.base.base_repository import BaseRepository
 from app.core.exceptions import (
     EntityNotFoundError,
     ValidationError
 )
+from app.schemas.common.enums import MaintenanceStatus, PaymentStatus
 
 
 class MultiHostelDashboardRepository(BaseRepository[MultiHostelDashboard]):
@@ -305,6 +311,172 @@ class MultiHostelDashboardRepository(BaseRepository[MultiHostelDashboard]):
         else:
             return 'low'
 
+    # ==================== PORTFOLIO OVERVIEW ====================
+
+    def get_portfolio_overview(
+        self,
+        admin_id: UUID,
+        start_date: date,
+        end_date: date
+    ) -> List[Dict[str, Any]]:
+        """
+        Get per-hostel stats and portfolio totals for an admin in one query.
+
+        Joins the admin's active assignments to their hostels and cached
+        quick stats, and computes the portfolio totals as window aggregates
+        over the same result, so the whole dashboard is one round trip
+        regardless of how many hostels the admin manages.
+
+        Revenue and task counts cover the requested period and are grouped
+        per hostel in subqueries of the same statement; occupancy, alerts,
+        open complaints and outstanding payments are current values from
+        the cached quick stats.
+
+        Args:
+            admin_id: Admin user ID
+            start_date: Period start
+            end_date: Period end (inclusive)
+
+        Returns:
+            One row per hostel; portfolio_* keys repeat the totals on every row
+        """
+        def stat(column, default=0):
+            return func.coalesce(column, default)
+
+        period_start = datetime.combine(start_date, time.min)
+        period_end = datetime.combine(end_date + timedelta(days=1), time.min)
+        today_start = datetime.combine(date.today(), time.min)
+
+        admin_hostels = select(AdminHostelAssignment.hostel_id).where(
+            AdminHostelAssignment.admin_id == admin_id,
+            AdminHostelAssignment.is_active.is_(True),
+            AdminHostelAssignment.is_deleted.is_(False)
+        )
+
+        period_revenue = (
+            select(
+                Payment.hostel_id,
+                func.sum(Payment.amount).label('revenue'),
+            )
+            .where(
+                Payment.hostel_id.in_(admin_hostels),
+                Payment.deleted_at.is_(None),
+                Payment.payment_status == PaymentStatus.COMPLETED,
+                Payment.paid_at >= period_start,
+                Payment.paid_at < period_end
+            )
+            .group_by(Payment.hostel_id)
+            .subquery('period_revenue')
+        )
+
+        done = MaintenanceRequest.status.in_([
+            MaintenanceStatus.COMPLETED,
+            MaintenanceStatus.REJECTED,
+            MaintenanceStatus.CANCELLED,
+        ])
+        period_tasks = (
+            select(
+                MaintenanceRequest.hostel_id,
+                func.count(MaintenanceRequest.id).label('total_tasks'),
+                func.count(MaintenanceRequest.id).filter(~done).label('open_tasks'),
+                func.count(MaintenanceRequest.id).filter(
+                    and_(~done, MaintenanceRequest.deadline < func.now())
+                ).label('overdue_tasks'),
+                func.count(MaintenanceRequest.id).filter(
+                    and_(
+                        MaintenanceRequest.status == MaintenanceStatus.COMPLETED,
+                        MaintenanceRequest.completed_at >= today_start
+                    )
+                ).label('completed_today'),
+            )
+            .where(
+                MaintenanceRequest.hostel_id.in_(admin_hostels),
+                MaintenanceRequest.is_deleted.is_(False),
+                MaintenanceRequest.created_at >= period_start,
+                MaintenanceRequest.created_at < period_end
+            )
+            .group_by(MaintenanceRequest.hostel_id)
+            .subquery('period_tasks')
+        )
+
+        students = stat(HostelQuickStats.total_students)
+        active_students = stat(HostelQuickStats.active_students)
+        capacity = stat(HostelQuickStats.total_capacity, Hostel.total_beds)
+        occupancy = stat(HostelQuickStats.occupancy_percentage, Decimal('0.00'))
+        pending_tasks = stat(HostelQuickStats.pending_tasks)
+        urgent_alerts = stat(HostelQuickStats.urgent_alerts)
+        open_complaints = stat(HostelQuickStats.open_complaints)
+        revenue = stat(period_revenue.c.revenue, Decimal('0.00'))
+        outstanding = stat(HostelQuickStats.outstanding_payments, Decimal('0.00'))
+        total_tasks = stat(period_tasks.c.total_tasks)
+        open_tasks = stat(period_tasks.c.open_tasks)
+        overdue_tasks = stat(period_tasks.c.overdue_tasks)
+        completed_today = stat(period_tasks.c.completed_today)
+
+        stmt = (
+            select(
+                Hostel.id.label('hostel_id'),
+                Hostel.name.label('hostel_name'),
+                Hostel.city.label('hostel_city'),
+                Hostel.hostel_type.label('hostel_type'),
+                AdminHostelAssignment.is_primary,
+                AdminHostelAssignment.permission_level,
+                AdminHostelAssignment.last_accessed,
+                AdminHostelAssignment.access_count,
+                User.full_name.label('admin_name'),
+                students.label('total_students'),
+                active_students.label('active_students'),
+                capacity.label('capacity'),
+                stat(HostelQuickStats.available_beds, Hostel.available_beds).label('available_beds'),
+                occupancy.label('occupancy_percentage'),
+                pending_tasks.label('pending_tasks'),
+                total_tasks.label('total_tasks'),
+                open_tasks.label('open_tasks'),
+                overdue_tasks.label('overdue_tasks'),
+                completed_today.label('completed_today'),
+                urgent_alerts.label('urgent_alerts'),
+                stat(HostelQuickStats.pending_bookings).label('pending_bookings'),
+                open_complaints.label('open_complaints'),
+                revenue.label('revenue_this_month'),
+                outstanding.label('outstanding_payments'),
+                HostelQuickStats.collection_rate,
+                HostelQuickStats.avg_student_rating,
+                HostelQuickStats.student_satisfaction_score,
+                stat(HostelQuickStats.health_score, Decimal('0.00')).label('health_score'),
+                func.count().over().label('portfolio_hostels'),
+                func.count(Hostel.id).filter(Hostel.is_active.is_(True)).over()
+                .label('portfolio_active_hostels'),
+                func.sum(students).over().label('portfolio_students'),
+                func.sum(active_students).over().label('portfolio_active_students'),
+                func.sum(capacity).over().label('portfolio_capacity'),
+                func.avg(occupancy).over().label('portfolio_avg_occupancy'),
+                func.sum(pending_tasks).over().label('portfolio_pending_tasks'),
+                func.sum(total_tasks).over().label('portfolio_total_tasks'),
+                func.sum(open_tasks).over().label('portfolio_open_tasks'),
+                func.sum(overdue_tasks).over().label('portfolio_overdue_tasks'),
+                func.sum(completed_today).over().label('portfolio_completed_today'),
+                func.sum(urgent_alerts).over().label('portfolio_urgent_alerts'),
+                func.sum(open_complaints).over().label('portfolio_open_complaints'),
+                func.sum(revenue).over().label('portfolio_revenue'),
+                func.sum(outstanding).over().label('portfolio_outstanding'),
+                func.avg(HostelQuickStats.avg_student_rating).over()
+                .label('portfolio_avg_rating'),
+            )
+            .select_from(AdminHostelAssignment)
+            .join(Hostel, Hostel.id == AdminHostelAssignment.hostel_id)
+            .join(AdminUser, AdminUser.id == AdminHostelAssignment.admin_id)
+            .outerjoin(User, User.id == AdminUser.user_id)
+            .outerjoin(HostelQuickStats, HostelQuickStats.hostel_id == Hostel.id)
+            .outerjoin(period_revenue, period_revenue.c.hostel_id == Hostel.id)
+            .outerjoin(period_tasks, period_tasks.c.hostel_id == Hostel.id)
+            .where(AdminHostelAssignment.admin_id == admin_id)
+            .where(AdminHostelAssignment.is_active.is_(True))
+            .where(AdminHostelAssignment.is_deleted.is_(False))
+            .order_by(desc(AdminHostelAssignment.is_primary), Hostel.name)
+        )
+
+        return [dict(row) for row in self.db.execute(stmt).mappings()]
+
     # ==================== CROSS-HOSTEL METRICS ====================
 
     async def _refresh_cross_hostel_metrics(
@@ -71,6 +71,11 @@ from app.repositories.announcement.announcement_tracking_repository import (
 from app.repositories.announcement.announcement_aggregate_repository import (
     AnnouncementAggregateRepository,
 )
+from app.repositories.announcement.audience_bitmap_index import (
+    AudienceBitmapIndex,
+    AudienceIndexCache,
+    audience_indexes,
+)
 
 # Public API
 __all__ = [
@@ -89,6 +94,11 @@ __all__ = [
     "ActiveAnnouncementsSpec",
     "UrgentAnnouncementsSpec",
     "RequiresAcknowledgmentSpec",
+    
+    # Audience Index
+    "AudienceBitmapIndex",
+    "AudienceIndexCache",
+    "audience_indexes",
 ]
 
 # Package metadata
@@ -9,8 +9,9 @@ from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from decimal import Decimal
 from collections import defaultdict
+import random
 
-from sqlalchemy import and_, or_, func, select, case
+from sqlalchemy import and_, or_, func, select, case, update
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.sql import Select
 
@@ -210,7 +211,8 @@ class AnnouncementDeliveryRepository(BaseRepository[AnnouncementDelivery]):
         delivery_id: UUID,
         failure_reason: str,
         failure_code: Optional[str] = None,
-        is_permanent: bool = False
+        is_permanent: bool = False,
+        retry_at: Optional[datetime] = None
     ) -> AnnouncementDelivery:
         """
         Mark delivery as failed.
@@ -220,6 +222,7 @@ class AnnouncementDeliveryRepository(BaseRepository[AnnouncementDelivery]):
             failure_reason: Reason for failure
             failure_code: Error code
             is_permanent: Whether failure is permanent
+            retry_at: When to retry (default: jittered exponential backoff)
             
         Returns:
             Updated delivery record
@@ -242,11 +245,108 @@ class AnnouncementDeliveryRepository(BaseRepository[AnnouncementDelivery]):
         
         # Schedule retry if not permanent and under limit
         if not is_permanent and delivery.retry_count < delivery.max_retries:
-            self._schedule_retry(delivery)
+            self._schedule_retry(delivery, retry_at=retry_at)
         
         self.session.flush()
         return delivery
     
+    def claim_due_deliveries(
+        self,
+        batch_size: int = 100,
+        lease_seconds: int = 300,
+        channel: Optional[str] = None
+    ) -> List[AnnouncementDelivery]:
+        """
+        Claim due pending deliveries for processing.
+        
+        Rows are locked with FOR UPDATE SKIP LOCKED so concurrent workers
+        never claim the same delivery, marked processing and committed.
+        Deliveries held by a worker that died are reclaimed once they have
+        been processing for longer than ``lease_seconds``.
+        
+        Args:
+            batch_size: Maximum deliveries to claim
+            lease_seconds: Lease duration
+            channel: Optional channel filter
+            
+        Returns:
+            Claimed deliveries
+        """
+        now = datetime.utcnow()
+        
+        query = (
+            select(AnnouncementDelivery)
+            .where(
+                or_(
+                    and_(
+                        AnnouncementDelivery.status == 'pending',
+                        or_(
+                            AnnouncementDelivery.scheduled_for.is_(None),
+                            AnnouncementDelivery.scheduled_for <= now
+                        ),
+                        or_(
+                            AnnouncementDelivery.next_retry_at.is_(None),
+                            AnnouncementDelivery.next_retry_at <= now
+                        )
+                    ),
+                    and_(
+                        AnnouncementDelivery.status == 'processing',
+                        AnnouncementDelivery.updated_at < now - timedelta(seconds=lease_seconds)
+                    )
+                )
+            )
+            .order_by(AnnouncementDelivery.created_at.asc())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        
+        if channel:
+            query = query.where(AnnouncementDelivery.channel == channel)
+        
+        deliveries = list(self.session.execute(query).scalars().all())
+        
+        for delivery in deliveries:
+            delivery.status = 'processing'
+            delivery.updated_at = now
+        
+        self.session.commit()
+        return deliveries
+    
+    def complete_deliveries(self, delivery_ids: List[UUID]) -> int:
+        """
+        Mark claimed deliveries delivered in one statement.
+        
+        Args:
+            delivery_ids: Delivery UUIDs
+            
+        Returns:
+            Number of deliveries updated
+        """
+        if not delivery_ids:
+            return 0
+        
+        now = datetime.utcnow()
+        result = self.session.execute(
+            update(AnnouncementDelivery)
+            .where(AnnouncementDelivery.id.in_(delivery_ids))
+            .values(
+                is_delivered=True,
+                delivered_at=now,
+                status='completed',
+                next_retry_at=None,
+                delivery_time_seconds=case(
+                    (
+                        AnnouncementDelivery.scheduled_for.isnot(None),
+                        func.extract('epoch', now - AnnouncementDelivery.scheduled_for)
+                    ),
+                    else_=None
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.session.commit()
+        return result.rowcount
+    
     # ==================== Batch Processing ====================
     
     def create_delivery_batch(
@@ -635,15 +735,24 @@ class AnnouncementDeliveryRepository(BaseRepository[AnnouncementDelivery]):
         self.session.add(failure)
         return failure
     
-    def _schedule_retry(self, delivery: AnnouncementDelivery) -> DeliveryRetry:
+    def _schedule_retry(
+        self,
+        delivery: AnnouncementDelivery,
+        retry_at: Optional[datetime] = None
+    ) -> DeliveryRetry:
         """Schedule delivery retry."""
         delivery.retry_count += 1
+        now = datetime.utcnow()
         
-        # Calculate delay with exponential backoff
-        delay_minutes = 2 ** delivery.retry_count  # 2, 4, 8, 16...
-        delay = timedelta(minutes=min(delay_minutes, 60))  # Max 1 hour
+        if retry_at is not None:
+            delay = max(retry_at - now, timedelta(0))
+        else:
+            # Exponential backoff (2, 4, 8... minutes, max 1 hour) with jitter
+            # so deliveries that failed together don't retry together
+            ceiling = min(2 ** delivery.retry_count, 60) * 60
+            delay = timedelta(seconds=random.uniform(ceiling / 2, ceiling))
         
-        delivery.next_retry_at = datetime.utcnow() + delay
+        delivery.next_retry_at = now + delay
         delivery.status = 'pending'
         
         # Record retry
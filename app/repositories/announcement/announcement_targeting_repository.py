@@ -23,8 +23,13 @@ from app.models.announcement import (
 from app.models.base.enums import TargetAudience, RoomType
 from app.models.user.user import User
 from app.models.room.room import Room
+from app.models.student.student import Student
 from app.repositories.base.base_repository import BaseRepository
 from app.repositories.base.query_builder import QueryBuilder
+from app.repositories.announcement.audience_bitmap_index import (
+    AudienceBitmapIndex,
+    audience_indexes,
+)
 from app.core.exceptions import (
     ResourceNotFoundError,
     ValidationError,
@@ -80,9 +85,9 @@ class AnnouncementTargetingRepository(BaseRepository[AnnouncementTarget]):
         self.session.add(target)
         self.session.flush()
         
-        # Calculate recipients
-        student_ids = self._calculate_target_audience(target)
-        target.estimated_recipients = len(student_ids)
+        # Estimate recipients from bitmap cardinality
+        index, bits = self._resolve_target_audience(target)
+        target.estimated_recipients = index.count(bits)
         
         # Validate targeting
         self._validate_targeting(target)
@@ -132,9 +137,9 @@ class AnnouncementTargetingRepository(BaseRepository[AnnouncementTarget]):
         
         self.session.flush()
         
-        # Calculate recipients
-        student_ids = self._calculate_target_audience(target)
-        target.estimated_recipients = len(student_ids)
+        # Estimate recipients from bitmap cardinality
+        index, bits = self._resolve_target_audience(target)
+        target.estimated_recipients = index.count(bits)
         target.is_validated = True
         target.validated_at = datetime.utcnow()
         
@@ -163,10 +168,11 @@ class AnnouncementTargetingRepository(BaseRepository[AnnouncementTarget]):
             )
         
         # Calculate audience
-        student_ids = self._calculate_target_audience(target)
+        index, bits = self._resolve_target_audience(target)
+        student_ids = index.ids(bits)
         
         # Get detailed breakdown
-        breakdown = self._get_audience_breakdown(student_ids)
+        breakdown = self._get_audience_breakdown(index, bits)
         
         # Update target
         target.actual_recipients = len(student_ids)
@@ -392,35 +398,37 @@ class AnnouncementTargetingRepository(BaseRepository[AnnouncementTarget]):
         """
         cutoff_time = datetime.utcnow() - timedelta(hours=timeframe_hours)
         
-        # Count announcements received by each student
+        if not student_ids:
+            return [], []
+        
+        # Only students at the limit come back from the database
         from app.models.announcement import AnnouncementRecipient
         
-        announcement_counts = (
-            self.session.query(
-                AnnouncementRecipient.student_id,
-                func.count(AnnouncementRecipient.id).label('count')
-            )
-            .filter(
-                AnnouncementRecipient.student_id.in_(student_ids),
-                AnnouncementRecipient.created_at >= cutoff_time
+        saturated = {
+            str(student_id)
+            for (student_id,) in (
+                self.session.query(AnnouncementRecipient.student_id)
+                .filter(
+                    AnnouncementRecipient.student_id.in_(student_ids),
+                    AnnouncementRecipient.created_at >= cutoff_time
+                )
+                .group_by(AnnouncementRecipient.student_id)
+                .having(func.count(AnnouncementRecipient.id) >= max_announcements)
+                .all()
             )
-            .group_by(AnnouncementRecipient.student_id)
-            .all()
-        )
+        }
         
-        # Build count dictionary
-        student_counts = {str(sid): count for sid, count in announcement_counts}
+        if not saturated:
+            return list(student_ids), []
         
-        # Filter students
         eligible = []
         filtered_out = []
         
         for student_id in student_ids:
-            count = student_counts.get(str(student_id), 0)
-            if count < max_announcements:
-                eligible.append(student_id)
-            else:
+            if str(student_id) in saturated:
                 filtered_out.append(student_id)
+            else:
+                eligible.append(student_id)
         
         return eligible, filtered_out
     
@@ -487,27 +495,36 @@ class AnnouncementTargetingRepository(BaseRepository[AnnouncementTarget]):
             .all()
         )
         
-        # Calculate audiences for each target
-        audience_sets = []
-        for target in targets:
-            student_ids = self._calculate_target_audience(target)
-            audience_sets.append(set(student_ids))
-        
-        # Combine based on mode
-        if bulk_rule.combine_mode == 'union':
-            final_audience = set.union(*audience_sets) if audience_sets else set()
-        elif bulk_rule.combine_mode == 'intersection':
-            final_audience = set.intersection(*audience_sets) if audience_sets else set()
-        else:
+        if bulk_rule.combine_mode not in ('union', 'intersection'):
             raise ValidationError(f"Invalid combine mode: {bulk_rule.combine_mode}")
         
-        # Apply global exclusions
-        if bulk_rule.global_exclude_student_ids:
-            exclusions = set(bulk_rule.global_exclude_student_ids)
-            final_audience = final_audience - exclusions
+        # Resolve each target to a bitmap of its hostel's index
+        audiences = [self._resolve_target_audience(target) for target in targets]
+        
+        if len({str(index.hostel_id) for index, _ in audiences}) <= 1:
+            # Same hostel: combine bitmaps directly
+            index = audiences[0][0] if audiences else None
+            final_bits = 0
+            for position, (_, bits) in enumerate(audiences):
+                if bulk_rule.combine_mode == 'union' or position == 0:
+                    final_bits |= bits
+                else:
+                    final_bits &= bits
+            if index is not None and bulk_rule.global_exclude_student_ids:
+                final_bits &= ~index.students(bulk_rule.global_exclude_student_ids)
+            final_audience = index.ids(final_bits) if index is not None else []
+        else:
+            audience_sets = [set(index.ids(bits)) for index, bits in audiences]
+            if bulk_rule.combine_mode == 'union':
+                combined = set.union(*audience_sets)
+            else:
+                combined = set.intersection(*audience_sets)
+            if bulk_rule.global_exclude_student_ids:
+                combined -= {UUID(str(sid)) for sid in bulk_rule.global_exclude_student_ids}
+            final_audience = list(combined)
         
         # Update bulk rule
-        bulk_rule.final_student_ids = list(final_audience)
+        bulk_rule.final_student_ids = final_audience
         bulk_rule.final_count = len(final_audience)
         bulk_rule.is_processed = True
         bulk_rule.processed_at = datetime.utcnow()
@@ -545,8 +562,9 @@ class AnnouncementTargetingRepository(BaseRepository[AnnouncementTarget]):
         if cache.is_stale and refresh_if_stale:
             target = self._get_target_by_announcement(announcement_id)
             if target:
-                student_ids = self._calculate_target_audience(target)
-                breakdown = self._get_audience_breakdown(student_ids)
+                index, bits = self._resolve_target_audience(target)
+                breakdown = self._get_audience_breakdown(index, bits)
+                student_ids = index.ids(bits)
                 cache = self._update_audience_cache(target, student_ids, breakdown)
         
         return cache
@@ -617,6 +635,24 @@ class AnnouncementTargetingRepository(BaseRepository[AnnouncementTarget]):
     
     # ==================== Helper Methods ====================
     
+    # Targeting rule fields served by the audience bitmap index
+    RULE_DIMENSIONS = {
+        'room_id': 'room',
+        'floor_number': 'floor',
+        'room_type': 'room_type',
+        'status': 'status',
+        'student_status': 'status',
+        'year_of_study': 'year',
+        'course': 'course',
+    }
+    
+    # Student statuses selected by the include_*_students flags
+    STATUS_FLAGS = {
+        'include_active_students': 'active',
+        'include_inactive_students': 'inactive',
+        'include_notice_period_students': 'on_notice',
+    }
+    
     def _calculate_target_audience(
         self,
         target: AnnouncementTarget
@@ -630,63 +666,114 @@ class AnnouncementTargetingRepository(BaseRepository[AnnouncementTarget]):
         Returns:
             List of student UUIDs
         """
-        announcement = self.session.get(Announcement, target.announcement_id)
-        hostel_id = announcement.hostel_id
+        index, bits = self._resolve_target_audience(target)
+        return index.ids(bits)
+    
+    def _resolve_target_audience(
+        self,
+        target: AnnouncementTarget
+    ) -> Tuple[AudienceBitmapIndex, int]:
+        """
+        Resolve a targeting configuration to a bitmap of its hostel's students.
         
-        # Base query for students in hostel
-        query = (
-            select(User.id)
-            .join(Room, User.room_id == Room.id)
-            .where(Room.hostel_id == hostel_id)
-        )
+        The base segment, targeting rules, status flags and exclusions are
+        combined with AND/OR/ANDNOT over the cached hostel index; only rules
+        on fields the index does not cover run a query.
         
-        # Apply target type filters
-        if target.target_type == TargetAudience.ALL:
-            # All students in hostel
-            pass
-        
-        elif target.target_type == TargetAudience.SPECIFIC_ROOMS:
-            if target.room_ids:
-                query = query.where(User.room_id.in_(target.room_ids))
-        
-        elif target.target_type == TargetAudience.SPECIFIC_FLOORS:
-            if target.floor_numbers:
-                query = query.where(Room.floor_number.in_(target.floor_numbers))
-        
-        elif target.target_type == TargetAudience.SPECIFIC_STUDENTS:
-            if target.student_ids:
-                query = select(User.id).where(User.id.in_(target.student_ids))
-        
-        elif target.target_type == TargetAudience.CUSTOM:
-            # Apply custom targeting rules
-            rules = self.get_targeting_rules(target.id)
-            for rule in rules:
-                rule_filter = self._build_rule_filter(rule)
-                if rule.is_inclusion:
-                    query = query.where(rule_filter)
-                else:
-                    query = query.where(~rule_filter)
+        Args:
+            target: Targeting configuration
+            
+        Returns:
+            Tuple of (hostel index, audience bitmap)
+        """
+        announcement = self.session.get(Announcement, target.announcement_id)
+        index = audience_indexes.get(self.session, announcement.hostel_id)
+        
+        # Base segment
+        target_type = getattr(target.target_type, 'value', target.target_type)
+        if target_type in ('specific_rooms', 'room_based') and target.room_ids:
+            bits = index.bitmap('room', target.room_ids)
+        elif target_type in ('specific_floors', 'floor_based') and target.floor_numbers:
+            bits = index.bitmap('floor', target.floor_numbers)
+        elif target_type in ('specific_individuals', 'specific_students') and target.student_ids:
+            bits = index.students(target.student_ids)
+        else:
+            bits = index.all
+        
+        if target.room_types:
+            bits &= index.bitmap('room_type', target.room_types)
+        
+        # Targeting rules
+        if target.id is not None:
+            for rule in self.get_targeting_rules(target.id):
+                rule_bits = self._rule_bitmap(index, announcement.hostel_id, rule)
+                bits = bits & rule_bits if rule.is_inclusion else bits & ~rule_bits
+        
+        # Status filters
+        statuses = [
+            status for flag, status in self.STATUS_FLAGS.items()
+            if getattr(target, flag, False)
+        ]
+        if statuses:
+            bits &= index.bitmap('status', statuses)
+        
+        # Exclusions
+        if target.exclude_student_ids:
+            bits &= ~index.students(target.exclude_student_ids)
         
-        # Apply status filters
-        if target.include_active_students:
-            query = query.where(User.status == 'ACTIVE')
+        if target.exclude_room_ids:
+            bits &= ~index.bitmap('room', target.exclude_room_ids)
         
-        if target.include_inactive_students:
-            query = query.where(User.status == 'INACTIVE')
+        return index, bits
+    
+    def _rule_bitmap(
+        self,
+        index: AudienceBitmapIndex,
+        hostel_id: UUID,
+        rule: TargetingRule
+    ) -> int:
+        """Bitmap of the students a targeting rule matches."""
+        dimension = self.RULE_DIMENSIONS.get(rule.rule_field)
+        if dimension is None:
+            # Field not indexed: evaluate the rule in SQL
+            query = (
+                select(Student.user_id)
+                .join(User, User.id == Student.user_id)
+                .outerjoin(Room, Room.id == Student.room_id)
+                .where(
+                    Student.hostel_id == str(hostel_id),
+                    Student.deleted_at.is_(None),
+                    self._build_rule_filter(rule)
+                )
+            )
+            return index.students(row[0] for row in self.session.execute(query))
         
-        if target.include_notice_period_students:
-            query = query.where(User.status == 'NOTICE_PERIOD')
+        operator = rule.rule_operator
+        value = rule.rule_value.get('value')
         
-        # Apply exclusions
-        if target.exclude_student_ids:
-            query = query.where(~User.id.in_(target.exclude_student_ids))
+        if operator == 'equals':
+            return index.bitmap(dimension, [value])
+        elif operator == 'in':
+            return index.bitmap(dimension, value)
         
-        if target.exclude_room_ids:
-            query = query.where(~User.room_id.in_(target.exclude_room_ids))
+        if dimension == 'floor':
+            value = [int(v) for v in value] if operator == 'between' else int(value)
+        else:
+            value = (
+                [str(v).lower() for v in value] if operator == 'between'
+                else str(value).lower()
+            )
         
-        # Execute query
-        result = self.session.execute(query)
-        return [row[0] for row in result]
+        if operator == 'contains':
+            return index.bitmap_where(dimension, lambda v: str(value) in str(v))
+        elif operator == 'greater_than':
+            return index.bitmap_where(dimension, lambda v: v > value)
+        elif operator == 'less_than':
+            return index.bitmap_where(dimension, lambda v: v < value)
+        elif operator == 'between':
+            return index.bitmap_where(dimension, lambda v: value[0] <= v <= value[1])
+        else:
+            raise ValidationError(f"Invalid operator: {operator}")
     
     def _build_rule_filter(self, rule: TargetingRule):
         """Build SQLAlchemy filter from targeting rule."""
@@ -718,55 +805,14 @@ class AnnouncementTargetingRepository(BaseRepository[AnnouncementTarget]):
     
     def _get_audience_breakdown(
         self,
-        student_ids: List[UUID]
+        index: AudienceBitmapIndex,
+        bits: int
     ) -> Dict[str, Dict]:
         """Get detailed breakdown of audience by various dimensions."""
-        if not student_ids:
-            return {
-                'by_room': {},
-                'by_floor': {},
-                'by_status': {},
-            }
-        
-        # Breakdown by room
-        room_breakdown = (
-            self.session.query(
-                Room.room_number,
-                func.count(User.id)
-            )
-            .join(User, User.room_id == Room.id)
-            .filter(User.id.in_(student_ids))
-            .group_by(Room.room_number)
-            .all()
-        )
-        
-        # Breakdown by floor
-        floor_breakdown = (
-            self.session.query(
-                Room.floor_number,
-                func.count(User.id)
-            )
-            .join(User, User.room_id == Room.id)
-            .filter(User.id.in_(student_ids))
-            .group_by(Room.floor_number)
-            .all()
-        )
-        
-        # Breakdown by status
-        status_breakdown = (
-            self.session.query(
-                User.status,
-                func.count(User.id)
-            )
-            .filter(User.id.in_(student_ids))
-            .group_by(User.status)
-            .all()
-        )
-        
         return {
-            'by_room': {room: count for room, count in room_breakdown},
-            'by_floor': {floor: count for floor, count in floor_breakdown},
-            'by_status': {status: count for status, count in status_breakdown},
+            'by_room': index.breakdown('room', bits),
+            'by_floor': index.breakdown('floor', bits),
+            'by_status': index.breakdown('status', bits),
         }
     
     def _update_audience_cache(
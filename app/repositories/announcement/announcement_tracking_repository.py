@@ -18,7 +18,8 @@ from decimal import Decimal
 from collections import defaultdict
 import statistics
 
-from sqlalchemy import and_, or_, func, select, desc, case, extract
+from sqlalchemy import and_, or_, func, select, desc, case, extract, literal_column, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.sql import Select
 
@@ -32,6 +33,7 @@ from app.models.announcement import (
     AnnouncementRecipient,
 )
 from app.models.user.user import User
+from app.models.student.student import Student
 from app.repositories.base.base_repository import BaseRepository
 from app.repositories.base.query_builder import QueryBuilder
 from app.repositories.base.pagination import PaginationParams, PaginatedResult
@@ -76,6 +78,9 @@ class AnnouncementTrackingRepository(BaseRepository[AnnouncementView]):
         """
         Record a student viewing an announcement.
         
+        A repeat view in the same session increments the session's view
+        count in the same upsert statement.
+        
         Args:
             announcement_id: Announcement UUID
             student_id: Student UUID
@@ -87,46 +92,29 @@ class AnnouncementTrackingRepository(BaseRepository[AnnouncementView]):
             metadata: Additional metadata
             
         Returns:
-            Created view record
+            Created or updated view record
         """
-        # Validate device type
-        if device_type and device_type not in ['mobile', 'web', 'tablet', 'desktop']:
-            raise ValidationError(f"Invalid device type: {device_type}")
-        
-        # Check if this is a repeat view in same session
-        existing_view = None
-        if session_id:
-            existing_view = (
-                self.session.query(AnnouncementView)
-                .filter(
-                    AnnouncementView.announcement_id == announcement_id,
-                    AnnouncementView.student_id == student_id,
-                    AnnouncementView.session_id == session_id
-                )
-                .first()
-            )
-        
-        if existing_view:
-            # Increment view count for this session
-            existing_view.view_count += 1
-            self.session.flush()
-            return existing_view
+        self.validate_device_type(device_type)
         
-        view = AnnouncementView(
-            announcement_id=announcement_id,
-            student_id=student_id,
-            viewed_at=datetime.utcnow(),
+        row = self.build_view_row(
+            announcement_id,
+            student_id,
             device_type=device_type,
             source=source,
             session_id=session_id,
             ip_address=ip_address,
             user_agent=user_agent,
-            view_count=1,
-            metadata=metadata or {}
+            metadata=metadata
         )
         
-        self.session.add(view)
-        self.session.flush()
+        view = self.session.scalars(
+            self._view_upsert([row]).returning(AnnouncementView),
+            execution_options={"populate_existing": True}
+        ).one()
+        
+        self.increment_engagement_counters(
+            {announcement_id: self._view_counter_deltas([row])}
+        )
         
         return view
     
@@ -205,13 +193,11 @@ class AnnouncementTrackingRepository(BaseRepository[AnnouncementView]):
         if not view:
             raise ResourceNotFoundError(f"View record {view_id} not found")
         
-        # Update flags based on action
-        if action_type == 'link_click':
-            view.clicked_links = True
-        elif action_type == 'download':
-            view.downloaded_attachments = True
-        elif action_type == 'share':
-            view.shared = True
+        # Update flags and announcement counters based on action
+        if action_type in self.ENGAGEMENT_ACTIONS:
+            counter, flag = self.ENGAGEMENT_ACTIONS[action_type]
+            setattr(view, flag, True)
+            self.increment_engagement_counters({view.announcement_id: {counter: 1}})
         
         # Store action in metadata
         if not view.metadata:
@@ -355,17 +341,434 @@ class AnnouncementTrackingRepository(BaseRepository[AnnouncementView]):
         Returns:
             Number of receipts created
         """
-        count = 0
-        for student_id in student_ids:
-            try:
-                self.mark_as_read(announcement_id, student_id)
-                count += 1
-            except Exception as e:
-                # Log error but continue
-                print(f"Error marking as read for student {student_id}: {e}")
-                continue
-        
-        return count
+        now = datetime.utcnow()
+        
+        return self.upsert_read_receipts([
+            self.build_read_row(announcement_id, student_id, read_at=now)
+            for student_id in dict.fromkeys(student_ids)
+        ])
+    
+    # ==================== Batched Ingestion ====================
+    
+    # Engagement metric column incremented per view, by device type
+    DEVICE_VIEW_COUNTERS = {
+        'mobile': 'mobile_views',
+        'web': 'web_views',
+        'tablet': 'tablet_views',
+        'desktop': 'desktop_views',
+    }
+    
+    # Engagement metric column and view flag per engagement action
+    ENGAGEMENT_ACTIONS = {
+        'link_click': ('link_clicks', 'clicked_links'),
+        'download': ('attachment_downloads', 'downloaded_attachments'),
+        'share': ('shares', 'shared'),
+    }
+    
+    # Rows per multi-row upsert statement
+    UPSERT_BATCH_SIZE = 1000
+    
+    @staticmethod
+    def validate_device_type(device_type: Optional[str]) -> None:
+        """
+        Validate a view's device type.
+        
+        Raises:
+            ValidationError: If the device type is not recognized
+        """
+        if device_type and device_type not in ['mobile', 'web', 'tablet', 'desktop']:
+            raise ValidationError(f"Invalid device type: {device_type}")
+    
+    @staticmethod
+    def validate_read_metrics(
+        reading_time_seconds: Optional[int],
+        scroll_percentage: Optional[int]
+    ) -> None:
+        """
+        Validate a read's reading time and scroll depth.
+        
+        Raises:
+            ValidationError: If either value is out of range
+        """
+        if reading_time_seconds is not None and not 0 <= reading_time_seconds <= 3600:
+            raise ValidationError("Reading time must be between 0 and 3600 seconds")
+        if scroll_percentage is not None and not 0 <= scroll_percentage <= 100:
+            raise ValidationError("Scroll percentage must be between 0 and 100")
+    
+    @staticmethod
+    def build_view_row(
+        announcement_id: UUID,
+        student_id: UUID,
+        device_type: Optional[str] = None,
+        source: str = "app",
+        session_id: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        metadata: Optional[Dict] = None,
+        viewed_at: Optional[datetime] = None,
+        view_count: int = 1
+    ) -> Dict[str, Any]:
+        """Build an announcement_views row; every row has the same keys."""
+        return {
+            'announcement_id': announcement_id,
+            'student_id': student_id,
+            'session_id': session_id,
+            'viewed_at': viewed_at or datetime.utcnow(),
+            'device_type': device_type,
+            'source': source,
+            'ip_address': ip_address,
+            'user_agent': user_agent,
+            'view_count': view_count,
+            'clicked_links': False,
+            'downloaded_attachments': False,
+            'shared': False,
+            'meta_data': metadata or {},
+        }
+    
+    @staticmethod
+    def build_read_row(
+        announcement_id: UUID,
+        student_id: UUID,
+        reading_time_seconds: Optional[int] = None,
+        scroll_percentage: Optional[int] = None,
+        device_type: Optional[str] = None,
+        source: str = "app",
+        read_at: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """Build a read receipt row; every row has the same keys."""
+        return {
+            'announcement_id': announcement_id,
+            'student_id': student_id,
+            'read_at': read_at or datetime.utcnow(),
+            'device_type': device_type,
+            'source': source,
+            'reading_time_seconds': reading_time_seconds,
+            'scroll_percentage': scroll_percentage,
+            'completed_reading': bool(scroll_percentage and scroll_percentage >= 90),
+        }
+    
+    def upsert_views(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Write coalesced view rows with multi-row upserts.
+        
+        Rows with a session id merge into the session's existing row
+        (view_count = view_count + excluded.view_count); rows without one
+        are inserted. Announcement-level view counters are incremented in
+        the same transaction.
+        
+        Args:
+            rows: Rows from build_view_row, at most one per
+                announcement, student and session
+            
+        Returns:
+            Number of view events written
+        """
+        if not rows:
+            return 0
+        
+        for start in range(0, len(rows), self.UPSERT_BATCH_SIZE):
+            self.session.execute(
+                self._view_upsert(rows[start:start + self.UPSERT_BATCH_SIZE])
+            )
+        
+        deltas: Dict[UUID, List[Dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            deltas[row['announcement_id']].append(row)
+        
+        self.increment_engagement_counters({
+            announcement_id: self._view_counter_deltas(announcement_rows)
+            for announcement_id, announcement_rows in deltas.items()
+        })
+        
+        return sum(row['view_count'] for row in rows)
+    
+    def set_view_flags(
+        self,
+        flags: Dict[Tuple[UUID, UUID, Optional[str]], Dict[str, bool]]
+    ) -> int:
+        """
+        Set engagement flags on existing views.
+        
+        One UPDATE per distinct flag combination.
+        
+        Args:
+            flags: View flags to set, keyed by (announcement, student, session)
+            
+        Returns:
+            Number of views updated
+        """
+        by_values: Dict[Tuple[Tuple[str, bool], ...], List[Tuple]] = defaultdict(list)
+        for key, values in flags.items():
+            values = tuple(sorted((name, True) for name, value in values.items() if value))
+            if values:
+                by_values[values].append(key)
+        
+        updated = 0
+        for values, keys in by_values.items():
+            updated += self.session.query(AnnouncementView).filter(
+                or_(*[
+                    and_(
+                        AnnouncementView.announcement_id == announcement_id,
+                        AnnouncementView.student_id == student_id,
+                        AnnouncementView.session_id.is_(None)
+                        if session_id is None
+                        else AnnouncementView.session_id == session_id
+                    )
+                    for announcement_id, student_id, session_id in keys
+                ])
+            ).update(dict(values), synchronize_session=False)
+        
+        return updated
+    
+    def upsert_read_receipts(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Write coalesced read receipts with multi-row upserts.
+        
+        Re-reads keep the first read time and update reading depth. For
+        newly created receipts, the announcement's read_count and the
+        recipients' read flags are updated set-based.
+        
+        Args:
+            rows: Rows from build_read_row, at most one per
+                announcement and student
+            
+        Returns:
+            Number of receipts created
+        """
+        if not rows:
+            return 0
+        
+        from app.models.announcement import AnnouncementDelivery
+        
+        created: List[Tuple[UUID, UUID]] = []
+        
+        for start in range(0, len(rows), self.UPSERT_BATCH_SIZE):
+            batch = rows[start:start + self.UPSERT_BATCH_SIZE]
+            pairs = [(row['announcement_id'], row['student_id']) for row in batch]
+            
+            delivered = dict(
+                ((delivery.announcement_id, delivery.recipient_id), delivery.delivered_at)
+                for delivery in self.session.query(
+                    AnnouncementDelivery.announcement_id,
+                    AnnouncementDelivery.recipient_id,
+                    func.min(AnnouncementDelivery.delivered_at).label('delivered_at')
+                )
+                .filter(
+                    tuple_(
+                        AnnouncementDelivery.announcement_id,
+                        AnnouncementDelivery.recipient_id
+                    ).in_(pairs),
+                    AnnouncementDelivery.delivered_at.isnot(None)
+                )
+                .group_by(
+                    AnnouncementDelivery.announcement_id,
+                    AnnouncementDelivery.recipient_id
+                )
+            )
+            
+            values = []
+            for row in batch:
+                delivered_at = delivered.get((row['announcement_id'], row['student_id']))
+                if delivered_at and delivered_at.tzinfo:
+                    delivered_at = delivered_at.replace(tzinfo=None)
+                values.append({
+                    **row,
+                    'delivered_at': delivered_at,
+                    'time_to_read_seconds': (
+                        max(int((row['read_at'] - delivered_at).total_seconds()), 0)
+                        if delivered_at else None
+                    ),
+                    'is_first_read': True,
+                })
+            
+            stmt = pg_insert(ReadReceipt).values(values)
+            excluded = stmt.excluded
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_read_receipts_announcement_student",
+                set_={
+                    'reading_time_seconds': func.coalesce(
+                        excluded.reading_time_seconds, ReadReceipt.reading_time_seconds
+                    ),
+                    'scroll_percentage': func.coalesce(
+                        excluded.scroll_percentage, ReadReceipt.scroll_percentage
+                    ),
+                    'completed_reading': or_(
+                        ReadReceipt.completed_reading, excluded.completed_reading
+                    ),
+                    'is_first_read': False,
+                }
+            ).returning(
+                ReadReceipt.announcement_id,
+                ReadReceipt.student_id,
+                # xmax is 0 only for rows this statement inserted
+                literal_column("xmax = 0").label('inserted')
+            )
+            
+            created.extend(
+                (row.announcement_id, row.student_id)
+                for row in self.session.execute(stmt)
+                if row.inserted
+            )
+        
+        if not created:
+            return 0
+        
+        per_announcement: Dict[UUID, int] = defaultdict(int)
+        for announcement_id, _ in created:
+            per_announcement[announcement_id] += 1
+        
+        for announcement_id, count in per_announcement.items():
+            self.session.query(Announcement).filter(
+                Announcement.id == announcement_id
+            ).update(
+                {Announcement.read_count: Announcement.read_count + count},
+                synchronize_session=False
+            )
+        
+        now = datetime.utcnow()
+        for start in range(0, len(created), self.UPSERT_BATCH_SIZE):
+            self.session.query(AnnouncementRecipient).filter(
+                tuple_(
+                    AnnouncementRecipient.announcement_id,
+                    AnnouncementRecipient.student_id
+                ).in_(created[start:start + self.UPSERT_BATCH_SIZE]),
+                AnnouncementRecipient.is_read == False
+            ).update(
+                {AnnouncementRecipient.is_read: True, AnnouncementRecipient.read_at: now},
+                synchronize_session=False
+            )
+        
+        return len(created)
+    
+    def increment_engagement_counters(
+        self,
+        deltas: Dict[UUID, Dict[str, int]]
+    ) -> None:
+        """
+        Add to announcement-level engagement counters in one upsert.
+        
+        Args:
+            deltas: Counter increments per announcement, keyed by
+                EngagementMetric column name
+        """
+        deltas = {
+            announcement_id: {column: value for column, value in counters.items() if value}
+            for announcement_id, counters in deltas.items()
+        }
+        deltas = {key: value for key, value in deltas.items() if value}
+        if not deltas:
+            return
+        
+        columns = sorted({column for counters in deltas.values() for column in counters})
+        
+        stmt = pg_insert(EngagementMetric).values([
+            {
+                'announcement_id': announcement_id,
+                **{column: counters.get(column, 0) for column in columns},
+            }
+            for announcement_id, counters in deltas.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EngagementMetric.announcement_id],
+            set_={
+                column: getattr(EngagementMetric, column) + getattr(stmt.excluded, column)
+                for column in columns
+            }
+        )
+        
+        self.session.execute(stmt)
+    
+    def rebuild_engagement_counters(self, announcement_id: UUID) -> EngagementMetric:
+        """
+        Recompute the incremental view and interaction counters from rows.
+        
+        Used to backfill announcements whose views predate incremental
+        counting, or to repair drift. Interaction counters are rebuilt
+        from view flags, so repeated actions within one view count once.
+        
+        Args:
+            announcement_id: Announcement UUID
+            
+        Returns:
+            Metric record with rebuilt counters
+        """
+        totals = (
+            self.session.query(
+                func.coalesce(func.sum(AnnouncementView.view_count), 0).label('view_count'),
+                *[
+                    func.coalesce(
+                        func.sum(AnnouncementView.view_count).filter(
+                            AnnouncementView.device_type == device
+                        ),
+                        0
+                    ).label(column)
+                    for device, column in self.DEVICE_VIEW_COUNTERS.items()
+                ],
+                *[
+                    func.count(AnnouncementView.id).filter(
+                        getattr(AnnouncementView, flag) == True
+                    ).label(column)
+                    for column, flag in self.ENGAGEMENT_ACTIONS.values()
+                ]
+            )
+            .filter(AnnouncementView.announcement_id == announcement_id)
+            .one()
+        )
+        
+        metric = self._get_or_create_metric(announcement_id)
+        for column, value in totals._mapping.items():
+            setattr(metric, column, int(value))
+        
+        self.session.flush()
+        return metric
+    
+    def _view_upsert(self, rows: List[Dict[str, Any]]):
+        """Build the multi-row view upsert statement."""
+        stmt = pg_insert(AnnouncementView).values(rows)
+        excluded = stmt.excluded
+        
+        return stmt.on_conflict_do_update(
+            index_elements=[
+                AnnouncementView.announcement_id,
+                AnnouncementView.student_id,
+                AnnouncementView.session_id,
+            ],
+            index_where=AnnouncementView.session_id.isnot(None),
+            set_={
+                'view_count': AnnouncementView.view_count + excluded.view_count,
+                'device_type': func.coalesce(excluded.device_type, AnnouncementView.device_type),
+                'clicked_links': or_(AnnouncementView.clicked_links, excluded.clicked_links),
+                'downloaded_attachments': or_(
+                    AnnouncementView.downloaded_attachments, excluded.downloaded_attachments
+                ),
+                'shared': or_(AnnouncementView.shared, excluded.shared),
+            }
+        )
+    
+    def _view_counter_deltas(self, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Engagement counter increments for view rows of one announcement."""
+        counters: Dict[str, int] = defaultdict(int)
+        for row in rows:
+            counters['view_count'] += row['view_count']
+            device_column = self.DEVICE_VIEW_COUNTERS.get(row['device_type'])
+            if device_column:
+                counters[device_column] += row['view_count']
+        return counters
+    
+    def _get_or_create_metric(self, announcement_id: UUID) -> EngagementMetric:
+        """Get the announcement's metric record, creating it if missing."""
+        metric = (
+            self.session.query(EngagementMetric)
+            .filter(EngagementMetric.announcement_id == announcement_id)
+            .populate_existing()
+            .first()
+        )
+        
+        if not metric:
+            metric = EngagementMetric(announcement_id=announcement_id)
+            self.session.add(metric)
+        
+        return metric
     
     # ==================== Acknowledgment Management ====================
     
@@ -531,6 +934,10 @@ class AnnouncementTrackingRepository(BaseRepository[AnnouncementView]):
         """
         Calculate and store comprehensive engagement metrics.
         
+        View, device and interaction counters are maintained incrementally
+        at ingestion (see upsert_views) and read as they are; the
+        announcement's read_count is maintained the same way.
+        
         Args:
             announcement_id: Announcement UUID
             
@@ -544,15 +951,7 @@ class AnnouncementTrackingRepository(BaseRepository[AnnouncementView]):
             )
         
         # Get or create metric record
-        metric = (
-            self.session.query(EngagementMetric)
-            .filter(EngagementMetric.announcement_id == announcement_id)
-            .first()
-        )
-        
-        if not metric:
-            metric = EngagementMetric(announcement_id=announcement_id)
-            self.session.add(metric)
+        metric = self._get_or_create_metric(announcement_id)
         
         # Total recipients
         total_recipients = announcement.total_recipients or 1
@@ -574,55 +973,30 @@ class AnnouncementTrackingRepository(BaseRepository[AnnouncementView]):
             str(round((delivered_count / total_recipients * 100), 2))
         ) if total_recipients > 0 else Decimal('0.00')
         
-        # View metrics
-        total_views = (
-            self.session.query(func.count(AnnouncementView.id))
-            .filter(AnnouncementView.announcement_id == announcement_id)
-            .scalar()
-        ) or 0
-        
-        unique_viewers = (
-            self.session.query(func.count(func.distinct(AnnouncementView.student_id)))
-            .filter(AnnouncementView.announcement_id == announcement_id)
-            .scalar()
-        ) or 0
-        
-        metric.view_count = total_views
-        metric.unique_readers = unique_viewers
+        # Read metrics (view counters are maintained incrementally)
+        read_count = announcement.read_count or 0
         
-        # Read metrics
-        read_count = (
-            self.session.query(func.count(ReadReceipt.id))
-            .filter(ReadReceipt.announcement_id == announcement_id)
-            .scalar()
-        ) or 0
-        
-        metric.unique_readers = read_count  # Override with actual read count
+        metric.unique_readers = read_count
         metric.read_rate = Decimal(
             str(round((read_count / total_recipients * 100), 2))
         ) if total_recipients > 0 else Decimal('0.00')
         
-        # Reading depth metrics
-        avg_reading_time = (
-            self.session.query(func.avg(ReadReceipt.reading_time_seconds))
-            .filter(ReadReceipt.announcement_id == announcement_id)
-            .scalar()
-        )
-        
-        avg_scroll = (
-            self.session.query(func.avg(ReadReceipt.scroll_percentage))
+        # Reading depth and timing metrics
+        reading = (
+            self.session.query(
+                func.avg(ReadReceipt.reading_time_seconds).label('avg_reading_time'),
+                func.avg(ReadReceipt.scroll_percentage).label('avg_scroll'),
+                func.count(ReadReceipt.id).filter(
+                    ReadReceipt.completed_reading == True
+                ).label('completed_count'),
+                func.avg(ReadReceipt.time_to_read_seconds).label('avg_time_to_read'),
+            )
             .filter(ReadReceipt.announcement_id == announcement_id)
-            .scalar()
+            .one()
         )
-        
-        completed_count = (
-            self.session.query(func.count(ReadReceipt.id))
-            .filter(
-                ReadReceipt.announcement_id == announcement_id,
-                ReadReceipt.completed_reading == True
-            )
-            .scalar()
-        ) or 0
+        avg_reading_time = reading.avg_reading_time
+        avg_scroll = reading.avg_scroll
+        completed_count = reading.completed_count or 0
         
         metric.average_reading_time_seconds = (
             Decimal(str(round(avg_reading_time, 2))) if avg_reading_time else None
@@ -663,11 +1037,7 @@ class AnnouncementTrackingRepository(BaseRepository[AnnouncementView]):
             ) if total_recipients > 0 else Decimal('0.00')
         
         # Timing metrics
-        avg_time_to_read = (
-            self.session.query(func.avg(ReadReceipt.time_to_read_seconds))
-            .filter(ReadReceipt.announcement_id == announcement_id)
-            .scalar()
-        )
+        avg_time_to_read = reading.avg_time_to_read
         
         if avg_time_to_read:
             metric.average_time_to_read_hours = Decimal(
@@ -710,55 +1080,6 @@ class AnnouncementTrackingRepository(BaseRepository[AnnouncementView]):
             elif channel == 'in_app':
                 metric.in_app_delivered = count
         
-        # Device breakdown
-        device_stats = (
-            self.session.query(
-                AnnouncementView.device_type,
-                func.count(AnnouncementView.id)
-            )
-            .filter(AnnouncementView.announcement_id == announcement_id)
-            .group_by(AnnouncementView.device_type)
-            .all()
-        )
-        
-        for device, count in device_stats:
-            if device == 'mobile':
-                metric.mobile_views = count
-            elif device == 'web':
-                metric.web_views = count
-            elif device == 'tablet':
-                metric.tablet_views = count
-            elif device == 'desktop':
-                metric.desktop_views = count
-        
-        # Interaction metrics
-        metric.link_clicks = (
-            self.session.query(func.count(AnnouncementView.id))
-            .filter(
-                AnnouncementView.announcement_id == announcement_id,
-                AnnouncementView.clicked_links == True
-            )
-            .scalar()
-        ) or 0
-        
-        metric.attachment_downloads = (
-            self.session.query(func.count(AnnouncementView.id))
-            .filter(
-                AnnouncementView.announcement_id == announcement_id,
-                AnnouncementView.downloaded_attachments == True
-            )
-            .scalar()
-        ) or 0
-        
-        metric.shares = (
-            self.session.query(func.count(AnnouncementView.id))
-            .filter(
-                AnnouncementView.announcement_id == announcement_id,
-                AnnouncementView.shared == True
-            )
-            .scalar()
-        ) or 0
-        
         # Calculate overall engagement score
         metric.engagement_score = self._calculate_engagement_score(
             announcement, metric
@@ -1213,34 +1534,83 @@ class AnnouncementTrackingRepository(BaseRepository[AnnouncementView]):
         """
         Compare performance across multiple announcements.
         
+        Rates come from one grouped query over recipient flags and read
+        receipts; ids that match no announcement are left out.
+        
         Args:
             announcement_ids: List of announcement UUIDs
             
         Returns:
             Comparative performance data
         """
-        comparison = {}
+        if not announcement_ids:
+            return {}
+        
+        counts = self._recipient_counts_query(
+            AnnouncementRecipient.announcement_id,
+            AnnouncementRecipient.announcement_id.in_(announcement_ids)
+        ).subquery()
+        
+        reading = (
+            select(
+                ReadReceipt.announcement_id.label('announcement_id'),
+                func.avg(ReadReceipt.reading_time_seconds).label('avg_reading_time'),
+                func.count(ReadReceipt.id).filter(
+                    ReadReceipt.completed_reading == True
+                ).label('completed'),
+            )
+            .where(ReadReceipt.announcement_id.in_(announcement_ids))
+            .group_by(ReadReceipt.announcement_id)
+            .subquery()
+        )
         
-        for announcement_id in announcement_ids:
-            metric = (
-                self.session.query(EngagementMetric)
-                .filter(EngagementMetric.announcement_id == announcement_id)
-                .first()
+        rows = self.session.execute(
+            select(
+                Announcement.id,
+                Announcement.title,
+                Announcement.category,
+                Announcement.requires_acknowledgment,
+                Announcement.total_recipients,
+                counts.c.targeted,
+                counts.c.delivered,
+                counts.c.read,
+                counts.c.acknowledged,
+                reading.c.avg_reading_time,
+                reading.c.completed,
             )
+            .outerjoin(counts, counts.c.key == Announcement.id)
+            .outerjoin(reading, reading.c.announcement_id == Announcement.id)
+            .where(Announcement.id.in_(announcement_ids))
+        ).all()
+        
+        comparison = {}
+        
+        for row in rows:
+            total = row.targeted or row.total_recipients or 0
+            read_count = row.read or 0
             
-            if not metric:
-                # Calculate if not exists
-                metric = self.calculate_engagement_metrics(announcement_id)
-            
-            announcement = self.session.get(Announcement, announcement_id)
+            delivery_rate = self._rate(row.delivered or 0, total)
+            read_rate = self._rate(read_count, total)
+            completion_rate = self._rate(row.completed or 0, read_count)
+            ack_rate = self._rate(row.acknowledged or 0, total)
             
-            comparison[str(announcement_id)] = {
-                'title': announcement.title if announcement else 'Unknown',
-                'category': announcement.category.value if announcement else None,
-                'read_rate': float(metric.read_rate),
-                'acknowledgment_rate': float(metric.acknowledgment_rate),
-                'engagement_score': float(metric.engagement_score),
-                'average_reading_time': float(metric.average_reading_time_seconds or 0),
+            comparison[str(row.id)] = {
+                'title': row.title,
+                'category': row.category.value if row.category else None,
+                'total_recipients': total,
+                'delivered_count': row.delivered or 0,
+                'read_count': read_count,
+                'acknowledged_count': row.acknowledged or 0,
+                'read_rate': read_rate,
+                'acknowledgment_rate': ack_rate,
+                'engagement_score': float(self._engagement_score(
+                    delivery_rate,
+                    read_rate,
+                    completion_rate,
+                    ack_rate,
+                    row.requires_acknowledgment
+                )),
+                'average_reading_time': float(row.avg_reading_time or 0),
             }
         
         return comparison
@@ -1254,6 +1624,10 @@ class AnnouncementTrackingRepository(BaseRepository[AnnouncementView]):
         """
         Identify students with low engagement rates.
         
+        Targeted, delivered, read and acknowledged counts for every
+        student in the hostel come from one grouped query over the
+        announcement recipients, filtered by engagement rate in SQL.
+        
         Args:
             hostel_id: Hostel UUID
             threshold_percentage: Engagement threshold
@@ -1264,32 +1638,75 @@ class AnnouncementTrackingRepository(BaseRepository[AnnouncementView]):
         """
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
-        # Get all students in hostel
-        students = (
-            self.session.query(User)
-            .join(Room, User.room_id == Room.id)
-            .filter(Room.hostel_id == hostel_id)
-            .all()
+        counts = self._recipient_counts_query(
+            AnnouncementRecipient.student_id,
+            Announcement.hostel_id == hostel_id,
+            AnnouncementRecipient.created_at >= cutoff_date
+        ).subquery()
+        
+        targeted = func.coalesce(counts.c.targeted, 0)
+        read = func.coalesce(counts.c.read, 0)
+        engagement_rate = case(
+            (targeted > 0, read * 100.0 / targeted),
+            else_=0
         )
         
-        low_engagement = []
-        
-        for student in students:
-            profile = self.get_student_engagement_profile(student.id, days)
-            
-            if profile['engagement_rate'] < threshold_percentage:
-                low_engagement.append({
-                    'student_id': str(student.id),
-                    'student_name': student.full_name,
-                    'engagement_rate': profile['engagement_rate'],
-                    'total_announcements': profile['total_announcements'],
-                    'read_count': profile['read_count'],
-                })
-        
-        # Sort by engagement rate ascending
-        low_engagement.sort(key=lambda x: x['engagement_rate'])
-        
-        return low_engagement
+        rows = self.session.execute(
+            select(
+                User.id,
+                User.full_name,
+                targeted.label('targeted'),
+                func.coalesce(counts.c.delivered, 0).label('delivered'),
+                read.label('read'),
+                func.coalesce(counts.c.acknowledged, 0).label('acknowledged'),
+                engagement_rate.label('engagement_rate'),
+            )
+            .join(Student, Student.user_id == User.id)
+            .outerjoin(counts, counts.c.key == User.id)
+            .where(
+                Student.hostel_id == str(hostel_id),
+                Student.deleted_at.is_(None),
+                engagement_rate < threshold_percentage
+            )
+            .order_by(engagement_rate, User.id)
+        ).all()
+        
+        return [
+            {
+                'student_id': str(row.id),
+                'student_name': row.full_name,
+                'engagement_rate': round(float(row.engagement_rate), 2),
+                'total_announcements': row.targeted,
+                'delivered_count': row.delivered,
+                'read_count': row.read,
+                'acknowledged_count': row.acknowledged,
+            }
+            for row in rows
+        ]
+    
+    def _recipient_counts_query(self, key_column, *criteria) -> Select:
+        """
+        Build targeted/delivered/read/acknowledged counts grouped by a
+        recipient column (student or announcement).
+        """
+        return (
+            select(
+                key_column.label('key'),
+                func.count(AnnouncementRecipient.id).label('targeted'),
+                func.count(AnnouncementRecipient.id).filter(
+                    AnnouncementRecipient.is_delivered == True
+                ).label('delivered'),
+                func.count(AnnouncementRecipient.id).filter(
+                    AnnouncementRecipient.is_read == True
+                ).label('read'),
+                func.count(AnnouncementRecipient.id).filter(
+                    AnnouncementRecipient.is_acknowledged == True
+                ).label('acknowledged'),
+            )
+            .join(Announcement, Announcement.id == AnnouncementRecipient.announcement_id)
+            .where(*criteria)
+            .group_by(key_column)
+        )
     
     # ==================== Helper Methods ====================
     
@@ -1307,21 +1724,43 @@ class AnnouncementTrackingRepository(BaseRepository[AnnouncementView]):
         - 20% completion rate
         - 20% acknowledgment rate (if required)
         """
+        return self._engagement_score(
+            float(metric.delivery_rate),
+            float(metric.read_rate),
+            float(metric.completion_rate),
+            float(metric.acknowledgment_rate or 0),
+            announcement.requires_acknowledgment
+        )
+    
+    @staticmethod
+    def _engagement_score(
+        delivery_rate: float,
+        read_rate: float,
+        completion_rate: float,
+        acknowledgment_rate: float,
+        requires_acknowledgment: bool
+    ) -> Decimal:
+        """Weighted engagement score (0-100) from percentage rates."""
         delivery_weight = 0.3
         read_weight = 0.3
         completion_weight = 0.2
         ack_weight = 0.2
         
         score = (
-            float(metric.delivery_rate) * delivery_weight +
-            float(metric.read_rate) * read_weight +
-            float(metric.completion_rate) * completion_weight
+            delivery_rate * delivery_weight +
+            read_rate * read_weight +
+            completion_rate * completion_weight
         )
         
-        if announcement.requires_acknowledgment:
-            score += float(metric.acknowledgment_rate) * ack_weight
+        if requires_acknowledgment:
+            score += acknowledgment_rate * ack_weight
         else:
             # Redistribute ack weight to other metrics
-            score += float(metric.read_rate) * ack_weight
+            score += read_rate * ack_weight
         
         return Decimal(str(round(score, 2)))
+    
+    @staticmethod
+    def _rate(count: int, total: int) -> float:
+        """Percentage of total, rounded to 2 places."""
+        return round(count / total * 100, 2) if total > 0 else 0.0
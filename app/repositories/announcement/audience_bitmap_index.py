@@ -0,0 +1,354 @@
+"""
+Audience Bitmap Index
+
+Per-hostel bitmaps of students for each targeting dimension (room, floor,
+room type, status, year of study, course) so announcement audiences are
+resolved with set algebra instead of a query per targeting rule.
+
+Every student in a hostel gets a dense ordinal and a bitmap is a Python int
+with those ordinals' bits set, so AND/OR/ANDNOT and cardinality run in C
+over a few hundred bytes even for large hostels. Indexes are built with one
+query, patched in place once a student's move commits (see
+apply_student_on_commit), and rebuilt after a TTL to bound drift from
+changes made by other processes.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.models.room.room import Room
+from app.models.student.student import Student
+
+
+# Targeting dimensions and the Student/Room attribute each is read from
+DIMENSIONS = ('room', 'floor', 'room_type', 'status', 'year', 'course')
+
+
+def _normalize(dimension: str, value: Any) -> Any:
+    """Normalize a dimension value so lookups match stored keys."""
+    if value is None:
+        return None
+    value = getattr(value, 'value', value)
+    if dimension == 'floor':
+        return int(value)
+    return str(value).strip().lower()
+
+
+def _student_key(student_id: Any) -> str:
+    return str(student_id).lower()
+
+
+class AudienceBitmapIndex:
+    """
+    Bitmaps of one hostel's students per targeting dimension.
+
+    Bitmaps are immutable ints replaced on write, so readers never see a
+    half-applied move; writers serialize on the index lock.
+    """
+
+    def __init__(self, hostel_id: UUID, built_at: float):
+        self.hostel_id = hostel_id
+        self.built_at = built_at
+        self.all = 0
+
+        self._ids: List[UUID] = []
+        self._positions: Dict[str, int] = {}
+        self._values: List[Dict[str, Any]] = []
+        self._bitmaps: Dict[str, Dict[Any, int]] = {dimension: {} for dimension in DIMENSIONS}
+        self._room_labels: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def set_student(
+        self,
+        student_id: Any,
+        values: Dict[str, Any],
+        room_label: Optional[str] = None
+    ) -> None:
+        """
+        Add a student or move them to new dimension values.
+
+        Args:
+            student_id: Student's user id
+            values: Raw value per dimension (missing dimensions are unset)
+            room_label: Room number shown in breakdowns
+        """
+        values = {
+            dimension: _normalize(dimension, values.get(dimension))
+            for dimension in DIMENSIONS
+        }
+
+        with self._lock:
+            key = _student_key(student_id)
+            position = self._positions.get(key)
+            if position is None:
+                position = self._positions[key] = len(self._ids)
+                self._ids.append(UUID(key))
+                self._values.append({})
+            bit = 1 << position
+
+            self._clear(position, bit)
+            for dimension, value in values.items():
+                if value is not None:
+                    bitmaps = self._bitmaps[dimension]
+                    bitmaps[value] = bitmaps.get(value, 0) | bit
+            self._values[position] = values
+            self.all |= bit
+
+            if room_label is not None and values['room'] is not None:
+                self._room_labels[values['room']] = room_label
+
+    def remove_student(self, student_id: Any) -> bool:
+        """Remove a student from every bitmap; their ordinal is not reused."""
+        with self._lock:
+            position = self._positions.get(_student_key(student_id))
+            if position is None or not self.all >> position & 1:
+                return False
+            bit = 1 << position
+            self._clear(position, bit)
+            self._values[position] = {}
+            self.all &= ~bit
+            return True
+
+    def __contains__(self, student_id: Any) -> bool:
+        position = self._positions.get(_student_key(student_id))
+        return position is not None and bool(self.all >> position & 1)
+
+    def _clear(self, position: int, bit: int) -> None:
+        """Clear a student's bit from the bitmaps of their current values (lock held)."""
+        for dimension, value in self._values[position].items():
+            if value is None:
+                continue
+            bitmaps = self._bitmaps[dimension]
+            remaining = bitmaps.get(value, 0) & ~bit
+            if remaining:
+                bitmaps[value] = remaining
+            else:
+                bitmaps.pop(value, None)
+
+    # ------------------------------------------------------------------
+    # Set algebra
+    # ------------------------------------------------------------------
+
+    def bitmap(self, dimension: str, values: Iterable[Any]) -> int:
+        """Union of the bitmaps for the given values of a dimension."""
+        bitmaps = self._bitmaps[dimension]
+        bits = 0
+        for value in values:
+            bits |= bitmaps.get(_normalize(dimension, value), 0)
+        return bits
+
+    def bitmap_where(self, dimension: str, predicate: Callable[[Any], bool]) -> int:
+        """Union of the bitmaps of every value of a dimension matching a predicate."""
+        bits = 0
+        for value, value_bits in list(self._bitmaps[dimension].items()):
+            if predicate(value):
+                bits |= value_bits
+        return bits
+
+    def students(self, student_ids: Iterable[Any]) -> int:
+        """Bitmap of the given students (ones not in this hostel are ignored)."""
+        bits = 0
+        for student_id in student_ids:
+            position = self._positions.get(_student_key(student_id))
+            if position is not None:
+                bits |= 1 << position
+        return bits & self.all
+
+    def ids(self, bits: int) -> List[UUID]:
+        """Student ids of a bitmap, in ordinal order."""
+        ids = self._ids
+        return [ids[position] for position, bit in enumerate(bin(bits)[:1:-1]) if bit == '1']
+
+    @staticmethod
+    def count(bits: int) -> int:
+        """Cardinality of a bitmap."""
+        return bits.bit_count()
+
+    def breakdown(self, dimension: str, bits: int) -> Dict[Any, int]:
+        """Count of a bitmap's students per value of a dimension."""
+        counts = {}
+        for value, value_bits in list(self._bitmaps[dimension].items()):
+            matched = (value_bits & bits).bit_count()
+            if matched:
+                label = self._room_labels.get(value, value) if dimension == 'room' else value
+                counts[label] = counts.get(label, 0) + matched
+        return counts
+
+
+class StudentPatch(NamedTuple):
+    """A student's indexed attributes, captured while the session can query."""
+    student_id: Any
+    hostel_key: Optional[str]
+    deleted: bool
+    values: Dict[str, Any]
+    room_label: Optional[str]
+
+
+class AudienceIndexCache:
+    """
+    Per-process cache of hostel audience bitmap indexes.
+
+    Indexes are built on first use and after the TTL; student moves made
+    through StudentRepository are applied to loaded indexes when their
+    transaction commits.
+    """
+
+    _PENDING_KEY = "audience_indexes.pending_students"
+    _LISTENING_KEY = "audience_indexes.listening"
+
+    def __init__(self, ttl_seconds: int = 300):
+        self.ttl_seconds = ttl_seconds
+        self._indexes: Dict[str, AudienceBitmapIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session: Session, hostel_id: Any) -> AudienceBitmapIndex:
+        """Get the hostel's index, building it if missing or expired"""
+        key = str(hostel_id).lower()
+        index = self._indexes.get(key)
+        if index is not None and time.monotonic() - index.built_at < self.ttl_seconds:
+            return index
+
+        index = self.build(session, hostel_id)
+        with self._lock:
+            self._indexes[key] = index
+        return index
+
+    def invalidate(self, hostel_ids: Optional[Iterable[Any]] = None) -> None:
+        """Drop indexes for the given hostels, or all of them"""
+        with self._lock:
+            if hostel_ids is None:
+                self._indexes.clear()
+                return
+            for hostel_id in hostel_ids:
+                self._indexes.pop(str(hostel_id).lower(), None)
+
+    def apply_student(self, session: Session, student: Student) -> None:
+        """
+        Apply a student's current hostel, room and status to loaded indexes.
+
+        Args:
+            session: Database session (used to look up the student's room)
+            student: Student after the change
+        """
+        self._apply(self._patch(session, student))
+
+    def apply_student_on_commit(self, session: Session, student: Student) -> None:
+        """
+        Apply a student's change to loaded indexes once the session commits.
+
+        The patch is captured now, while the session can still look up the
+        room, and dropped if the transaction rolls back, so indexes never
+        reflect uncommitted moves.
+
+        Args:
+            session: Database session the change is made on
+            student: Student after the change
+        """
+        pending = session.info.setdefault(self._PENDING_KEY, {})
+        if not session.info.get(self._LISTENING_KEY):
+            event.listen(session, "after_commit", self._after_commit)
+            event.listen(session, "after_rollback", self._after_rollback)
+            session.info[self._LISTENING_KEY] = True
+
+        # The latest change to a student in the transaction wins
+        pending[student.user_id] = self._patch(session, student)
+
+    def _after_commit(self, session: Session) -> None:
+        for patch in session.info.pop(self._PENDING_KEY, {}).values():
+            self._apply(patch)
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(self._PENDING_KEY, None)
+
+    def _patch(self, session: Session, student: Student) -> StudentPatch:
+        room = session.get(Room, student.room_id) if student.room_id else None
+        return StudentPatch(
+            student_id=student.user_id,
+            hostel_key=str(student.hostel_id).lower() if student.hostel_id else None,
+            deleted=student.deleted_at is not None,
+            values=self._values(
+                student.room_id,
+                room.floor_number if room else None,
+                room.room_type if room else None,
+                student.student_status,
+                student.year_of_study,
+                student.course,
+            ),
+            room_label=room.room_number if room else None,
+        )
+
+    def _apply(self, patch: StudentPatch) -> None:
+        for key, index in list(self._indexes.items()):
+            if key != patch.hostel_key:
+                index.remove_student(patch.student_id)
+
+        index = self._indexes.get(patch.hostel_key) if patch.hostel_key else None
+        if index is None:
+            return
+
+        if patch.deleted:
+            index.remove_student(patch.student_id)
+            return
+
+        index.set_student(patch.student_id, patch.values, room_label=patch.room_label)
+
+    def build(self, session: Session, hostel_id: Any) -> AudienceBitmapIndex:
+        """Load a hostel's students and build their bitmaps (one query)"""
+        rows = session.execute(
+            select(
+                Student.user_id,
+                Student.room_id,
+                Student.student_status,
+                Student.year_of_study,
+                Student.course,
+                Room.floor_number,
+                Room.room_type,
+                Room.room_number,
+            )
+            .outerjoin(Room, Room.id == Student.room_id)
+            .where(
+                Student.hostel_id == str(hostel_id),
+                Student.deleted_at.is_(None)
+            )
+            .order_by(Student.user_id)
+        ).all()
+
+        index = AudienceBitmapIndex(hostel_id, time.monotonic())
+        for row in rows:
+            index.set_student(
+                row.user_id,
+                self._values(
+                    row.room_id,
+                    row.floor_number,
+                    row.room_type,
+                    row.student_status,
+                    row.year_of_study,
+                    row.course,
+                ),
+                room_label=row.room_number,
+            )
+        return index
+
+    @staticmethod
+    def _values(room_id, floor, room_type, status, year, course) -> Dict[str, Any]:
+        return {
+            'room': room_id,
+            'floor': floor,
+            'room_type': room_type,
+            'status': status,
+            'year': year,
+            'course': course,
+        }
+
+
+# Process-wide audience index cache
+audience_indexes = AudienceIndexCache()
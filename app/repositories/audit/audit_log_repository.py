@@ -5,11 +5,15 @@ Provides advanced querying, filtering, and analytics for audit logs
 with performance optimization and compliance features.
 """
 
+import gzip
+import json
+import os
+import re
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, or_, func, desc, asc
+from sqlalchemy import and_, or_, func, desc, asc, delete, insert, select, text, tuple_
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.audit import AuditLog
@@ -848,74 +852,280 @@ class AuditLogRepository(BaseRepository):
     
     # ==================== Maintenance Operations ====================
     
+    def bulk_insert_rows(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert audit rows with multi-row INSERT statements (no ORM objects).
+
+        All rows must have the same keys. Does not commit.
+
+        Args:
+            rows: Column dictionaries
+
+        Returns:
+            Number of inserted rows
+        """
+        if not rows:
+            return 0
+        self.session.execute(insert(AuditLog), rows)
+        return len(rows)
+
     def archive_old_logs(
         self,
         cutoff_date: datetime,
-        batch_size: int = 1000
+        batch_size: int = 1000,
+        archive_dir: Optional[str] = None
     ) -> int:
         """
         Archive audit logs older than cutoff date.
-        
+
+        On a partitioned table, every monthly partition entirely before the
+        cutoff is detached. With ``archive_dir`` it is first dumped to a
+        gzipped JSON-lines file and then dropped; without, the detached
+        table is kept for cold querying.
+
+        On a plain table, rows are streamed to a gzipped JSON-lines file in
+        ``archive_dir`` in keyset batches and each batch is deleted once
+        written. A batch interrupted between write and delete is archived
+        again on the next run, so archives are at-least-once.
+
         Args:
             cutoff_date: Date before which logs should be archived
             batch_size: Number of records per batch
-            
+            archive_dir: Directory for compressed archive files
+
         Returns:
             Number of archived records
         """
-        # This would typically move records to an archive table
-        # For now, we'll just count what would be archived
-        count = self.session.query(AuditLog).filter(
-            AuditLog.created_at < cutoff_date
-        ).count()
-        
-        # TODO: Implement actual archival to archive table or file storage
-        
-        return count
-    
+        if self.is_partitioned():
+            archived = 0
+            for name, lower, upper in self.list_partitions():
+                if upper > cutoff_date:
+                    continue
+                if archive_dir:
+                    path = os.path.join(archive_dir, f"{name}.jsonl.gz")
+                    archived += self._dump_range(path, lower, upper, batch_size)
+                    self._detach_partition(name, drop=True)
+                else:
+                    archived += self.session.query(func.count(AuditLog.id)).filter(
+                        AuditLog.created_at >= lower,
+                        AuditLog.created_at < upper
+                    ).scalar()
+                    self._detach_partition(name, drop=False)
+            return archived
+
+        if not archive_dir:
+            raise ValueError("archive_dir is required to archive a non-partitioned audit table")
+
+        path = os.path.join(
+            archive_dir, f"{AuditLog.__tablename__}_before_{cutoff_date:%Y%m%d}.jsonl.gz"
+        )
+        return self._dump_range(path, None, cutoff_date, batch_size, delete_batches=True)
+
+    @staticmethod
+    def retention_eligible(default_retention_days: int = 365):
+        """
+        Predicate matching logs past their retention.
+
+        Rows with their own ``retention_days`` expire on that; the rest
+        expire after ``default_retention_days`` unless sensitive.
+
+        Args:
+            default_retention_days: Default retention in days
+
+        Returns:
+            SQL boolean clause over AuditLog
+        """
+        cutoff_date = datetime.utcnow() - timedelta(days=default_retention_days)
+
+        return or_(
+            and_(
+                AuditLog.retention_days.isnot(None),
+                AuditLog.created_at < func.now() - func.make_interval(
+                    0, 0, 0, AuditLog.retention_days
+                )
+            ),
+            and_(
+                AuditLog.retention_days.is_(None),
+                AuditLog.created_at < cutoff_date,
+                AuditLog.is_sensitive == False  # Keep sensitive logs longer
+            )
+        )
+
     def cleanup_by_retention_policy(
         self,
-        default_retention_days: int = 365
+        default_retention_days: int = 365,
+        batch_size: int = 5000
     ) -> int:
         """
         Clean up logs based on retention policies.
-        
+
+        Deletes in set-based batches (``DELETE ... WHERE id IN (SELECT ...
+        LIMIT n)``), committing each batch so locks and WAL stay bounded.
+
         Args:
             default_retention_days: Default retention in days
-            
+            batch_size: Rows deleted per statement
+
         Returns:
             Number of deleted records
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=default_retention_days)
-        
-        # Find logs eligible for deletion
-        eligible_logs = self.session.query(AuditLog).filter(
-            or_(
-                and_(
-                    AuditLog.retention_days.isnot(None),
-                    AuditLog.created_at < func.now() - func.cast(
-                        func.concat(AuditLog.retention_days, ' days'),
-                        type_=type(timedelta())
-                    )
-                ),
-                and_(
-                    AuditLog.retention_days.is_(None),
-                    AuditLog.created_at < cutoff_date,
-                    AuditLog.is_sensitive == False  # Keep sensitive logs longer
-                )
+        eligible = self.retention_eligible(default_retention_days)
+
+        total = 0
+        while True:
+            batch_ids = select(AuditLog.id).where(eligible).limit(batch_size).scalar_subquery()
+            result = self.session.execute(
+                delete(AuditLog)
+                .where(AuditLog.id.in_(batch_ids))
+                .execution_options(synchronize_session=False)
             )
-        ).all()
-        
-        count = len(eligible_logs)
-        
-        # Soft delete or hard delete based on requirements
-        for log in eligible_logs:
-            self.session.delete(log)
-        
+            self.session.commit()
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                break
+
+        return total
+
+    # ==================== Partitioning ====================
+
+    PARTITION_PATTERN = re.compile(r"^audit_logs_y(\d{4})m(\d{2})$")
+
+    def is_partitioned(self) -> bool:
+        """Whether audit_logs is a PostgreSQL partitioned table."""
+        if self.session.get_bind().dialect.name != "postgresql":
+            return False
+        return bool(self.session.execute(
+            text(
+                "SELECT 1 FROM pg_partitioned_table pt "
+                "JOIN pg_class c ON c.oid = pt.partrelid "
+                "WHERE c.relname = :table"
+            ),
+            {"table": AuditLog.__tablename__}
+        ).scalar())
+
+    def list_partitions(self) -> List[Tuple[str, datetime, datetime]]:
+        """
+        List attached monthly partitions, oldest first.
+
+        Returns:
+            (partition name, lower bound, upper bound) tuples
+        """
+        names = self.session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits i "
+                "JOIN pg_class parent ON parent.oid = i.inhparent "
+                "JOIN pg_class child ON child.oid = i.inhrelid "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": AuditLog.__tablename__}
+        ).scalars()
+
+        partitions = []
+        for name in names:
+            match = self.PARTITION_PATTERN.match(name)
+            if match:
+                lower = datetime(int(match.group(1)), int(match.group(2)), 1)
+                partitions.append((name, lower, self._next_month(lower)))
+        return sorted(partitions, key=lambda partition: partition[1])
+
+    def ensure_partitions(self, months_ahead: int = 2) -> List[str]:
+        """
+        Create monthly partitions from the current month up to
+        ``months_ahead`` months ahead, if missing.
+
+        Returns:
+            Names of all ensured partitions
+        """
+        if not self.is_partitioned():
+            return []
+
+        month = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        names = []
+        for _ in range(months_ahead + 1):
+            upper = self._next_month(month)
+            name = f"{AuditLog.__tablename__}_y{month.year:04d}m{month.month:02d}"
+            self.session.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {AuditLog.__tablename__} "
+                f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')"
+            ))
+            names.append(name)
+            month = upper
         self.session.commit()
-        
-        return count
-    
+        return names
+
+    def _detach_partition(self, name: str, drop: bool) -> None:
+        """Detach (and optionally drop) a partition."""
+        if not self.PARTITION_PATTERN.match(name):
+            raise ValueError(f"Not an audit log partition: {name}")
+        self.session.execute(text(
+            f"ALTER TABLE {AuditLog.__tablename__} DETACH PARTITION {name}"
+        ))
+        if drop:
+            self.session.execute(text(f"DROP TABLE {name}"))
+        self.session.commit()
+
+    def _dump_range(
+        self,
+        path: str,
+        lower: Optional[datetime],
+        upper: datetime,
+        batch_size: int,
+        delete_batches: bool = False
+    ) -> int:
+        """
+        Stream rows in [lower, upper) to a gzipped JSON-lines file using
+        keyset pagination on (created_at, id).
+
+        Without ``delete_batches`` the file is written to a temporary name
+        and renamed once complete; with it, batches are appended and each
+        is deleted after being flushed to disk.
+
+        Returns:
+            Number of rows written
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        target = path if delete_batches else f"{path}.tmp"
+        table = AuditLog.__table__
+
+        written = 0
+        last_key = None
+        with gzip.open(target, "at" if delete_batches else "wt", encoding="utf-8") as archive:
+            while True:
+                query = select(table).where(table.c.created_at < upper)
+                if lower is not None:
+                    query = query.where(table.c.created_at >= lower)
+                if last_key is not None and not delete_batches:
+                    query = query.where(tuple_(table.c.created_at, table.c.id) > last_key)
+                rows = self.session.execute(
+                    query.order_by(table.c.created_at, table.c.id).limit(batch_size)
+                ).mappings().all()
+                if not rows:
+                    break
+
+                for row in rows:
+                    archive.write(json.dumps(dict(row), default=str) + "\n")
+                written += len(rows)
+                last_key = (rows[-1]["created_at"], rows[-1]["id"])
+
+                if delete_batches:
+                    archive.flush()
+                    os.fsync(archive.fileno())
+                    self.session.execute(
+                        delete(AuditLog)
+                        .where(AuditLog.id.in_([row["id"] for row in rows]))
+                        .execution_options(synchronize_session=False)
+                    )
+                    self.session.commit()
+
+        if not delete_batches:
+            os.replace(target, path)
+        return written
+
+    @staticmethod
+    def _next_month(month: datetime) -> datetime:
+        """First day of the following month."""
+        return (month.replace(day=1) + timedelta(days=32)).replace(day=1)
+
     # ==================== Helper Methods ====================
     
     def _calculate_severity(
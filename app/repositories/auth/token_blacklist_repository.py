@@ -15,6 +15,7 @@ from app.models.auth import (
     SecurityEvent,
 )
 from app.repositories.base.base_repository import BaseRepository
+from app.core.security.revocation_filter import revocation_filter
 
 
 class BlacklistedTokenRepository(BaseRepository[BlacklistedToken]):
@@ -70,6 +71,7 @@ class BlacklistedTokenRepository(BaseRepository[BlacklistedToken]):
         )
         
         self.db.add(blacklisted)
+        revocation_filter.publish_on_commit(self.db, [jti])
         self.db.commit()
         self.db.refresh(blacklisted)
         return blacklisted
@@ -92,6 +94,22 @@ class BlacklistedTokenRepository(BaseRepository[BlacklistedToken]):
         
         return exists
 
+    def get_active_jtis(self, batch_size: int = 10000) -> List[str]:
+        """
+        Get JTIs of all blacklisted tokens that have not yet expired.
+
+        Args:
+            batch_size: Rows fetched per round trip
+
+        Returns:
+            List of JWT IDs
+        """
+        rows = self.db.query(BlacklistedToken.jti).filter(
+            BlacklistedToken.expires_at > datetime.utcnow()
+        ).yield_per(batch_size)
+
+        return [jti for (jti,) in rows]
+
     def find_by_jti(self, jti: str) -> Optional[BlacklistedToken]:
         """Find blacklisted token by JTI."""
         return self.db.query(BlacklistedToken).filter(
@@ -150,6 +168,7 @@ class BlacklistedTokenRepository(BaseRepository[BlacklistedToken]):
         ]
         
         self.db.bulk_save_objects(blacklisted_tokens)
+        revocation_filter.publish_on_commit(self.db, jtis)
         self.db.commit()
         
         return len(blacklisted_tokens)
@@ -125,11 +125,16 @@ from app.repositories.base.caching_repository import (
     cached_method,
 )
 
+from app.repositories.base.outbox_repository import OutboxRepository
+
 __all__ = [
     # Base repository
     "BaseRepository",
     "AuditContext",
     
+    # Transactional outbox
+    "OutboxRepository",
+    
     # Query builder
     "QueryBuilder",
     "JoinType",
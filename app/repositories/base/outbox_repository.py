@@ -0,0 +1,195 @@
+"""
+Transactional outbox repository.
+
+Writes outbox messages inside the caller's transaction and lets relay
+workers claim them concurrently with ``FOR UPDATE SKIP LOCKED``.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.models.common.outbox import OutboxMessage
+from app.repositories.base.base_repository import BaseRepository
+
+
+class OutboxRepository(BaseRepository[OutboxMessage]):
+    """
+    Repository for outbox messages.
+    """
+
+    def __init__(self, db: Session):
+        super().__init__(OutboxMessage, db)
+
+    def add_message(
+        self,
+        channel: str,
+        topic: str,
+        payload: Dict[str, Any],
+        available_at: Optional[datetime] = None,
+        max_attempts: int = 10,
+    ) -> OutboxMessage:
+        """
+        Stage an outbox message in the current transaction (no commit).
+
+        Args:
+            channel: Delivery channel
+            topic: Event type or routing key
+            payload: JSON-serializable payload
+            available_at: Earliest delivery time (defaults to now)
+            max_attempts: Attempts before dead-lettering
+
+        Returns:
+            Staged outbox message
+        """
+        message = OutboxMessage(
+            channel=channel,
+            topic=topic,
+            payload=payload,
+            status=OutboxMessage.STATUS_PENDING,
+            attempts=0,
+            max_attempts=max_attempts,
+            available_at=available_at or datetime.utcnow(),
+        )
+        self.db.add(message)
+        return message
+
+    def add_messages(self, messages: Iterable[Dict[str, Any]]) -> List[OutboxMessage]:
+        """Stage several outbox messages in the current transaction (no commit)."""
+        return [self.add_message(**message) for message in messages]
+
+    def claim_batch(
+        self,
+        batch_size: int = 100,
+        lease_seconds: int = 60,
+        channels: Optional[List[str]] = None,
+    ) -> List[OutboxMessage]:
+        """
+        Claim due messages for delivery.
+
+        Rows are locked with ``FOR UPDATE SKIP LOCKED`` so concurrent relays
+        never claim the same message, then leased by moving ``available_at``
+        forward and committed. A relay that dies mid-batch leaves its
+        messages to be reclaimed once the lease expires.
+
+        Args:
+            batch_size: Maximum messages to claim
+            lease_seconds: Lease duration
+            channels: Restrict to these channels
+
+        Returns:
+            Claimed messages
+        """
+        now = datetime.utcnow()
+        query = self.db.query(OutboxMessage).filter(
+            OutboxMessage.status.in_([
+                OutboxMessage.STATUS_PENDING,
+                OutboxMessage.STATUS_PROCESSING,
+            ]),
+            OutboxMessage.available_at <= now,
+        )
+        if channels:
+            query = query.filter(OutboxMessage.channel.in_(channels))
+
+        messages = (
+            query.order_by(OutboxMessage.available_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+        lease_until = now + timedelta(seconds=lease_seconds)
+        for message in messages:
+            message.status = OutboxMessage.STATUS_PROCESSING
+            message.attempts += 1
+            message.available_at = lease_until
+
+        self.db.commit()
+        return messages
+
+    def mark_delivered(self, message_ids: List[str]) -> int:
+        """Mark messages delivered in one statement."""
+        if not message_ids:
+            return 0
+        result = self.db.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(message_ids))
+            .values(
+                status=OutboxMessage.STATUS_DELIVERED,
+                delivered_at=datetime.utcnow(),
+                last_error=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def mark_failed(
+        self,
+        message: OutboxMessage,
+        error: str,
+        retry_at: datetime,
+    ) -> bool:
+        """
+        Record a failed attempt, scheduling a retry or dead-lettering.
+
+        Returns:
+            True if the message was dead-lettered
+        """
+        dead = message.attempts >= message.max_attempts
+        self.db.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id == message.id)
+            .values(
+                status=OutboxMessage.STATUS_DEAD if dead else OutboxMessage.STATUS_PENDING,
+                available_at=retry_at,
+                last_error=error[:2000],
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return dead
+
+    def purge_delivered(self, older_than_days: int = 7, batch_size: int = 5000) -> int:
+        """
+        Delete delivered messages older than the retention window in batches.
+
+        Returns:
+            Number of deleted messages
+        """
+        cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+        total = 0
+        while True:
+            ids = [
+                row.id for row in self.db.query(OutboxMessage.id).filter(
+                    OutboxMessage.status == OutboxMessage.STATUS_DELIVERED,
+                    OutboxMessage.delivered_at < cutoff,
+                ).limit(batch_size)
+            ]
+            if not ids:
+                break
+            total += self.db.query(OutboxMessage).filter(
+                OutboxMessage.id.in_(ids)
+            ).delete(synchronize_session=False)
+            self.db.commit()
+        return total
+
+    def get_backlog_statistics(self) -> Dict[str, Any]:
+        """Count messages by status and report the oldest pending message age."""
+        counts = dict(
+            self.db.query(OutboxMessage.status, func.count(OutboxMessage.id))
+            .group_by(OutboxMessage.status)
+            .all()
+        )
+        oldest = self.db.query(func.min(OutboxMessage.created_at)).filter(
+            OutboxMessage.status.in_([
+                OutboxMessage.STATUS_PENDING,
+                OutboxMessage.STATUS_PROCESSING,
+            ])
+        ).scalar()
+        return {
+            "by_status": counts,
+            "oldest_pending_at": oldest.isoformat() if oldest else None,
+        }
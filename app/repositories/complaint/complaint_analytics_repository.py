@@ -10,7 +10,7 @@ from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import String, and_, cast, desc, func, literal, literal_column, select, union_all
 from sqlalchemy.orm import Session
 
 from app.models.complaint.complaint_analytics import (
@@ -376,6 +376,11 @@ class ComplaintAnalyticSnapshotRepository(BaseRepository[ComplaintAnalyticSnapsh
         """
         Calculate metrics for a specific period.
         
+        Aggregation is pushed down to the database so no complaint rows are
+        loaded: on PostgreSQL a single GROUPING SETS query returns the
+        totals row plus the category, priority and status breakdowns; other
+        dialects use a portable equivalent.
+        
         Args:
             period_start: Period start date
             period_end: Period end date
@@ -388,21 +393,20 @@ class ComplaintAnalyticSnapshotRepository(BaseRepository[ComplaintAnalyticSnapsh
         start_dt = datetime.combine(period_start, datetime.min.time()).replace(tzinfo=timezone.utc)
         end_dt = datetime.combine(period_end, datetime.max.time()).replace(tzinfo=timezone.utc)
         
-        # Base query
-        query = select(Complaint).where(
-            and_(
-                Complaint.opened_at >= start_dt,
-                Complaint.opened_at <= end_dt,
-            )
-        )
-        
+        conditions = [
+            Complaint.opened_at >= start_dt,
+            Complaint.opened_at <= end_dt,
+        ]
         if hostel_id:
-            query = query.where(Complaint.hostel_id == hostel_id)
+            conditions.append(Complaint.hostel_id == hostel_id)
         
-        result = self.session.execute(query)
-        complaints = list(result.scalars().all())
+        if self.session.get_bind().dialect.name == "postgresql":
+            totals, breakdowns = self._aggregate_period_postgresql(conditions)
+        else:
+            totals, breakdowns = self._aggregate_period_portable(conditions)
         
-        if not complaints:
+        total = totals["total"] or 0
+        if not total:
             return {
                 "total_complaints": 0,
                 "open_complaints": 0,
@@ -411,93 +415,154 @@ class ComplaintAnalyticSnapshotRepository(BaseRepository[ComplaintAnalyticSnapsh
                 "closed_complaints": 0,
             }
         
-        # Calculate metrics
-        total = len(complaints)
-        
-        # Status counts
-        from app.models.base.enums import ComplaintStatus
-        status_counts = {
-            "open": len([c for c in complaints if c.status == ComplaintStatus.OPEN]),
-            "in_progress": len([c for c in complaints if c.status == ComplaintStatus.IN_PROGRESS]),
-            "resolved": len([c for c in complaints if c.status == ComplaintStatus.RESOLVED]),
-            "closed": len([c for c in complaints if c.status == ComplaintStatus.CLOSED]),
-        }
-        
-        # Resolution time metrics
-        resolved_complaints = [
-            c for c in complaints
-            if c.resolved_at is not None
-        ]
+        def hours(value):
+            return Decimal(str(value)) if value is not None else None
         
-        resolution_times = []
-        for c in resolved_complaints:
-            hours = (c.resolved_at - c.opened_at).total_seconds() / 3600
-            resolution_times.append(hours)
-        
-        avg_resolution_time = (
-            sum(resolution_times) / len(resolution_times)
-            if resolution_times else None
-        )
-        
-        median_resolution_time = None
-        if resolution_times:
-            sorted_times = sorted(resolution_times)
-            n = len(sorted_times)
-            if n % 2 == 0:
-                median_resolution_time = (sorted_times[n//2-1] + sorted_times[n//2]) / 2
-            else:
-                median_resolution_time = sorted_times[n//2]
-        
-        min_resolution_time = min(resolution_times) if resolution_times else None
-        max_resolution_time = max(resolution_times) if resolution_times else None
-        
-        # SLA metrics
-        sla_compliant = len([c for c in complaints if not c.sla_breach])
-        sla_breached = len([c for c in complaints if c.sla_breach])
-        sla_compliance_rate = (sla_compliant / total * 100) if total > 0 else 0
-        
-        # Other metrics
-        escalated = len([c for c in complaints if c.escalated])
-        reopened = len([c for c in complaints if c.reopened_count > 0])
-        
-        # Category breakdown
-        category_breakdown = {}
-        for c in complaints:
-            cat = c.category.value
-            category_breakdown[cat] = category_breakdown.get(cat, 0) + 1
-        
-        # Priority breakdown
-        priority_breakdown = {}
-        for c in complaints:
-            pri = c.priority.value
-            priority_breakdown[pri] = priority_breakdown.get(pri, 0) + 1
-        
-        # Status breakdown
-        status_breakdown = {}
-        for c in complaints:
-            stat = c.status.value
-            status_breakdown[stat] = status_breakdown.get(stat, 0) + 1
+        status_breakdown = breakdowns["status"]
+        sla_breached = totals["sla_breached"] or 0
+        sla_compliant = total - sla_breached
         
         return {
             "total_complaints": total,
-            "open_complaints": status_counts["open"],
-            "in_progress_complaints": status_counts["in_progress"],
-            "resolved_complaints": status_counts["resolved"],
-            "closed_complaints": status_counts["closed"],
-            "avg_resolution_time_hours": Decimal(str(avg_resolution_time)) if avg_resolution_time else None,
-            "median_resolution_time_hours": Decimal(str(median_resolution_time)) if median_resolution_time else None,
-            "min_resolution_time_hours": Decimal(str(min_resolution_time)) if min_resolution_time else None,
-            "max_resolution_time_hours": Decimal(str(max_resolution_time)) if max_resolution_time else None,
+            "open_complaints": status_breakdown.get("open", 0),
+            "in_progress_complaints": status_breakdown.get("in_progress", 0),
+            "resolved_complaints": status_breakdown.get("resolved", 0),
+            "closed_complaints": status_breakdown.get("closed", 0),
+            "avg_resolution_time_hours": hours(totals["avg_hours"]),
+            "median_resolution_time_hours": hours(totals["median_hours"]),
+            "min_resolution_time_hours": hours(totals["min_hours"]),
+            "max_resolution_time_hours": hours(totals["max_hours"]),
             "sla_compliant_count": sla_compliant,
             "sla_breached_count": sla_breached,
-            "sla_compliance_rate": Decimal(str(sla_compliance_rate)),
-            "escalated_count": escalated,
-            "reopened_count": reopened,
-            "category_breakdown": category_breakdown,
-            "priority_breakdown": priority_breakdown,
+            "sla_compliance_rate": Decimal(str(sla_compliant / total * 100)),
+            "escalated_count": totals["escalated"] or 0,
+            "reopened_count": totals["reopened"] or 0,
+            "category_breakdown": breakdowns["category"],
+            "priority_breakdown": breakdowns["priority"],
             "status_breakdown": status_breakdown,
         }
 
+    @staticmethod
+    def _period_aggregates(resolution_hours) -> List[Any]:
+        """Aggregate columns shared by both period metric queries."""
+        return [
+            func.count().label("total"),
+            func.count().filter(Complaint.sla_breach.is_(True)).label("sla_breached"),
+            func.count().filter(Complaint.escalated.is_(True)).label("escalated"),
+            func.count().filter(Complaint.reopened_count > 0).label("reopened"),
+            # NULL for unresolved complaints, which the aggregates skip
+            func.avg(resolution_hours).label("avg_hours"),
+            func.min(resolution_hours).label("min_hours"),
+            func.max(resolution_hours).label("max_hours"),
+        ]
+
+    @staticmethod
+    def _enum_value(value: Any) -> Any:
+        return getattr(value, "value", value)
+
+    def _aggregate_period_postgresql(
+        self,
+        conditions: List[Any],
+    ) -> tuple:
+        """
+        Compute period totals and breakdowns in one GROUPING SETS query.
+        
+        Returns:
+            (totals row mapping, {"category"|"priority"|"status": counts})
+        """
+        resolution_hours = func.extract(
+            "epoch", Complaint.resolved_at - Complaint.opened_at
+        ) / 3600
+        
+        query = select(
+            func.grouping(Complaint.category).label("by_category"),
+            func.grouping(Complaint.priority).label("by_priority"),
+            func.grouping(Complaint.status).label("by_status"),
+            Complaint.category,
+            Complaint.priority,
+            Complaint.status,
+            *self._period_aggregates(resolution_hours),
+            func.percentile_cont(0.5).within_group(resolution_hours).label("median_hours"),
+        ).where(and_(*conditions)).group_by(
+            func.grouping_sets(
+                literal_column("()"),
+                Complaint.category,
+                Complaint.priority,
+                Complaint.status,
+            )
+        )
+        
+        totals: Dict[str, Any] = {"total": 0}
+        breakdowns: Dict[str, Dict[str, int]] = {"category": {}, "priority": {}, "status": {}}
+        for row in self.session.execute(query).mappings():
+            # grouping() is 1 for a column rolled up in this row's set
+            if row["by_category"] == 0:
+                breakdowns["category"][self._enum_value(row["category"])] = row["total"]
+            elif row["by_priority"] == 0:
+                breakdowns["priority"][self._enum_value(row["priority"])] = row["total"]
+            elif row["by_status"] == 0:
+                breakdowns["status"][self._enum_value(row["status"])] = row["total"]
+            else:
+                totals = dict(row)
+        return totals, breakdowns
+
+    def _aggregate_period_portable(
+        self,
+        conditions: List[Any],
+    ) -> tuple:
+        """
+        Portable equivalent of _aggregate_period_postgresql (e.g. SQLite).
+        
+        Uses one aggregate query, one UNION ALL query for the breakdowns
+        and an OFFSET lookup for the median, so memory stays constant.
+        
+        Returns:
+            (totals row mapping, {"category"|"priority"|"status": counts})
+        """
+        resolution_hours = (
+            func.julianday(Complaint.resolved_at) - func.julianday(Complaint.opened_at)
+        ) * 24
+        where = and_(*conditions)
+        
+        totals = dict(self.session.execute(
+            select(*self._period_aggregates(resolution_hours)).where(where)
+        ).mappings().one())
+        
+        resolved = totals["total"] and self.session.execute(
+            select(func.count()).where(where, Complaint.resolved_at.isnot(None))
+        ).scalar()
+        totals["median_hours"] = None
+        if resolved:
+            middle = self.session.execute(
+                select(resolution_hours.label("hours"))
+                .where(where, Complaint.resolved_at.isnot(None))
+                .order_by(resolution_hours)
+                .offset((resolved - 1) // 2)
+                .limit(2 - resolved % 2)
+            ).scalars().all()
+            totals["median_hours"] = sum(middle) / len(middle)
+        
+        breakdowns: Dict[str, Dict[str, int]] = {"category": {}, "priority": {}, "status": {}}
+        if totals["total"]:
+            dimensions = {
+                "category": Complaint.category,
+                "priority": Complaint.priority,
+                "status": Complaint.status,
+            }
+            # Enum columns store member names; cast so the union has one type
+            grouped = union_all(*(
+                select(
+                    literal(dimension).label("dimension"),
+                    cast(column, String).label("name"),
+                    func.count().label("total"),
+                ).where(where).group_by(column)
+                for dimension, column in dimensions.items()
+            ))
+            for row in self.session.execute(grouped).mappings():
+                enum_class = dimensions[row["dimension"]].type.enum_class
+                breakdowns[row["dimension"]][enum_class[row["name"]].value] = row["total"]
+        return totals, breakdowns
+
 
 class ComplaintCategoryMetricRepository(BaseRepository[ComplaintCategoryMetric]):
     """
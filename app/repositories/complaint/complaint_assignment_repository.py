@@ -6,13 +6,20 @@ Handles assignment history, workload balancing, and assignment optimization
 for efficient complaint resolution.
 """
 
+import heapq
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import and_, desc, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
-from app.models.complaint.complaint_assignment import ComplaintAssignment
+from app.models.base.enums import ComplaintStatus
+from app.models.complaint.complaint_assignment import (
+    ComplaintAssigneeWorkload,
+    ComplaintAssignment,
+)
 from app.models.complaint.complaint import Complaint
 from app.repositories.base.base_repository import BaseRepository
 
@@ -23,8 +30,19 @@ class ComplaintAssignmentRepository(BaseRepository[ComplaintAssignment]):
     
     Provides assignment tracking, workload optimization, and performance
     analytics for complaint resolution staff.
+    
+    Open workload per assignee is materialized in complaint_assignee_workloads
+    and adjusted in the same transaction as every assignment, reassignment,
+    resolution and reopen, so selection and balancing read one row per
+    candidate instead of aggregating assignment history.
     """
 
+    # Statuses whose current assignment no longer counts as open workload
+    CLOSED_STATUSES = (ComplaintStatus.RESOLVED, ComplaintStatus.CLOSED)
+    
+    # Half-life of the rolling reassignment counters
+    REASSIGNMENT_HALF_LIFE_DAYS = 30.0
+
     def __init__(self, session: Session):
         """
         Initialize complaint assignment repository.
@@ -63,8 +81,33 @@ class ComplaintAssignmentRepository(BaseRepository[ComplaintAssignment]):
         Returns:
             Created assignment instance
         """
+        complaint = self.session.get(Complaint, complaint_id)
+        
         # Mark previous assignment as not current if exists
-        self._deactivate_previous_assignments(complaint_id)
+        previous = self._deactivate_previous_assignments(complaint_id)
+        
+        if complaint is not None:
+            is_open = self._is_open_status(complaint.status)
+            deltas = []
+            
+            if previous is not None:
+                deltas.append({
+                    "assignee_id": previous.assigned_to,
+                    "hostel_id": complaint.hostel_id,
+                    "open_count": -1 if is_open else 0,
+                    "workload_score": -previous.workload_score if is_open else 0,
+                    "reassigned_away": int(previous.assigned_to != assigned_to),
+                })
+            
+            deltas.append({
+                "assignee_id": assigned_to,
+                "hostel_id": complaint.hostel_id,
+                "open_count": 1 if is_open else 0,
+                "workload_score": workload_score if is_open else 0,
+                "assigned": 1,
+            })
+            
+            self._apply_workload_deltas(deltas)
         
         assignment = ComplaintAssignment(
             complaint_id=complaint_id,
@@ -100,6 +143,17 @@ class ComplaintAssignmentRepository(BaseRepository[ComplaintAssignment]):
         
         now = datetime.now(timezone.utc)
         
+        # Release the workload it still holds
+        if assignment.is_current:
+            complaint = self.session.get(Complaint, assignment.complaint_id)
+            if complaint is not None and self._is_open_status(complaint.status):
+                self._apply_workload_deltas([{
+                    "assignee_id": assignment.assigned_to,
+                    "hostel_id": complaint.hostel_id,
+                    "open_count": -1,
+                    "workload_score": -assignment.workload_score,
+                }])
+        
         # Calculate duration
         duration_delta = now - assignment.assigned_at
         duration_hours = int(duration_delta.total_seconds() / 3600)
@@ -112,6 +166,38 @@ class ComplaintAssignmentRepository(BaseRepository[ComplaintAssignment]):
         
         return self.update(assignment_id, update_data)
 
+    def record_status_transition(
+        self,
+        complaint: Complaint,
+        new_status: Any,
+    ) -> None:
+        """
+        Adjust the assignee's workload for a complaint status change.
+        
+        Resolving or closing an open complaint releases its current
+        assignment's workload; reopening takes it back. Runs in the
+        caller's transaction (no commit).
+        
+        Args:
+            complaint: Complaint before the status change
+            new_status: Status being applied
+        """
+        was_open = self._is_open_status(complaint.status)
+        if was_open == self._is_open_status(new_status):
+            return
+        
+        current = self.find_current_assignment(complaint.id)
+        if current is None:
+            return
+        
+        sign = 1 if not was_open else -1
+        self._apply_workload_deltas([{
+            "assignee_id": current.assigned_to,
+            "hostel_id": complaint.hostel_id,
+            "open_count": sign,
+            "workload_score": sign * current.workload_score,
+        }])
+
     # ==================== Query Operations ====================
 
     def find_by_complaint(
@@ -352,6 +438,74 @@ class ComplaintAssignmentRepository(BaseRepository[ComplaintAssignment]):
             ),
         }
 
+    def get_workload_snapshot(
+        self,
+        user_ids: List[str],
+        hostel_id: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Read materialized workload for a set of users in one query.
+        
+        Without a hostel filter, a user's workload is summed across hostels.
+        Users without a workload row are reported with zero workload.
+        
+        Args:
+            user_ids: List of user identifiers
+            hostel_id: Optional hostel filter
+            
+        Returns:
+            Workload metrics keyed by user ID
+        """
+        totals = {
+            user_id: {
+                "open_count": 0,
+                "workload_score": 0,
+                "recent_assignments": 0.0,
+                "recent_reassignments": 0.0,
+            }
+            for user_id in user_ids
+        }
+        
+        if user_ids:
+            query = select(ComplaintAssigneeWorkload).where(
+                ComplaintAssigneeWorkload.assignee_id.in_(user_ids)
+            )
+            
+            if hostel_id:
+                query = query.where(ComplaintAssigneeWorkload.hostel_id == hostel_id)
+            
+            now = datetime.now(timezone.utc)
+            
+            for row in self.session.execute(query).scalars():
+                factor = self._decay_factor(row.decayed_at, now)
+                total = totals[row.assignee_id]
+                total["open_count"] += row.open_count
+                total["workload_score"] += row.workload_score
+                total["recent_assignments"] += row.recent_assignments * factor
+                total["recent_reassignments"] += row.recent_reassignments * factor
+        
+        snapshot = {}
+        
+        for user_id, total in totals.items():
+            open_count = total["open_count"]
+            recent_assignments = total["recent_assignments"]
+            
+            snapshot[user_id] = {
+                "user_id": user_id,
+                "total_assignments": open_count,
+                "total_workload_score": total["workload_score"],
+                "average_workload_score": (
+                    total["workload_score"] / open_count
+                    if open_count > 0 else 0
+                ),
+                "reassignment_rate": (
+                    min(total["recent_reassignments"] / recent_assignments * 100, 100.0)
+                    if recent_assignments > 0 else 0
+                ),
+            }
+        
+        return snapshot
+
     def get_team_workload_distribution(
         self,
         user_ids: List[str],
@@ -360,6 +514,9 @@ class ComplaintAssignmentRepository(BaseRepository[ComplaintAssignment]):
         """
         Get workload distribution across a team.
         
+        Reads the materialized workload; use get_user_workload for the
+        priority and overdue breakdown of a single user.
+        
         Args:
             user_ids: List of user identifiers
             hostel_id: Optional hostel filter
@@ -367,11 +524,7 @@ class ComplaintAssignmentRepository(BaseRepository[ComplaintAssignment]):
         Returns:
             List of workload metrics per user
         """
-        workload_data = []
-        
-        for user_id in user_ids:
-            workload = self.get_user_workload(user_id, hostel_id)
-            workload_data.append(workload)
+        workload_data = list(self.get_workload_snapshot(user_ids, hostel_id).values())
         
         # Sort by total assignments descending
         workload_data.sort(key=lambda x: x["total_assignments"], reverse=True)
@@ -396,18 +549,91 @@ class ComplaintAssignmentRepository(BaseRepository[ComplaintAssignment]):
         if not user_ids:
             return None
         
-        workload_data = self.get_team_workload_distribution(user_ids, hostel_id)
+        snapshot = self.get_workload_snapshot(user_ids, hostel_id)
+        
+        # Ties go to the earlier candidate
+        return min(
+            user_ids,
+            key=lambda user_id: (
+                snapshot[user_id]["total_workload_score"],
+                snapshot[user_id]["total_assignments"],
+            ),
+        )
+
+    def rebuild_workloads(
+        self,
+        hostel_id: Optional[str] = None,
+    ) -> int:
+        """
+        Recompute open workload from assignment history.
         
-        if not workload_data:
-            return user_ids[0]
+        Backfills the materialized table and corrects drift from writes
+        that bypassed this repository (e.g. bulk updates). Rolling
+        reassignment counters are kept as they are.
         
-        # Find user with minimum workload score
-        min_workload_user = min(
-            workload_data,
-            key=lambda x: x["total_workload_score"]
+        Args:
+            hostel_id: Optional hostel filter
+            
+        Returns:
+            Number of workload rows written
+        """
+        open_query = (
+            select(
+                ComplaintAssignment.assigned_to,
+                Complaint.hostel_id,
+                func.count(ComplaintAssignment.id).label("open_count"),
+                func.coalesce(func.sum(ComplaintAssignment.workload_score), 0).label("workload_score"),
+            )
+            .join(Complaint, Complaint.id == ComplaintAssignment.complaint_id)
+            .where(
+                and_(
+                    ComplaintAssignment.is_current == True,
+                    Complaint.status.notin_(self.CLOSED_STATUSES),
+                )
+            )
+            .group_by(ComplaintAssignment.assigned_to, Complaint.hostel_id)
         )
         
-        return min_workload_user["user_id"]
+        existing_query = select(ComplaintAssigneeWorkload)
+        
+        if hostel_id:
+            open_query = open_query.where(Complaint.hostel_id == hostel_id)
+            existing_query = existing_query.where(
+                ComplaintAssigneeWorkload.hostel_id == hostel_id
+            )
+        
+        computed = {
+            (row.assigned_to, row.hostel_id): row
+            for row in self.session.execute(open_query)
+        }
+        existing = {
+            (row.assignee_id, row.hostel_id): row
+            for row in self.session.execute(existing_query).scalars()
+        }
+        
+        now = datetime.now(timezone.utc)
+        
+        for key in existing.keys() | computed.keys():
+            row = existing.get(key)
+            if row is None:
+                row = ComplaintAssigneeWorkload(
+                    assignee_id=key[0],
+                    hostel_id=key[1],
+                    recent_assignments=0.0,
+                    recent_reassignments=0.0,
+                    total_assignments=0,
+                    total_reassignments=0,
+                    decayed_at=now,
+                )
+                self.session.add(row)
+            
+            source = computed.get(key)
+            row.open_count = source.open_count if source else 0
+            row.workload_score = int(source.workload_score) if source else 0
+        
+        self.session.commit()
+        
+        return len(existing.keys() | computed.keys())
 
     def calculate_workload_score(
         self,
@@ -595,7 +821,7 @@ class ComplaintAssignmentRepository(BaseRepository[ComplaintAssignment]):
         hostel_id: Optional[str] = None,
     ) -> Optional[str]:
         """
-        Suggest optimal assignee based on workload and performance.
+        Suggest optimal assignee based on workload and reassignment history.
         
         Args:
             complaint_id: Complaint being assigned
@@ -609,41 +835,22 @@ class ComplaintAssignmentRepository(BaseRepository[ComplaintAssignment]):
             return None
         
         # Get complaint details
-        complaint_query = select(Complaint).where(Complaint.id == complaint_id)
-        complaint_result = self.session.execute(complaint_query)
-        complaint = complaint_result.scalar_one_or_none()
-        
-        if not complaint:
+        complaint_query = select(Complaint.id).where(Complaint.id == complaint_id)
+        if self.session.execute(complaint_query).scalar_one_or_none() is None:
             return None
         
-        # Calculate scores for each candidate
-        candidate_scores = []
+        snapshot = self.get_workload_snapshot(candidate_user_ids, hostel_id)
         
-        for user_id in candidate_user_ids:
-            workload = self.get_user_workload(user_id, hostel_id)
-            performance = self.get_assignment_performance(user_id)
-            
-            # Calculate composite score (lower is better)
-            # Factors: workload (50%), reassignment rate (30%), response time (20%)
-            workload_score = workload["total_workload_score"]
-            reassignment_penalty = performance["reassignment_rate"] * 10
-            
-            composite_score = (
-                workload_score * 0.5 +
-                reassignment_penalty * 0.3
+        # Composite score (lower is better)
+        # Factors: workload (50%), rolling reassignment rate (30%)
+        def composite_score(user_id: str) -> float:
+            workload = snapshot[user_id]
+            return (
+                workload["total_workload_score"] * 0.5 +
+                workload["reassignment_rate"] * 10 * 0.3
             )
-            
-            candidate_scores.append({
-                "user_id": user_id,
-                "score": composite_score,
-                "workload": workload_score,
-                "reassignment_rate": performance["reassignment_rate"],
-            })
-        
-        # Sort by score (ascending - lower is better)
-        candidate_scores.sort(key=lambda x: x["score"])
         
-        return candidate_scores[0]["user_id"] if candidate_scores else None
+        return min(candidate_user_ids, key=composite_score)
 
     def balance_workload(
         self,
@@ -652,7 +859,13 @@ class ComplaintAssignmentRepository(BaseRepository[ComplaintAssignment]):
         threshold_percentage: float = 30.0,
     ) -> List[Dict[str, Any]]:
         """
-        Identify workload imbalances and suggest reassignments.
+        Build a greedy reassignment plan for workload imbalances.
+        
+        Users more than threshold_percentage above the team average give up
+        their largest movable complaints, each to whoever is currently
+        least loaded (min-heap), as long as the move narrows the gap and
+        keeps the receiver within the threshold. Only complaints not yet
+        in progress are moved.
         
         Args:
             user_ids: List of team member IDs
@@ -660,51 +873,242 @@ class ComplaintAssignmentRepository(BaseRepository[ComplaintAssignment]):
             threshold_percentage: Imbalance threshold
             
         Returns:
-            List of suggested reassignments
+            Ordered list of suggested complaint moves
         """
-        workload_data = self.get_team_workload_distribution(user_ids, hostel_id)
+        snapshot = self.get_workload_snapshot(user_ids, hostel_id)
         
-        if not workload_data:
+        if not snapshot:
             return []
         
+        loads = {
+            user_id: workload["total_workload_score"]
+            for user_id, workload in snapshot.items()
+        }
+        
         # Calculate average workload
-        avg_workload = sum(w["total_workload_score"] for w in workload_data) / len(workload_data)
+        avg_workload = sum(loads.values()) / len(loads)
         
-        # Identify overloaded and underloaded users
-        overloaded = []
-        underloaded = []
+        if avg_workload <= 0:
+            return []
         
-        for workload in workload_data:
-            deviation = (workload["total_workload_score"] - avg_workload) / avg_workload * 100
-            
-            if deviation > threshold_percentage:
-                overloaded.append(workload)
-            elif deviation < -threshold_percentage:
-                underloaded.append(workload)
+        upper_bound = avg_workload * (1 + threshold_percentage / 100)
+        overloaded = [user_id for user_id, load in loads.items() if load > upper_bound]
+        receivers = [(load, user_id) for user_id, load in loads.items() if load < avg_workload]
+        
+        if not overloaded or not receivers:
+            return []
+        
+        heapq.heapify(receivers)
+        
+        # Movable assignments of overloaded users, largest first
+        movable_query = (
+            select(
+                ComplaintAssignment.id,
+                ComplaintAssignment.complaint_id,
+                ComplaintAssignment.assigned_to,
+                ComplaintAssignment.workload_score,
+            )
+            .join(Complaint, Complaint.id == ComplaintAssignment.complaint_id)
+            .where(
+                and_(
+                    ComplaintAssignment.assigned_to.in_(overloaded),
+                    ComplaintAssignment.is_current == True,
+                    ComplaintAssignment.workload_score > 0,
+                    Complaint.status.notin_(
+                        [ComplaintStatus.IN_PROGRESS, *self.CLOSED_STATUSES]
+                    ),
+                )
+            )
+            .order_by(desc(ComplaintAssignment.workload_score))
+        )
+        
+        if hostel_id:
+            movable_query = movable_query.where(Complaint.hostel_id == hostel_id)
+        
+        movable = defaultdict(list)
+        for row in self.session.execute(movable_query):
+            movable[row.assigned_to].append(row)
         
         suggestions = []
         
-        # Suggest reassignments from overloaded to underloaded
-        for overload in overloaded:
-            for underload in underloaded:
+        for from_user in sorted(overloaded, key=lambda user_id: loads[user_id], reverse=True):
+            for item in movable[from_user]:
+                if loads[from_user] <= upper_bound:
+                    break
+                
+                to_load, to_user = receivers[0]
+                score = item.workload_score
+                
+                if to_load + score >= loads[from_user] or to_load + score > upper_bound:
+                    continue
+                
                 suggestions.append({
-                    "from_user": overload["user_id"],
-                    "to_user": underload["user_id"],
-                    "from_workload": overload["total_workload_score"],
-                    "to_workload": underload["total_workload_score"],
+                    "assignment_id": item.id,
+                    "complaint_id": item.complaint_id,
+                    "from_user": from_user,
+                    "to_user": to_user,
+                    "workload_score": score,
+                    "from_workload": loads[from_user],
+                    "to_workload": to_load,
                     "reason": "Workload balancing",
                 })
+                
+                loads[from_user] -= score
+                loads[to_user] = to_load + score
+                heapq.heapreplace(receivers, (loads[to_user], to_user))
         
         return suggestions
 
     # ==================== Helper Methods ====================
 
-    def _deactivate_previous_assignments(self, complaint_id: str) -> None:
+    def _apply_workload_deltas(self, deltas: List[Dict[str, Any]]) -> None:
+        """
+        Apply workload changes in the current transaction (no commit).
+        
+        Deltas for the same assignee and hostel are merged, and rows are
+        locked in key order so concurrent reassignments cannot deadlock.
+        
+        Args:
+            deltas: Changes with assignee_id, hostel_id and any of
+                open_count, workload_score, assigned, reassigned_away
+        """
+        merged: Dict[Tuple[str, str], Dict[str, int]] = defaultdict(
+            lambda: {"open_count": 0, "workload_score": 0, "assigned": 0, "reassigned_away": 0}
+        )
+        
+        for delta in deltas:
+            totals = merged[(delta["assignee_id"], delta["hostel_id"])]
+            for field in totals:
+                totals[field] += delta.get(field, 0)
+        
+        now = datetime.now(timezone.utc)
+        
+        for assignee_id, hostel_id in sorted(merged):
+            change = merged[(assignee_id, hostel_id)]
+            row = self._lock_workload_row(assignee_id, hostel_id, now)
+            
+            factor = self._decay_factor(row.decayed_at, now)
+            row.recent_assignments = row.recent_assignments * factor + change["assigned"]
+            row.recent_reassignments = row.recent_reassignments * factor + change["reassigned_away"]
+            row.decayed_at = now
+            
+            row.open_count = max(row.open_count + change["open_count"], 0)
+            row.workload_score = max(row.workload_score + change["workload_score"], 0)
+            row.total_assignments += change["assigned"]
+            row.total_reassignments += change["reassigned_away"]
+            
+            if change["assigned"]:
+                row.last_assigned_at = now
+        
+        self.session.flush()
+
+    def _lock_workload_row(
+        self,
+        assignee_id: str,
+        hostel_id: str,
+        now: datetime,
+    ) -> ComplaintAssigneeWorkload:
+        """
+        Get the workload row for update, creating it if missing.
+        
+        Args:
+            assignee_id: User ID of assignee
+            hostel_id: Hostel identifier
+            now: Current timestamp
+            
+        Returns:
+            Locked workload row
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            self.session.execute(
+                pg_insert(ComplaintAssigneeWorkload)
+                .values(assignee_id=assignee_id, hostel_id=hostel_id, decayed_at=now)
+                .on_conflict_do_nothing(
+                    index_elements=[
+                        ComplaintAssigneeWorkload.assignee_id,
+                        ComplaintAssigneeWorkload.hostel_id,
+                    ]
+                )
+            )
+        
+        row = self.session.execute(
+            select(ComplaintAssigneeWorkload)
+            .where(
+                and_(
+                    ComplaintAssigneeWorkload.assignee_id == assignee_id,
+                    ComplaintAssigneeWorkload.hostel_id == hostel_id,
+                )
+            )
+            .with_for_update()
+        ).scalar_one_or_none()
+        
+        if row is None:
+            row = ComplaintAssigneeWorkload(
+                assignee_id=assignee_id,
+                hostel_id=hostel_id,
+                open_count=0,
+                workload_score=0,
+                total_assignments=0,
+                total_reassignments=0,
+                recent_assignments=0.0,
+                recent_reassignments=0.0,
+                decayed_at=now,
+            )
+            self.session.add(row)
+        
+        return row
+
+    def _decay_factor(self, decayed_at: Optional[datetime], now: datetime) -> float:
+        """
+        Get the decay factor for rolling counters last decayed at a time.
+        
+        Args:
+            decayed_at: Time the counters were last decayed to
+            now: Current timestamp
+            
+        Returns:
+            Multiplier in (0, 1]
+        """
+        if decayed_at is None:
+            return 1.0
+        
+        if decayed_at.tzinfo is None:
+            decayed_at = decayed_at.replace(tzinfo=timezone.utc)
+        
+        elapsed_days = (now - decayed_at).total_seconds() / 86400
+        if elapsed_days <= 0:
+            return 1.0
+        
+        return 0.5 ** (elapsed_days / self.REASSIGNMENT_HALF_LIFE_DAYS)
+
+    def _is_open_status(self, status: Any) -> bool:
+        """
+        Check whether a status counts toward open workload.
+        
+        Args:
+            status: ComplaintStatus member, value or name
+            
+        Returns:
+            True unless the complaint is resolved or closed
+        """
+        value = str(getattr(status, "value", status)).lower()
+        return value not in {closed.value for closed in self.CLOSED_STATUSES}
+
+    def _deactivate_previous_assignments(
+        self,
+        complaint_id: str,
+    ) -> Optional[ComplaintAssignment]:
         """
         Mark all previous assignments for a complaint as inactive.
         
+        Changes are flushed, not committed, so they land in the same
+        transaction as the new assignment.
+        
         Args:
             complaint_id: Complaint identifier
+            
+        Returns:
+            The assignment that was current, or None
         """
         now = datetime.now(timezone.utc)
         
@@ -721,6 +1125,6 @@ class ComplaintAssignmentRepository(BaseRepository[ComplaintAssignment]):
                 "is_current": False,
                 "unassigned_at": now,
                 "duration_hours": duration_hours,
-            })
-
-
+            }, commit=False)
+        
+        return current
@@ -17,6 +17,9 @@ from app.models.base.enums import ComplaintCategory, ComplaintStatus, Priority
 from app.repositories.base.base_repository import BaseRepository
 from app.repositories.base.query_builder import QueryBuilder
 from app.repositories.base.specifications import Specification
+from app.repositories.complaint.complaint_assignment_repository import (
+    ComplaintAssignmentRepository,
+)
 
 
 class ComplaintRepository(BaseRepository[Complaint]):
@@ -118,6 +121,9 @@ class ComplaintRepository(BaseRepository[Complaint]):
         
         # Track specific updates
         if "status" in update_data:
+            ComplaintAssignmentRepository(self.session).record_status_transition(
+                complaint, update_data["status"]
+            )
             self._handle_status_change(complaint, update_data["status"])
         
         if "priority" in update_data:
@@ -604,6 +610,10 @@ class ComplaintRepository(BaseRepository[Complaint]):
         
         now = datetime.now(timezone.utc)
         
+        ComplaintAssignmentRepository(self.session).record_status_transition(
+            complaint, ComplaintStatus.RESOLVED
+        )
+        
         update_data = {
             "status": ComplaintStatus.RESOLVED,
             "resolved_at": now,
@@ -635,6 +645,10 @@ class ComplaintRepository(BaseRepository[Complaint]):
         if not complaint:
             return None
         
+        ComplaintAssignmentRepository(self.session).record_status_transition(
+            complaint, ComplaintStatus.OPEN
+        )
+        
         update_data = {
             "status": ComplaintStatus.REOPENED,
             "reopened_count": complaint.reopened_count + 1,
@@ -20,6 +20,11 @@ from app.repositories.fee_structure.fee_calculation_repository import (
 from app.repositories.fee_structure.fee_aggregate_repository import (
     FeeAggregateRepository,
 )
+from app.repositories.fee_structure.pricing_rule_set import (
+    PricingRuleSet,
+    PricingRuleSetCache,
+    pricing_rules,
+)
 
 __all__ = [
     # Fee Structure
@@ -33,4 +38,8 @@ __all__ = [
     "FeeProjectionRepository",
     # Aggregates
     "FeeAggregateRepository",
+    # Compiled pricing rules
+    "PricingRuleSet",
+    "PricingRuleSetCache",
+    "pricing_rules",
 ]
\ No newline at end of file
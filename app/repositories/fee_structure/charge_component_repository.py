@@ -12,7 +12,7 @@ from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 import json
 
-from sqlalchemy import and_, or_, func, case, select, desc, asc
+from sqlalchemy import and_, or_, func, case, select, desc, asc, update
 from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.models.fee_structure.charge_component import (
@@ -21,6 +21,10 @@ from app.models.fee_structure.charge_component import (
     DiscountConfiguration,
 )
 from app.repositories.base.base_repository import BaseRepository
+from app.repositories.fee_structure.pricing_rule_set import (
+    CompiledDiscount,
+    pricing_rules,
+)
 from app.core.exceptions import (
     NotFoundError,
     ValidationError,
@@ -101,6 +105,7 @@ class ChargeComponentRepository(BaseRepository[ChargeComponent]):
         self._apply_audit(component, audit_context)
         self.session.add(component)
         self.session.flush()
+        self._invalidate_pricing_rules(component)
         
         return component
     
@@ -153,6 +158,7 @@ class ChargeComponentRepository(BaseRepository[ChargeComponent]):
         
         self._apply_audit(component, audit_context, is_update=True)
         self.session.flush()
+        self._invalidate_pricing_rules(component)
         
         return component
     
@@ -187,6 +193,7 @@ class ChargeComponentRepository(BaseRepository[ChargeComponent]):
             component.deleted_by = audit_context.get('user_id')
         
         self.session.flush()
+        self._invalidate_pricing_rules(component)
         return True
     
     # ============================================================
@@ -1113,6 +1120,7 @@ class ChargeComponentRepository(BaseRepository[ChargeComponent]):
         )
         
         self.session.flush()
+        pricing_rules.invalidate_on_commit(self.session)
         return updated
     
     def clone_components_to_structure(
@@ -1350,6 +1358,14 @@ validate component data."""
                 f"Component with name '{component_name}' already exists in this fee structure"
             )
     
+    def _invalidate_pricing_rules(self, component: ChargeComponent) -> None:
+        """Drop the compiled pricing rules of the component's hostel on commit"""
+        fee_structure = component.fee_structure
+        pricing_rules.invalidate_on_commit(
+            self.session,
+            [fee_structure.hostel_id] if fee_structure else None
+        )
+    
     def _apply_audit(
         self,
         entity: ChargeComponent,
@@ -1934,6 +1950,7 @@ class DiscountConfigurationRepository(BaseRepository[DiscountConfiguration]):
         self._apply_audit(discount, audit_context)
         self.session.add(discount)
         self.session.flush()
+        pricing_rules.invalidate_for_discount(discount, self.session)
         
         return discount
     
@@ -1960,7 +1977,10 @@ class DiscountConfigurationRepository(BaseRepository[DiscountConfiguration]):
         """
         discount = self.find_by_id(discount_id)
         if not discount:
-            raise NotFoundException(f"Discount configuration {discount_id} not found")
+            raise NotFoundError(f"Discount configuration {discount_id} not found")
+        
+        # Previous hostel scope must be dropped as well as the new one
+        pricing_rules.invalidate_for_discount(discount, self.session)
         
         # Validate updates
         self._validate_discount(
@@ -1980,6 +2000,7 @@ class DiscountConfigurationRepository(BaseRepository[DiscountConfiguration]):
         
         self._apply_audit(discount, audit_context, is_update=True)
         self.session.flush()
+        pricing_rules.invalidate_for_discount(discount, self.session)
         
         return discount
     
@@ -2308,7 +2329,10 @@ class DiscountConfigurationRepository(BaseRepository[DiscountConfiguration]):
         discount_id: UUID
     ) -> DiscountConfiguration:
         """
-        Increment usage count for a discount.
+        Atomically increment usage count for a discount.
+        
+        The limit check and increment run as a single conditional UPDATE,
+        so concurrent redemptions can never exceed max_usage_count.
         
         Args:
             discount_id: Discount identifier
@@ -2317,20 +2341,39 @@ class DiscountConfigurationRepository(BaseRepository[DiscountConfiguration]):
             Updated DiscountConfiguration instance
             
         Raises:
-            NotFoundException: If discount not found
-            ValidationException: If max usage exceeded
-        """
+            NotFoundError: If discount not found
+            ValidationError: If max usage exceeded
+        """
+        result = self.session.execute(
+            update(DiscountConfiguration)
+            .where(
+                DiscountConfiguration.id == discount_id,
+                DiscountConfiguration.deleted_at.is_(None),
+                or_(
+                    DiscountConfiguration.max_usage_count.is_(None),
+                    DiscountConfiguration.current_usage_count
+                    < DiscountConfiguration.max_usage_count
+                )
+            )
+            .values(
+                current_usage_count=DiscountConfiguration.current_usage_count + 1,
+                updated_at=datetime.utcnow()
+            )
+            .execution_options(synchronize_session=False)
+        )
+        
+        if result.rowcount == 0:
+            if not self.find_by_id(discount_id):
+                raise NotFoundError(f"Discount {discount_id} not found")
+            raise ValidationError("Discount has reached maximum usage limit")
+        
         discount = self.find_by_id(discount_id)
-        if not discount:
-            raise NotFoundException(f"Discount {discount_id} not found")
+        self.session.refresh(discount, ['current_usage_count', 'updated_at'])
         
         if discount.max_usage_count and discount.current_usage_count >= discount.max_usage_count:
-            raise ValidationException("Discount has reached maximum usage limit")
+            # Exhausted discounts must drop out of compiled rule sets
+            pricing_rules.invalidate_for_discount(discount, self.session)
         
-        discount.current_usage_count += 1
-        discount.updated_at = datetime.utcnow()
-        
-        self.session.flush()
         return discount
     
     def decrement_usage(
@@ -2338,7 +2381,7 @@ class DiscountConfigurationRepository(BaseRepository[DiscountConfiguration]):
         discount_id: UUID
     ) -> DiscountConfiguration:
         """
-        Decrement usage count for a discount (e.g., on cancellation).
+        Atomically decrement usage count for a discount (e.g., on cancellation).
         
         Args:
             discount_id: Discount identifier
@@ -2347,16 +2390,29 @@ class DiscountConfigurationRepository(BaseRepository[DiscountConfiguration]):
             Updated DiscountConfiguration instance
             
         Raises:
-            NotFoundException: If discount not found
+            NotFoundError: If discount not found
         """
+        result = self.session.execute(
+            update(DiscountConfiguration)
+            .where(
+                DiscountConfiguration.id == discount_id,
+                DiscountConfiguration.current_usage_count > 0
+            )
+            .values(
+                current_usage_count=DiscountConfiguration.current_usage_count - 1,
+                updated_at=datetime.utcnow()
+            )
+            .execution_options(synchronize_session=False)
+        )
+        
         discount = self.find_by_id(discount_id)
         if not discount:
-            raise NotFoundException(f"Discount {discount_id} not found")
+            raise NotFoundError(f"Discount {discount_id} not found")
         
-        if discount.current_usage_count > 0:
-            discount.current_usage_count -= 1
-            discount.updated_at = datetime.utcnow()
-            self.session.flush()
+        if result.rowcount:
+            self.session.refresh(discount, ['current_usage_count', 'updated_at'])
+            if discount.max_usage_count:
+                pricing_rules.invalidate_for_discount(discount, self.session)
         
         return discount
     
@@ -2536,10 +2592,13 @@ class DiscountConfigurationRepository(BaseRepository[DiscountConfiguration]):
         is_new_student: bool = False,
         stay_months: Optional[int] = None,
         check_date: Optional[Date] = None
-    ) -> Optional[Tuple[DiscountConfiguration, Decimal]]:
+    ) -> Optional[Tuple[CompiledDiscount, Decimal]]:
         """
         Find the best applicable discount for given criteria.
         
+        Evaluated against the hostel's compiled pricing rule set, so no
+        queries are issued once the rule set is warm.
+        
         Args:
             hostel_id: Hostel identifier
             room_type: Room type
@@ -2549,39 +2608,16 @@ class DiscountConfigurationRepository(BaseRepository[DiscountConfiguration]):
             check_date: Date to check
             
         Returns:
-            Tuple of (DiscountConfiguration, discount_amount) or None
+            Tuple of (CompiledDiscount, discount_amount) or None
         """
-        applicable_discounts = self.find_active_discounts(
-            hostel_id=hostel_id,
-            room_type=room_type,
-            as_of_date=check_date,
-            new_students_only=is_new_student if is_new_student else None
+        rule_set = pricing_rules.get(self.session, hostel_id)
+        return rule_set.best_discount(
+            room_type,
+            base_amount,
+            is_new_student=is_new_student,
+            stay_months=stay_months,
+            check_date=check_date
         )
-        
-        best_discount = None
-        best_amount = Decimal('0.00')
-        
-        for discount in applicable_discounts:
-            # Validate applicability
-            is_valid, _ = self.validate_discount_applicability(
-                discount.id,
-                hostel_id,
-                room_type,
-                is_new_student,
-                stay_months,
-                check_date
-            )
-            
-            if is_valid:
-                discount_amount = self.calculate_discount_amount(discount.id, base_amount)
-                if discount_amount > best_amount:
-                    best_amount = discount_amount
-                    best_discount = discount
-        
-        if best_discount:
-            return (best_discount, best_amount)
-        
-        return None
     
     # ============================================================
     # Analytics
@@ -2781,6 +2817,7 @@ class DiscountConfigurationRepository(BaseRepository[DiscountConfiguration]):
         )
         
         self.session.flush()
+        pricing_rules.invalidate_on_commit(self.session)
         return updated
     
     def bulk_deactivate_discounts(
@@ -2811,6 +2848,7 @@ class DiscountConfigurationRepository(BaseRepository[DiscountConfiguration]):
         )
         
         self.session.flush()
+        pricing_rules.invalidate_on_commit(self.session)
         return updated
     
     def expire_discounts(
@@ -2846,6 +2884,8 @@ class DiscountConfigurationRepository(BaseRepository[DiscountConfiguration]):
         ).update(update_data, synchronize_session=False)
         
         self.session.flush()
+        if expired:
+            pricing_rules.invalidate_on_commit(self.session)
         return expired
     
     # ============================================================
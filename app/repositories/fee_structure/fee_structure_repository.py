@@ -17,6 +17,7 @@ from app.models.fee_structure.fee_structure import FeeStructure, FeeApproval
 from app.models.base.enums import RoomType, FeeType, ChargeType
 from app.repositories.base.base_repository import BaseRepository
 from app.repositories.base.specifications import Specification
+from app.repositories.fee_structure.pricing_rule_set import pricing_rules
 from app.core.exceptions import (
     NotFoundError,
     ValidationError,
@@ -109,6 +110,7 @@ class FeeStructureRepository(BaseRepository[FeeStructure]):
         
         self.session.add(fee_structure)
         self.session.flush()
+        pricing_rules.invalidate_on_commit(self.session, [fee_structure.hostel_id])
         
         return fee_structure
     
@@ -159,6 +161,7 @@ class FeeStructureRepository(BaseRepository[FeeStructure]):
             
             self._apply_audit(fee_structure, audit_context, is_update=True)
             self.session.flush()
+            pricing_rules.invalidate_on_commit(self.session, [fee_structure.hostel_id])
             
             return fee_structure
     
@@ -615,6 +618,7 @@ class FeeStructureRepository(BaseRepository[FeeStructure]):
         )
         
         self.session.flush()
+        pricing_rules.invalidate_on_commit(self.session)
         return updated
     
     def bulk_deactivate(
@@ -658,6 +662,7 @@ class FeeStructureRepository(BaseRepository[FeeStructure]):
         
         updated = query.update(update_data, synchronize_session=False)
         self.session.flush()
+        pricing_rules.invalidate_on_commit(self.session, [hostel_id])
         
         return updated
     
@@ -826,6 +831,7 @@ class FeeStructureRepository(BaseRepository[FeeStructure]):
         
         self.session.add(new_version)
         self.session.flush()
+        pricing_rules.invalidate_on_commit(self.session, [new_version.hostel_id])
         
         return new_version
     
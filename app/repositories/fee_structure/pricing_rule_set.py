@@ -0,0 +1,510 @@
+"""
+Pricing Rule Set
+
+Compiles a hostel's active fee structures, charge components and discount
+configurations into an immutable, versioned in-memory rule set so quotes
+can be priced without any database round trips.
+
+Rule sets are cached per hostel and invalidated whenever a fee structure,
+charge component or discount changes. Usage counters held in a rule set are
+a snapshot used only to skip exhausted discounts; redemption is enforced by
+the atomic counter update in DiscountConfigurationRepository.increment_usage.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date as Date
+from decimal import Decimal
+from itertools import count
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, or_
+from sqlalchemy.orm import Session
+
+from app.models.fee_structure.charge_component import (
+    ChargeComponent,
+    DiscountConfiguration,
+)
+from app.models.fee_structure.fee_structure import FeeStructure
+
+
+ZERO = Decimal('0.00')
+CENT = Decimal('0.01')
+
+
+def _enum_value(value: Any) -> str:
+    return getattr(value, 'value', value)
+
+
+def _split_csv(value: Optional[str]) -> Optional[FrozenSet[str]]:
+    if not value:
+        return None
+    return frozenset(part.strip() for part in value.split(',') if part.strip())
+
+
+def _in_window(check_date: Date, start: Optional[Date], end: Optional[Date]) -> bool:
+    return (start is None or start <= check_date) and (end is None or check_date <= end)
+
+
+@dataclass(frozen=True)
+class CompiledCharge:
+    """Charge component snapshot"""
+    component_type: str
+    amount: Decimal
+    tax_percentage: Decimal
+    is_taxable: bool
+    is_recurring: bool
+    is_mandatory: bool
+    room_types: Optional[FrozenSet[str]]
+    applies_from: Optional[Date]
+    applies_to: Optional[Date]
+
+    def applies(self, room_type: str, check_date: Date) -> bool:
+        """Check whether the component applies to a room type on a date"""
+        if self.room_types is not None and room_type not in self.room_types:
+            return False
+        return _in_window(check_date, self.applies_from, self.applies_to)
+
+
+@dataclass(frozen=True)
+class CompiledFeeStructure:
+    """Fee structure snapshot with its charge components"""
+    id: UUID
+    room_type: str
+    fee_type: str
+    monthly_rent: Decimal
+    security_deposit: Decimal
+    mess_monthly: Decimal
+    utilities_monthly: Decimal
+    effective_from: Date
+    effective_to: Optional[Date]
+    version: int
+    charges: Tuple[CompiledCharge, ...]
+
+
+@dataclass(frozen=True)
+class CompiledDiscount:
+    """Discount configuration snapshot"""
+    id: UUID
+    discount_name: str
+    discount_code: Optional[str]
+    discount_type: str
+    discount_percentage: Optional[Decimal]
+    discount_amount: Optional[Decimal]
+    applies_to: str
+    room_types: Optional[FrozenSet[str]]
+    minimum_stay_months: Optional[int]
+    valid_for_new_students_only: bool
+    max_usage_count: Optional[int]
+    current_usage_count: int
+    valid_from: Optional[Date]
+    valid_to: Optional[Date]
+
+    def check(
+        self,
+        room_type: str,
+        is_new_student: bool,
+        stay_months: Optional[int],
+        check_date: Date
+    ) -> Tuple[bool, Optional[str]]:
+        """Check applicability; mirrors validate_discount_applicability"""
+        if self.valid_from and check_date < self.valid_from:
+            return False, f"Discount not valid until {self.valid_from.isoformat()}"
+        if self.valid_to and check_date > self.valid_to:
+            return False, f"Discount expired on {self.valid_to.isoformat()}"
+        if self.max_usage_count and self.current_usage_count >= self.max_usage_count:
+            return False, "Discount has reached maximum usage limit"
+        if self.room_types is not None and room_type not in self.room_types:
+            return False, "Discount not applicable to this room type"
+        if self.valid_for_new_students_only and not is_new_student:
+            return False, "Discount only valid for new students"
+        if self.minimum_stay_months and stay_months:
+            if stay_months < self.minimum_stay_months:
+                return False, f"Minimum stay of {self.minimum_stay_months} months required"
+        return True, None
+
+    def amount_for(self, base_amount: Decimal) -> Decimal:
+        """Discount amount for a base amount; mirrors calculate_discount_amount"""
+        if self.discount_type == 'percentage':
+            return (base_amount * (self.discount_percentage or ZERO) / 100).quantize(CENT)
+        if self.discount_type == 'fixed_amount':
+            return min(self.discount_amount or ZERO, base_amount)
+        if self.discount_type == 'waiver':
+            return base_amount
+        return ZERO
+
+
+@dataclass(frozen=True)
+class PricingRuleSet:
+    """Immutable, versioned pricing rules for one hostel"""
+    hostel_id: UUID
+    version: int
+    compiled_at: float
+    structures: Tuple[CompiledFeeStructure, ...]
+    discounts: Tuple[CompiledDiscount, ...]
+
+    def find_structure(
+        self,
+        room_type: str,
+        check_date: Date,
+        fee_type: Optional[str] = None
+    ) -> Optional[CompiledFeeStructure]:
+        """Most recent structure effective for a room type on a date"""
+        room_type = _enum_value(room_type)
+        best = None
+        for structure in self.structures:
+            if structure.room_type != room_type:
+                continue
+            if fee_type and structure.fee_type != fee_type:
+                continue
+            if not _in_window(check_date, structure.effective_from, structure.effective_to):
+                continue
+            if best is None or (structure.effective_from, structure.version) > (
+                best.effective_from, best.version
+            ):
+                best = structure
+        return best
+
+    def best_discount(
+        self,
+        room_type: str,
+        base_amount: Decimal,
+        is_new_student: bool = False,
+        stay_months: Optional[int] = None,
+        check_date: Optional[Date] = None
+    ) -> Optional[Tuple[CompiledDiscount, Decimal]]:
+        """Highest-value applicable automatic discount"""
+        check_date = check_date or Date.today()
+        room_type = _enum_value(room_type)
+        best: Optional[Tuple[CompiledDiscount, Decimal]] = None
+        for discount in self.discounts:
+            is_valid, _ = discount.check(room_type, is_new_student, stay_months, check_date)
+            if not is_valid:
+                continue
+            amount = discount.amount_for(base_amount)
+            if amount > ZERO and (best is None or amount > best[1]):
+                best = (discount, amount)
+        return best
+
+    def find_discount_by_code(self, discount_code: str) -> Optional[CompiledDiscount]:
+        """Look up a coded discount"""
+        code = discount_code.strip().upper()
+        for discount in self.discounts:
+            if discount.discount_code and discount.discount_code.upper() == code:
+                return discount
+        return None
+
+    def quote(
+        self,
+        room_type: str,
+        check_in_date: Date,
+        duration_months: int,
+        is_new_student: bool = False,
+        discount_code: Optional[str] = None,
+        fee_type: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Price a stay entirely from the compiled rules.
+
+        Returns:
+            Quote dictionary, or None if no fee structure applies
+        """
+        room_type = _enum_value(room_type)
+        structure = self.find_structure(room_type, check_in_date, fee_type)
+        if structure is None:
+            return None
+
+        recurring_charges = ZERO
+        one_time_charges = ZERO
+        tax_amount = ZERO
+        for charge in structure.charges:
+            if not charge.is_mandatory or not charge.applies(room_type, check_in_date):
+                continue
+            months = duration_months if charge.is_recurring else 1
+            if charge.is_recurring:
+                recurring_charges += charge.amount
+            else:
+                one_time_charges += charge.amount
+            if charge.is_taxable:
+                tax_amount += charge.amount * months * charge.tax_percentage / 100
+
+        monthly_recurring = (
+            structure.monthly_rent + structure.mess_monthly
+            + structure.utilities_monthly + recurring_charges
+        )
+        rent_total = structure.monthly_rent * duration_months
+        mess_total = structure.mess_monthly * duration_months
+        subtotal = monthly_recurring * duration_months + structure.security_deposit + one_time_charges
+
+        bases = {
+            'base_rent': rent_total,
+            'mess_charges': mess_total,
+            'security_deposit': structure.security_deposit,
+            'total': subtotal,
+        }
+
+        applied: Optional[Tuple[CompiledDiscount, Decimal]] = None
+        discount_error = None
+        if discount_code:
+            discount = self.find_discount_by_code(discount_code)
+            if discount is None:
+                discount_error = "Discount code not found"
+            else:
+                is_valid, discount_error = discount.check(
+                    room_type, is_new_student, duration_months, check_in_date
+                )
+                if is_valid:
+                    applied = (discount, discount.amount_for(bases.get(discount.applies_to, subtotal)))
+        else:
+            for applies_to, base in bases.items():
+                candidate = self._best_for_base(
+                    applies_to, base, room_type, is_new_student, duration_months, check_in_date
+                )
+                if candidate and (applied is None or candidate[1] > applied[1]):
+                    applied = candidate
+
+        discount_amount = applied[1] if applied else ZERO
+        total_payable = (subtotal - discount_amount + tax_amount).quantize(CENT)
+
+        return {
+            'hostel_id': str(self.hostel_id),
+            'fee_structure_id': str(structure.id),
+            'rule_set_version': self.version,
+            'room_type': room_type,
+            'check_in_date': check_in_date.isoformat(),
+            'duration_months': duration_months,
+            'monthly_rent': structure.monthly_rent.quantize(CENT),
+            'mess_charges_monthly': structure.mess_monthly.quantize(CENT),
+            'utility_charges_monthly': structure.utilities_monthly.quantize(CENT),
+            'other_recurring_monthly': recurring_charges.quantize(CENT),
+            'monthly_recurring': monthly_recurring.quantize(CENT),
+            'security_deposit': structure.security_deposit.quantize(CENT),
+            'one_time_charges': one_time_charges.quantize(CENT),
+            'subtotal': subtotal.quantize(CENT),
+            'discount_id': str(applied[0].id) if applied else None,
+            'discount_name': applied[0].discount_name if applied else None,
+            'discount_applied': discount_amount.quantize(CENT),
+            'discount_error': discount_error,
+            'tax_amount': tax_amount.quantize(CENT),
+            'total_amount': total_payable,
+        }
+
+    def quote_many(
+        self,
+        room_types: Iterable[str],
+        check_in_date: Date,
+        duration_months: int,
+        is_new_student: bool = False
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Quote many room types, pricing each distinct type once"""
+        quotes: Dict[str, Optional[Dict[str, Any]]] = {}
+        for room_type in room_types:
+            key = _enum_value(room_type)
+            if key not in quotes:
+                quotes[key] = self.quote(key, check_in_date, duration_months, is_new_student)
+        return quotes
+
+    def _best_for_base(
+        self,
+        applies_to: str,
+        base_amount: Decimal,
+        room_type: str,
+        is_new_student: bool,
+        stay_months: int,
+        check_date: Date
+    ) -> Optional[Tuple[CompiledDiscount, Decimal]]:
+        best = None
+        for discount in self.discounts:
+            # Coded discounts are only applied when the code is presented
+            if discount.discount_code or discount.applies_to != applies_to:
+                continue
+            is_valid, _ = discount.check(room_type, is_new_student, stay_months, check_date)
+            if not is_valid:
+                continue
+            amount = discount.amount_for(base_amount)
+            if amount > ZERO and (best is None or amount > best[1]):
+                best = (discount, amount)
+        return best
+
+
+class PricingRuleSetCache:
+    """
+    Per-process cache of compiled pricing rule sets.
+
+    Entries are replaced atomically; readers always see a complete,
+    immutable rule set. A TTL bounds staleness for changes made by other
+    processes.
+    """
+
+    _PENDING_KEY = "pricing_rules.pending_invalidation"
+    _LISTENING_KEY = "pricing_rules.listening"
+    _ALL_HOSTELS = "*"
+
+    def __init__(self, ttl_seconds: int = 300):
+        self.ttl_seconds = ttl_seconds
+        self._rule_sets: Dict[UUID, PricingRuleSet] = {}
+        self._versions = count(1)
+        self._lock = threading.Lock()
+
+    def get(self, session: Session, hostel_id: UUID) -> PricingRuleSet:
+        """Get the hostel's rule set, compiling it if missing or expired"""
+        rule_set = self._rule_sets.get(hostel_id)
+        if rule_set is not None and time.monotonic() - rule_set.compiled_at < self.ttl_seconds:
+            return rule_set
+
+        rule_set = self.compile(session, hostel_id)
+        with self._lock:
+            self._rule_sets[hostel_id] = rule_set
+        return rule_set
+
+    def invalidate(self, hostel_ids: Optional[Iterable[Any]] = None) -> None:
+        """Drop compiled rule sets for the given hostels, or all of them"""
+        with self._lock:
+            if hostel_ids is None:
+                self._rule_sets.clear()
+                return
+            for hostel_id in hostel_ids:
+                key = hostel_id if isinstance(hostel_id, UUID) else UUID(str(hostel_id))
+                self._rule_sets.pop(key, None)
+
+    def invalidate_on_commit(
+        self,
+        session: Session,
+        hostel_ids: Optional[Iterable[Any]] = None
+    ) -> None:
+        """
+        Drop compiled rule sets once the session's transaction ends.
+
+        Invalidating before commit lets a concurrent reader recompile from
+        the old rows and cache them again, so writers defer invalidation to
+        the commit. Pending hostels are dropped on rollback as well, in case
+        the transaction compiled its own uncommitted rules.
+        """
+        pending = session.info.get(self._PENDING_KEY)
+        if pending is None:
+            pending = session.info[self._PENDING_KEY] = set()
+            if not session.info.get(self._LISTENING_KEY):
+                event.listen(session, "after_commit", self._end_of_transaction)
+                event.listen(session, "after_rollback", self._end_of_transaction)
+                session.info[self._LISTENING_KEY] = True
+
+        if hostel_ids is None:
+            pending.add(self._ALL_HOSTELS)
+        else:
+            pending.update(
+                hostel_id if isinstance(hostel_id, UUID) else UUID(str(hostel_id))
+                for hostel_id in hostel_ids
+            )
+
+    def invalidate_for_discount(
+        self,
+        discount: DiscountConfiguration,
+        session: Optional[Session] = None
+    ) -> None:
+        """
+        Invalidate every hostel a discount may apply to, at the end of the
+        session's transaction when a session is given
+        """
+        hostel_ids = _split_csv(discount.hostel_ids)
+        if session is None:
+            self.invalidate(hostel_ids)
+        else:
+            self.invalidate_on_commit(session, hostel_ids)
+
+    def _end_of_transaction(self, session: Session) -> None:
+        pending = session.info.pop(self._PENDING_KEY, None)
+        if pending:
+            self.invalidate(None if self._ALL_HOSTELS in pending else pending)
+
+    def compile(self, session: Session, hostel_id: UUID) -> PricingRuleSet:
+        """Load and compile a hostel's rules (three queries)"""
+        structures = session.query(FeeStructure).filter(
+            FeeStructure.hostel_id == hostel_id,
+            FeeStructure.is_active == True,
+            FeeStructure.deleted_at.is_(None)
+        ).all()
+
+        charges_by_structure: Dict[UUID, List[CompiledCharge]] = {}
+        if structures:
+            components = session.query(ChargeComponent).filter(
+                ChargeComponent.fee_structure_id.in_([s.id for s in structures]),
+                ChargeComponent.deleted_at.is_(None)
+            ).order_by(ChargeComponent.display_order).all()
+            for component in components:
+                charges_by_structure.setdefault(component.fee_structure_id, []).append(
+                    CompiledCharge(
+                        component_type=component.component_type,
+                        amount=component.amount,
+                        tax_percentage=component.tax_percentage or ZERO,
+                        is_taxable=component.is_taxable,
+                        is_recurring=component.is_recurring,
+                        is_mandatory=component.is_mandatory,
+                        room_types=_split_csv(component.applies_to_room_types),
+                        applies_from=component.applies_from_date,
+                        applies_to=component.applies_to_date,
+                    )
+                )
+
+        discounts = session.query(DiscountConfiguration).filter(
+            DiscountConfiguration.is_active == True,
+            DiscountConfiguration.deleted_at.is_(None),
+            or_(
+                DiscountConfiguration.hostel_ids.is_(None),
+                DiscountConfiguration.hostel_ids.like(f'%{hostel_id}%')
+            )
+        ).all()
+
+        return PricingRuleSet(
+            hostel_id=hostel_id,
+            version=next(self._versions),
+            compiled_at=time.monotonic(),
+            structures=tuple(
+                CompiledFeeStructure(
+                    id=s.id,
+                    room_type=_enum_value(s.room_type),
+                    fee_type=_enum_value(s.fee_type),
+                    monthly_rent=s.amount,
+                    security_deposit=s.security_deposit or ZERO,
+                    mess_monthly=(s.mess_charges_monthly or ZERO) if not s.includes_mess else ZERO,
+                    utilities_monthly=(
+                        (s.electricity_fixed_amount if _enum_value(s.electricity_charges) == 'fixed' else None)
+                        or ZERO
+                    ) + (
+                        (s.water_fixed_amount if _enum_value(s.water_charges) == 'fixed' else None)
+                        or ZERO
+                    ),
+                    effective_from=s.effective_from,
+                    effective_to=s.effective_to,
+                    version=s.version,
+                    charges=tuple(charges_by_structure.get(s.id, ())),
+                )
+                for s in structures
+            ),
+            discounts=tuple(
+                CompiledDiscount(
+                    id=d.id,
+                    discount_name=d.discount_name,
+                    discount_code=d.discount_code,
+                    discount_type=d.discount_type,
+                    discount_percentage=d.discount_percentage,
+                    discount_amount=d.discount_amount,
+                    applies_to=d.applies_to,
+                    room_types=_split_csv(d.room_types),
+                    minimum_stay_months=d.minimum_stay_months,
+                    valid_for_new_students_only=d.valid_for_new_students_only,
+                    max_usage_count=d.max_usage_count,
+                    current_usage_count=d.current_usage_count or 0,
+                    valid_from=d.valid_from,
+                    valid_to=d.valid_to,
+                )
+                for d in discounts
+                # hostel_ids LIKE is a prefilter; confirm exact membership
+                if d.hostel_ids is None or str(hostel_id) in _split_csv(d.hostel_ids)
+            ),
+        )
+
+
+# Process-wide rule set cache
+pricing_rules = PricingRuleSetCache()
@@ -35,6 +35,11 @@ from app.repositories.integrations.workflow_repository import (
 from app.repositories.integrations.integration_aggregate_repository import (
     IntegrationAggregateRepository
 )
+from app.repositories.integrations.provider_merkle_index import (
+    ProviderMerkleIndex,
+    ProviderMerkleCache,
+    provider_merkle_indexes
+)
 
 __all__ = [
     # API Integration
@@ -65,4 +70,9 @@ __all__ = [
     
     # Aggregate
     "IntegrationAggregateRepository",
+    
+    # Reconciliation
+    "ProviderMerkleIndex",
+    "ProviderMerkleCache",
+    "provider_merkle_indexes",
 ]
\ No newline at end of file
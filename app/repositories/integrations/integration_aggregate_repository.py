@@ -12,7 +12,14 @@ from uuid import UUID
 from sqlalchemy import and_, or_, func, case
 from sqlalchemy.orm import Session
 
+from app.core.exceptions import ValidationException
+from app.models.payment.gateway_transaction import GatewayProvider
 from app.repositories.base.base_repository import BaseRepository
+from app.repositories.integrations.provider_merkle_index import (
+    local_view,
+    provider_merkle_indexes,
+    provider_view,
+)
 
 
 class IntegrationAggregateRepository:
@@ -344,6 +351,81 @@ class IntegrationAggregateRepository:
         """
         return []
     
+    # ============================================================================
+    # PROVIDER RECONCILIATION
+    # ============================================================================
+    
+    def reconcile_provider(
+        self,
+        provider: str,
+        full_scan: bool = False,
+        sample_limit: int = 50
+    ) -> Dict[str, Any]:
+        """
+        Reconcile local gateway transactions with the provider's view.
+        
+        Compares Merkle range digests of both sides and only loads the id
+        ranges whose digests differ. Incremental runs read rows updated
+        since the last run; a full scan rebuilds the provider's index.
+        
+        Args:
+            provider: Gateway provider
+            full_scan: Rebuild the index from every row first
+            sample_limit: Maximum drifted records listed in the report
+            
+        Returns:
+            Reconciliation report
+        """
+        provider = getattr(provider, 'value', provider).lower()
+        try:
+            GatewayProvider(provider)
+        except ValueError:
+            raise ValidationException(f"Unknown payment gateway provider: {provider}")
+        
+        index, scanned = provider_merkle_indexes.get(
+            self.session, provider, rebuild=full_scan
+        )
+        drifted_ranges, ranges_compared = index.diff()
+        
+        rows = provider_merkle_indexes.fetch_ranges(self.session, provider, drifted_ranges)
+        index.apply_rows(rows)
+        
+        mismatches = missing_local = missing_remote = 0
+        drifted_records = []
+        for row in rows:
+            local, remote = local_view(row), provider_view(provider, row)
+            if local == remote:
+                continue
+            if local is None:
+                missing_local += 1
+                kind = "missing_local"
+            elif remote is None:
+                missing_remote += 1
+                kind = "missing_remote"
+            else:
+                mismatches += 1
+                kind = "mismatch"
+            if len(drifted_records) < sample_limit:
+                drifted_records.append({
+                    "id": str(row.id),
+                    "type": kind,
+                    "local": local,
+                    "provider": remote,
+                })
+        
+        return {
+            "total_records": index.total_records,
+            "records_scanned": scanned,
+            "ranges_total": 16 ** index.depth,
+            "ranges_compared": ranges_compared,
+            "ranges_drifted": len(drifted_ranges),
+            "rows_compared": len(rows),
+            "mismatches": mismatches,
+            "missing_local": missing_local,
+            "missing_remote": missing_remote,
+            "drifted_records": drifted_records,
+        }
+    
     # ============================================================================
     # COMPARATIVE ANALYSIS
     # ============================================================================
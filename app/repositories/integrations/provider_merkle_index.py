@@ -0,0 +1,352 @@
+"""
+Provider Merkle Index
+
+Hash-bucketed summaries of a provider's gateway transactions, kept on two
+sides: the local view (our columns) and the provider's view (what the
+gateway last told us in its response or webhook). Rows are bucketed by the
+leading hex digits of their id, so each leaf covers a contiguous id range;
+a node's digest is the XOR of the row hashes under it.
+
+Reconciliation walks both trees from the root and only descends into
+ranges whose digests differ, so its cost follows the number of drifted
+ranges rather than the table size. Indexes are patched from rows updated
+since the last refresh and rebuilt after a TTL, which also picks up hard
+deletes the incremental feed cannot see.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
+from hashlib import blake2b
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from app.models.payment.gateway_transaction import (
+    GatewayProvider,
+    GatewayTransaction,
+    GatewayTransactionStatus,
+)
+
+
+# Row view compared between sides: (status, amount, currency, gateway txn id)
+RowView = Tuple[str, str, str, str]
+
+# Columns read for each row; payloads carry the provider's view
+ROW_COLUMNS = (
+    GatewayTransaction.id,
+    GatewayTransaction.transaction_status,
+    GatewayTransaction.transaction_amount,
+    GatewayTransaction.currency,
+    GatewayTransaction.gateway_transaction_id,
+    GatewayTransaction.is_deleted,
+    GatewayTransaction.response_payload,
+    GatewayTransaction.webhook_payload,
+    GatewayTransaction.updated_at,
+)
+
+# Gateways reporting amounts in minor units (paise, cents)
+MINOR_UNIT_PROVIDERS = {GatewayProvider.RAZORPAY.value, GatewayProvider.STRIPE.value}
+
+# Gateway status names mapped onto ours
+STATUS_ALIASES = {
+    'created': GatewayTransactionStatus.INITIATED.value,
+    'authorized': GatewayTransactionStatus.PROCESSING.value,
+    'captured': GatewayTransactionStatus.SUCCESS.value,
+    'succeeded': GatewayTransactionStatus.SUCCESS.value,
+    'paid': GatewayTransactionStatus.SUCCESS.value,
+    'requires_payment_method': GatewayTransactionStatus.FAILED.value,
+    'canceled': GatewayTransactionStatus.CANCELLED.value,
+}
+
+# Overlap re-read on incremental refreshes to cover in-flight commits
+WATERMARK_OVERLAP = timedelta(seconds=30)
+
+
+def _row_hash(row_id: Any, view: Optional[RowView]) -> int:
+    """64-bit hash of a row's view; absent rows hash to 0."""
+    if view is None:
+        return 0
+    digest = blake2b(f"{row_id}|{'|'.join(view)}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+def _amount(value: Any) -> str:
+    try:
+        return str(Decimal(str(value)).quantize(Decimal('0.01')))
+    except (InvalidOperation, ValueError):
+        return ''
+
+
+def _columns_view(row: Any) -> RowView:
+    return (
+        getattr(row.transaction_status, 'value', row.transaction_status) or '',
+        _amount(row.transaction_amount),
+        (row.currency or '').upper(),
+        row.gateway_transaction_id or '',
+    )
+
+
+def local_view(row: Any) -> Optional[RowView]:
+    """Our view of a transaction, or None if it is deleted locally."""
+    if row.is_deleted:
+        return None
+    return _columns_view(row)
+
+
+def provider_view(provider: str, row: Any) -> Optional[RowView]:
+    """
+    The provider's view of a transaction from its latest webhook or
+    response payload.
+
+    Fields the payload does not carry are taken from the local view so only
+    real disagreements count. Transactions never sent to the gateway have
+    nothing to disagree with and mirror the local view.
+    """
+    local = _columns_view(row)
+    entity = _payload_entity(row.webhook_payload) or _payload_entity(row.response_payload)
+    if entity is None:
+        if local[0] == GatewayTransactionStatus.INITIATED.value:
+            return local_view(row)
+        return None
+
+    status = entity.get('status')
+    if status is not None:
+        status = str(status).lower()
+        status = STATUS_ALIASES.get(status, status)
+
+    amount = entity.get('amount')
+    if amount is not None:
+        try:
+            amount = Decimal(str(amount))
+        except InvalidOperation:
+            amount = None
+    if amount is not None and provider in MINOR_UNIT_PROVIDERS:
+        amount = amount / 100
+
+    currency = entity.get('currency')
+    return (
+        status or local[0],
+        _amount(amount) if amount is not None else local[1],
+        str(currency).upper() if currency else local[2],
+        str(entity.get('id') or '') or local[3],
+    )
+
+
+def _payload_entity(payload: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Unwrap the transaction object from a gateway payload."""
+    if not payload:
+        return None
+    nested = payload.get('payload', {}).get('payment', {}).get('entity')  # Razorpay
+    if isinstance(nested, dict):
+        return nested
+    nested = payload.get('data', {}).get('object')  # Stripe
+    if isinstance(nested, dict):
+        return nested
+    return payload
+
+
+def range_bounds(prefix: str) -> Tuple[UUID, UUID]:
+    """Inclusive id bounds of the range covered by a hex prefix."""
+    return UUID(prefix.ljust(32, '0')), UUID(prefix.ljust(32, 'f'))
+
+
+class ProviderMerkleIndex:
+    """
+    Local and provider range digests for one provider's transactions.
+
+    Row hashes are kept per id so a changed row is patched out of its leaf
+    with two XORs; writers serialize on the index lock.
+    """
+
+    def __init__(self, provider: str, depth: int, built_at: float):
+        self.provider = provider
+        self.depth = depth
+        self.built_at = built_at
+        self.watermark: Optional[datetime] = None
+
+        self._rows: Dict[UUID, Tuple[int, int]] = {}
+        self._leaves: Tuple[Dict[str, int], Dict[str, int]] = ({}, {})
+        self._live = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total_records(self) -> int:
+        """Transactions that exist locally."""
+        return self._live
+
+    def apply_rows(self, rows: Iterable[Any]) -> int:
+        """
+        Apply fresh rows to both sides.
+
+        Returns:
+            Number of rows applied
+        """
+        applied = 0
+        with self._lock:
+            for row in rows:
+                row_id = row.id if isinstance(row.id, UUID) else UUID(str(row.id))
+                hashes = (
+                    _row_hash(row_id, local_view(row)),
+                    _row_hash(row_id, provider_view(self.provider, row)),
+                )
+                self._set_row(row_id, hashes)
+                if row.updated_at is not None and (
+                    self.watermark is None or row.updated_at > self.watermark
+                ):
+                    self.watermark = row.updated_at
+                applied += 1
+        return applied
+
+    def diff(self) -> Tuple[List[str], int]:
+        """
+        Find leaf ranges whose local and provider digests differ.
+
+        Returns:
+            Tuple of (drifted leaf prefixes, ranges compared)
+        """
+        with self._lock:
+            local, remote = self._leaves
+            levels = [
+                (self._level(local, length), self._level(remote, length))
+                for length in range(self.depth + 1)
+            ]
+
+        drifted = ['']
+        compared = 0
+        for length in range(self.depth + 1):
+            level_local, level_remote = levels[length]
+            candidates = drifted if length == 0 else [
+                prefix + digit for prefix in drifted for digit in '0123456789abcdef'
+            ]
+            drifted = []
+            for prefix in candidates:
+                left, right = level_local.get(prefix, 0), level_remote.get(prefix, 0)
+                if left or right:
+                    compared += 1
+                    if left != right:
+                        drifted.append(prefix)
+        return drifted, compared
+
+    def _set_row(self, row_id: UUID, hashes: Tuple[int, int]) -> None:
+        """Replace a row's hashes in its leaf on both sides (lock held)."""
+        leaf = row_id.hex[:self.depth]
+        previous = self._rows.get(row_id, (0, 0))
+        for side, old, new in zip(self._leaves, previous, hashes):
+            value = side.get(leaf, 0) ^ old ^ new
+            if value:
+                side[leaf] = value
+            else:
+                side.pop(leaf, None)
+
+        self._live += bool(hashes[0]) - bool(previous[0])
+        if hashes == (0, 0):
+            self._rows.pop(row_id, None)
+        else:
+            self._rows[row_id] = hashes
+
+    @staticmethod
+    def _level(leaves: Dict[str, int], length: int) -> Dict[str, int]:
+        """Digests of the nodes at a prefix length (lock held)."""
+        level: Dict[str, int] = {}
+        for prefix, value in leaves.items():
+            node = prefix[:length]
+            level[node] = level.get(node, 0) ^ value
+        return level
+
+
+class ProviderMerkleCache:
+    """
+    Per-process cache of provider Merkle indexes.
+
+    Indexes are built with one streaming query on first use, after the TTL
+    or on request, and otherwise refreshed from rows updated since their
+    watermark.
+    """
+
+    def __init__(self, depth: int = 3, ttl_seconds: int = 3600, chunk_size: int = 2000):
+        self.depth = depth
+        self.ttl_seconds = ttl_seconds
+        self.chunk_size = chunk_size
+        self._indexes: Dict[str, ProviderMerkleIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        session: Session,
+        provider: str,
+        rebuild: bool = False
+    ) -> Tuple[ProviderMerkleIndex, int]:
+        """
+        Get a provider's refreshed index.
+
+        Returns:
+            Tuple of (index, rows read to refresh it)
+        """
+        provider = getattr(provider, 'value', provider).lower()
+        index = self._indexes.get(provider)
+        if (
+            rebuild
+            or index is None
+            or time.monotonic() - index.built_at >= self.ttl_seconds
+        ):
+            index = ProviderMerkleIndex(provider, self.depth, time.monotonic())
+            scanned = index.apply_rows(self._stream(session, provider))
+            with self._lock:
+                self._indexes[provider] = index
+            return index, scanned
+
+        since = index.watermark - WATERMARK_OVERLAP if index.watermark else None
+        return index, index.apply_rows(self._stream(session, provider, since))
+
+    def invalidate(self, providers: Optional[Iterable[str]] = None) -> None:
+        """Drop indexes for the given providers, or all of them"""
+        with self._lock:
+            if providers is None:
+                self._indexes.clear()
+                return
+            for provider in providers:
+                self._indexes.pop(getattr(provider, 'value', provider).lower(), None)
+
+    def fetch_ranges(
+        self,
+        session: Session,
+        provider: str,
+        prefixes: List[str]
+    ) -> List[Any]:
+        """Load the rows of the given leaf ranges, a chunk of ranges per query"""
+        rows: List[Any] = []
+        for start in range(0, len(prefixes), 100):
+            ranges = [
+                GatewayTransaction.id.between(*range_bounds(prefix))
+                for prefix in prefixes[start:start + 100]
+            ]
+            rows.extend(session.execute(
+                select(*ROW_COLUMNS).where(
+                    GatewayTransaction.gateway_name == GatewayProvider(provider),
+                    or_(*ranges)
+                )
+            ).all())
+        return rows
+
+    def _stream(
+        self,
+        session: Session,
+        provider: str,
+        since: Optional[datetime] = None
+    ) -> Iterable[Any]:
+        query = select(*ROW_COLUMNS).where(
+            GatewayTransaction.gateway_name == GatewayProvider(provider)
+        )
+        if since is not None:
+            query = query.where(GatewayTransaction.updated_at >= since)
+        return session.execute(
+            query.execution_options(yield_per=self.chunk_size)
+        )
+
+
+# Process-wide provider Merkle index cache
+provider_merkle_indexes = ProviderMerkleCache()
@@ -5,21 +5,26 @@ Comprehensive leave application management with advanced querying,
 status tracking, analytics, and workflow optimization.
 """
 
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 
 from sqlalchemy import and_, or_, func, case, extract
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.sql import text
 
 from app.models.leave.leave_application import (
+    ACTIVE_LEAVE_STATUSES,
+    leave_period,
     LeaveApplication,
     LeaveCancellation,
     LeaveDocument,
     LeaveEmergencyContact,
     LeaveStatusHistory,
 )
+from app.models.leave.leave_balance import LeaveBalance
 from app.models.common.enums import LeaveStatus, LeaveType
 from app.repositories.base.base_repository import BaseRepository
 from app.repositories.base.query_builder import QueryBuilder
@@ -98,9 +103,17 @@ class LeaveApplicationRepository(BaseRepository[LeaveApplication]):
             changed_by=audit_context.get('user_id') if audit_context else None
         )
         
-        self.session.add(application)
-        self.session.add(initial_status)
-        self.session.flush()
+        if not self._enforces_leave_overlap():
+            if self.check_overlapping_leaves(
+                student_id, application.from_date, application.to_date
+            ):
+                raise ValueError("Leave overlaps an existing pending or approved leave")
+        
+        with self._leave_constraints():
+            self.session.add(application)
+            self.session.add(initial_status)
+            self.session.flush()
+            self._adjust_balance(application, pending_days=application.total_days)
         
         return application
 
@@ -480,6 +493,9 @@ class LeaveApplicationRepository(BaseRepository[LeaveApplication]):
             
         Returns:
             Updated leave application or None
+            
+        Raises:
+            ValueError: If the leave exceeds the remaining balance
         """
         application = self.find_by_id(leave_id)
         if not application or application.status != LeaveStatus.PENDING:
@@ -494,6 +510,13 @@ class LeaveApplicationRepository(BaseRepository[LeaveApplication]):
         application.approval_notes = approval_notes
         application.conditions = conditions
         
+        with self._leave_constraints():
+            self._adjust_balance(
+                application,
+                pending_days=-application.total_days,
+                used_days=application.total_days
+            )
+        
         # Record status change
         status_history = LeaveStatusHistory(
             leave_id=leave_id,
@@ -542,6 +565,8 @@ class LeaveApplicationRepository(BaseRepository[LeaveApplication]):
         application.rejected_at = datetime.utcnow()
         application.rejection_reason = rejection_reason
         
+        self._adjust_balance(application, pending_days=-application.total_days)
+        
         # Record status change
         status_history = LeaveStatusHistory(
             leave_id=leave_id,
@@ -590,6 +615,11 @@ class LeaveApplicationRepository(BaseRepository[LeaveApplication]):
         application.cancelled_at = datetime.utcnow()
         application.cancellation_reason = cancellation_reason
         
+        if old_status == LeaveStatus.APPROVED:
+            self._adjust_balance(application, used_days=-application.total_days)
+        else:
+            self._adjust_balance(application, pending_days=-application.total_days)
+        
         # Record status change
         status_history = LeaveStatusHistory(
             leave_id=leave_id,
@@ -1079,6 +1109,10 @@ class LeaveApplicationRepository(BaseRepository[LeaveApplication]):
         """
         Check for overlapping leave applications.
         
+        On PostgreSQL this is a single probe of the exclusion constraint's
+        GiST index; other dialects compare the student's active leaves in
+        memory.
+        
         Args:
             student_id: Student ID
             from_date: Leave start date
@@ -1090,28 +1124,24 @@ class LeaveApplicationRepository(BaseRepository[LeaveApplication]):
         """
         query = self.session.query(LeaveApplication).filter(
             LeaveApplication.student_id == student_id,
-            LeaveApplication.status.in_([LeaveStatus.PENDING, LeaveStatus.APPROVED]),
-            or_(
-                and_(
-                    LeaveApplication.from_date >= from_date,
-                    LeaveApplication.from_date <= to_date
-                ),
-                and_(
-                    LeaveApplication.to_date >= from_date,
-                    LeaveApplication.to_date <= to_date
-                ),
-                and_(
-                    LeaveApplication.from_date <= from_date,
-                    LeaveApplication.to_date >= to_date
-                )
-            ),
+            LeaveApplication.status.in_(ACTIVE_LEAVE_STATUSES),
             LeaveApplication.deleted_at.is_(None)
         )
         
         if exclude_leave_id:
             query = query.filter(LeaveApplication.id != exclude_leave_id)
         
-        return query.all()
+        if not self._enforces_leave_overlap():
+            return [
+                leave for leave in query.all()
+                if leave.overlaps(from_date, to_date)
+            ]
+        
+        return query.filter(
+            leave_period(
+                LeaveApplication.from_date, LeaveApplication.to_date
+            ).op("&&")(leave_period(from_date, to_date))
+        ).all()
 
     def validate_leave_quota(
         self,
@@ -1123,6 +1153,9 @@ class LeaveApplicationRepository(BaseRepository[LeaveApplication]):
         """
         Validate leave against quota.
         
+        Reads the student's maintained balance for the year; a leave type
+        without a balance has no quota to enforce.
+        
         Args:
             student_id: Student ID
             leave_type: Leave type
@@ -1132,14 +1165,34 @@ class LeaveApplicationRepository(BaseRepository[LeaveApplication]):
         Returns:
             Validation result with quota information
         """
-        # This would integrate with LeaveBalance repository
-        # For now, return basic structure
+        balance = self.session.query(LeaveBalance).filter(
+            LeaveBalance.student_id == student_id,
+            LeaveBalance.leave_type == leave_type,
+            LeaveBalance.academic_year_start == academic_year_start,
+            LeaveBalance.is_active == True
+        ).first()
+        
+        if not balance:
+            return {
+                'is_valid': True,
+                'days_available': None,
+                'days_used': None,
+                'days_pending': None,
+                'days_remaining': None,
+                'exceeds_quota': False,
+                'is_locked': False
+            }
+        
+        exceeds_quota = days_requested > balance.remaining_days
+        
         return {
-            'is_valid': True,
-            'days_available': None,
-            'days_used': None,
-            'days_remaining': None,
-            'exceeds_quota': False
+            'is_valid': not exceeds_quota and not balance.is_locked,
+            'days_available': balance.allocated_days + balance.carry_forward_days,
+            'days_used': balance.used_days,
+            'days_pending': balance.pending_days,
+            'days_remaining': balance.remaining_days,
+            'exceeds_quota': exceeds_quota,
+            'is_locked': balance.is_locked
         }
 
     # ============================================================================
@@ -1167,7 +1220,10 @@ class LeaveApplicationRepository(BaseRepository[LeaveApplication]):
         failed = []
         
         for leave_id in leave_ids:
-            result = self.approve_leave(leave_id, approver_id, audit_context=audit_context)
+            try:
+                result = self.approve_leave(leave_id, approver_id, audit_context=audit_context)
+            except ValueError:
+                result = None
             if result:
                 approved.append(leave_id)
             else:
@@ -1233,6 +1289,70 @@ class LeaveApplicationRepository(BaseRepository[LeaveApplication]):
     # HELPER METHODS
     # ============================================================================
 
+    def _enforces_leave_overlap(self) -> bool:
+        """Check whether the database enforces the leave exclusion constraint."""
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    @contextmanager
+    def _leave_constraints(self):
+        """
+        Run writes in a savepoint, translating leave constraint violations.
+        
+        Raises:
+            ValueError: If the leave overlaps another active leave or
+                exceeds the remaining balance
+        """
+        try:
+            with self.session.begin_nested():
+                yield
+        except IntegrityError as e:
+            constraint = getattr(getattr(e.orig, "diag", None), "constraint_name", None)
+            if constraint == "ex_leave_application_student_period":
+                raise ValueError(
+                    "Leave overlaps an existing pending or approved leave"
+                ) from e
+            if constraint == "ck_leave_balance_remaining_non_negative":
+                raise ValueError("Leave exceeds the remaining balance") from e
+            raise
+
+    def _adjust_balance(
+        self,
+        application: LeaveApplication,
+        pending_days: int = 0,
+        used_days: int = 0
+    ) -> int:
+        """
+        Move days between a student's pending, used and remaining balance.
+        
+        Applied as one atomic UPDATE of the balance for the academic year
+        containing the leave, so concurrent applications cannot overdraw it.
+        
+        Args:
+            application: Leave application
+            pending_days: Change in pending days
+            used_days: Change in used days
+            
+        Returns:
+            Number of balances updated (0 if the leave type has no balance)
+        """
+        return self.session.query(LeaveBalance).filter(
+            LeaveBalance.student_id == application.student_id,
+            LeaveBalance.leave_type == application.leave_type,
+            LeaveBalance.academic_year_start <= application.from_date,
+            LeaveBalance.academic_year_end > application.from_date,
+            LeaveBalance.is_active == True
+        ).update(
+            {
+                LeaveBalance.pending_days: LeaveBalance.pending_days + pending_days,
+                LeaveBalance.used_days: LeaveBalance.used_days + used_days,
+                LeaveBalance.remaining_days: (
+                    LeaveBalance.remaining_days - pending_days - used_days
+                ),
+                LeaveBalance.last_calculated_at: datetime.utcnow(),
+            },
+            synchronize_session=False
+        )
+
     def _paginate_query(
         self,
         query,
@@ -10,7 +10,8 @@ from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from decimal import Decimal
 
-from sqlalchemy import and_, or_, func, case
+from sqlalchemy import Date as SQLDate, and_, or_, func, case, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.models.leave.leave_balance import (
@@ -189,7 +190,11 @@ class LeaveBalanceRepository(BaseRepository[LeaveBalance]):
         balance_id: UUID
     ) -> Optional[LeaveBalance]:
         """
-        Recalculate balance from usage records.
+        Recalculate balance from the student's leave applications.
+        
+        Used and pending days are summed from approved and pending
+        applications in the academic year, the same rows approval and
+        cancellation move between the balance counters.
         
         Args:
             balance_id: Balance ID
@@ -201,28 +206,24 @@ class LeaveBalanceRepository(BaseRepository[LeaveBalance]):
         if not balance:
             return None
         
-        # Calculate used days from approved leaves
-        used_days = self.session.query(
-            func.coalesce(func.sum(LeaveUsage.days_used), 0)
-        ).filter(
-            LeaveUsage.balance_id == balance_id,
-            LeaveUsage.usage_type == 'approved'
-        ).scalar() or 0
-        
-        # Calculate pending days from pending applications
         from app.models.leave.leave_application import LeaveApplication
         from app.models.common.enums import LeaveStatus
         
-        pending_days = self.session.query(
-            func.coalesce(func.sum(LeaveApplication.total_days), 0)
+        def days_with(status: LeaveStatus):
+            return func.coalesce(func.sum(LeaveApplication.total_days).filter(
+                LeaveApplication.status == status
+            ), 0)
+        
+        used_days, pending_days = self.session.query(
+            days_with(LeaveStatus.APPROVED),
+            days_with(LeaveStatus.PENDING)
         ).filter(
             LeaveApplication.student_id == balance.student_id,
             LeaveApplication.leave_type == balance.leave_type,
-            LeaveApplication.status == LeaveStatus.PENDING,
             LeaveApplication.from_date >= balance.academic_year_start,
             LeaveApplication.from_date < balance.academic_year_end,
             LeaveApplication.deleted_at.is_(None)
-        ).scalar() or 0
+        ).one()
         
         balance.used_days = int(used_days)
         balance.pending_days = int(pending_days)
@@ -512,6 +513,268 @@ class LeaveBalanceRepository(BaseRepository[LeaveBalance]):
         
         return carry_forward
 
+    def get_rollover_student_ids(
+        self,
+        from_year_start: date,
+        hostel_id: Optional[UUID] = None,
+        after_student_id: Optional[UUID] = None,
+        limit: int = 500
+    ) -> List[UUID]:
+        """
+        Get the next chunk of students with balances to roll over.
+        
+        Students are returned in id order so a rollover can resume after
+        the last student it finished.
+        
+        Args:
+            from_year_start: Source year start
+            hostel_id: Restrict to one hostel
+            after_student_id: Resume after this student
+            limit: Chunk size
+            
+        Returns:
+            Student IDs in ascending order
+        """
+        from app.models.student.student import Student
+        
+        query = self.session.query(LeaveBalance.student_id).filter(
+            LeaveBalance.academic_year_start == from_year_start,
+            LeaveBalance.is_active == True
+        )
+        
+        if hostel_id:
+            query = query.join(
+                Student, Student.id == LeaveBalance.student_id
+            ).filter(Student.hostel_id == hostel_id)
+        
+        if after_student_id:
+            query = query.filter(LeaveBalance.student_id > after_student_id)
+        
+        rows = query.distinct().order_by(LeaveBalance.student_id).limit(limit).all()
+        return [row.student_id for row in rows]
+
+    def bulk_rollover(
+        self,
+        student_ids: List[UUID],
+        from_year_start: date,
+        to_year_start: date,
+        leave_types: Optional[List[LeaveType]] = None,
+        max_carry_forward_days: Optional[int] = None,
+        expiry_months: Optional[int] = None,
+        processed_by: Optional[UUID] = None
+    ) -> Dict[str, int]:
+        """
+        Roll a chunk of students over to the next academic year.
+        
+        Set-based equivalent of process_carry_forward for many students:
+        one INSERT ... SELECT records carry forwards from the source
+        balances, and one INSERT ... SELECT ... ON CONFLICT creates or
+        updates the target-year balances, allocating the hostel's active
+        annual quota to new balances. Carry forward follows the quota's
+        allow_carry_forward and carry_forward_max_days unless
+        max_carry_forward_days is given. Both statements are idempotent,
+        so a chunk can safely be re-run.
+        
+        Args:
+            student_ids: Students in this chunk
+            from_year_start: Source year start
+            to_year_start: Target year start
+            leave_types: Restrict to these leave types
+            max_carry_forward_days: Cap overriding the quota's cap
+            expiry_months: Expiry period in months
+            processed_by: User processing the rollover
+            
+        Returns:
+            Counts of carry forward rows inserted and balances upserted
+        """
+        from app.models.student.student import Student
+        
+        if not student_ids:
+            return {"carry_forwards": 0, "balances": 0}
+        
+        from_year_end = date(from_year_start.year + 1, from_year_start.month, from_year_start.day)
+        to_year_end = date(to_year_start.year + 1, to_year_start.month, to_year_start.day)
+        expiry_date = (
+            to_year_start + timedelta(days=expiry_months * 30)
+            if expiry_months else None
+        )
+        now = datetime.utcnow()
+        
+        # Latest quota in force at the start of the target year
+        quota_rank = func.row_number().over(
+            partition_by=(LeaveQuota.hostel_id, LeaveQuota.leave_type),
+            order_by=LeaveQuota.effective_from.desc()
+        )
+        quota = (
+            select(
+                LeaveQuota.hostel_id,
+                LeaveQuota.leave_type,
+                LeaveQuota.annual_quota,
+                LeaveQuota.allow_carry_forward,
+                LeaveQuota.carry_forward_max_days,
+                quota_rank.label("rank"),
+            )
+            .where(
+                LeaveQuota.is_active == True,
+                LeaveQuota.effective_from <= to_year_start,
+                or_(
+                    LeaveQuota.effective_to.is_(None),
+                    LeaveQuota.effective_to >= to_year_start
+                )
+            )
+            .subquery("quota")
+        )
+        
+        source_filters = [
+            LeaveBalance.student_id.in_(student_ids),
+            LeaveBalance.academic_year_start == from_year_start,
+            LeaveBalance.is_active == True,
+        ]
+        if leave_types:
+            source_filters.append(LeaveBalance.leave_type.in_(leave_types))
+        
+        remaining = func.greatest(LeaveBalance.remaining_days, 0)
+        cap = (
+            literal(max_carry_forward_days)
+            if max_carry_forward_days is not None
+            else quota.c.carry_forward_max_days
+        )
+        carried = case(
+            (and_(cap.isnot(None), cap < remaining), cap),
+            else_=remaining
+        )
+        
+        carry_forward_source = (
+            select(
+                func.gen_random_uuid(),
+                LeaveBalance.student_id,
+                LeaveBalance.leave_type,
+                literal(from_year_start),
+                literal(from_year_end),
+                literal(to_year_start),
+                literal(to_year_end),
+                LeaveBalance.allocated_days,
+                LeaveBalance.used_days,
+                remaining,
+                carried,
+                literal(0),
+                literal(0),
+                literal(expiry_date, SQLDate),
+                literal(False),
+                literal(now),
+                literal(processed_by, LeaveCarryForward.processed_by.type),
+            )
+            .select_from(LeaveBalance)
+            .join(Student, Student.id == LeaveBalance.student_id)
+            .outerjoin(
+                quota,
+                and_(
+                    quota.c.hostel_id == Student.hostel_id,
+                    quota.c.leave_type == LeaveBalance.leave_type,
+                    quota.c.rank == 1
+                )
+            )
+            .where(
+                *source_filters,
+                LeaveBalance.remaining_days > 0,
+                or_(
+                    quota.c.allow_carry_forward.is_(None),
+                    quota.c.allow_carry_forward == True
+                )
+            )
+        )
+        
+        carry_forward_insert = pg_insert(LeaveCarryForward).from_select(
+            [
+                "id", "student_id", "leave_type",
+                "from_year_start", "from_year_end", "to_year_start", "to_year_end",
+                "original_balance", "used_in_source_year",
+                "eligible_for_carry_forward", "days_carried_forward",
+                "days_used_from_carry_forward", "days_expired",
+                "expiry_date", "is_expired", "processed_at", "processed_by",
+            ],
+            carry_forward_source
+        ).on_conflict_do_nothing(
+            constraint="uq_leave_carry_forward_student_type_years"
+        )
+        
+        carry_forwards = self.session.execute(carry_forward_insert).rowcount
+        
+        # Target balances: allocate quota, add whatever was carried forward
+        allocated = func.coalesce(quota.c.annual_quota, 0)
+        carried_forward = func.coalesce(LeaveCarryForward.days_carried_forward, 0)
+        
+        balance_source = (
+            select(
+                func.gen_random_uuid(),
+                LeaveBalance.student_id,
+                LeaveBalance.leave_type,
+                literal(to_year_start),
+                literal(to_year_end),
+                allocated,
+                literal(0),
+                literal(0),
+                carried_forward,
+                allocated + carried_forward,
+                literal(0),
+                literal(0),
+                literal(0),
+                literal(True),
+                literal(False),
+                literal(now),
+            )
+            .select_from(LeaveBalance)
+            .join(Student, Student.id == LeaveBalance.student_id)
+            .outerjoin(
+                quota,
+                and_(
+                    quota.c.hostel_id == Student.hostel_id,
+                    quota.c.leave_type == LeaveBalance.leave_type,
+                    quota.c.rank == 1
+                )
+            )
+            .outerjoin(
+                LeaveCarryForward,
+                and_(
+                    LeaveCarryForward.student_id == LeaveBalance.student_id,
+                    LeaveCarryForward.leave_type == LeaveBalance.leave_type,
+                    LeaveCarryForward.from_year_start == from_year_start,
+                    LeaveCarryForward.to_year_start == to_year_start
+                )
+            )
+            .where(*source_filters)
+        )
+        
+        balance_insert = pg_insert(LeaveBalance).from_select(
+            [
+                "id", "student_id", "leave_type",
+                "academic_year_start", "academic_year_end",
+                "allocated_days", "used_days", "pending_days",
+                "carry_forward_days", "remaining_days",
+                "total_applications", "approved_applications", "rejected_applications",
+                "is_active", "is_locked", "last_calculated_at",
+            ],
+            balance_source
+        )
+        balance_upsert = balance_insert.on_conflict_do_update(
+            constraint="uq_leave_balance_student_type_year",
+            set_={
+                # Replace, not add, so re-running a chunk is a no-op
+                "carry_forward_days": balance_insert.excluded.carry_forward_days,
+                "remaining_days": (
+                    LeaveBalance.remaining_days
+                    - LeaveBalance.carry_forward_days
+                    + balance_insert.excluded.carry_forward_days
+                ),
+                "last_calculated_at": balance_insert.excluded.last_calculated_at,
+            }
+        )
+        
+        balances = self.session.execute(balance_upsert).rowcount
+        self.session.flush()
+        
+        return {"carry_forwards": carry_forwards, "balances": balances}
+
     def get_carry_forward(
         self,
         student_id: UUID,
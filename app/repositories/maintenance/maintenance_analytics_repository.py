@@ -6,18 +6,24 @@ Comprehensive analytics and reporting for maintenance operations
 with predictive insights and performance benchmarking.
 """
 
+import math
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, case, cast, desc, extract, func, or_, select, text
+from sqlalchemy import (
+    and_, case, cast, delete, desc, extract, func, insert, or_, select, text,
+    tuple_, union_all,
+)
 from sqlalchemy.orm import Session
-from sqlalchemy.types import Date as DateType, Numeric
+from sqlalchemy.types import Date as DateType, Integer, Numeric
 
 from app.models.maintenance import (
     MaintenanceAnalytic,
     CategoryPerformanceMetric,
+    MaintenanceDailyRollup,
+    MaintenanceRollupWatermark,
     MaintenanceRequest,
     MaintenanceCompletion,
     MaintenanceCost,
@@ -29,6 +35,91 @@ from app.repositories.base.pagination import PaginationParams, PaginatedResult
 from app.schemas.common.enums import MaintenanceCategory, MaintenanceStatus, Priority
 
 
+# Rollup histograms use log buckets growing 2% per bucket (~1% median error)
+HISTOGRAM_GROWTH = 1.02
+_LOG_GROWTH = math.log(HISTOGRAM_GROWTH)
+
+# Re-read changes slightly older than the watermark so rows committed by
+# transactions that started before the last refresh are not missed
+ROLLUP_WATERMARK_OVERLAP = timedelta(minutes=5)
+ROLLUP_ALL_SCOPE = "all"
+ROLLUP_DIRTY_CHUNK_SIZE = 500
+
+_ROLLUP_SUM_FIELDS = (
+    "total_requests",
+    "completed_requests",
+    "pending_requests",
+    "cancelled_requests",
+    "critical_requests",
+    "urgent_requests",
+    "high_requests",
+    "completion_hours_sum",
+    "completion_count",
+    "on_time_count",
+    "cost_total",
+    "cost_count",
+    "cost_variance_sum",
+    "cost_variance_count",
+    "within_budget_count",
+    "completions_count",
+    "quality_checked_count",
+    "quality_rating_sum",
+    "quality_rating_count",
+    "rework_count",
+)
+_ROLLUP_HISTOGRAM_FIELDS = ("completion_hours_histogram", "cost_histogram")
+
+
+def _histogram_bucket(value):
+    """SQL expression for the log histogram bucket of a positive value."""
+    return cast(func.floor(func.ln(func.greatest(value, 0.01)) / _LOG_GROWTH), Integer)
+
+
+def _count_buckets(buckets: Optional[Iterable[int]]) -> Dict[str, int]:
+    """Turn an aggregated bucket array into a bucket -> count histogram."""
+    histogram: Dict[str, int] = {}
+    for bucket in buckets or ():
+        if bucket is not None:
+            key = str(int(bucket))
+            histogram[key] = histogram.get(key, 0) + 1
+    return histogram
+
+
+def _histogram_median(histogram: Dict[str, int]) -> Optional[Decimal]:
+    """Approximate median of a log-bucketed histogram."""
+    total = sum(histogram.values())
+    if not total:
+        return None
+    target = (total + 1) // 2
+    cumulative = 0
+    for key in sorted(histogram, key=int):
+        cumulative += histogram[key]
+        if cumulative >= target:
+            return round(Decimal(str(HISTOGRAM_GROWTH ** (int(key) + 0.5))), 2)
+    return None
+
+
+def _percentage(numerator: Any, denominator: Any) -> Decimal:
+    if not denominator:
+        return Decimal("0.00")
+    return round(Decimal(numerator or 0) / Decimal(denominator) * 100, 2)
+
+
+def _fold_rollups(rows: Iterable[MaintenanceDailyRollup]) -> Dict[str, Any]:
+    """Add daily rollup rows into a single set of totals."""
+    totals: Dict[str, Any] = {field: 0 for field in _ROLLUP_SUM_FIELDS}
+    for field in _ROLLUP_HISTOGRAM_FIELDS:
+        totals[field] = {}
+    for row in rows:
+        for field in _ROLLUP_SUM_FIELDS:
+            totals[field] += getattr(row, field) or 0
+        for field in _ROLLUP_HISTOGRAM_FIELDS:
+            merged = totals[field]
+            for key, count in (getattr(row, field) or {}).items():
+                merged[key] = merged.get(key, 0) + count
+    return totals
+
+
 class MaintenanceAnalyticsRepository(BaseRepository[MaintenanceAnalytic]):
     """
     Repository for maintenance analytics operations.
@@ -234,49 +325,21 @@ class MaintenanceAnalyticsRepository(BaseRepository[MaintenanceAnalytic]):
         Returns:
             Generated daily analytics
         """
-        period_start = target_date
-        period_end = target_date
-        period_label = target_date.strftime("%Y-%m-%d")
-        
-        # Calculate metrics
-        metrics = self._calculate_period_metrics(
-            hostel_id,
-            period_start,
-            period_end
-        )
-        
-        # Check if record exists
-        existing = self.find_by_period(
+        return self._generate_period_analytics(
             hostel_id,
             "daily",
-            period_start,
-            period_end
-        )
-        
-        if existing:
-            # Update existing record
-            for key, value in metrics.items():
-                setattr(existing, key, value)
-            existing.calculate_efficiency_score()
-            self.session.commit()
-            self.session.refresh(existing)
-            return existing
-        
-        # Create new record
-        return self.create_analytics_record(
-            hostel_id=hostel_id,
-            period_type="daily",
-            period_start=period_start,
-            period_end=period_end,
-            period_label=period_label,
-            **metrics
+            target_date,
+            target_date,
+            target_date.strftime("%Y-%m-%d")
         )
     
     def generate_monthly_analytics(
         self,
         hostel_id: UUID,
         year: int,
-        month: int
+        month: int,
+        refresh: bool = True,
+        commit: bool = True
     ) -> MaintenanceAnalytic:
         """
         Generate monthly analytics for hostel.
@@ -285,6 +348,8 @@ class MaintenanceAnalyticsRepository(BaseRepository[MaintenanceAnalytic]):
             hostel_id: Hostel identifier
             year: Year
             month: Month
+            refresh: Fold pending changes into rollups first
+            commit: Commit after generating
             
         Returns:
             Generated monthly analytics
@@ -292,58 +357,26 @@ class MaintenanceAnalyticsRepository(BaseRepository[MaintenanceAnalytic]):
         from calendar import monthrange
         
         period_start = date(year, month, 1)
-        last_day = monthrange(year, month)[1]
-        period_end = date(year, month, last_day)
-        period_label = period_start.strftime("%Y-%m")
+        period_end = date(year, month, monthrange(year, month)[1])
         
-        # Calculate metrics
-        metrics = self._calculate_period_metrics(
-            hostel_id,
-            period_start,
-            period_end
-        )
-        
-        # Check if record exists
-        existing = self.find_by_period(
+        return self._generate_period_analytics(
             hostel_id,
             "monthly",
             period_start,
-            period_end
-        )
-        
-        if existing:
-            # Update existing record
-            for key, value in metrics.items():
-                setattr(existing, key, value)
-            existing.calculate_efficiency_score()
-            self.session.commit()
-            self.session.refresh(existing)
-            return existing
-        
-        # Create new record
-        analytics = self.create_analytics_record(
-            hostel_id=hostel_id,
-            period_type="monthly",
-            period_start=period_start,
-            period_end=period_end,
-            period_label=period_label,
-            **metrics
-        )
-        
-        # Generate category performance metrics
-        self._generate_category_metrics(
-            hostel_id,
-            period_start,
-            period_end
+            period_end,
+            period_start.strftime("%Y-%m"),
+            include_categories=True,
+            refresh=refresh,
+            commit=commit
         )
-        
-        return analytics
     
     def generate_quarterly_analytics(
         self,
         hostel_id: UUID,
         year: int,
-        quarter: int
+        quarter: int,
+        refresh: bool = True,
+        commit: bool = True
     ) -> MaintenanceAnalytic:
         """
         Generate quarterly analytics for hostel.
@@ -352,6 +385,8 @@ class MaintenanceAnalyticsRepository(BaseRepository[MaintenanceAnalytic]):
             hostel_id: Hostel identifier
             year: Year
             quarter: Quarter (1-4)
+            refresh: Fold pending changes into rollups first
+            commit: Commit after generating
             
         Returns:
             Generated quarterly analytics
@@ -363,48 +398,24 @@ class MaintenanceAnalyticsRepository(BaseRepository[MaintenanceAnalytic]):
         end_month = start_month + 2
         
         period_start = date(year, start_month, 1)
-        last_day = monthrange(year, end_month)[1]
-        period_end = date(year, end_month, last_day)
-        period_label = f"Q{quarter} {year}"
+        period_end = date(year, end_month, monthrange(year, end_month)[1])
         
-        # Calculate metrics
-        metrics = self._calculate_period_metrics(
-            hostel_id,
-            period_start,
-            period_end
-        )
-        
-        # Check if record exists
-        existing = self.find_by_period(
+        return self._generate_period_analytics(
             hostel_id,
             "quarterly",
             period_start,
-            period_end
-        )
-        
-        if existing:
-            # Update existing record
-            for key, value in metrics.items():
-                setattr(existing, key, value)
-            existing.calculate_efficiency_score()
-            self.session.commit()
-            self.session.refresh(existing)
-            return existing
-        
-        # Create new record
-        return self.create_analytics_record(
-            hostel_id=hostel_id,
-            period_type="quarterly",
-            period_start=period_start,
-            period_end=period_end,
-            period_label=period_label,
-            **metrics
+            period_end,
+            f"Q{quarter} {year}",
+            refresh=refresh,
+            commit=commit
         )
     
     def generate_annual_analytics(
         self,
         hostel_id: UUID,
-        year: int
+        year: int,
+        refresh: bool = True,
+        commit: bool = True
     ) -> MaintenanceAnalytic:
         """
         Generate annual analytics for hostel.
@@ -412,47 +423,433 @@ class MaintenanceAnalyticsRepository(BaseRepository[MaintenanceAnalytic]):
         Args:
             hostel_id: Hostel identifier
             year: Year
+            refresh: Fold pending changes into rollups first
+            commit: Commit after generating
             
         Returns:
             Generated annual analytics
         """
-        period_start = date(year, 1, 1)
-        period_end = date(year, 12, 31)
-        period_label = str(year)
-        
-        # Calculate metrics
-        metrics = self._calculate_period_metrics(
+        return self._generate_period_analytics(
             hostel_id,
-            period_start,
-            period_end
+            "yearly",
+            date(year, 1, 1),
+            date(year, 12, 31),
+            str(year),
+            refresh=refresh,
+            commit=commit
         )
+    
+    def regenerate_analytics(
+        self,
+        hostel_ids: List[UUID],
+        year: int
+    ) -> int:
+        """
+        Regenerate a year of monthly, quarterly and annual analytics.
         
-        # Check if record exists
-        existing = self.find_by_period(
-            hostel_id,
-            "yearly",
-            period_start,
-            period_end
+        Rollups are refreshed once for all hostels and every period is
+        derived from them, committing once at the end.
+        
+        Args:
+            hostel_ids: Hostels to regenerate
+            year: Year
+            
+        Returns:
+            Number of analytics records generated
+        """
+        self.refresh_daily_rollups(commit=False)
+        
+        generated = 0
+        for hostel_id in hostel_ids:
+            for month in range(1, 13):
+                self.generate_monthly_analytics(hostel_id, year, month, refresh=False, commit=False)
+            for quarter in range(1, 5):
+                self.generate_quarterly_analytics(hostel_id, year, quarter, refresh=False, commit=False)
+            self.generate_annual_analytics(hostel_id, year, refresh=False, commit=False)
+            generated += 17
+        
+        self.session.commit()
+        return generated
+    
+    # ============================================================================
+    # DAILY ROLLUPS
+    # ============================================================================
+    
+    def refresh_daily_rollups(
+        self,
+        hostel_id: Optional[UUID] = None,
+        full: bool = False,
+        commit: bool = True
+    ) -> int:
+        """
+        Fold changed maintenance data into the daily rollups.
+        
+        Only (hostel, day) pairs touched by requests, costs or completions
+        updated since the scope's high-water mark are recomputed. The first
+        refresh of a scope (or full=True) rebuilds all of its rollups.
+        
+        Args:
+            hostel_id: Optional hostel to refresh (all hostels if omitted)
+            full: Rebuild every rollup in scope
+            commit: Commit after refreshing
+            
+        Returns:
+            Number of rollup rows written
+        """
+        scope = str(hostel_id) if hostel_id else ROLLUP_ALL_SCOPE
+        watermark = self.session.execute(
+            select(MaintenanceRollupWatermark).where(
+                MaintenanceRollupWatermark.scope == scope
+            )
+        ).scalar_one_or_none()
+        
+        since = None
+        if watermark and not full:
+            since = watermark.high_water_mark - ROLLUP_WATERMARK_OVERLAP
+        
+        changed = self._find_changed_days(hostel_id, since)
+        if not changed:
+            return 0
+        
+        high_water_mark = max(row.changed_at for row in changed)
+        written = 0
+        
+        if since is None:
+            # Full rebuild in one grouped pass
+            delete_query = delete(MaintenanceDailyRollup)
+            if hostel_id:
+                delete_query = delete_query.where(MaintenanceDailyRollup.hostel_id == hostel_id)
+            self.session.execute(delete_query)
+            written += self._write_rollups(hostel_id, None)
+        else:
+            pairs = [(row.hostel_id, row.rollup_date) for row in changed]
+            for offset in range(0, len(pairs), ROLLUP_DIRTY_CHUNK_SIZE):
+                chunk = pairs[offset:offset + ROLLUP_DIRTY_CHUNK_SIZE]
+                self.session.execute(
+                    delete(MaintenanceDailyRollup).where(
+                        tuple_(
+                            MaintenanceDailyRollup.hostel_id,
+                            MaintenanceDailyRollup.rollup_date
+                        ).in_(chunk)
+                    )
+                )
+                written += self._write_rollups(hostel_id, chunk)
+        
+        if watermark:
+            watermark.high_water_mark = max(watermark.high_water_mark, high_water_mark)
+        else:
+            self.session.add(
+                MaintenanceRollupWatermark(scope=scope, high_water_mark=high_water_mark)
+            )
+        
+        if commit:
+            self.session.commit()
+        else:
+            self.session.flush()
+        
+        return written
+    
+    def _find_changed_days(
+        self,
+        hostel_id: Optional[UUID],
+        since: Optional[datetime]
+    ) -> List[Any]:
+        """
+        Find (hostel, day) pairs with source rows updated since a point in time.
+        
+        Returns:
+            Rows of (hostel_id, rollup_date, changed_at)
+        """
+        request_day = cast(MaintenanceRequest.created_at, DateType)
+        
+        def changed_since(source):
+            query = select(
+                MaintenanceRequest.hostel_id.label("hostel_id"),
+                request_day.label("rollup_date"),
+                source.updated_at.label("changed_at")
+            )
+            if source is not MaintenanceRequest:
+                query = query.join(
+                    MaintenanceRequest,
+                    source.maintenance_request_id == MaintenanceRequest.id
+                )
+            if since is not None:
+                query = query.where(source.updated_at > since)
+            if hostel_id:
+                query = query.where(MaintenanceRequest.hostel_id == hostel_id)
+            return query
+        
+        changes = union_all(
+            changed_since(MaintenanceRequest),
+            changed_since(MaintenanceCost),
+            changed_since(MaintenanceCompletion),
+        ).subquery()
+        
+        query = select(
+            changes.c.hostel_id,
+            changes.c.rollup_date,
+            func.max(changes.c.changed_at).label("changed_at")
+        ).group_by(
+            changes.c.hostel_id,
+            changes.c.rollup_date
         )
         
-        if existing:
-            # Update existing record
+        return self.session.execute(query).all()
+    
+    def _write_rollups(
+        self,
+        hostel_id: Optional[UUID],
+        days: Optional[List[Tuple[UUID, date]]]
+    ) -> int:
+        """
+        Compute and insert rollups for the given (hostel, day) pairs.
+        
+        Args:
+            hostel_id: Optional hostel restriction
+            days: (hostel_id, day) pairs to compute, or None for all days
+            
+        Returns:
+            Number of rollup rows inserted
+        """
+        rollups = self._aggregate_rollups(hostel_id, days)
+        if rollups:
+            self.session.execute(insert(MaintenanceDailyRollup), rollups)
+        
+        return len(rollups)
+    
+    def _aggregate_rollups(
+        self,
+        hostel_id: Optional[UUID],
+        days: Optional[List[Tuple[UUID, date]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Compute rollups for the given (hostel, day) pairs in one GROUP BY pass.
+        
+        Args:
+            hostel_id: Optional hostel restriction
+            days: (hostel_id, day) pairs to compute, or None for all days
+            
+        Returns:
+            Rollup column dictionaries, one per (hostel, day, category)
+        """
+        request_day = cast(MaintenanceRequest.created_at, DateType)
+        is_completed = and_(
+            MaintenanceRequest.status == MaintenanceStatus.COMPLETED,
+            MaintenanceRequest.completed_at.isnot(None)
+        )
+        completion_hours = extract(
+            'epoch', MaintenanceRequest.completed_at - MaintenanceRequest.created_at
+        ) / 3600
+        quality_rating = case(
+            (MaintenanceCompletion.quality_verified == True, MaintenanceCompletion.quality_rating),
+            else_=None
+        )
+        
+        # Costs pre-aggregated per request so the join cannot fan out
+        request_costs = select(
+            MaintenanceCost.maintenance_request_id.label("request_id"),
+            func.sum(MaintenanceCost.actual_cost).label("cost_sum"),
+            func.count(MaintenanceCost.id).label("cost_rows"),
+            func.sum(MaintenanceCost.variance_percentage).label("variance_sum"),
+            func.count(MaintenanceCost.variance_percentage).label("variance_rows"),
+            func.sum(
+                case((MaintenanceCost.within_budget == True, 1), else_=0)
+            ).label("within_budget_rows")
+        ).where(
+            MaintenanceCost.actual_cost.isnot(None),
+            MaintenanceCost.deleted_at.is_(None)
+        ).group_by(
+            MaintenanceCost.maintenance_request_id
+        ).subquery()
+        
+        # Completions likewise, so request-level counts stay one per request
+        request_completions = select(
+            MaintenanceCompletion.maintenance_request_id.label("request_id"),
+            func.count(MaintenanceCompletion.id).label("completion_rows"),
+            func.sum(
+                case((MaintenanceCompletion.quality_verified == True, 1), else_=0)
+            ).label("quality_checked_rows"),
+            func.sum(quality_rating).label("quality_rating_sum"),
+            func.count(quality_rating).label("quality_rating_rows"),
+            func.sum(
+                case((MaintenanceCompletion.follow_up_required == True, 1), else_=0)
+            ).label("rework_rows")
+        ).where(
+            MaintenanceCompletion.deleted_at.is_(None)
+        ).group_by(
+            MaintenanceCompletion.maintenance_request_id
+        ).subquery()
+        
+        query = select(
+            MaintenanceRequest.hostel_id,
+            request_day.label("rollup_date"),
+            MaintenanceRequest.category,
+            func.count(MaintenanceRequest.id).label("total_requests"),
+            func.sum(case((MaintenanceRequest.status == MaintenanceStatus.COMPLETED, 1), else_=0)).label("completed_requests"),
+            func.sum(case((MaintenanceRequest.status == MaintenanceStatus.PENDING, 1), else_=0)).label("pending_requests"),
+            func.sum(case((MaintenanceRequest.status == MaintenanceStatus.CANCELLED, 1), else_=0)).label("cancelled_requests"),
+            func.sum(case((MaintenanceRequest.priority == Priority.CRITICAL, 1), else_=0)).label("critical_requests"),
+            func.sum(case((MaintenanceRequest.priority == Priority.URGENT, 1), else_=0)).label("urgent_requests"),
+            func.sum(case((MaintenanceRequest.priority == Priority.HIGH, 1), else_=0)).label("high_requests"),
+            func.coalesce(func.sum(case((is_completed, completion_hours), else_=None)), 0).label("completion_hours_sum"),
+            func.sum(case((is_completed, 1), else_=0)).label("completion_count"),
+            func.sum(
+                case(
+                    (
+                        and_(
+                            is_completed,
+                            MaintenanceRequest.deadline.isnot(None),
+                            MaintenanceRequest.completed_at <= MaintenanceRequest.deadline
+                        ),
+                        1
+                    ),
+                    else_=0
+                )
+            ).label("on_time_count"),
+            func.array_agg(_histogram_bucket(completion_hours)).filter(is_completed).label("completion_buckets"),
+            func.coalesce(func.sum(request_costs.c.cost_sum), 0).label("cost_total"),
+            func.coalesce(func.sum(request_costs.c.cost_rows), 0).label("cost_count"),
+            func.coalesce(func.sum(request_costs.c.variance_sum), 0).label("cost_variance_sum"),
+            func.coalesce(func.sum(request_costs.c.variance_rows), 0).label("cost_variance_count"),
+            func.coalesce(func.sum(request_costs.c.within_budget_rows), 0).label("within_budget_count"),
+            func.array_agg(_histogram_bucket(request_costs.c.cost_sum)).filter(
+                request_costs.c.cost_sum.isnot(None)
+            ).label("cost_buckets"),
+            func.coalesce(func.sum(request_completions.c.completion_rows), 0).label("completions_count"),
+            func.coalesce(func.sum(request_completions.c.quality_checked_rows), 0).label("quality_checked_count"),
+            func.coalesce(func.sum(request_completions.c.quality_rating_sum), 0).label("quality_rating_sum"),
+            func.coalesce(func.sum(request_completions.c.quality_rating_rows), 0).label("quality_rating_count"),
+            func.coalesce(func.sum(request_completions.c.rework_rows), 0).label("rework_count")
+        ).outerjoin(
+            request_costs,
+            request_costs.c.request_id == MaintenanceRequest.id
+        ).outerjoin(
+            request_completions,
+            request_completions.c.request_id == MaintenanceRequest.id
+        ).where(
+            MaintenanceRequest.deleted_at.is_(None)
+        ).group_by(
+            MaintenanceRequest.hostel_id,
+            request_day,
+            MaintenanceRequest.category
+        )
+        
+        if hostel_id:
+            query = query.where(MaintenanceRequest.hostel_id == hostel_id)
+        if days is not None:
+            query = query.where(tuple_(MaintenanceRequest.hostel_id, request_day).in_(days))
+        
+        refreshed_at = datetime.utcnow()
+        rollups = []
+        for row in self.session.execute(query).all():
+            rollup = {field: getattr(row, field) or 0 for field in _ROLLUP_SUM_FIELDS}
+            rollup.update(
+                hostel_id=row.hostel_id,
+                rollup_date=row.rollup_date,
+                category=str(getattr(row.category, "value", row.category)),
+                completion_hours_histogram=_count_buckets(row.completion_buckets),
+                cost_histogram=_count_buckets(row.cost_buckets),
+                refreshed_at=refreshed_at
+            )
+            rollups.append(rollup)
+        
+        return rollups
+    
+    def _load_rollups(
+        self,
+        hostel_id: UUID,
+        period_start: date,
+        period_end: date,
+        category: Optional[str] = None
+    ) -> List[MaintenanceDailyRollup]:
+        """
+        Load the daily rollups of a hostel for a period.
+        
+        Past days come from the rollup table, kept current by the scheduled
+        refresh. Today is still changing, so it is aggregated live and
+        returned as transient rollup rows.
+        """
+        # Rollup days are UTC dates of request creation
+        today = datetime.utcnow().date()
+        query = select(MaintenanceDailyRollup).where(
+            MaintenanceDailyRollup.hostel_id == hostel_id,
+            MaintenanceDailyRollup.rollup_date >= period_start,
+            MaintenanceDailyRollup.rollup_date <= min(period_end, today - timedelta(days=1))
+        )
+        
+        if category:
+            query = query.where(MaintenanceDailyRollup.category == category)
+        
+        rows = list(self.session.execute(query).scalars().all())
+        
+        if period_start <= today <= period_end:
+            rows.extend(
+                MaintenanceDailyRollup(**rollup)
+                for rollup in self._aggregate_rollups(hostel_id, [(hostel_id, today)])
+                if not category or rollup["category"] == category
+            )
+        
+        return rows
+    
+    def _generate_period_analytics(
+        self,
+        hostel_id: UUID,
+        period_type: str,
+        period_start: date,
+        period_end: date,
+        period_label: str,
+        include_categories: bool = False,
+        refresh: bool = True,
+        commit: bool = True
+    ) -> MaintenanceAnalytic:
+        """
+        Create or update the analytics record of a period from rollups.
+        
+        Args:
+            hostel_id: Hostel identifier
+            period_type: Period type
+            period_start: Period start date
+            period_end: Period end date
+            period_label: Period label
+            include_categories: Also upsert category performance metrics
+            refresh: Fold pending changes into rollups first
+            commit: Commit after generating
+            
+        Returns:
+            Generated analytics record
+        """
+        if refresh:
+            self.refresh_daily_rollups(hostel_id, commit=False)
+        
+        metrics = self._calculate_period_metrics(hostel_id, period_start, period_end)
+        
+        analytics = self.find_by_period(hostel_id, period_type, period_start, period_end)
+        if analytics:
             for key, value in metrics.items():
-                setattr(existing, key, value)
-            existing.calculate_efficiency_score()
+                setattr(analytics, key, value)
+        else:
+            analytics = MaintenanceAnalytic(
+                hostel_id=hostel_id,
+                period_type=period_type,
+                period_start=period_start,
+                period_end=period_end,
+                period_label=period_label,
+                **metrics
+            )
+            self.session.add(analytics)
+        
+        analytics.calculate_efficiency_score()
+        
+        if include_categories:
+            self._generate_category_metrics(hostel_id, period_start, period_end)
+        
+        if commit:
             self.session.commit()
-            self.session.refresh(existing)
-            return existing
-        
-        # Create new record
-        return self.create_analytics_record(
-            hostel_id=hostel_id,
-            period_type="yearly",
-            period_start=period_start,
-            period_end=period_end,
-            period_label=period_label,
-            **metrics
-        )
+            self.session.refresh(analytics)
+        else:
+            self.session.flush()
+        
+        return analytics
     
     # ============================================================================
     # KPI CALCULATIONS
@@ -863,8 +1260,36 @@ class MaintenanceAnalyticsRepository(BaseRepository[MaintenanceAnalytic]):
         Returns:
             Forecasted demand data
         """
-        # Get historical data (last 12 months)
-        historical_data = self.get_request_trends(hostel_id, months=12)
+        self.refresh_daily_rollups(hostel_id)
+        
+        # Historical monthly volumes (last 12 months) from daily rollups
+        start_date = date.today() - timedelta(days=12 * 30)
+        month = func.date_trunc('month', MaintenanceDailyRollup.rollup_date)
+        
+        query = select(
+            month.label("month"),
+            func.sum(MaintenanceDailyRollup.total_requests).label("request_count"),
+            func.sum(MaintenanceDailyRollup.completion_hours_sum).label("completion_hours"),
+            func.sum(MaintenanceDailyRollup.completion_count).label("completion_count")
+        ).where(
+            MaintenanceDailyRollup.hostel_id == hostel_id,
+            MaintenanceDailyRollup.rollup_date >= start_date
+        ).group_by(
+            month
+        ).order_by(
+            month
+        )
+        
+        historical_data = [
+            {
+                "request_count": int(row.request_count or 0),
+                "avg_completion_days": (
+                    float(row.completion_hours) / float(row.completion_count) / 24
+                    if row.completion_count else 0
+                )
+            }
+            for row in self.session.execute(query).all()
+        ]
         
         if len(historical_data) < 3:
             return []
@@ -1046,7 +1471,7 @@ class MaintenanceAnalyticsRepository(BaseRepository[MaintenanceAnalytic]):
         period_end: date
     ) -> Dict[str, Any]:
         """
-        Calculate comprehensive metrics for period.
+        Calculate comprehensive metrics for period by summing daily rollups.
         
         Args:
             hostel_id: Hostel identifier
@@ -1056,272 +1481,67 @@ class MaintenanceAnalyticsRepository(BaseRepository[MaintenanceAnalytic]):
         Returns:
             Dictionary of calculated metrics
         """
-        # Request counts
-        request_query = select(
-            func.count(MaintenanceRequest.id).label("total"),
-            func.sum(
-                case(
-                    (MaintenanceRequest.status == MaintenanceStatus.COMPLETED, 1),
-                    else_=0
-                )
-            ).label("completed"),
-            func.sum(
-                case(
-                    (MaintenanceRequest.status == MaintenanceStatus.PENDING, 1),
-                    else_=0
-                )
-            ).label("pending"),
-            func.sum(
-                case(
-                    (MaintenanceRequest.status == MaintenanceStatus.CANCELLED, 1),
-                    else_=0
-                )
-            ).label("cancelled"),
-            func.sum(
-                case(
-                    (MaintenanceRequest.priority == Priority.CRITICAL, 1),
-                    else_=0
-                )
-            ).label("critical"),
-            func.sum(
-                case(
-                    (MaintenanceRequest.priority == Priority.URGENT, 1),
-                    else_=0
-                )
-            ).label("urgent"),
-            func.sum(
-                case(
-                    (MaintenanceRequest.priority == Priority.HIGH, 1),
-                    else_=0
-                )
-            ).label("high")
-        ).where(
-            MaintenanceRequest.hostel_id == hostel_id,
-            MaintenanceRequest.created_at >= datetime.combine(period_start, datetime.min.time()),
-            MaintenanceRequest.created_at <= datetime.combine(period_end, datetime.max.time()),
-            MaintenanceRequest.deleted_at.is_(None)
-        )
-        
-        request_result = self.session.execute(request_query).first()
-        
-        total_requests = request_result.total or 0
-        completed_requests = request_result.completed or 0
-        pending_requests = request_result.pending or 0
-        cancelled_requests = request_result.cancelled or 0
-        
-        # Calculate completion rate
-        completion_rate = Decimal("0.00")
-        if total_requests > 0:
-            completion_rate = round(
-                Decimal(completed_requests) / Decimal(total_requests) * 100,
-                2
+        rows = self._load_rollups(hostel_id, period_start, period_end)
+        totals = _fold_rollups(rows)
+        
+        requests_by_category: Dict[str, int] = {}
+        cost_by_category: Dict[str, float] = {}
+        for row in rows:
+            requests_by_category[row.category] = (
+                requests_by_category.get(row.category, 0) + row.total_requests
             )
-        
-        # Time metrics
-        time_query = select(
-            func.avg(
-                extract('epoch', MaintenanceRequest.completed_at - MaintenanceRequest.created_at) / 3600
-            ).label("avg_hours"),
-            func.percentile_cont(0.5).within_group(
-                extract('epoch', MaintenanceRequest.completed_at - MaintenanceRequest.created_at) / 86400
-            ).label("median_days"),
-            func.sum(
-                case(
-                    (
-                        and_(
-                            MaintenanceRequest.completed_at.isnot(None),
-                            MaintenanceRequest.deadline.isnot(None),
-                            MaintenanceRequest.completed_at <= MaintenanceRequest.deadline
-                        ),
-                        1
-                    ),
-                    else_=0
+            if row.cost_count:
+                cost_by_category[row.category] = (
+                    cost_by_category.get(row.category, 0.0) + float(row.cost_total)
                 )
-            ).label("on_time")
-        ).where(
-            MaintenanceRequest.hostel_id == hostel_id,
-            MaintenanceRequest.status == MaintenanceStatus.COMPLETED,
-            MaintenanceRequest.completed_at.isnot(None),
-            MaintenanceRequest.created_at >= datetime.combine(period_start, datetime.min.time()),
-            MaintenanceRequest.created_at <= datetime.combine(period_end, datetime.max.time()),
-            MaintenanceRequest.deleted_at.is_(None)
-        )
         
-        time_result = self.session.execute(time_query).first()
+        completed_requests = totals["completed_requests"]
         
-        avg_hours = Decimal(str(time_result.avg_hours)) if time_result.avg_hours else Decimal("0.00")
+        avg_hours = Decimal("0.00")
+        if totals["completion_count"]:
+            avg_hours = Decimal(str(totals["completion_hours_sum"])) / totals["completion_count"]
         avg_days = avg_hours / 24 if avg_hours > 0 else Decimal("0.00")
-        median_days = Decimal(str(time_result.median_days)) if time_result.median_days else Decimal("0.00")
         
-        on_time_rate = Decimal("0.00")
-        if completed_requests > 0:
-            on_time_rate = round(
-                Decimal(time_result.on_time or 0) / Decimal(completed_requests) * 100,
-                2
-            )
+        median_hours = _histogram_median(totals["completion_hours_histogram"])
+        median_days = round(median_hours / 24, 2) if median_hours else Decimal("0.00")
         
-        # Cost metrics
-        cost_query = select(
-            func.sum(MaintenanceCost.actual_cost).label("total_cost"),
-            func.avg(MaintenanceCost.actual_cost).label("avg_cost"),
-            func.avg(MaintenanceCost.variance_percentage).label("avg_variance"),
-            func.sum(
-                case(
-                    (MaintenanceCost.within_budget == True, 1),
-                    else_=0
-                )
-            ).label("within_budget_count")
-        ).join(
-            MaintenanceRequest,
-            MaintenanceCost.maintenance_request_id == MaintenanceRequest.id
-        ).where(
-            MaintenanceRequest.hostel_id == hostel_id,
-            MaintenanceCost.actual_cost.isnot(None),
-            MaintenanceRequest.created_at >= datetime.combine(period_start, datetime.min.time()),
-            MaintenanceRequest.created_at <= datetime.combine(period_end, datetime.max.time()),
-            MaintenanceCost.deleted_at.is_(None)
-        )
+        total_cost = Decimal(str(totals["cost_total"]))
+        avg_cost = total_cost / totals["cost_count"] if totals["cost_count"] else Decimal("0.00")
+        cost_variance = Decimal("0.00")
+        if totals["cost_variance_count"]:
+            cost_variance = Decimal(str(totals["cost_variance_sum"])) / totals["cost_variance_count"]
         
-        cost_result = self.session.execute(cost_query).first()
+        quality_check_rate = _percentage(totals["quality_checked_count"], totals["completions_count"])
         
-        total_cost = Decimal(str(cost_result.total_cost)) if cost_result.total_cost else Decimal("0.00")
-        avg_cost = Decimal(str(cost_result.avg_cost)) if cost_result.avg_cost else Decimal("0.00")
-        cost_variance = Decimal(str(cost_result.avg_variance)) if cost_result.avg_variance else Decimal("0.00")
-        
-        within_budget_rate = Decimal("0.00")
-        if completed_requests > 0:
-            within_budget_rate = round(
-                Decimal(cost_result.within_budget_count or 0) / Decimal(completed_requests) * 100,
+        average_quality_rating = None
+        if totals["quality_rating_count"]:
+            average_quality_rating = round(
+                Decimal(str(totals["quality_rating_sum"])) / totals["quality_rating_count"],
                 2
             )
         
-        # Quality metrics
-        quality_query = select(
-            func.count(MaintenanceCompletion.id).label("total_completions"),
-            func.sum(
-                case(
-                    (MaintenanceCompletion.quality_verified == True, 1),
-                    else_=0
-                )
-            ).label("quality_checked"),
-            func.avg(
-                case(
-                    (MaintenanceCompletion.quality_verified == True, MaintenanceCompletion.quality_rating),
-                    else_=None
-                )
-            ).label("avg_quality_rating")
-        ).join(
-            MaintenanceRequest,
-            MaintenanceCompletion.maintenance_request_id == MaintenanceRequest.id
-        ).where(
-            MaintenanceRequest.hostel_id == hostel_id,
-            MaintenanceRequest.created_at >= datetime.combine(period_start, datetime.min.time()),
-            MaintenanceRequest.created_at <= datetime.combine(period_end, datetime.max.time()),
-            MaintenanceCompletion.deleted_at.is_(None)
-        )
-        
-        quality_result = self.session.execute(quality_query).first()
-        
-        quality_check_rate = Decimal("0.00")
-        if quality_result.total_completions and quality_result.total_completions > 0:
-            quality_check_rate = round(
-                Decimal(quality_result.quality_checked or 0) / Decimal(quality_result.total_completions) * 100,
-                2
-            )
-        
-        # Simplified quality pass rate (assuming quality checked items passed)
-        quality_pass_rate = quality_check_rate  # This could be more sophisticated
-        
-        # Rework rate calculation
-        rework_query = select(
-            func.sum(
-                case(
-                    (MaintenanceCompletion.follow_up_required == True, 1),
-                    else_=0
-                )
-            ).label("rework_count")
-        ).join(
-            MaintenanceRequest,
-            MaintenanceCompletion.maintenance_request_id == MaintenanceRequest.id
-        ).where(
-            MaintenanceRequest.hostel_id == hostel_id,
-            MaintenanceRequest.created_at >= datetime.combine(period_start, datetime.min.time()),
-            MaintenanceRequest.created_at <= datetime.combine(period_end, datetime.max.time()),
-            MaintenanceCompletion.deleted_at.is_(None)
-        )
-        
-        rework_result = self.session.execute(rework_query).scalar_one_or_none()
-        
-        rework_rate = Decimal("0.00")
-        if completed_requests > 0:
-            rework_rate = round(
-                Decimal(rework_result or 0) / Decimal(completed_requests) * 100,
-                2
-            )
-        
-        # Category and priority breakdowns
-        category_query = select(
-            MaintenanceRequest.category,
-            func.count(MaintenanceRequest.id).label("count")
-        ).where(
-            MaintenanceRequest.hostel_id == hostel_id,
-            MaintenanceRequest.created_at >= datetime.combine(period_start, datetime.min.time()),
-            MaintenanceRequest.created_at <= datetime.combine(period_end, datetime.max.time()),
-            MaintenanceRequest.deleted_at.is_(None)
-        ).group_by(
-            MaintenanceRequest.category
-        )
-        
-        category_results = self.session.execute(category_query).all()
-        requests_by_category = {
-            str(row.category.value): row.count
-            for row in category_results
-        }
-        
-        # Cost by category
-        cost_by_category_query = select(
-            MaintenanceRequest.category,
-            func.sum(MaintenanceCost.actual_cost).label("total_cost")
-        ).join(
-            MaintenanceCost,
-            MaintenanceRequest.id == MaintenanceCost.maintenance_request_id
-        ).where(
-            MaintenanceRequest.hostel_id == hostel_id,
-            MaintenanceCost.actual_cost.isnot(None),
-            MaintenanceRequest.created_at >= datetime.combine(period_start, datetime.min.time()),
-            MaintenanceRequest.created_at <= datetime.combine(period_end, datetime.max.time()),
-            MaintenanceCost.deleted_at.is_(None)
-        ).group_by(
-            MaintenanceRequest.category
-        )
-        
-        cost_category_results = self.session.execute(cost_by_category_query).all()
-        cost_by_category = {
-            str(row.category.value): float(row.total_cost)
-            for row in cost_category_results
-        }
-        
         return {
-            "total_requests": total_requests,
+            "total_requests": totals["total_requests"],
             "completed_requests": completed_requests,
-            "pending_requests": pending_requests,
-            "cancelled_requests": cancelled_requests,
-            "completion_rate": completion_rate,
+            "pending_requests": totals["pending_requests"],
+            "cancelled_requests": totals["cancelled_requests"],
+            "completion_rate": _percentage(completed_requests, totals["total_requests"]),
             "average_completion_time_hours": avg_hours,
             "average_completion_time_days": avg_days,
             "median_completion_time_days": median_days,
-            "on_time_completion_rate": on_time_rate,
+            "on_time_completion_rate": _percentage(totals["on_time_count"], completed_requests),
             "total_cost": total_cost,
             "average_cost_per_request": avg_cost,
             "cost_variance_percentage": cost_variance,
-            "within_budget_rate": within_budget_rate,
+            "within_budget_rate": _percentage(totals["within_budget_count"], completed_requests),
             "quality_check_rate": quality_check_rate,
-            "quality_pass_rate": quality_pass_rate,
-            "average_quality_rating": Decimal(str(quality_result.avg_quality_rating)) if quality_result.avg_quality_rating else None,
-            "rework_rate": rework_rate,
-            "critical_requests": request_result.critical or 0,
-            "urgent_requests": request_result.urgent or 0,
-            "high_requests": request_result.high or 0,
+            # Simplified quality pass rate (assuming quality checked items passed)
+            "quality_pass_rate": quality_check_rate,
+            "average_quality_rating": average_quality_rating,
+            "rework_rate": _percentage(totals["rework_count"], completed_requests),
+            "critical_requests": totals["critical_requests"],
+            "urgent_requests": totals["urgent_requests"],
+            "high_requests": totals["high_requests"],
             "requests_by_category": requests_by_category,
             "cost_by_category": cost_by_category,
             "efficiency_score": Decimal("0.00")  # Will be calculated by model
@@ -1334,42 +1554,41 @@ class MaintenanceAnalyticsRepository(BaseRepository[MaintenanceAnalytic]):
         period_end: date
     ) -> None:
         """
-        Generate category performance metrics for period.
+        Create or update category performance metrics for period from rollups.
         
         Args:
             hostel_id: Hostel identifier
             period_start: Period start date
             period_end: Period end date
         """
-        # Get all categories with requests in period
-        category_query = select(
-            MaintenanceRequest.category
-        ).where(
-            MaintenanceRequest.hostel_id == hostel_id,
-            MaintenanceRequest.created_at >= datetime.combine(period_start, datetime.min.time()),
-            MaintenanceRequest.created_at <= datetime.combine(period_end, datetime.max.time()),
-            MaintenanceRequest.deleted_at.is_(None)
-        ).distinct()
-        
-        categories = self.session.execute(category_query).scalars().all()
-        
-        for category in categories:
-            # Calculate category-specific metrics
-            category_metrics = self._calculate_category_metrics(
-                hostel_id,
-                category,
-                period_start,
-                period_end
+        rows_by_category: Dict[str, List[MaintenanceDailyRollup]] = {}
+        for row in self._load_rollups(hostel_id, period_start, period_end):
+            rows_by_category.setdefault(row.category, []).append(row)
+        
+        existing = {
+            metric.category: metric
+            for metric in self.get_category_performance_for_period(
+                hostel_id, period_start, period_end
             )
+        }
+        
+        for category, rows in rows_by_category.items():
+            category_metrics = self._category_metrics_from_totals(_fold_rollups(rows))
             
-            # Create or update category performance metric
-            self.create_category_performance(
-                hostel_id=hostel_id,
-                category=str(category.value),
-                period_start=period_start,
-                period_end=period_end,
-                **category_metrics
-            )
+            metric = existing.get(category)
+            if metric:
+                for key, value in category_metrics.items():
+                    setattr(metric, key, value)
+            else:
+                self.session.add(
+                    CategoryPerformanceMetric(
+                        hostel_id=hostel_id,
+                        category=category,
+                        period_start=period_start,
+                        period_end=period_end,
+                        **category_metrics
+                    )
+                )
     
     def _calculate_category_metrics(
         self,
@@ -1379,7 +1598,7 @@ class MaintenanceAnalyticsRepository(BaseRepository[MaintenanceAnalytic]):
         period_end: date
     ) -> Dict[str, Any]:
         """
-        Calculate metrics for specific category.
+        Calculate metrics for specific category from daily rollups.
         
         Args:
             hostel_id: Hostel identifier
@@ -1390,115 +1609,37 @@ class MaintenanceAnalyticsRepository(BaseRepository[MaintenanceAnalytic]):
         Returns:
             Category metrics dictionary
         """
-        # Request counts
-        request_query = select(
-            func.count(MaintenanceRequest.id).label("total"),
-            func.sum(
-                case(
-                    (MaintenanceRequest.status == MaintenanceStatus.COMPLETED, 1),
-                    else_=0
-                )
-            ).label("completed"),
-            func.sum(
-                case(
-                    (MaintenanceRequest.status == MaintenanceStatus.PENDING, 1),
-                    else_=0
-                )
-            ).label("pending"),
-            func.sum(
-                case(
-                    (MaintenanceRequest.priority == Priority.HIGH, 1),
-                    else_=0
-                )
-            ).label("high_priority"),
-            func.sum(
-                case(
-                    (MaintenanceRequest.priority == Priority.URGENT, 1),
-                    else_=0
-                )
-            ).label("urgent_priority")
-        ).where(
-            MaintenanceRequest.hostel_id == hostel_id,
-            MaintenanceRequest.category == category,
-            MaintenanceRequest.created_at >= datetime.combine(period_start, datetime.min.time()),
-            MaintenanceRequest.created_at <= datetime.combine(period_end, datetime.max.time()),
-            MaintenanceRequest.deleted_at.is_(None)
-        )
-        
-        request_result = self.session.execute(request_query).first()
-        
-        # Cost metrics
-        cost_query = select(
-            func.sum(MaintenanceCost.actual_cost).label("total_cost"),
-            func.avg(MaintenanceCost.actual_cost).label("avg_cost"),
-            func.percentile_cont(0.5).within_group(
-                MaintenanceCost.actual_cost
-            ).label("median_cost")
-        ).join(
-            MaintenanceRequest,
-            MaintenanceCost.maintenance_request_id == MaintenanceRequest.id
-        ).where(
-            MaintenanceRequest.hostel_id == hostel_id,
-            MaintenanceRequest.category == category,
-            MaintenanceCost.actual_cost.isnot(None),
-            MaintenanceRequest.created_at >= datetime.combine(period_start, datetime.min.time()),
-            MaintenanceRequest.created_at <= datetime.combine(period_end, datetime.max.time()),
-            MaintenanceCost.deleted_at.is_(None)
-        )
-        
-        cost_result = self.session.execute(cost_query).first()
-        
-        # Time metrics
-        time_query = select(
-            func.avg(
-                extract('epoch', MaintenanceRequest.completed_at - MaintenanceRequest.created_at) / 3600
-            ).label("avg_hours"),
-            func.sum(
-                case(
-                    (
-                        and_(
-                            MaintenanceRequest.completed_at.isnot(None),
-                            MaintenanceRequest.deadline.isnot(None),
-                            MaintenanceRequest.completed_at <= MaintenanceRequest.deadline
-                        ),
-                        1
-                    ),
-                    else_=0
-                )
-            ).label("on_time")
-        ).where(
-            MaintenanceRequest.hostel_id == hostel_id,
-            MaintenanceRequest.category == category,
-            MaintenanceRequest.status == MaintenanceStatus.COMPLETED,
-            MaintenanceRequest.created_at >= datetime.combine(period_start, datetime.min.time()),
-            MaintenanceRequest.created_at <= datetime.combine(period_end, datetime.max.time()),
-            MaintenanceRequest.deleted_at.is_(None)
+        rows = self._load_rollups(
+            hostel_id,
+            period_start,
+            period_end,
+            category=str(getattr(category, "value", category))
         )
+        return self._category_metrics_from_totals(_fold_rollups(rows))
+    
+    def _category_metrics_from_totals(self, totals: Dict[str, Any]) -> Dict[str, Any]:
+        """Derive category performance metrics from folded rollup totals."""
+        completed = totals["completed_requests"]
         
-        time_result = self.session.execute(time_query).first()
-        
-        avg_hours = Decimal(str(time_result.avg_hours)) if time_result.avg_hours else Decimal("0.00")
+        avg_hours = Decimal("0.00")
+        if totals["completion_count"]:
+            avg_hours = Decimal(str(totals["completion_hours_sum"])) / totals["completion_count"]
         avg_days = avg_hours / 24 if avg_hours > 0 else Decimal("0.00")
         
-        completed = request_result.completed or 0
-        on_time_rate = Decimal("0.00")
-        if completed > 0:
-            on_time_rate = round(
-                Decimal(time_result.on_time or 0) / Decimal(completed) * 100,
-                2
-            )
+        total_cost = Decimal(str(totals["cost_total"]))
         
         return {
-            "total_requests": request_result.total or 0,
+            "total_requests": totals["total_requests"],
             "completed_requests": completed,
-            "pending_requests": request_result.pending or 0,
-            "total_cost": Decimal(str(cost_result.total_cost)) if cost_result.total_cost else Decimal("0.00"),
-            "average_cost": Decimal(str(cost_result.avg_cost)) if cost_result.avg_cost else Decimal("0.00"),
-            "median_cost": Decimal(str(cost_result.median_cost)) if cost_result.median_cost else None,
+            "pending_requests": totals["pending_requests"],
+            "cancelled_requests": totals["cancelled_requests"],
+            "total_cost": total_cost,
+            "average_cost": total_cost / totals["cost_count"] if totals["cost_count"] else Decimal("0.00"),
+            "median_cost": _histogram_median(totals["cost_histogram"]),
             "average_completion_time_hours": avg_hours,
             "average_completion_time_days": avg_days,
-            "on_time_completion_rate": on_time_rate,
-            "high_priority_count": request_result.high_priority or 0,
-            "urgent_priority_count": request_result.urgent_priority or 0,
+            "on_time_completion_rate": _percentage(totals["on_time_count"], completed),
+            "high_priority_count": totals["high_requests"],
+            "urgent_priority_count": totals["urgent_requests"],
             "category_performance_score": Decimal("0.00")  # Will be calculated
-        }
\ No newline at end of file
+        }
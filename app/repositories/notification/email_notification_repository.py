@@ -21,6 +21,7 @@ from app.models.notification.email_notification import (
     EmailClickEvent
 )
 from app.models.notification.notification import Notification
+from app.schemas.common.enums import NotificationStatus, NotificationType
 from app.repositories.base.base_repository import BaseRepository
 from app.repositories.base.specifications import Specification
 from app.repositories.base.pagination import PaginationParams, PaginatedResult
@@ -86,6 +87,38 @@ class EmailNotificationRepository(BaseRepository[EmailNotification]):
         self.db_session.commit()
         return email_notification
 
+    def create_bulk_email_notifications(
+        self,
+        db: Session,
+        payload: Dict[str, Any]
+    ) -> List[EmailNotification]:
+        """
+        Create one notification and email row per bulk recipient.
+        
+        Rows are flushed, not committed, so callers control the transaction;
+        they are returned in recipient order.
+        """
+        emails = []
+        for recipient in payload["recipients"]:
+            notification = Notification(
+                recipient_email=str(recipient),
+                notification_type=NotificationType.EMAIL,
+                subject=payload.get("subject"),
+                message_body=payload.get("body_html", ""),
+                template_code=payload.get("template_code"),
+            )
+            db.add(notification)
+            emails.append(EmailNotification(
+                notification=notification,
+                body_html=payload.get("body_html", ""),
+                track_opens=payload.get("track_opens", True),
+                track_clicks=payload.get("track_clicks", True),
+            ))
+        
+        db.add_all(emails)
+        db.flush()
+        return emails
+
     def find_by_notification_id(self, notification_id: UUID) -> Optional[EmailNotification]:
         """Find email by notification ID."""
         return self.db_session.query(EmailNotification).filter(
@@ -222,6 +255,72 @@ class EmailNotificationRepository(BaseRepository[EmailNotification]):
         self.db_session.commit()
         return True
 
+    # Direct delivery
+    def claim_emails_for_delivery(self, email_ids: List[UUID]) -> int:
+        """Mark emails as being sent directly so background workers skip them."""
+        return self._set_direct_delivery_status(
+            email_ids, 'sending', {Notification.status: NotificationStatus.PROCESSING}
+        )
+
+    def release_emails(self, email_ids: List[UUID]) -> int:
+        """Hand claimed emails back to background workers."""
+        return self._set_direct_delivery_status(
+            email_ids, None, {Notification.status: NotificationStatus.PENDING}
+        )
+
+    def mark_emails_sent(self, email_ids: List[UUID]) -> int:
+        """Mark emails the SMTP server accepted as sent."""
+        return self._set_direct_delivery_status(
+            email_ids,
+            'sent',
+            {Notification.status: NotificationStatus.SENT, Notification.sent_at: datetime.utcnow()},
+        )
+
+    def _set_direct_delivery_status(
+        self,
+        email_ids: List[UUID],
+        delivery_status: Optional[str],
+        notification_values: Dict[Any, Any]
+    ) -> int:
+        if not email_ids:
+            return 0
+        
+        updated = self.db_session.query(EmailNotification).filter(
+            EmailNotification.id.in_(email_ids)
+        ).update({EmailNotification.delivery_status: delivery_status}, synchronize_session=False)
+        
+        self.db_session.query(Notification).filter(
+            Notification.id.in_(
+                select(EmailNotification.notification_id).where(
+                    EmailNotification.id.in_(email_ids)
+                )
+            )
+        ).update(notification_values, synchronize_session=False)
+        
+        self.db_session.commit()
+        return updated
+
+    def mark_emails_failed(self, failures: Dict[UUID, str]) -> int:
+        """Mark emails whose direct delivery failed, with the SMTP error."""
+        if not failures:
+            return 0
+        
+        now = datetime.utcnow()
+        emails = self.db_session.query(EmailNotification).filter(
+            EmailNotification.id.in_(list(failures))
+        ).options(joinedload(EmailNotification.notification)).all()
+        
+        for email in emails:
+            email.delivery_status = 'failed'
+            notification = email.notification
+            if notification is not None:
+                notification.status = NotificationStatus.FAILED
+                notification.failed_at = now
+                notification.failure_reason = failures[email.id]
+        
+        self.db_session.commit()
+        return len(emails)
+
     # Analytics and reporting
     def get_engagement_analytics(
         self,
@@ -11,7 +11,7 @@ from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from enum import Enum
 
-from sqlalchemy import and_, or_, func, desc, asc, case, text
+from sqlalchemy import and_, or_, func, desc, asc, case, text, update
 from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.sql import select
 
@@ -77,9 +77,15 @@ class NotificationQueueRepository(BaseRepository[NotificationQueue]):
         notification: Notification,
         priority: Priority = Priority.MEDIUM,
         scheduled_for: Optional[datetime] = None,
-        batch_id: Optional[UUID] = None
+        batch_id: Optional[UUID] = None,
+        commit: bool = True
     ) -> NotificationQueue:
-        """Add notification to processing queue."""
+        """
+        Add notification to processing queue.
+
+        With ``commit=False`` the item is only flushed, leaving the
+        transaction (and any open savepoint) to the caller.
+        """
         queue_item = NotificationQueue(
             notification_id=notification.id,
             notification_type=notification.notification_type,
@@ -91,6 +97,11 @@ class NotificationQueueRepository(BaseRepository[NotificationQueue]):
         # Update notification status
         notification.status = NotificationStatus.QUEUED
         
+        if not commit:
+            self.db.add(queue_item)
+            self.db.flush()
+            return queue_item
+        
         return self.create(queue_item)
 
     def dequeue_next_batch(
@@ -100,12 +111,17 @@ class NotificationQueueRepository(BaseRepository[NotificationQueue]):
         worker_id: Optional[str] = None
     ) -> List[NotificationQueue]:
         """Get next batch of notifications for processing."""
+        now = datetime.utcnow()
         query = self.db_session.query(NotificationQueue).filter(
             and_(
                 NotificationQueue.status == NotificationStatus.QUEUED,
                 or_(
                     NotificationQueue.scheduled_for.is_(None),
-                    NotificationQueue.scheduled_for <= datetime.utcnow()
+                    NotificationQueue.scheduled_for <= now
+                ),
+                or_(
+                    NotificationQueue.next_retry_at.is_(None),
+                    NotificationQueue.next_retry_at <= now
                 )
             )
         ).order_by(
@@ -133,6 +149,109 @@ class NotificationQueueRepository(BaseRepository[NotificationQueue]):
         
         return items
 
+    def claim_due_items(
+        self,
+        batch_size: int = 100,
+        lease_seconds: int = 300,
+        worker_id: Optional[str] = None,
+        priority: Optional[Priority] = None
+    ) -> List[NotificationQueue]:
+        """
+        Claim due queue items for processing.
+
+        Rows are locked with FOR UPDATE SKIP LOCKED so concurrent workers
+        never claim the same item, marked PROCESSING and committed. Items
+        held by a worker that died are reclaimed once processing started
+        more than ``lease_seconds`` ago.
+        """
+        now = datetime.utcnow()
+        query = self.db_session.query(NotificationQueue).filter(
+            or_(
+                and_(
+                    NotificationQueue.status == NotificationStatus.QUEUED,
+                    or_(
+                        NotificationQueue.scheduled_for.is_(None),
+                        NotificationQueue.scheduled_for <= now
+                    ),
+                    or_(
+                        NotificationQueue.next_retry_at.is_(None),
+                        NotificationQueue.next_retry_at <= now
+                    )
+                ),
+                and_(
+                    NotificationQueue.status == NotificationStatus.PROCESSING,
+                    NotificationQueue.processing_started_at < now - timedelta(seconds=lease_seconds)
+                )
+            )
+        )
+        if priority:
+            query = query.filter(NotificationQueue.priority == priority)
+
+        items = query.order_by(
+            desc(NotificationQueue.priority),
+            asc(NotificationQueue.queued_at)
+        ).limit(batch_size).with_for_update(skip_locked=True).all()
+
+        for item in items:
+            item.status = NotificationStatus.PROCESSING
+            item.processing_started_at = now
+            item.worker_id = worker_id
+
+        self.db_session.commit()
+        return items
+
+    def complete_items(self, item_ids: List[UUID]) -> int:
+        """Mark claimed items completed in one statement."""
+        if not item_ids:
+            return 0
+        result = self.db_session.execute(
+            update(NotificationQueue)
+            .where(NotificationQueue.id.in_(item_ids))
+            .values(
+                status=NotificationStatus.COMPLETED,
+                processing_completed_at=datetime.utcnow(),
+                next_retry_at=None,
+                worker_id=None
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db_session.commit()
+        return result.rowcount
+
+    def fail_item(
+        self,
+        item_id: UUID,
+        retry_count: int,
+        max_retries: int,
+        error: str,
+        retry_at: datetime
+    ) -> bool:
+        """
+        Record a failed attempt, scheduling a retry or dead-lettering.
+
+        Dead-lettered items stay FAILED with retry_count at max_retries.
+
+        Returns:
+            True if the item was dead-lettered
+        """
+        retry_count += 1
+        dead = retry_count >= max_retries
+        self.db_session.execute(
+            update(NotificationQueue)
+            .where(NotificationQueue.id == item_id)
+            .values(
+                status=NotificationStatus.FAILED if dead else NotificationStatus.QUEUED,
+                retry_count=retry_count,
+                next_retry_at=None if dead else retry_at,
+                last_error=error[:2000],
+                processing_completed_at=datetime.utcnow(),
+                worker_id=None
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db_session.commit()
+        return dead
+
     def mark_processing_complete(
         self,
         queue_item_id: UUID,
@@ -10,7 +10,7 @@ for comprehensive student insights and reporting.
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Any, Optional
-from sqlalchemy import and_, or_, func, desc, case
+from sqlalchemy import and_, or_, func, desc, case, select, true
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.student.student import Student
@@ -22,7 +22,41 @@ from app.models.student.room_transfer_history import RoomTransferHistory
 from app.models.user.user import User
 from app.models.hostel.hostel import Hostel
 from app.models.room.room import Room
-from app.models.base.enums import StudentStatus
+from app.models.attendance.attendance_record import AttendanceRecord
+from app.models.payment.payment import Payment
+from app.models.complaint.complaint import Complaint
+from app.models.base.enums import AttendanceStatus, ComplaintStatus, StudentStatus
+from app.models.common.enums import LeaveStatus
+from app.schemas.common.enums import PaymentStatus
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_leave_models: Optional[tuple] = None
+
+
+def _load_leave_models() -> tuple:
+    """
+    Import the leave models on first use.
+
+    They are not imported at module level because app.models.leave raises
+    a mixin MRO TypeError on import. A failed import is logged once and
+    leaves the result empty, so callers can skip leave counters instead
+    of failing.
+
+    Returns:
+        (LeaveApplication, LeaveBalance), or () if they cannot be imported
+    """
+    global _leave_models
+    if _leave_models is None:
+        try:
+            from app.models.leave.leave_application import LeaveApplication
+            from app.models.leave.leave_balance import LeaveBalance
+            _leave_models = (LeaveApplication, LeaveBalance)
+        except (ImportError, TypeError) as e:
+            logger.error(f"Leave models failed to import; leave counters disabled: {e}")
+            _leave_models = ()
+    return _leave_models
 
 
 class StudentAggregateRepository:
@@ -111,6 +145,153 @@ class StudentAggregateRepository:
     # DASHBOARD STATISTICS
     # ============================================================================
 
+    def get_student_dashboard_counters(
+        self,
+        student_id: str,
+        start_date: date,
+        end_date: date
+    ) -> dict[str, Any]:
+        """
+        Get every student dashboard counter in a single query.
+        
+        Each domain is aggregated in its own single-row CTE and the CTEs
+        are cross joined, so attendance, payments, complaints and leave
+        come back in one round trip.
+        
+        Args:
+            student_id: Student UUID
+            start_date: Period start date
+            end_date: Period end date
+            
+        Returns:
+            Dictionary of dashboard counters; the leave counters
+            (used_days, pending_applications, available_balance) are
+            omitted when the leave models cannot be imported
+        """
+        period_start = datetime.combine(start_date, datetime.min.time())
+        period_end = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+
+        attendance = select(
+            func.count(AttendanceRecord.id).label('total_days'),
+            func.count(AttendanceRecord.id).filter(
+                AttendanceRecord.status.in_([
+                    AttendanceStatus.PRESENT,
+                    AttendanceStatus.LATE,
+                    AttendanceStatus.HALF_DAY,
+                ])
+            ).label('present_days'),
+            func.count(AttendanceRecord.id).filter(
+                AttendanceRecord.status == AttendanceStatus.ABSENT
+            ).label('absent_days'),
+            func.count(AttendanceRecord.id).filter(
+                or_(
+                    AttendanceRecord.is_late.is_(True),
+                    AttendanceRecord.status == AttendanceStatus.LATE
+                )
+            ).label('late_arrivals'),
+        ).where(
+            AttendanceRecord.student_id == student_id,
+            AttendanceRecord.attendance_date.between(start_date, end_date)
+        ).cte('attendance')
+
+        unpaid = Payment.payment_status.in_([
+            PaymentStatus.PENDING,
+            PaymentStatus.PROCESSING,
+        ])
+        payments = select(
+            func.coalesce(func.sum(Payment.amount), 0).label('total_due'),
+            func.coalesce(func.sum(Payment.amount).filter(
+                Payment.payment_status == PaymentStatus.COMPLETED
+            ), 0).label('paid_amount'),
+            func.coalesce(func.sum(Payment.amount).filter(unpaid), 0).label('pending_amount'),
+            func.coalesce(func.sum(Payment.amount).filter(
+                and_(unpaid, Payment.is_overdue.is_(True))
+            ), 0).label('overdue_amount'),
+        ).where(
+            Payment.student_id == student_id,
+            Payment.deleted_at.is_(None),
+            Payment.due_date.between(start_date, end_date)
+        ).cte('payments')
+
+        # Next due date is not limited to the period
+        next_due = select(
+            func.min(Payment.due_date).label('next_due_date'),
+        ).where(
+            Payment.student_id == student_id,
+            Payment.deleted_at.is_(None),
+            unpaid,
+            Payment.due_date >= date.today()
+        ).cte('next_due')
+
+        complaints = select(
+            func.count(Complaint.id).label('total_complaints'),
+            func.count(Complaint.id).filter(
+                Complaint.status.in_([ComplaintStatus.RESOLVED, ComplaintStatus.CLOSED])
+            ).label('resolved_complaints'),
+            func.count(Complaint.id).filter(
+                Complaint.status.in_([
+                    ComplaintStatus.OPEN,
+                    ComplaintStatus.IN_PROGRESS,
+                    ComplaintStatus.ESCALATED,
+                ])
+            ).label('pending_complaints'),
+        ).where(
+            Complaint.student_id == student_id,
+            Complaint.deleted_at.is_(None),
+            Complaint.opened_at >= period_start,
+            Complaint.opened_at < period_end
+        ).cte('complaints')
+
+        ctes = [attendance, payments, next_due, complaints]
+
+        leave_models = _load_leave_models()
+        if leave_models:
+            LeaveApplication, LeaveBalance = leave_models
+
+            ctes.append(select(
+                func.coalesce(func.sum(LeaveApplication.total_days).filter(
+                    and_(
+                        LeaveApplication.status == LeaveStatus.APPROVED,
+                        LeaveApplication.from_date <= end_date,
+                        LeaveApplication.to_date >= start_date
+                    )
+                ), 0).label('used_days'),
+                func.count(LeaveApplication.id).filter(
+                    LeaveApplication.status == LeaveStatus.PENDING
+                ).label('pending_applications'),
+            ).where(
+                LeaveApplication.student_id == student_id,
+                LeaveApplication.deleted_at.is_(None)
+            ).cte('leave'))
+
+            ctes.append(select(
+                func.coalesce(func.sum(LeaveBalance.remaining_days), 0).label('available_balance'),
+            ).where(
+                LeaveBalance.student_id == student_id,
+                LeaveBalance.is_active.is_(True)
+            ).cte('leave_balance'))
+
+        joined = ctes[0]
+        for cte in ctes[1:]:
+            joined = joined.join(cte, true())
+        stmt = select(*ctes).select_from(joined)
+
+        counters = dict(self.db.execute(stmt).mappings().one())
+
+        counters['attendance_percentage'] = round(
+            counters['present_days'] / counters['total_days'] * 100, 2
+        ) if counters['total_days'] else 0.0
+
+        if counters['overdue_amount'] > 0:
+            counters['payment_status'] = 'overdue'
+        elif counters['pending_amount'] > 0:
+            counters['payment_status'] = 'pending'
+        else:
+            counters['payment_status'] = 'paid'
+
+        return counters
+
+
     def get_hostel_dashboard_stats(
         self,
         hostel_id: str
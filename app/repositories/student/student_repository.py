@@ -20,6 +20,12 @@ from app.models.hostel.hostel import Hostel
 from app.models.room.room import Room
 from app.models.room.bed import Bed
 from app.models.base.enums import StudentStatus
+from app.repositories.announcement.audience_bitmap_index import audience_indexes
+
+# Student fields indexed for announcement targeting
+AUDIENCE_FIELDS = frozenset({
+    'hostel_id', 'room_id', 'student_status', 'year_of_study', 'course', 'deleted_at'
+})
 
 
 class StudentRepository:
@@ -68,6 +74,7 @@ class StudentRepository:
         student = Student(**student_data)
         self.db.add(student)
         self.db.flush()
+        audience_indexes.apply_student_on_commit(self.db, student)
         
         return student
 
@@ -161,6 +168,9 @@ class StudentRepository:
                 setattr(student, key, value)
         
         self.db.flush()
+        
+        if AUDIENCE_FIELDS.intersection(update_data):
+            audience_indexes.apply_student_on_commit(self.db, student)
         return student
 
     def soft_delete(
@@ -187,6 +197,7 @@ class StudentRepository:
             student.deleted_by = audit_context.get('user_id')
         
         self.db.flush()
+        audience_indexes.apply_student_on_commit(self.db, student)
         return True
 
     def restore(self, student_id: str) -> bool:
@@ -206,6 +217,7 @@ class StudentRepository:
         student.deleted_at = None
         student.deleted_by = None
         self.db.flush()
+        audience_indexes.apply_student_on_commit(self.db, student)
         
         return True
 
@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 
 from app.services.base import (
+    AuditService,
     BaseService,
     ServiceResult,
     ServiceError,
@@ -56,6 +57,7 @@ class AdminActivityService(BaseService[AuditLog, AuditLogRepository]):
         """
         super().__init__(audit_repository, db_session)
         self.audit_repository = audit_repository
+        self.audit = AuditService(audit_repository, db_session)
         self.override_repository = override_repository
         self.security_repository = security_repository
     
@@ -72,10 +74,13 @@ class AdminActivityService(BaseService[AuditLog, AuditLogRepository]):
         category: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
         success: bool = True,
-    ) -> ServiceResult[AuditLog]:
+    ) -> ServiceResult[Dict[str, Any]]:
         """
         Record an admin activity as audit log entry.
         
+        The entry is buffered and written by the audit flusher, so it is
+        not visible to queries until the next flush.
+        
         Args:
             admin_user_id: Admin user ID
             action: Action performed
@@ -86,21 +91,19 @@ class AdminActivityService(BaseService[AuditLog, AuditLogRepository]):
             success: Whether action was successful
             
         Returns:
-            ServiceResult containing created audit log entry
+            ServiceResult containing the buffered audit row
         """
-        try:
-            entry = self.audit_repository.create({
-                "actor_user_id": admin_user_id,
-                "action": action,
-                "entity_type": entity_type,
-                "entity_id": entity_id,
-                "category": category,
-                "context": context or {},
-                "status": "success" if success else "failed",
-                "timestamp": datetime.utcnow(),
-            })
-            self.db.commit()
-            
+        result = self.audit.log_action(
+            admin_user_id,
+            action,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            category=category,
+            context=context,
+            status="success" if success else "failed",
+        )
+        
+        if result.is_success:
             self._logger.info(
                 f"Activity logged: {action}",
                 extra={
@@ -110,12 +113,8 @@ class AdminActivityService(BaseService[AuditLog, AuditLogRepository]):
                     "success": success,
                 },
             )
-            
-            return ServiceResult.success(entry, message="Activity logged")
-            
-        except Exception as e:
-            self.db.rollback()
-            return self._handle_exception(e, "log activity", admin_user_id)
+        
+        return result
     
     def log_bulk_activity(
         self,
@@ -123,7 +122,7 @@ class AdminActivityService(BaseService[AuditLog, AuditLogRepository]):
         activities: List[Dict[str, Any]],
     ) -> ServiceResult[Dict[str, Any]]:
         """
-        Log multiple activities in a single transaction.
+        Log multiple activities through the audit buffer.
         
         Args:
             admin_user_id: Admin user ID
@@ -137,22 +136,24 @@ class AdminActivityService(BaseService[AuditLog, AuditLogRepository]):
             failed_count = 0
             
             for activity in activities:
-                try:
-                    activity['actor_user_id'] = admin_user_id
-                    activity.setdefault('timestamp', datetime.utcnow())
-                    activity.setdefault('context', {})
-                    
-                    self.audit_repository.create(activity)
+                result = self.audit.log_action(
+                    admin_user_id,
+                    activity.get("action", "unknown"),
+                    entity_type=activity.get("entity_type"),
+                    entity_id=activity.get("entity_id"),
+                    category=activity.get("category"),
+                    context=activity.get("context"),
+                    status=activity.get("status", "success"),
+                )
+                if result.is_success:
                     logged_count += 1
-                except Exception as e:
+                else:
                     failed_count += 1
                     self._logger.warning(
-                        f"Failed to log activity: {str(e)}",
+                        f"Failed to log activity: {result.error.message}",
                         extra={"activity": activity},
                     )
             
-            self.db.commit()
-            
             summary = {
                 "total": len(activities),
                 "logged": logged_count,
@@ -165,7 +166,6 @@ class AdminActivityService(BaseService[AuditLog, AuditLogRepository]):
             )
             
         except Exception as e:
-            self.db.rollback()
             return self._handle_exception(e, "log bulk activity", admin_user_id)
     
     # =========================================================================
@@ -65,7 +65,7 @@ class AdminAuthenticationService(BaseService[AdminUser, AdminUserRepository]):
     # Authentication
     # =========================================================================
     
-    def login(
+    async def login(
         self,
         request: LoginRequest,
         ip_address: Optional[str] = None,
@@ -91,7 +91,7 @@ class AdminAuthenticationService(BaseService[AdminUser, AdminUserRepository]):
         """
         try:
             # Authenticate user
-            admin = self._authenticate_admin(request.email, request.password)
+            admin = await self._authenticate_admin(request.email, request.password)
             if isinstance(admin, ServiceResult):
                 # Authentication failed
                 if ip_address or user_agent:
@@ -303,7 +303,7 @@ class AdminAuthenticationService(BaseService[AdminUser, AdminUserRepository]):
     # Private Helper Methods
     # =========================================================================
     
-    def _authenticate_admin(
+    async def _authenticate_admin(
         self,
         email: str,
         password: str,
@@ -325,8 +325,18 @@ class AdminAuthenticationService(BaseService[AdminUser, AdminUserRepository]):
                 )
             )
         
-        # Verify password
-        if not self.password_hasher.verify(password, admin.user.password_hash):
+        # Verify password, upgrading the stored hash if its cost is outdated
+        matches, new_hash = await self.password_hasher.verify_and_update_async(
+            password, admin.user.password_hash
+        )
+        if new_hash:
+            try:
+                admin.user.password_hash = new_hash
+                self.db.flush()
+            except Exception as e:
+                self._logger.error(f"Failed to upgrade password hash: {str(e)}")
+                # Non-critical, retried on next login
+        if not matches:
             return ServiceResult.failure(
                 ServiceError(
                     code=ErrorCode.UNAUTHORIZED,
@@ -7,11 +7,11 @@ and bulk operations.
 
 from typing import Optional, List, Dict, Any
 from uuid import UUID
-from datetime import datetime
 
 from sqlalchemy.orm import Session
 
 from app.services.base import (
+    AuditService,
     BaseService,
     ServiceResult,
     ServiceError,
@@ -19,6 +19,7 @@ from app.services.base import (
     ErrorSeverity,
 )
 from app.repositories.admin import AdminPermissionsRepository
+from app.repositories.audit import AuditLogRepository
 from app.models.admin import (
     AdminPermission,
     PermissionTemplate,
@@ -57,6 +58,7 @@ class AdminPermissionService(BaseService[AdminPermission, AdminPermissionsReposi
             db_session: Database session
         """
         super().__init__(repository, db_session)
+        self.audit = AuditService(AuditLogRepository(db_session), db_session)
     
     # =========================================================================
     # Permission Management
@@ -729,23 +731,20 @@ class AdminPermissionService(BaseService[AdminPermission, AdminPermissionsReposi
             changed_by: User who made the change
             action: Action performed
         """
-        try:
-            audit_data = {
-                'admin_id': admin_id,
-                'changed_by': changed_by,
-                'action': action,
-                'permissions_before': old_state,
-                'permissions_after': new_state,
-                'timestamp': datetime.utcnow(),
-            }
-            
-            self.repository.create_audit_log(audit_data)
-            self.db.flush()
-            
-        except Exception as e:
+        result = self.audit.log_change(
+            changed_by,
+            entity_type="admin_permission",
+            entity_id=admin_id,
+            changes={
+                "permissions_before": old_state,
+                "permissions_after": new_state,
+            },
+            context={"action": action},
+        )
+        
+        if not result.is_success:
             self._logger.error(
-                f"Failed to log permission change: {str(e)}",
-                exc_info=True,
+                f"Failed to log permission change: {result.error.message}",
                 extra={"admin_id": str(admin_id)},
             )
     
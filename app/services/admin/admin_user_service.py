@@ -94,7 +94,7 @@ class AdminUserService(BaseService[AdminUser, AdminUserRepository]):
     # Admin User Creation and Management
     # =========================================================================
     
-    def create_admin_user(
+    async def create_admin_user(
         self,
         create_data: AdminUserCreate,
         created_by: Optional[UUID] = None,
@@ -141,7 +141,7 @@ class AdminUserService(BaseService[AdminUser, AdminUserRepository]):
                     return hierarchy_check
             
             # Create base user
-            user = self._create_base_user(create_data)
+            user = await self._create_base_user(create_data)
             self.db.flush()
             
             # Create admin user
@@ -593,7 +593,7 @@ class AdminUserService(BaseService[AdminUser, AdminUserRepository]):
     # Authentication and Authorization
     # =========================================================================
     
-    def authenticate_admin(
+    async def authenticate_admin(
         self,
         email: str,
         password: str,
@@ -631,7 +631,7 @@ class AdminUserService(BaseService[AdminUser, AdminUserRepository]):
                 )
             
             # Verify password
-            if not self._verify_password(password, admin.user.password_hash):
+            if not await self._verify_password(password, admin.user.password_hash):
                 return ServiceResult.failure(
                     ServiceError(
                         code=ErrorCode.INVALID_CREDENTIALS,
@@ -829,10 +829,10 @@ class AdminUserService(BaseService[AdminUser, AdminUserRepository]):
     # Private Helper Methods
     # =========================================================================
     
-    def _hash_password(self, password: str) -> str:
+    async def _hash_password(self, password: str) -> str:
         """Hash password using available hasher or fallback."""
         if self.password_hasher:
-            return self.password_hasher.hash(password)
+            return await self.password_hasher.hash_async(password)
         else:
             # Temporary fallback - replace with proper implementation
             import hashlib
@@ -840,10 +840,10 @@ class AdminUserService(BaseService[AdminUser, AdminUserRepository]):
                 self._logger.warning("Using fallback password hashing - not secure for production")
             return hashlib.sha256(password.encode()).hexdigest()
     
-    def _verify_password(self, password: str, hashed: str) -> bool:
+    async def _verify_password(self, password: str, hashed: str) -> bool:
         """Verify password using available hasher or fallback."""
         if self.password_hasher:
-            return self.password_hasher.verify(password, hashed)
+            return await self.password_hasher.verify_async(password, hashed)
         else:
             # Fallback verification
             import hashlib
@@ -872,14 +872,14 @@ class AdminUserService(BaseService[AdminUser, AdminUserRepository]):
             )
         return ServiceResult.success(None)
     
-    def _create_base_user(self, create_data: AdminUserCreate):
+    async def _create_base_user(self, create_data: AdminUserCreate):
         """Create base user entity."""
         user_data = {
             "email": create_data.email,
             "phone": create_data.phone,
             "full_name": create_data.full_name,
             "role": create_data.role,
-            "password_hash": self._hash_password(create_data.password),
+            "password_hash": await self._hash_password(create_data.password),
             "is_active": True,
         }
         return self.user_repository.create(user_data)
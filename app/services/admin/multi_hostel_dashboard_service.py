@@ -8,6 +8,7 @@ managing multiple hostels.
 from typing import Optional, Dict, Any, List
 from uuid import UUID
 from datetime import date, datetime, timedelta
+from decimal import Decimal
 
 from sqlalchemy.orm import Session
 
@@ -30,6 +31,9 @@ from app.schemas.admin.multi_hostel_dashboard import (
     AggregatedStats,
     HostelTaskSummary,
     CrossHostelComparison,
+    HostelMetricComparison,
+    TopPerformer,
+    BottomPerformer,
 )
 
 
@@ -565,37 +569,165 @@ class MultiHostelDashboardService(
         Returns:
             Dashboard schema
         """
-        # Get aggregated stats
-        aggregated = self.repository.get_aggregated_stats(admin_id, start_date, end_date)
-        
-        # Get per-hostel quick stats
-        quick_stats = self.repository.get_quick_stats_for_admin(admin_id, start_date, end_date)
-        
-        # Get task summary
-        task_summary = self.repository.get_task_summary(admin_id, start_date, end_date)
-        
-        # Get cross-hostel comparison if requested
+        # Per-hostel stats and portfolio totals come back from one query;
+        # revenue and tasks are limited to the period
+        rows = self.repository.get_portfolio_overview(admin_id, start_date, end_date)
+        portfolio = rows[0] if rows else {}
+
+        hostels = [self._build_hostel_quick_stats(row) for row in rows]
+
+        aggregated = AggregatedStats(
+            admin_id=admin_id,
+            total_hostels=portfolio.get("portfolio_hostels", 0),
+            active_hostels=portfolio.get("portfolio_active_hostels", 0),
+            total_students=portfolio.get("portfolio_students") or 0,
+            active_students=portfolio.get("portfolio_active_students") or 0,
+            total_capacity=portfolio.get("portfolio_capacity") or 0,
+            avg_occupancy_percentage=self._decimal(portfolio.get("portfolio_avg_occupancy")),
+            total_pending_tasks=portfolio.get("portfolio_pending_tasks") or 0,
+            total_urgent_alerts=portfolio.get("portfolio_urgent_alerts") or 0,
+            total_open_complaints=portfolio.get("portfolio_open_complaints") or 0,
+            total_revenue_this_month=self._decimal(portfolio.get("portfolio_revenue")),
+            total_outstanding_payments=self._decimal(portfolio.get("portfolio_outstanding")),
+            avg_student_rating=(
+                self._decimal(portfolio["portfolio_avg_rating"])
+                if portfolio.get("portfolio_avg_rating") is not None else None
+            ),
+        )
+
+        task_summary = HostelTaskSummary(
+            total_tasks=portfolio.get("portfolio_total_tasks") or 0,
+            pending_tasks=portfolio.get("portfolio_open_tasks") or 0,
+            overdue_tasks=portfolio.get("portfolio_overdue_tasks") or 0,
+            urgent_tasks=aggregated.total_urgent_alerts,
+            completed_today=portfolio.get("portfolio_completed_today") or 0,
+            tasks_by_hostel={row["hostel_id"]: row["total_tasks"] for row in rows},
+        )
+
         comparison = None
-        if include_comparison:
-            comparison = self.repository.get_cross_hostel_comparison(
-                admin_id,
-                start_date,
-                end_date,
-            )
-        
+        if include_comparison and rows:
+            comparison = self._build_comparison(rows, aggregated)
+
         # Build schema
         schema = MultiHostelDashboardSchema(
             admin_id=admin_id,
+            admin_name=portfolio.get("admin_name") or str(admin_id),
             generated_at=datetime.utcnow(),
             period_start=start_date,
             period_end=end_date,
             aggregated_stats=aggregated,
-            hostels=quick_stats,
+            hostels=hostels,
             task_summary=task_summary,
             cross_hostel_comparison=comparison,
         )
-        
+
         return schema
+
+    @staticmethod
+    def _decimal(value: Any) -> Decimal:
+        """Coerce an aggregate value to a 2dp Decimal."""
+        return Decimal(str(value or 0)).quantize(Decimal("0.01"))
+
+    def _build_hostel_quick_stats(self, row: Dict[str, Any]) -> HostelQuickStats:
+        """
+        Build per-hostel quick stats from a portfolio overview row.
+        
+        Args:
+            row: Row from get_portfolio_overview
+            
+        Returns:
+            Hostel quick stats schema
+        """
+        return HostelQuickStats(
+            hostel_id=row["hostel_id"],
+            hostel_name=row["hostel_name"],
+            hostel_city=row["hostel_city"],
+            hostel_type=getattr(row["hostel_type"], "value", row["hostel_type"]),
+            is_primary=bool(row["is_primary"]),
+            permission_level=row["permission_level"],
+            total_students=row["total_students"],
+            capacity=row["capacity"],
+            occupancy_percentage=self._decimal(row["occupancy_percentage"]),
+            available_beds=row["available_beds"],
+            pending_tasks=row["pending_tasks"],
+            urgent_alerts=row["urgent_alerts"],
+            pending_bookings=row["pending_bookings"],
+            open_complaints=row["open_complaints"],
+            revenue_this_month=self._decimal(row["revenue_this_month"]),
+            outstanding_payments=self._decimal(row["outstanding_payments"]),
+            avg_student_rating=row["avg_student_rating"],
+            last_activity=row["last_accessed"],
+            access_count=row["access_count"] or 0,
+        )
+
+    def _build_comparison(
+        self,
+        rows: List[Dict[str, Any]],
+        aggregated: AggregatedStats,
+    ) -> CrossHostelComparison:
+        """
+        Build cross-hostel comparison from portfolio overview rows.
+        
+        Args:
+            rows: Rows from get_portfolio_overview
+            aggregated: Portfolio aggregates
+            
+        Returns:
+            Cross-hostel comparison schema
+        """
+        hostel_count = len(rows)
+        metrics = []
+        for column, name, unit, average in (
+            ("occupancy_percentage", "occupancy", "%", aggregated.avg_occupancy_percentage),
+            ("revenue_this_month", "revenue", "currency",
+             aggregated.total_revenue_this_month / hostel_count),
+            ("total_students", "student_count", "count",
+             Decimal(aggregated.total_students) / hostel_count),
+            ("open_complaints", "open_complaints", "count",
+             Decimal(aggregated.total_open_complaints) / hostel_count),
+        ):
+            # Fewer complaints is better; higher is better for the rest
+            lower_is_better = column == "open_complaints"
+            ordered = sorted(rows, key=lambda r: r[column] or 0, reverse=not lower_is_better)
+            best, worst = ordered[0], ordered[-1]
+            metrics.append(HostelMetricComparison(
+                metric_name=name,
+                unit=unit,
+                portfolio_average=self._decimal(average),
+                best_hostel_id=best["hostel_id"],
+                best_hostel_name=best["hostel_name"],
+                best_value=self._decimal(best[column]),
+                worst_hostel_id=worst["hostel_id"],
+                worst_hostel_name=worst["hostel_name"],
+                worst_value=self._decimal(worst[column]),
+            ))
+
+        ranked = sorted(rows, key=lambda r: r["health_score"], reverse=True)
+        performer_count = min(3, hostel_count)
+
+        def performer(cls, row, rank):
+            return cls(
+                hostel_id=row["hostel_id"],
+                hostel_name=row["hostel_name"],
+                hostel_city=row["hostel_city"],
+                hostel_type=getattr(row["hostel_type"], "value", row["hostel_type"]),
+                performance_score=self._decimal(row["health_score"]),
+                rank=rank,
+                key_metric="health_score",
+                key_metric_value=self._decimal(row["health_score"]),
+            )
+
+        return CrossHostelComparison(
+            metrics=metrics,
+            top_performers=[
+                performer(TopPerformer, row, rank)
+                for rank, row in enumerate(ranked[:performer_count], start=1)
+            ],
+            bottom_performers=[
+                performer(BottomPerformer, row, rank)
+                for rank, row in enumerate(reversed(ranked[-performer_count:]), start=1)
+            ],
+        )
     
     def _get_cached_dashboard(
         self,
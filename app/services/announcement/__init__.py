@@ -33,6 +33,9 @@ from app.services.announcement.announcement_tracking_service import (
 from app.services.announcement.announcement_template_service import (
     AnnouncementTemplateService
 )
+from app.services.announcement.announcement_event_buffer import (
+    AnnouncementEventBuffer
+)
 
 __all__ = [
     "AnnouncementService",
@@ -42,6 +45,7 @@ __all__ = [
     "AnnouncementDeliveryService",
     "AnnouncementTrackingService",
     "AnnouncementTemplateService",
+    "AnnouncementEventBuffer",
 ]
 
 __version__ = "2.0.0"
@@ -0,0 +1,309 @@
+"""
+Buffered ingestion of announcement views, reads and engagement actions.
+
+Events are coalesced in memory per announcement, student and session, and a
+background thread writes them as multi-row upserts on its own session. A
+hostel-wide announcement opened by thousands of students therefore costs a
+handful of statements per flush instead of a transaction per event. At most
+one flush interval of events can be lost if the process dies.
+"""
+
+import atexit
+from collections import defaultdict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.repositories.announcement import AnnouncementTrackingRepository
+from app.services.base.buffered_writer import BufferedWriter
+
+ViewKey = Tuple[UUID, UUID, Optional[str]]
+ReadKey = Tuple[UUID, UUID]
+
+# Flush item: (kind, key, payload) with kind one of view, read, flags, actions
+BufferedEvent = Tuple[str, Hashable, Dict[str, Any]]
+
+
+class AnnouncementEventBuffer(BufferedWriter):
+    """
+    Process-wide buffer that coalesces announcement engagement events.
+
+    Repeat views in a session become one row with a summed view_count,
+    repeat reads by a student keep the first read time and the deepest
+    reading, and engagement actions set flags on the view they belong to.
+    Events that fail to write are isolated, merged back for later flushes
+    and dead-lettered after ``max_attempts``; new keys arriving while
+    ``max_pending`` keys are waiting are dead-lettered.
+    """
+
+    thread_name = "announcement-event-flusher"
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        flush_interval: float = 2.0,
+        max_pending: int = 20000,
+        max_attempts: int = 5,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            session_factory: Factory for flush sessions (defaults to SessionLocal)
+            flush_interval: Seconds between flushes; bounds the loss window
+            max_pending: Buffered keys beyond which new keys are dead-lettered
+            max_attempts: Failed writes after which an event is dead-lettered
+        """
+        super().__init__(
+            session_factory=session_factory,
+            flush_interval=flush_interval,
+            max_pending=max_pending,
+            max_attempts=max_attempts,
+        )
+
+        self._views: Dict[ViewKey, Dict[str, Any]] = {}
+        self._reads: Dict[ReadKey, Dict[str, Any]] = {}
+        self._flags: Dict[ViewKey, Dict[str, bool]] = {}
+        self._actions: Dict[UUID, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+        self._stats.update({"events": 0, "views_written": 0, "receipts_created": 0})
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def add_view(
+        self,
+        announcement_id: UUID,
+        student_id: UUID,
+        device_type: Optional[str] = None,
+        source: str = "app",
+        session_id: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Buffer a view event.
+
+        Raises:
+            ValidationError: If the device type is not recognized
+        """
+        AnnouncementTrackingRepository.validate_device_type(device_type)
+        row = AnnouncementTrackingRepository.build_view_row(
+            announcement_id,
+            student_id,
+            device_type=device_type,
+            source=source,
+            session_id=session_id,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            metadata=metadata,
+        )
+
+        key = (announcement_id, student_id, session_id)
+        with self._lock:
+            accepted = key in self._views or self._has_room()
+            if accepted:
+                self._merge_view(key, row)
+                self._stats["events"] += 1
+
+        if not accepted:
+            self._dead_letter(("view", key, row), "buffer full")
+        self._after_add()
+
+    def add_read(
+        self,
+        announcement_id: UUID,
+        student_id: UUID,
+        reading_time_seconds: Optional[int] = None,
+        scroll_percentage: Optional[int] = None,
+        device_type: Optional[str] = None,
+        source: str = "app",
+    ) -> None:
+        """
+        Buffer a read event.
+
+        Raises:
+            ValidationError: If reading time or scroll depth is out of range
+        """
+        AnnouncementTrackingRepository.validate_read_metrics(
+            reading_time_seconds, scroll_percentage
+        )
+        row = AnnouncementTrackingRepository.build_read_row(
+            announcement_id,
+            student_id,
+            reading_time_seconds=reading_time_seconds,
+            scroll_percentage=scroll_percentage,
+            device_type=device_type,
+            source=source,
+        )
+
+        key = (announcement_id, student_id)
+        with self._lock:
+            accepted = key in self._reads or self._has_room()
+            if accepted:
+                self._merge_read(key, row)
+                self._stats["events"] += 1
+
+        if not accepted:
+            self._dead_letter(("read", key, row), "buffer full")
+        self._after_add()
+
+    def add_engagement(
+        self,
+        announcement_id: UUID,
+        student_id: UUID,
+        action_type: str,
+        session_id: Optional[str] = None,
+    ) -> None:
+        """
+        Buffer an engagement action (link_click, download, share).
+
+        Unknown action types are ignored.
+        """
+        action = AnnouncementTrackingRepository.ENGAGEMENT_ACTIONS.get(action_type)
+        if action is None:
+            return
+        counter, flag = action
+
+        key = (announcement_id, student_id, session_id)
+        with self._lock:
+            accepted = key in self._flags or self._has_room()
+            if accepted:
+                self._merge_flags(key, {flag: True})
+                self._actions[announcement_id][counter] += 1
+                self._stats["events"] += 1
+
+        if not accepted:
+            self._dead_letter(("flags", key, {flag: True}), "buffer full")
+        self._after_add()
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def flush(self) -> Dict[str, int]:
+        """
+        Write every buffered event.
+
+        Returns:
+            Counts of view events written and receipts created
+        """
+        counts = self._flush_batches()
+        return {
+            "views": counts.get("views_written", 0),
+            "receipts": counts.get("receipts_created", 0),
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buffer statistics."""
+        with self._lock:
+            return {
+                **self._stats,
+                "pending_views": len(self._views),
+                "pending_reads": len(self._reads),
+                "pending_flags": len(self._flags),
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _merge_view(self, key: ViewKey, row: Dict[str, Any]) -> None:
+        """Coalesce a view row into the pending views (lock held)."""
+        pending = self._views.get(key)
+        if pending is None:
+            self._views[key] = dict(row)
+            return
+
+        pending["view_count"] += row["view_count"]
+        pending["viewed_at"] = min(pending["viewed_at"], row["viewed_at"])
+        for field in ("device_type", "ip_address", "user_agent"):
+            if row[field]:
+                pending[field] = row[field]
+        for flag in ("clicked_links", "downloaded_attachments", "shared"):
+            pending[flag] = pending[flag] or row[flag]
+        if row["meta_data"]:
+            pending["meta_data"] = {**pending["meta_data"], **row["meta_data"]}
+
+    def _merge_read(self, key: ReadKey, row: Dict[str, Any]) -> None:
+        """Coalesce a read row into the pending reads (lock held)."""
+        pending = self._reads.get(key)
+        if pending is None:
+            self._reads[key] = dict(row)
+            return
+
+        pending["read_at"] = min(pending["read_at"], row["read_at"])
+        for field in ("reading_time_seconds", "scroll_percentage"):
+            if row[field] is not None:
+                pending[field] = max(pending[field] or 0, row[field])
+        pending["completed_reading"] = pending["completed_reading"] or row["completed_reading"]
+        if row["device_type"]:
+            pending["device_type"] = row["device_type"]
+
+    def _merge_flags(self, key: ViewKey, flags: Dict[str, bool]) -> None:
+        """Coalesce view flags into the pending flags (lock held)."""
+        pending = self._flags.setdefault(key, {})
+        for flag, value in flags.items():
+            pending[flag] = pending.get(flag, False) or value
+
+    def _take_batch(self) -> List[BufferedEvent]:
+        views, self._views = self._views, {}
+        reads, self._reads = self._reads, {}
+        flags, self._flags = self._flags, {}
+        actions = self._actions
+        self._actions = defaultdict(lambda: defaultdict(int))
+
+        # Flags of views written in this flush go in with the upsert
+        for key, view_flags in list(flags.items()):
+            if key in views:
+                views[key].update(view_flags)
+                del flags[key]
+
+        return (
+            [("view", key, row) for key, row in views.items()]
+            + [("flags", key, view_flags) for key, view_flags in flags.items()]
+            + [("read", key, row) for key, row in reads.items()]
+            + [("actions", key, dict(counters)) for key, counters in actions.items()]
+        )
+
+    def _restore(self, items: List[BufferedEvent]) -> None:
+        for kind, key, payload in items:
+            if kind == "view":
+                self._merge_view(key, payload)
+            elif kind == "read":
+                self._merge_read(key, payload)
+            elif kind == "flags":
+                self._merge_flags(key, payload)
+            else:
+                for counter, value in payload.items():
+                    self._actions[key][counter] += value
+
+    def _pending_count(self) -> int:
+        return len(self._views) + len(self._reads) + len(self._flags)
+
+    def _write(self, session: Session, items: List[BufferedEvent]) -> Dict[str, int]:
+        grouped: Dict[str, Dict[Hashable, Dict[str, Any]]] = defaultdict(dict)
+        for kind, key, payload in items:
+            grouped[kind][key] = payload
+
+        repository = AnnouncementTrackingRepository(session)
+        written = created = 0
+        if grouped["view"]:
+            written = repository.upsert_views(list(grouped["view"].values()))
+        if grouped["flags"]:
+            repository.set_view_flags(grouped["flags"])
+        if grouped["read"]:
+            created = repository.upsert_read_receipts(list(grouped["read"].values()))
+        if grouped["actions"]:
+            repository.increment_engagement_counters(grouped["actions"])
+        return {"views_written": written, "receipts_created": created}
+
+    def _item_key(self, item: BufferedEvent) -> Hashable:
+        return item[0], item[1]
+
+
+announcement_event_buffer = AnnouncementEventBuffer()
+atexit.register(announcement_event_buffer.stop)
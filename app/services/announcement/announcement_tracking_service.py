@@ -19,6 +19,10 @@ from app.services.base import (
     ErrorSeverity,
 )
 from app.repositories.announcement import AnnouncementTrackingRepository
+from app.services.announcement.announcement_event_buffer import (
+    AnnouncementEventBuffer,
+    announcement_event_buffer,
+)
 from app.models.announcement.announcement_tracking import (
     AnnouncementView as AnnouncementViewModel
 )
@@ -62,7 +66,8 @@ class AnnouncementTrackingService(
     def __init__(
         self,
         repository: AnnouncementTrackingRepository,
-        db_session: Session
+        db_session: Session,
+        buffer: Optional[AnnouncementEventBuffer] = None,
     ):
         """
         Initialize tracking service.
@@ -70,8 +75,10 @@ class AnnouncementTrackingService(
         Args:
             repository: Tracking repository instance
             db_session: SQLAlchemy database session
+            buffer: Event buffer for views, reads and engagement actions
         """
         super().__init__(repository, db_session)
+        self.buffer = buffer or announcement_event_buffer
 
     def record_view(
         self,
@@ -95,7 +102,7 @@ class AnnouncementTrackingService(
         Notes:
             - Records timestamp and device information
             - Supports duplicate views for analytics
-            - Lightweight operation for high volume
+            - Buffered; written within one flush interval
         """
         try:
             # Validate device type if provided
@@ -109,17 +116,14 @@ class AnnouncementTrackingService(
                     )
                 )
             
-            # Record view
-            self.repository.record_view(
+            self.buffer.add_view(
                 announcement_id=announcement_id,
                 student_id=student_id,
                 device_type=device_type,
-                metadata=metadata or {}
+                session_id=(metadata or {}).get("session_id"),
+                metadata=metadata or {},
             )
             
-            # Commit transaction
-            self.db.commit()
-            
             return ServiceResult.success(
                 data=True,
                 message="View recorded successfully",
@@ -130,15 +134,93 @@ class AnnouncementTrackingService(
                 }
             )
             
-        except SQLAlchemyError as e:
-            self.db.rollback()
-            return self._handle_database_error(
-                e, "record view", announcement_id
+        except Exception as e:
+            return self._handle_exception(e, "record view", announcement_id)
+
+    def record_read(
+        self,
+        announcement_id: UUID,
+        student_id: UUID,
+        reading_time_seconds: Optional[int] = None,
+        scroll_percentage: Optional[int] = None,
+        device_type: Optional[str] = None,
+    ) -> ServiceResult[bool]:
+        """
+        Record a read event for announcement.
+        
+        Repeat reads coalesce into the student's single read receipt,
+        keeping the first read time and the deepest reading.
+        
+        Args:
+            announcement_id: Unique identifier of announcement
+            student_id: Unique identifier of student
+            reading_time_seconds: Time spent reading
+            scroll_percentage: Scroll depth reached
+            device_type: Type of device used
+            
+        Returns:
+            ServiceResult containing success boolean or error
+        """
+        try:
+            self.buffer.add_read(
+                announcement_id=announcement_id,
+                student_id=student_id,
+                reading_time_seconds=reading_time_seconds,
+                scroll_percentage=scroll_percentage,
+                device_type=device_type,
             )
+            return ServiceResult.success(data=True, message="Read recorded successfully")
             
         except Exception as e:
-            self.db.rollback()
-            return self._handle_exception(e, "record view", announcement_id)
+            return self._handle_exception(e, "record read", announcement_id)
+
+    def record_engagement(
+        self,
+        announcement_id: UUID,
+        student_id: UUID,
+        action_type: str,
+        session_id: Optional[str] = None,
+    ) -> ServiceResult[bool]:
+        """
+        Record an engagement action (link_click, download, share).
+        
+        Args:
+            announcement_id: Unique identifier of announcement
+            student_id: Unique identifier of student
+            action_type: Engagement action
+            session_id: View session the action belongs to
+            
+        Returns:
+            ServiceResult containing success boolean or error
+        """
+        if action_type not in AnnouncementTrackingRepository.ENGAGEMENT_ACTIONS:
+            return ServiceResult.failure(
+                ServiceError(
+                    code=ErrorCode.VALIDATION_ERROR,
+                    message=f"Invalid action_type: {action_type}",
+                    severity=ErrorSeverity.WARNING,
+                )
+            )
+        
+        try:
+            self.buffer.add_engagement(
+                announcement_id=announcement_id,
+                student_id=student_id,
+                action_type=action_type,
+                session_id=session_id,
+            )
+            return ServiceResult.success(data=True, message="Engagement recorded successfully")
+            
+        except Exception as e:
+            return self._handle_exception(e, "record engagement", announcement_id)
+
+    def flush_events(self) -> ServiceResult[Dict[str, int]]:
+        """Write buffered tracking events now (e.g. before reading metrics)."""
+        try:
+            written = self.buffer.flush()
+            return ServiceResult.success(written, metadata=self.buffer.get_stats())
+        except Exception as e:
+            return self._handle_exception(e, "flush tracking events")
 
     def submit_read_receipt(
         self,
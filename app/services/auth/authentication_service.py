@@ -75,7 +75,7 @@ class AuthenticationService(BaseService[User, UserRepository]):
     # Email-based Authentication
     # -------------------------------------------------------------------------
 
-    def login(
+    async def login(
         self,
         request: LoginRequest,
         ip_address: Optional[str] = None,
@@ -128,7 +128,7 @@ class AuthenticationService(BaseService[User, UserRepository]):
                 )
 
             # Verify password
-            if not self.password_hasher.verify(request.password, user.password_hash):
+            if not await self._verify_password(user, request.password):
                 self._record_failed_login(user.id, email, ip_address, user_agent)
                 return self._invalid_credentials_error()
 
@@ -173,7 +173,7 @@ class AuthenticationService(BaseService[User, UserRepository]):
     # Phone-based Authentication
     # -------------------------------------------------------------------------
 
-    def phone_login(
+    async def phone_login(
         self,
         request: PhoneLoginRequest,
         ip_address: Optional[str] = None,
@@ -226,7 +226,7 @@ class AuthenticationService(BaseService[User, UserRepository]):
                 )
 
             # Verify password
-            if not self.password_hasher.verify(request.password, user.password_hash):
+            if not await self._verify_password(user, request.password):
                 self._record_failed_login(user.id, phone, ip_address, user_agent)
                 return self._invalid_credentials_error()
 
@@ -497,6 +497,23 @@ class AuthenticationService(BaseService[User, UserRepository]):
             logger.error(f"Failed to record successful login: {str(e)}")
             # Non-critical, continue
 
+    async def _verify_password(self, user: User, password: str) -> bool:
+        """
+        Verify a user's password on the hashing pool, upgrading the stored
+        hash when its cost is below the current hashing policy.
+        """
+        matches, new_hash = await self.password_hasher.verify_and_update_async(
+            password, user.password_hash
+        )
+        if new_hash:
+            try:
+                user.password_hash = new_hash
+                self.db.flush()
+            except Exception as e:
+                logger.error(f"Failed to upgrade password hash: {str(e)}")
+                # Non-critical, retried on next login
+        return matches
+
     def _record_failed_login(
         self,
         user_id: Optional[UUID],
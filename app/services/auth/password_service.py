@@ -79,7 +79,7 @@ class PasswordService(BaseService[User, UserRepository]):
     # Password Change
     # -------------------------------------------------------------------------
 
-    def change_password(
+    async def change_password(
         self,
         user_id: UUID,
         request: PasswordChangeRequest,
@@ -108,7 +108,9 @@ class PasswordService(BaseService[User, UserRepository]):
                 )
 
             # Verify current password
-            if not self.hasher.verify(request.current_password, user.password_hash):
+            if not await self.hasher.verify_async(
+                request.current_password, user.password_hash
+            ):
                 logger.warning(f"Incorrect current password for user: {user_id}")
                 return ServiceResult.failure(
                     ServiceError(
@@ -119,7 +121,7 @@ class PasswordService(BaseService[User, UserRepository]):
                 )
 
             # Validate new password
-            validation_result = self._validate_new_password(
+            validation_result = await self._validate_new_password(
                 user=user,
                 new_password=request.new_password,
                 confirm_password=request.confirm_password,
@@ -148,7 +150,7 @@ class PasswordService(BaseService[User, UserRepository]):
                     )
 
             # Hash new password
-            new_hash = self.hasher.hash(request.new_password)
+            new_hash = await self.hasher.hash_async(request.new_password)
 
             # Save to password history
             self.history_repository.record_change(
@@ -258,7 +260,7 @@ class PasswordService(BaseService[User, UserRepository]):
                 message="Password reset initiated",
             )
 
-    def confirm_reset(
+    async def confirm_reset(
         self,
         request: PasswordResetConfirm,
     ) -> ServiceResult[bool]:
@@ -323,7 +325,7 @@ class PasswordService(BaseService[User, UserRepository]):
                 )
 
             # Check password history
-            if self._is_password_reused(user_id, request.new_password):
+            if await self._is_password_reused(user_id, request.new_password):
                 return ServiceResult.failure(
                     ServiceError(
                         code=ErrorCode.VALIDATION_ERROR,
@@ -336,7 +338,7 @@ class PasswordService(BaseService[User, UserRepository]):
                 )
 
             # Hash and update password
-            new_hash = self.hasher.hash(request.new_password)
+            new_hash = await self.hasher.hash_async(request.new_password)
             
             # Save to history
             self.history_repository.record_change(user_id, user.password_hash)
@@ -412,7 +414,7 @@ class PasswordService(BaseService[User, UserRepository]):
     # Private Helper Methods
     # -------------------------------------------------------------------------
 
-    def _validate_new_password(
+    async def _validate_new_password(
         self,
         user: User,
         new_password: str,
@@ -464,7 +466,7 @@ class PasswordService(BaseService[User, UserRepository]):
             )
 
         # Check password history
-        if self._is_password_reused(user.id, new_password):
+        if await self._is_password_reused(user.id, new_password):
             return ServiceResult.failure(
                 ServiceError(
                     code=ErrorCode.VALIDATION_ERROR,
@@ -478,7 +480,7 @@ class PasswordService(BaseService[User, UserRepository]):
 
         return ServiceResult.success(True)
 
-    def _is_password_reused(self, user_id: UUID, new_password: str) -> bool:
+    async def _is_password_reused(self, user_id: UUID, new_password: str) -> bool:
         """
         Check if password has been used recently.
         
@@ -496,7 +498,7 @@ class PasswordService(BaseService[User, UserRepository]):
             )
             
             for old_hash in recent_hashes:
-                if self.hasher.verify(new_password, old_hash):
+                if await self.hasher.verify_async(new_password, old_hash):
                     return True
             
             return False
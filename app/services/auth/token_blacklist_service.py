@@ -25,10 +25,27 @@ from app.repositories.auth import (
     TokenRevocationRepository,
 )
 from app.models.auth.token_blacklist import BlacklistedToken
+from app.core.security.revocation_filter import revocation_filter
 
 logger = logging.getLogger(__name__)
 
 
+def _token_jti(token: str) -> str:
+    """
+    Extract the JTI from a JWT without verifying it.
+
+    Blacklist entries are keyed by JTI; a value that is not a decodable JWT
+    is treated as the JTI itself.
+    """
+    try:
+        import jwt
+
+        claims = jwt.decode(token, options={"verify_signature": False})
+        return str(claims.get("jti") or token)
+    except Exception:
+        return token
+
+
 class TokenBlacklistService(BaseService[BlacklistedToken, BlacklistedTokenRepository]):
     """
     Manage JWT token blacklist and revocation tracking.
@@ -39,6 +56,7 @@ class TokenBlacklistService(BaseService[BlacklistedToken, BlacklistedTokenReposi
     - Bulk revocation for users
     - Automatic cleanup of expired blacklist entries
     - Audit trail for compliance
+    - In-memory Bloom filter in front of blacklist lookups
     """
 
     # Configuration
@@ -80,7 +98,7 @@ class TokenBlacklistService(BaseService[BlacklistedToken, BlacklistedTokenReposi
         """
         try:
             # Check if already blacklisted
-            if self.blacklist_repo.is_blacklisted(token):
+            if self.blacklist_repo.is_blacklisted(_token_jti(token)):
                 logger.info(f"Token already blacklisted")
                 return ServiceResult.success(
                     True,
@@ -103,6 +121,7 @@ class TokenBlacklistService(BaseService[BlacklistedToken, BlacklistedTokenReposi
             )
 
             self.db.commit()
+            revocation_filter.publish(_token_jti(token))
 
             logger.info(
                 f"Token blacklisted for user: {user_id} - Reason: {reason}"
@@ -129,6 +148,10 @@ class TokenBlacklistService(BaseService[BlacklistedToken, BlacklistedTokenReposi
         """
         Check if token is blacklisted.
         
+        Tokens absent from the revocation filter are answered without a
+        database round trip; possible matches are confirmed against the
+        blacklist table.
+        
         Args:
             token: JWT token to check
             
@@ -136,7 +159,12 @@ class TokenBlacklistService(BaseService[BlacklistedToken, BlacklistedTokenReposi
             ServiceResult with blacklist status
         """
         try:
-            is_blacklisted = self.blacklist_repo.is_blacklisted(token)
+            jti = _token_jti(token)
+            if not revocation_filter.might_contain(jti):
+                return ServiceResult.success(False, message="Not blacklisted")
+
+            is_blacklisted = self.blacklist_repo.is_blacklisted(jti)
+            revocation_filter.record_outcome(is_blacklisted)
             
             return ServiceResult.success(
                 is_blacklisted,
@@ -174,6 +202,9 @@ class TokenBlacklistService(BaseService[BlacklistedToken, BlacklistedTokenReposi
 
             self.db.commit()
 
+            # The revoked JTIs are not known here, so reload them all
+            revocation_filter.rebuild()
+
             logger.info(
                 f"Revoked {count} token(s) for user: {user_id} - Reason: {reason}"
             )
@@ -225,6 +256,9 @@ class TokenBlacklistService(BaseService[BlacklistedToken, BlacklistedTokenReposi
 
             self.db.commit()
 
+            # Rebuild so expired entries stop occupying the filter
+            revocation_filter.rebuild()
+
             logger.info(f"Cleaned up {deleted_count} expired blacklist entries")
             
             return ServiceResult.success(
@@ -244,6 +278,15 @@ class TokenBlacklistService(BaseService[BlacklistedToken, BlacklistedTokenReposi
             logger.error(f"Error during cleanup: {str(e)}")
             return self._handle_exception(e, "cleanup expired tokens")
 
+    def get_filter_stats(self) -> ServiceResult[Dict[str, Any]]:
+        """
+        Get revocation filter statistics.
+        
+        Returns:
+            ServiceResult with filter size and false positive metrics
+        """
+        return ServiceResult.success(revocation_filter.get_stats())
+
     # -------------------------------------------------------------------------
     # Revocation History
     # -------------------------------------------------------------------------
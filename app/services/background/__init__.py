@@ -11,6 +11,7 @@ Services:
     - HealthCheckService: System health monitoring and aggregation
     - MetricsCollectionService: Operational metrics collection and analytics
     - QueueProcessorService: Multi-queue batch processing
+    - OutboxRelayService: Transactional outbox delivery
     - TaskSchedulerService: Scheduled task execution across domains
 
 Usage:
@@ -63,6 +64,7 @@ from typing import List
 
 # Import services
 from .cleanup_service import CleanupService, CleanupConfig, CleanupTask, CleanupResult
+from .cleanup_engine import ChunkedCleanupEngine, CleanupTarget, CleanupRunStats
 from .data_sync_service import (
     DataSyncService,
     SyncConfig,
@@ -92,6 +94,7 @@ from .queue_processor_service import (
     ProcessingStatus,
     ProcessingMetrics,
 )
+from .outbox_relay_service import OutboxRelayService, OutboxRelayConfig
 from .task_scheduler_service import (
     TaskSchedulerService,
     SchedulerConfig,
@@ -114,11 +117,15 @@ __all__: List[str] = [
     "HealthCheckService",
     "MetricsCollectionService",
     "QueueProcessorService",
+    "OutboxRelayService",
     "TaskSchedulerService",
     # Cleanup exports
     "CleanupConfig",
     "CleanupTask",
     "CleanupResult",
+    "ChunkedCleanupEngine",
+    "CleanupTarget",
+    "CleanupRunStats",
     # Sync exports
     "SyncConfig",
     "SyncDirection",
@@ -140,6 +147,8 @@ __all__: List[str] = [
     "QueueType",
     "ProcessingStatus",
     "ProcessingMetrics",
+    # Outbox relay exports
+    "OutboxRelayConfig",
     # Scheduler exports
     "SchedulerConfig",
     "TaskType",
@@ -163,6 +172,7 @@ def get_all_services() -> List[str]:
         "HealthCheckService",
         "MetricsCollectionService",
         "QueueProcessorService",
+        "OutboxRelayService",
         "TaskSchedulerService",
     ]
 
@@ -240,6 +250,17 @@ def get_service_info(service_name: str) -> dict:
                 "Dead letter queue management",
             ],
         },
+        "OutboxRelayService": {
+            "name": "Outbox Relay Service",
+            "description": "At-least-once delivery of transactional outbox messages",
+            "config_class": "OutboxRelayConfig",
+            "tasks": [
+                "Event bus publishing",
+                "Notification enqueueing",
+                "Outbound webhook delivery",
+                "Delivered message purging",
+            ],
+        },
         "TaskSchedulerService": {
             "name": "Task Scheduler Service",
             "description": "Scheduled task execution across domains",
@@ -248,6 +269,8 @@ def get_service_info(service_name: str) -> dict:
                 "Announcement publishing",
                 "Report generation",
                 "Billing cycle generation",
+                "Maintenance analytics rollup refresh",
+                "Outbox relay for events and notifications",
                 "Task prioritization and timeout handling",
             ],
         },
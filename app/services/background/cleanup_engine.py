@@ -0,0 +1,329 @@
+"""
+Chunked, set-based delete engine for background cleanup.
+
+Each cleanup target is purged with repeated
+``DELETE ... WHERE id IN (SELECT id ... ORDER BY id LIMIT n)`` statements,
+one short transaction per chunk on the task's own session, so large
+backlogs never hold long locks or produce one huge WAL burst.
+
+Between chunks the engine:
+- resizes the chunk towards a target statement time
+- sleeps in proportion to the work done, longer while replicas lag or
+  sessions queue on locks
+- stops promptly on cancellation or deadline
+
+The highest deleted key is saved with every chunk, so an interrupted pass
+resumes where it stopped.
+"""
+
+from typing import Any, Callable, List, Optional, Tuple
+from datetime import datetime
+from dataclasses import dataclass
+import threading
+import time
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.orm import Session
+
+from app.models.common.cleanup_checkpoint import CleanupCheckpoint
+from app.core1.logging import get_logger
+
+
+@dataclass
+class CleanupTarget:
+    """
+    One table purged by a cleanup task.
+
+    ``partition_purge``, when set, runs first on the target's session and
+    may retire whole partitions instead; it returns None when the table is
+    not partitioned, and the chunked deletes run as usual.
+    """
+    name: str
+    model: Any
+    criteria: List[Any]
+    partition_purge: Optional[Callable[[Session], Optional[int]]] = None
+
+
+@dataclass
+class CleanupRunStats:
+    """Outcome of purging one target."""
+    target: str
+    deleted: int = 0
+    chunks: int = 0
+    duration_seconds: float = 0.0
+    slept_seconds: float = 0.0
+    resumed: bool = False
+    completed: bool = False
+    cancelled: bool = False
+
+    @property
+    def rows_per_second(self) -> float:
+        """Delete throughput, including pauses between chunks."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.deleted / self.duration_seconds
+
+
+class ChunkedCleanupEngine:
+    """
+    Purges cleanup targets in adaptive, resumable chunks.
+
+    Sessions come from ``session_factory`` (defaults to SessionLocal), one
+    per target, so targets may run on separate threads. Replication lag
+    and lock waiters are read from pg_stat_replication and
+    pg_stat_activity; if those are not readable, throttling falls back to
+    chunk timings alone.
+    """
+
+    # Consecutive lock timeouts after which a run gives up until next time
+    MAX_LOCK_TIMEOUTS = 5
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        chunk_size: int = 1000,
+        min_chunk_size: int = 100,
+        max_chunk_size: int = 10000,
+        target_chunk_seconds: float = 0.5,
+        sleep_ratio: float = 0.5,
+        max_sleep_seconds: float = 30.0,
+        max_replication_lag_seconds: float = 5.0,
+        max_lock_waiters: int = 5,
+        lock_timeout_ms: int = 2000,
+    ):
+        self._session_factory = session_factory
+        self.chunk_size = chunk_size
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.target_chunk_seconds = target_chunk_seconds
+        self.sleep_ratio = sleep_ratio
+        self.max_sleep_seconds = max_sleep_seconds
+        self.max_replication_lag_seconds = max_replication_lag_seconds
+        self.max_lock_waiters = max_lock_waiters
+        self.lock_timeout_ms = lock_timeout_ms
+        self._probe_pressure = True
+        self._logger = get_logger(self.__class__.__name__)
+
+    def purge(
+        self,
+        target: CleanupTarget,
+        cancel: Optional[threading.Event] = None,
+        deadline: Optional[float] = None,
+    ) -> CleanupRunStats:
+        """
+        Delete every row of a target matching its criteria.
+
+        Args:
+            target: Table and criteria to purge
+            cancel: Event that stops the run between chunks
+            deadline: time.monotonic() value after which the run stops
+
+        Returns:
+            Run statistics; ``completed`` is False if the run was cancelled
+            or hit the deadline, and the next run resumes from its cursor
+        """
+        cancel = cancel or threading.Event()
+        stats = CleanupRunStats(target=target.name)
+        started = time.monotonic()
+        chunk_size = self.chunk_size
+        lock_timeouts = 0
+        key = target.model.id
+        key_type = self._key_type(key)
+
+        session = self._new_session()
+        try:
+            if target.partition_purge is not None:
+                retired = target.partition_purge(session)
+                if retired is not None:
+                    session.commit()
+                    stats.deleted = retired
+                    stats.completed = True
+                    return stats
+
+            cursor = self._load_cursor(session, target.name)
+            stats.resumed = cursor is not None
+            if cursor is not None:
+                cursor = key_type(cursor)
+
+            while True:
+                if cancel.is_set() or (deadline is not None and time.monotonic() >= deadline):
+                    stats.cancelled = True
+                    break
+
+                chunk_started = time.monotonic()
+                try:
+                    deleted_ids = self._delete_chunk(session, target, key, cursor, chunk_size)
+                except OperationalError as e:
+                    session.rollback()
+                    if not self._is_lock_timeout(e):
+                        raise
+                    lock_timeouts += 1
+                    if lock_timeouts >= self.MAX_LOCK_TIMEOUTS:
+                        self._logger.warning(
+                            f"Cleanup {target.name} paused after {lock_timeouts} lock timeouts"
+                        )
+                        break
+                    # Someone holds the rows; back off with a smaller chunk
+                    chunk_size = max(self.min_chunk_size, chunk_size // 2)
+                    stats.slept_seconds += self._pause(cancel, self.max_sleep_seconds / 4)
+                    continue
+                lock_timeouts = 0
+
+                if not deleted_ids:
+                    self._finish_pass(session, target.name)
+                    session.commit()
+                    stats.completed = True
+                    break
+
+                cursor = max(deleted_ids)
+                self._save_cursor(session, target.name, cursor, len(deleted_ids))
+                session.commit()
+
+                elapsed = time.monotonic() - chunk_started
+                stats.deleted += len(deleted_ids)
+                stats.chunks += 1
+
+                if len(deleted_ids) < chunk_size:
+                    # Short chunk: the next one will come back empty and close the pass
+                    continue
+
+                chunk_size, delay = self._throttle(session, chunk_size, elapsed)
+                stats.slept_seconds += self._pause(cancel, delay)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+            stats.duration_seconds = time.monotonic() - started
+
+        self._logger.info(
+            f"Cleanup {target.name}: deleted {stats.deleted} rows in {stats.chunks} chunks "
+            f"({stats.rows_per_second:.0f} rows/s, slept {stats.slept_seconds:.1f}s)"
+            + ("" if stats.completed else ", paused before the end")
+        )
+        return stats
+
+    # ---------------------------------------------------------------------
+    # Chunks
+    # ---------------------------------------------------------------------
+
+    def _delete_chunk(
+        self,
+        session: Session,
+        target: CleanupTarget,
+        key: Any,
+        cursor: Any,
+        chunk_size: int,
+    ) -> List[Any]:
+        """Delete the next chunk past the cursor and return its keys."""
+        if session.get_bind().dialect.name == "postgresql":
+            session.execute(text(f"SET LOCAL lock_timeout = {int(self.lock_timeout_ms)}"))
+
+        chunk = select(key).where(*target.criteria)
+        if cursor is not None:
+            chunk = chunk.where(key > cursor)
+        chunk = chunk.order_by(key).limit(chunk_size).with_for_update(skip_locked=True)
+
+        return list(session.execute(
+            delete(target.model)
+            .where(key.in_(chunk.scalar_subquery()))
+            .returning(key)
+            .execution_options(synchronize_session=False)
+        ).scalars())
+
+    def _throttle(self, session: Session, chunk_size: int, elapsed: float) -> Tuple[int, float]:
+        """Next chunk size and the pause before it."""
+        if elapsed < self.target_chunk_seconds / 2:
+            chunk_size = min(self.max_chunk_size, int(chunk_size * 1.5))
+        elif elapsed > self.target_chunk_seconds * 2:
+            chunk_size = max(self.min_chunk_size, chunk_size // 2)
+
+        delay = elapsed * self.sleep_ratio
+        lag, lock_waiters = self._pressure(session)
+        if lag > self.max_replication_lag_seconds:
+            delay = max(delay, lag)
+        if lock_waiters > self.max_lock_waiters:
+            chunk_size = max(self.min_chunk_size, chunk_size // 2)
+            delay = max(delay, elapsed * 4)
+
+        return chunk_size, min(delay, self.max_sleep_seconds)
+
+    def _pressure(self, session: Session) -> Tuple[float, int]:
+        """Replica replay lag (seconds) and sessions waiting on locks."""
+        if not self._probe_pressure:
+            return 0.0, 0
+        try:
+            row = session.execute(text(
+                "SELECT "
+                "(SELECT COALESCE(EXTRACT(EPOCH FROM MAX(replay_lag)), 0) "
+                "FROM pg_stat_replication), "
+                "(SELECT COUNT(*) FROM pg_stat_activity WHERE wait_event_type = 'Lock')"
+            )).one()
+            session.rollback()
+            return float(row[0] or 0), int(row[1] or 0)
+        except DBAPIError as e:
+            session.rollback()
+            self._probe_pressure = False
+            self._logger.warning(f"Cleanup throttling falls back to chunk timings: {e}")
+            return 0.0, 0
+
+    @staticmethod
+    def _pause(cancel: threading.Event, seconds: float) -> float:
+        """Sleep unless cancelled; returns the time slept."""
+        if seconds <= 0:
+            return 0.0
+        started = time.monotonic()
+        cancel.wait(seconds)
+        return time.monotonic() - started
+
+    @staticmethod
+    def _is_lock_timeout(error: OperationalError) -> bool:
+        return getattr(error.orig, "pgcode", None) == "55P03" or "lock timeout" in str(error).lower()
+
+    # ---------------------------------------------------------------------
+    # Checkpoints
+    # ---------------------------------------------------------------------
+
+    @staticmethod
+    def _checkpoint(session: Session, name: str) -> Optional[CleanupCheckpoint]:
+        return session.execute(
+            select(CleanupCheckpoint).where(CleanupCheckpoint.target == name)
+        ).scalar_one_or_none()
+
+    def _load_cursor(self, session: Session, name: str) -> Optional[str]:
+        checkpoint = self._checkpoint(session, name)
+        cursor = checkpoint.cursor if checkpoint else None
+        session.rollback()
+        return cursor
+
+    def _save_cursor(self, session: Session, name: str, cursor: Any, deleted: int) -> None:
+        checkpoint = self._checkpoint(session, name)
+        if checkpoint is None:
+            checkpoint = CleanupCheckpoint(target=name, rows_deleted=0)
+            session.add(checkpoint)
+        if checkpoint.cursor is None:
+            checkpoint.pass_started_at = datetime.utcnow()
+            checkpoint.rows_deleted = 0
+        checkpoint.cursor = str(cursor)
+        checkpoint.rows_deleted = (checkpoint.rows_deleted or 0) + deleted
+
+    def _finish_pass(self, session: Session, name: str) -> None:
+        checkpoint = self._checkpoint(session, name)
+        if checkpoint is not None:
+            checkpoint.cursor = None
+            checkpoint.last_completed_at = datetime.utcnow()
+
+    @staticmethod
+    def _key_type(key: Any) -> Callable[[str], Any]:
+        """Converter from a stored cursor back to the key's Python type."""
+        try:
+            return key.type.python_type
+        except NotImplementedError:
+            return str
+
+    def _new_session(self) -> Session:
+        if self._session_factory is None:
+            from app.config.database import SessionLocal
+            self._session_factory = SessionLocal
+        return self._session_factory()
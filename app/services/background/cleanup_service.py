@@ -1,4 +1,3 @@
-
 """
 Background cleanup service.
 
@@ -11,25 +10,26 @@ Performs periodic cleanup of expired/obsolete data:
 - Old audit logs (per retention policy)
 
 Performance improvements:
-- Batch processing with configurable limits
-- Parallel task execution support
-- Detailed metrics collection
-- Graceful error handling per task
-- Transaction optimization
+- Chunked, set-based deletes committed per chunk (see cleanup_engine)
+- Adaptive pacing on replication lag and lock waits
+- Cancellable runs resuming from a persisted cursor
+- Parallel tasks, each on its own session
+- Rows-per-second metrics per task
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
-import asyncio
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
 
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
 
 from app.services.base import BaseService, ServiceResult
 from app.services.base.service_result import ServiceError, ErrorCode, ErrorSeverity
+from app.services.background.cleanup_engine import ChunkedCleanupEngine, CleanupTarget
 from app.repositories.auth import (
     OTPTokenRepository,
     UserSessionRepository,
@@ -42,6 +42,12 @@ from app.repositories.announcement import (
 )
 from app.repositories.audit import AuditLogRepository
 from app.models.auth.otp_token import OTPToken
+from app.models.auth.user_session import UserSession
+from app.models.auth.token_blacklist import BlacklistedToken
+from app.models.file_management.file_upload import UploadSession
+from app.models.announcement.announcement_scheduling import PublishQueue
+from app.models.announcement.announcement_delivery import DeliveryBatch, DeliveryState
+from app.models.audit.audit_log import AuditLog
 from app.core1.logging import get_logger
 
 
@@ -62,7 +68,16 @@ class CleanupConfig:
     temp_upload_retention_hours: int = 24
     stale_queue_retention_days: int = 7
     audit_log_retention_days: int = 365
+    audit_archive_dir: Optional[str] = None
     batch_size: int = 1000
+    min_batch_size: int = 100
+    max_batch_size: int = 10000
+    target_chunk_seconds: float = 0.5
+    max_replication_lag_seconds: float = 5.0
+    max_lock_waiters: int = 5
+    max_sleep_seconds: float = 30.0
+    lock_timeout_ms: int = 2000
+    max_run_seconds: int = 3600
     enable_parallel: bool = False
     max_workers: int = 3
 
@@ -75,18 +90,26 @@ class CleanupResult:
     success: bool
     duration_ms: float
     error: Optional[str] = None
+    chunks: int = 0
+    rows_per_second: float = 0.0
+    completed: bool = True
 
 
 class CleanupService(BaseService[OTPToken, OTPTokenRepository]):
     """
-    Orchestrates cleanup tasks by delegating to specialized repositories.
+    Orchestrates cleanup tasks.
     
     Features:
     - Individual and batch cleanup execution
     - Configurable retention policies
-    - Performance metrics tracking
+    - Chunked deletes that resume where an interrupted run stopped
     - Optional parallel execution
+    - Cancellation between chunks
     - Comprehensive error handling
+
+    Each task deletes through ChunkedCleanupEngine on sessions from
+    ``session_factory``, never on the request session, so tasks are safe
+    to run on worker threads.
     """
 
     def __init__(
@@ -100,6 +123,7 @@ class CleanupService(BaseService[OTPToken, OTPTokenRepository]):
         audit_repo: AuditLogRepository,
         db_session: Session,
         config: Optional[CleanupConfig] = None,
+        session_factory: Optional[Callable[[], Session]] = None,
     ):
         super().__init__(otp_repo, db_session)
         self.otp_repo = otp_repo
@@ -110,8 +134,29 @@ class CleanupService(BaseService[OTPToken, OTPTokenRepository]):
         self.ann_delivery_repo = ann_delivery_repo
         self.audit_repo = audit_repo
         self.config = config or CleanupConfig()
+        self.engine = ChunkedCleanupEngine(
+            session_factory=session_factory,
+            chunk_size=self.config.batch_size,
+            min_chunk_size=self.config.min_batch_size,
+            max_chunk_size=self.config.max_batch_size,
+            target_chunk_seconds=self.config.target_chunk_seconds,
+            max_sleep_seconds=self.config.max_sleep_seconds,
+            max_replication_lag_seconds=self.config.max_replication_lag_seconds,
+            max_lock_waiters=self.config.max_lock_waiters,
+            lock_timeout_ms=self.config.lock_timeout_ms,
+        )
+        self._cancel = threading.Event()
+        self._deadline: Optional[float] = None
         self._logger = get_logger(self.__class__.__name__)
 
+    def cancel(self) -> None:
+        """
+        Stop running cleanup tasks after their current chunk.
+
+        Progress is kept; the next run resumes from each task's cursor.
+        """
+        self._cancel.set()
+
     def run_daily_cleanup(
         self,
         tasks: Optional[List[CleanupTask]] = None,
@@ -134,25 +179,29 @@ class CleanupService(BaseService[OTPToken, OTPTokenRepository]):
         if tasks is None:
             tasks = list(CleanupTask)
         
+        self._cancel.clear()
+        self._deadline = time.monotonic() + self.config.max_run_seconds
+        
         try:
             if use_parallel and len(tasks) > 1:
                 cleanup_results = self._run_parallel_cleanup(tasks)
             else:
                 cleanup_results = self._run_sequential_cleanup(tasks)
             
-            # Aggregate results
-            total_cleaned = sum(r.count for r in cleanup_results if r.success)
+            # Aggregate results; chunks are committed as they go
+            total_cleaned = sum(r.count for r in cleanup_results)
             failed_tasks = [r.task.value for r in cleanup_results if not r.success]
+            paused_tasks = [
+                r.task.value for r in cleanup_results if r.success and not r.completed
+            ]
             
-            # Commit if all tasks succeeded
             if not failed_tasks:
-                self.db.commit()
                 self._logger.info(
                     f"Daily cleanup completed successfully. "
                     f"Total items cleaned: {total_cleaned}"
+                    + (f" (paused: {paused_tasks})" if paused_tasks else "")
                 )
             else:
-                self.db.rollback()
                 self._logger.warning(
                     f"Daily cleanup completed with failures: {failed_tasks}"
                 )
@@ -162,14 +211,20 @@ class CleanupService(BaseService[OTPToken, OTPTokenRepository]):
             response = {
                 "total_cleaned": total_cleaned,
                 "duration_seconds": round(duration, 2),
+                "rows_per_second": round(total_cleaned / duration, 2) if duration > 0 else 0.0,
                 "tasks_executed": len(cleanup_results),
                 "tasks_succeeded": len([r for r in cleanup_results if r.success]),
                 "tasks_failed": len(failed_tasks),
                 "failed_tasks": failed_tasks,
+                "paused_tasks": paused_tasks,
+                "cancelled": self._cancel.is_set(),
                 "details": {
                     r.task.value: {
                         "count": r.count,
                         "success": r.success,
+                        "completed": r.completed,
+                        "chunks": r.chunks,
+                        "rows_per_second": round(r.rows_per_second, 2),
                         "duration_ms": round(r.duration_ms, 2),
                         "error": r.error,
                     }
@@ -194,9 +249,10 @@ class CleanupService(BaseService[OTPToken, OTPTokenRepository]):
             )
             
         except Exception as e:
-            self.db.rollback()
             self._logger.error(f"Critical error in daily cleanup: {str(e)}", exc_info=True)
             return self._handle_exception(e, "daily cleanup")
+        finally:
+            self._deadline = None
 
     def _run_sequential_cleanup(self, tasks: List[CleanupTask]) -> List[CleanupResult]:
         """Execute cleanup tasks sequentially."""
@@ -220,10 +276,13 @@ class CleanupService(BaseService[OTPToken, OTPTokenRepository]):
         return results
 
     def _run_parallel_cleanup(self, tasks: List[CleanupTask]) -> List[CleanupResult]:
-        """Execute cleanup tasks in parallel using thread pool."""
+        """Execute cleanup tasks in parallel, each on its own sessions."""
         results = []
         
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+        with ThreadPoolExecutor(
+            max_workers=self.config.max_workers,
+            thread_name_prefix="cleanup",
+        ) as executor:
             future_to_task = {
                 executor.submit(self._execute_cleanup_task, task): task
                 for task in tasks
@@ -259,51 +318,36 @@ class CleanupService(BaseService[OTPToken, OTPTokenRepository]):
         
         return results
 
-    def _execute_cleanup_task(self, task: CleanupTask) -> CleanupResult:
-        """Execute a single cleanup task and return its result."""
+    def _execute_cleanup_task(
+        self,
+        task: CleanupTask,
+        targets: Optional[List[CleanupTarget]] = None,
+    ) -> CleanupResult:
+        """Purge a task's targets and return its result."""
         start_time = datetime.utcnow()
         
         try:
-            # Map task to method
-            task_map = {
-                CleanupTask.OTP_TOKENS: self.cleanup_otps,
-                CleanupTask.USER_SESSIONS: self.cleanup_sessions,
-                CleanupTask.BLACKLISTED_TOKENS: lambda: self.cleanup_blacklist(
-                    self.config.blacklist_retention_days
-                ),
-                CleanupTask.TEMP_UPLOADS: lambda: self.cleanup_temp_uploads(
-                    self.config.temp_upload_retention_hours
-                ),
-                CleanupTask.STALE_QUEUES: lambda: self.cleanup_queues(
-                    self.config.stale_queue_retention_days
-                ),
-                CleanupTask.AUDIT_LOGS: lambda: self.cleanup_audit_logs(
-                    self.config.audit_log_retention_days
-                ),
-            }
+            if targets is None:
+                targets = self._task_targets(task)
             
-            cleanup_method = task_map.get(task)
-            if not cleanup_method:
-                raise ValueError(f"Unknown cleanup task: {task}")
+            deleted = chunks = 0
+            completed = True
+            for target in targets:
+                stats = self.engine.purge(target, cancel=self._cancel, deadline=self._deadline)
+                deleted += stats.deleted
+                chunks += stats.chunks
+                completed = completed and stats.completed
             
-            result = cleanup_method()
             duration = (datetime.utcnow() - start_time).total_seconds() * 1000
-            
-            if result.success:
-                return CleanupResult(
-                    task=task,
-                    count=result.data or 0,
-                    success=True,
-                    duration_ms=duration,
-                )
-            else:
-                return CleanupResult(
-                    task=task,
-                    count=0,
-                    success=False,
-                    duration_ms=duration,
-                    error=result.error.message if result.error else "Unknown error",
-                )
+            return CleanupResult(
+                task=task,
+                count=deleted,
+                success=True,
+                duration_ms=duration,
+                chunks=chunks,
+                rows_per_second=deleted / (duration / 1000) if duration > 0 else 0.0,
+                completed=completed,
+            )
                 
         except Exception as e:
             duration = (datetime.utcnow() - start_time).total_seconds() * 1000
@@ -316,8 +360,61 @@ class CleanupService(BaseService[OTPToken, OTPTokenRepository]):
                 success=False,
                 duration_ms=duration,
                 error=error_msg,
+                completed=False,
             )
 
+    def _task_targets(self, task: CleanupTask) -> List[CleanupTarget]:
+        """Targets of a task under the configured retention."""
+        task_map = {
+            CleanupTask.OTP_TOKENS: self._otp_targets,
+            CleanupTask.USER_SESSIONS: self._session_targets,
+            CleanupTask.BLACKLISTED_TOKENS: lambda: self._blacklist_targets(
+                self.config.blacklist_retention_days
+            ),
+            CleanupTask.TEMP_UPLOADS: lambda: self._temp_upload_targets(
+                self.config.temp_upload_retention_hours
+            ),
+            CleanupTask.STALE_QUEUES: lambda: self._queue_targets(
+                self.config.stale_queue_retention_days
+            ),
+            CleanupTask.AUDIT_LOGS: lambda: self._audit_log_targets(
+                self.config.audit_log_retention_days
+            ),
+        }
+        
+        build_targets = task_map.get(task)
+        if not build_targets:
+            raise ValueError(f"Unknown cleanup task: {task}")
+        return build_targets()
+
+    def _run_task(
+        self,
+        task: CleanupTask,
+        targets: List[CleanupTarget],
+        operation: str,
+    ) -> ServiceResult[int]:
+        """Run one task on its own and wrap the deleted count."""
+        result = self._execute_cleanup_task(task, targets)
+        if not result.success:
+            return ServiceResult.failure(
+                error=ServiceError(
+                    code=ErrorCode.OPERATION_FAILED,
+                    message=f"Failed to {operation}",
+                    severity=ErrorSeverity.ERROR,
+                    details={"error": result.error},
+                )
+            )
+        
+        self._logger.info(
+            f"{operation.capitalize()}: {result.count} rows "
+            f"({result.rows_per_second:.0f} rows/s)"
+            + ("" if result.completed else ", resumes next run")
+        )
+        return ServiceResult.success(
+            result.count,
+            message=f"Cleaned {result.count} rows"
+        )
+
     # ---------------------------------------------------------------------
     # Individual cleanup tasks
     # ---------------------------------------------------------------------
@@ -329,21 +426,9 @@ class CleanupService(BaseService[OTPToken, OTPTokenRepository]):
         Returns:
             ServiceResult with count of purged tokens
         """
-        try:
-            count = self.otp_repo.purge_expired()
-            self.db.flush()
-            
-            self._logger.info(f"Purged {count} expired OTP tokens")
-            return ServiceResult.success(
-                count,
-                message=f"Purged {count} expired OTP tokens"
-            )
-            
-        except SQLAlchemyError as e:
-            self._logger.error(f"Database error purging OTPs: {str(e)}")
-            return self._handle_exception(e, "cleanup OTPs")
-        except Exception as e:
-            return self._handle_exception(e, "cleanup OTPs")
+        return self._run_task(
+            CleanupTask.OTP_TOKENS, self._otp_targets(), "purge expired OTP tokens"
+        )
 
     def cleanup_sessions(self) -> ServiceResult[int]:
         """
@@ -352,21 +437,9 @@ class CleanupService(BaseService[OTPToken, OTPTokenRepository]):
         Returns:
             ServiceResult with count of purged sessions
         """
-        try:
-            count = self.session_repo.purge_expired()
-            self.db.flush()
-            
-            self._logger.info(f"Purged {count} expired user sessions")
-            return ServiceResult.success(
-                count,
-                message=f"Purged {count} expired sessions"
-            )
-            
-        except SQLAlchemyError as e:
-            self._logger.error(f"Database error purging sessions: {str(e)}")
-            return self._handle_exception(e, "cleanup sessions")
-        except Exception as e:
-            return self._handle_exception(e, "cleanup sessions")
+        return self._run_task(
+            CleanupTask.USER_SESSIONS, self._session_targets(), "purge expired sessions"
+        )
 
     def cleanup_blacklist(self, retention_days: int = 90) -> ServiceResult[int]:
         """
@@ -378,37 +451,27 @@ class CleanupService(BaseService[OTPToken, OTPTokenRepository]):
         Returns:
             ServiceResult with count of purged tokens
         """
-        try:
-            if retention_days < 1:
-                return ServiceResult.failure(
-                    error=ServiceError(
-                        code=ErrorCode.VALIDATION_ERROR,
-                        message="Retention days must be at least 1",
-                        severity=ErrorSeverity.ERROR,
-                    )
+        if retention_days < 1:
+            return ServiceResult.failure(
+                error=ServiceError(
+                    code=ErrorCode.VALIDATION_ERROR,
+                    message="Retention days must be at least 1",
+                    severity=ErrorSeverity.ERROR,
                 )
-            
-            before = datetime.utcnow() - timedelta(days=retention_days)
-            count = self.blacklist_repo.purge_before(before)
-            self.db.flush()
-            
-            self._logger.info(
-                f"Purged {count} blacklisted tokens older than {retention_days} days"
-            )
-            return ServiceResult.success(
-                count,
-                message=f"Purged {count} old blacklisted tokens"
             )
-            
-        except SQLAlchemyError as e:
-            self._logger.error(f"Database error purging blacklist: {str(e)}")
-            return self._handle_exception(e, "cleanup blacklisted tokens")
-        except Exception as e:
-            return self._handle_exception(e, "cleanup blacklisted tokens")
+        
+        return self._run_task(
+            CleanupTask.BLACKLISTED_TOKENS,
+            self._blacklist_targets(retention_days),
+            f"purge blacklisted tokens older than {retention_days} days",
+        )
 
     def cleanup_temp_uploads(self, older_than_hours: int = 24) -> ServiceResult[int]:
         """
-        Remove incomplete or temporary file uploads.
+        Remove expired or failed upload sessions.
+        
+        Sessions still initialized or uploading hold reserved quota and are
+        left to the upload repository's expiry, which releases it first.
         
         Args:
             older_than_hours: Remove uploads older than this many hours
@@ -416,37 +479,24 @@ class CleanupService(BaseService[OTPToken, OTPTokenRepository]):
         Returns:
             ServiceResult with count of removed uploads
         """
-        try:
-            if older_than_hours < 1:
-                return ServiceResult.failure(
-                    error=ServiceError(
-                        code=ErrorCode.VALIDATION_ERROR,
-                        message="Retention hours must be at least 1",
-                        severity=ErrorSeverity.ERROR,
-                    )
+        if older_than_hours < 1:
+            return ServiceResult.failure(
+                error=ServiceError(
+                    code=ErrorCode.VALIDATION_ERROR,
+                    message="Retention hours must be at least 1",
+                    severity=ErrorSeverity.ERROR,
                 )
-            
-            before = datetime.utcnow() - timedelta(hours=older_than_hours)
-            count = self.file_upload_repo.cleanup_incomplete_before(before)
-            self.db.flush()
-            
-            self._logger.info(
-                f"Cleaned {count} temporary uploads older than {older_than_hours} hours"
-            )
-            return ServiceResult.success(
-                count,
-                message=f"Cleaned {count} temporary uploads"
             )
-            
-        except SQLAlchemyError as e:
-            self._logger.error(f"Database error cleaning temp uploads: {str(e)}")
-            return self._handle_exception(e, "cleanup temporary uploads")
-        except Exception as e:
-            return self._handle_exception(e, "cleanup temporary uploads")
+        
+        return self._run_task(
+            CleanupTask.TEMP_UPLOADS,
+            self._temp_upload_targets(older_than_hours),
+            f"clean temporary uploads older than {older_than_hours} hours",
+        )
 
     def cleanup_queues(self, older_than_days: int = 7) -> ServiceResult[int]:
         """
-        Clean stale announcement scheduling and delivery queues.
+        Clean finished announcement publish queue items and delivery batches.
         
         Args:
             older_than_days: Remove queue items older than this many days
@@ -454,38 +504,20 @@ class CleanupService(BaseService[OTPToken, OTPTokenRepository]):
         Returns:
             ServiceResult with total count of cleaned queue items
         """
-        try:
-            if older_than_days < 1:
-                return ServiceResult.failure(
-                    error=ServiceError(
-                        code=ErrorCode.VALIDATION_ERROR,
-                        message="Retention days must be at least 1",
-                        severity=ErrorSeverity.ERROR,
-                    )
+        if older_than_days < 1:
+            return ServiceResult.failure(
+                error=ServiceError(
+                    code=ErrorCode.VALIDATION_ERROR,
+                    message="Retention days must be at least 1",
+                    severity=ErrorSeverity.ERROR,
                 )
-            
-            before = datetime.utcnow() - timedelta(days=older_than_days)
-            
-            sched_count = self.ann_sched_repo.cleanup_stale(before) or 0
-            delivery_count = self.ann_delivery_repo.cleanup_stale(before) or 0
-            total_count = sched_count + delivery_count
-            
-            self.db.flush()
-            
-            self._logger.info(
-                f"Cleaned {total_count} stale queue items "
-                f"(scheduling: {sched_count}, delivery: {delivery_count})"
-            )
-            return ServiceResult.success(
-                total_count,
-                message=f"Cleaned {total_count} stale queue items"
             )
-            
-        except SQLAlchemyError as e:
-            self._logger.error(f"Database error cleaning queues: {str(e)}")
-            return self._handle_exception(e, "cleanup queues")
-        except Exception as e:
-            return self._handle_exception(e, "cleanup queues")
+        
+        return self._run_task(
+            CleanupTask.STALE_QUEUES,
+            self._queue_targets(older_than_days),
+            f"clean queue items older than {older_than_days} days",
+        )
 
     def cleanup_audit_logs(self, retention_days: int = 365) -> ServiceResult[int]:
         """
@@ -497,30 +529,87 @@ class CleanupService(BaseService[OTPToken, OTPTokenRepository]):
         Returns:
             ServiceResult with count of purged logs
         """
-        try:
-            if retention_days < 30:
-                self._logger.warning(
-                    f"Audit log retention of {retention_days} days is below "
-                    f"recommended minimum of 30 days"
-                )
-            
-            before = datetime.utcnow() - timedelta(days=retention_days)
-            count = self.audit_repo.purge_before(before)
-            self.db.flush()
-            
-            self._logger.info(
-                f"Purged {count} audit logs older than {retention_days} days"
+        if retention_days < 30:
+            self._logger.warning(
+                f"Audit log retention of {retention_days} days is below "
+                f"recommended minimum of 30 days"
             )
-            return ServiceResult.success(
-                count,
-                message=f"Purged {count} old audit logs"
+        
+        return self._run_task(
+            CleanupTask.AUDIT_LOGS,
+            self._audit_log_targets(retention_days),
+            f"purge audit logs past retention (default {retention_days} days)",
+        )
+
+    # ---------------------------------------------------------------------
+    # Targets
+    # ---------------------------------------------------------------------
+
+    @staticmethod
+    def _otp_targets() -> List[CleanupTarget]:
+        return [CleanupTarget(
+            "otp_tokens", OTPToken, [OTPToken.expires_at < datetime.utcnow()]
+        )]
+
+    @staticmethod
+    def _session_targets() -> List[CleanupTarget]:
+        return [CleanupTarget(
+            "user_sessions", UserSession, [UserSession.expires_at < datetime.utcnow()]
+        )]
+
+    @staticmethod
+    def _blacklist_targets(retention_days: int) -> List[CleanupTarget]:
+        before = datetime.utcnow() - timedelta(days=retention_days)
+        return [CleanupTarget(
+            "blacklisted_tokens", BlacklistedToken, [BlacklistedToken.expires_at < before]
+        )]
+
+    @staticmethod
+    def _temp_upload_targets(older_than_hours: int) -> List[CleanupTarget]:
+        before = datetime.utcnow() - timedelta(hours=older_than_hours)
+        return [CleanupTarget("upload_sessions", UploadSession, [
+            UploadSession.status.in_(["expired", "failed"]),
+            UploadSession.updated_at < before,
+        ])]
+
+    @staticmethod
+    def _queue_targets(older_than_days: int) -> List[CleanupTarget]:
+        before = datetime.utcnow() - timedelta(days=older_than_days)
+        finished = [DeliveryState.COMPLETED, DeliveryState.FAILED, DeliveryState.CANCELLED]
+        return [
+            CleanupTarget("announcement_publish_queue", PublishQueue, [
+                PublishQueue.status.in_(finished),
+                PublishQueue.updated_at < before,
+            ]),
+            CleanupTarget("announcement_delivery_batches", DeliveryBatch, [
+                DeliveryBatch.status.in_(finished),
+                DeliveryBatch.updated_at < before,
+            ]),
+        ]
+
+    def _audit_log_targets(self, retention_days: int) -> List[CleanupTarget]:
+        # Same rules as AuditLogRepository.cleanup_by_retention_policy:
+        # per-row retention wins and sensitive logs are kept. A partitioned
+        # table is retired by whole partitions through archive_old_logs,
+        # detached (or dumped to audit_archive_dir and dropped) rather than
+        # row-deleted.
+        archive_dir = self.config.audit_archive_dir
+
+        def retire_partitions(session: Session) -> Optional[int]:
+            repo = AuditLogRepository(session)
+            if not repo.is_partitioned():
+                return None
+            return repo.archive_old_logs(
+                datetime.utcnow() - timedelta(days=retention_days),
+                archive_dir=archive_dir,
             )
-            
-        except SQLAlchemyError as e:
-            self._logger.error(f"Database error purging audit logs: {str(e)}")
-            return self._handle_exception(e, "cleanup audit logs")
-        except Exception as e:
-            return self._handle_exception(e, "cleanup audit logs")
+
+        return [CleanupTarget(
+            "audit_logs",
+            AuditLog,
+            [AuditLogRepository.retention_eligible(retention_days)],
+            partition_purge=retire_partitions,
+        )]
 
     def get_cleanup_stats(self) -> ServiceResult[Dict[str, Any]]:
         """
@@ -403,9 +403,13 @@ class DataSyncService(BaseService[APIIntegration, APIIntegrationRepository]):
         """
         Run a reconciliation job between local and provider data.
         
+        Local and provider records are summarized as Merkle digests per id
+        range; only ranges whose digests differ are compared row by row.
+        
         Args:
             provider: Provider identifier
-            full_scan: Whether to perform full reconciliation (vs incremental)
+            full_scan: Rebuild the range digests from every record instead
+                of refreshing them from records updated since the last run
             
         Returns:
             ServiceResult with reconciliation report
@@ -0,0 +1,277 @@
+"""
+Transactional outbox relay.
+
+Drains outbox messages written by committed transactions and hands them to
+their delivery channel:
+- Events -> EventBus handlers
+- Notifications -> notification queue
+- Webhooks -> outbound webhook delivery
+
+Delivery is at-least-once: messages are claimed in batches with
+FOR UPDATE SKIP LOCKED under a lease, so several relay workers can run
+concurrently and messages held by a crashed worker are retried once the
+lease expires. Consumers must tolerate duplicates.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+from datetime import datetime, timedelta
+from dataclasses import dataclass
+import asyncio
+import random
+import time
+
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.services.base import BaseService, ServiceResult
+from app.repositories.base.outbox_repository import OutboxRepository
+from app.models.common.outbox import OutboxMessage
+from app.core.events import BaseEvent, event_bus
+from app.core.logging import get_logger
+
+
+OutboxHandler = Callable[[OutboxMessage], None]
+
+
+@dataclass
+class OutboxRelayConfig:
+    """Configuration for the outbox relay."""
+    batch_size: int = 100
+    lease_seconds: int = 60
+    max_batches_per_run: int = 50
+    retry_base_seconds: int = 5
+    retry_max_seconds: int = 3600
+    delivered_retention_days: int = 7
+    event_timeout_seconds: float = 30.0
+
+
+class OutboxRelayService(BaseService[OutboxMessage, OutboxRepository]):
+    """
+    Deliver transactional outbox messages.
+
+    Handlers are registered per channel; a handler signals failure by
+    raising. Failed messages are retried with jittered exponential backoff
+    and dead-lettered after their max_attempts.
+    """
+
+    def __init__(
+        self,
+        outbox_repo: OutboxRepository,
+        db_session: Session,
+        config: Optional[OutboxRelayConfig] = None,
+        event_loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
+        """
+        Initialize the outbox relay.
+
+        Args:
+            outbox_repo: Outbox repository
+            db_session: Database session
+            config: Relay configuration
+            event_loop: Loop running the EventBus, when relaying from a
+                worker thread of the application process
+        """
+        super().__init__(outbox_repo, db_session)
+        self.outbox_repo = outbox_repo
+        self.config = config or OutboxRelayConfig()
+        self.event_loop = event_loop
+        self._logger = get_logger(self.__class__.__name__)
+        self._handlers: Dict[str, OutboxHandler] = {
+            OutboxMessage.CHANNEL_EVENT: self._deliver_event,
+            OutboxMessage.CHANNEL_NOTIFICATION: self._deliver_notification,
+            OutboxMessage.CHANNEL_WEBHOOK: self._deliver_webhook,
+        }
+
+    def register_handler(self, channel: str, handler: OutboxHandler) -> None:
+        """
+        Register or replace the handler for a channel.
+
+        Args:
+            channel: Outbox channel
+            handler: Callable delivering one message; raises on failure
+        """
+        self._handlers[channel] = handler
+
+    # -------------------------------------------------------------------------
+    # Relay
+    # -------------------------------------------------------------------------
+
+    def relay_batch(self, channels: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Claim and deliver one batch of due messages.
+
+        Args:
+            channels: Restrict to these channels
+
+        Returns:
+            Counts of claimed, delivered, retried and dead-lettered messages
+        """
+        messages = self.outbox_repo.claim_batch(
+            batch_size=self.config.batch_size,
+            lease_seconds=self.config.lease_seconds,
+            channels=channels,
+        )
+        stats = {"claimed": len(messages), "delivered": 0, "retried": 0, "dead": 0}
+        delivered_ids: List[str] = []
+
+        for message in messages:
+            try:
+                # A failed delivery rolls back to its savepoint only, keeping
+                # the writes of messages already delivered in this batch
+                with self.db.begin_nested():
+                    self.deliver(message)
+                delivered_ids.append(message.id)
+            except Exception as e:
+                dead = self.outbox_repo.mark_failed(
+                    message,
+                    error=f"{type(e).__name__}: {e}",
+                    retry_at=datetime.utcnow() + self._retry_delay(message.attempts),
+                )
+                stats["dead" if dead else "retried"] += 1
+                log = self._logger.error if dead else self._logger.warning
+                log(
+                    f"Outbox delivery failed for {message.channel}:{message.topic} "
+                    f"(attempt {message.attempts}/{message.max_attempts}): {e}",
+                    extra={"outbox_message_id": message.id},
+                )
+
+        stats["delivered"] = self.outbox_repo.mark_delivered(delivered_ids)
+        return stats
+
+    def deliver(self, message: OutboxMessage) -> None:
+        """
+        Deliver one message with its channel handler.
+
+        Raises:
+            LookupError: If no handler is registered for the channel
+            Exception: Whatever the handler raises on failure
+        """
+        handler = self._handlers.get(message.channel)
+        if handler is None:
+            raise LookupError(f"No outbox handler for channel '{message.channel}'")
+        handler(message)
+
+    def run(self, channels: Optional[List[str]] = None) -> ServiceResult[Dict[str, Any]]:
+        """
+        Drain due messages, batch by batch, until the outbox is empty or
+        max_batches_per_run is reached.
+
+        Args:
+            channels: Restrict to these channels
+
+        Returns:
+            ServiceResult with relay statistics
+        """
+        started = time.perf_counter()
+        totals = {"claimed": 0, "delivered": 0, "retried": 0, "dead": 0, "batches": 0}
+
+        try:
+            for _ in range(self.config.max_batches_per_run):
+                stats = self.relay_batch(channels)
+                if not stats["claimed"]:
+                    break
+                totals["batches"] += 1
+                for key in ("claimed", "delivered", "retried", "dead"):
+                    totals[key] += stats[key]
+
+            totals["duration_seconds"] = round(time.perf_counter() - started, 3)
+            if totals["claimed"]:
+                self._logger.info(f"Outbox relay: {totals}")
+            return ServiceResult.success(totals, message="Outbox relayed")
+
+        except SQLAlchemyError as e:
+            self._rollback()
+            return self._handle_exception(e, "relay outbox")
+        except Exception as e:
+            self._rollback()
+            return self._handle_exception(e, "relay outbox")
+
+    def purge_delivered(self) -> ServiceResult[int]:
+        """
+        Delete delivered messages past the retention window.
+
+        Returns:
+            ServiceResult with number of purged messages
+        """
+        try:
+            purged = self.outbox_repo.purge_delivered(
+                older_than_days=self.config.delivered_retention_days
+            )
+            return ServiceResult.success(purged, message=f"Purged {purged} outbox messages")
+        except Exception as e:
+            self._rollback()
+            return self._handle_exception(e, "purge outbox")
+
+    def get_backlog(self) -> ServiceResult[Dict[str, Any]]:
+        """
+        Get outbox backlog statistics.
+
+        Returns:
+            ServiceResult with message counts by status
+        """
+        try:
+            return ServiceResult.success(self.outbox_repo.get_backlog_statistics())
+        except Exception as e:
+            return self._handle_exception(e, "get outbox backlog")
+
+    def _retry_delay(self, attempts: int) -> timedelta:
+        """Exponential backoff with jitter."""
+        ceiling = min(
+            self.config.retry_max_seconds,
+            self.config.retry_base_seconds * 2 ** max(attempts - 1, 0),
+        )
+        return timedelta(seconds=random.uniform(ceiling / 2, ceiling))
+
+    # -------------------------------------------------------------------------
+    # Channel Handlers
+    # -------------------------------------------------------------------------
+
+    def _deliver_event(self, message: OutboxMessage) -> None:
+        """Run EventBus handlers for an event message."""
+        event = BaseEvent(message.topic, message.payload)
+        event.event_id = message.id
+        if self.event_loop is not None and self.event_loop.is_running():
+            asyncio.run_coroutine_threadsafe(
+                event_bus.dispatch(event), self.event_loop
+            ).result(timeout=self.config.event_timeout_seconds)
+        else:
+            asyncio.run(event_bus.dispatch(event))
+
+    def _deliver_notification(self, message: OutboxMessage) -> None:
+        """Enqueue a notification on the notification queue."""
+        from app.models.notification.notification import Notification
+        from app.repositories.notification import NotificationQueueRepository
+
+        payload = message.payload
+        notification = self.db.get(Notification, payload["notification_id"])
+        if notification is None:
+            raise LookupError(f"Notification {payload['notification_id']} not found")
+
+        kwargs: Dict[str, Any] = {}
+        if payload.get("priority"):
+            kwargs["priority"] = payload["priority"]
+        if payload.get("scheduled_for"):
+            kwargs["scheduled_for"] = datetime.fromisoformat(payload["scheduled_for"])
+
+        # Flush only: the relay commits the batch, and a failure must be
+        # able to roll back this message's savepoint
+        NotificationQueueRepository(self.db).enqueue_notification(
+            notification, commit=False, **kwargs
+        )
+
+    def _deliver_webhook(self, message: OutboxMessage) -> None:
+        """Deliver an outbound webhook."""
+        from app.services.integrations.webhook_service import WebhookService
+        from app.repositories.integrations import APIIntegrationRepository
+
+        payload = message.payload
+        result = WebhookService(APIIntegrationRepository(self.db), self.db).deliver_outbound(
+            provider=payload["provider"],
+            webhook_id=payload["webhook_id"],
+            payload=payload.get("payload", {}),
+            event_type=message.topic,
+            idempotency_key=message.id,
+        )
+        if not result.is_success or not (result.data or {}).get("success", False):
+            error = result.error.message if result.error else "delivery failed"
+            raise RuntimeError(error)
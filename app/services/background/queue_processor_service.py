@@ -4,23 +4,29 @@ Generic queue processor service.
 Handles batch processing of different queues:
 - Notification queue (email/SMS/push/in-app)
 - Announcement delivery queue
-- Third-party webhooks
-
-Performance improvements:
-- Optimized batch processing with deadlock prevention
-- Priority-based queue processing
-- Retry logic with exponential backoff
-- Concurrent processing with thread pools
-- Dead letter queue handling
-- Detailed processing metrics
+- Third-party webhooks (webhook channel of the transactional outbox)
+
+Queues are drained concurrently, one lane per queue, each lane running up
+to its own number of workers with their own sessions. Batch slots and the
+item budget are shared across lanes by weighted fair (stride) scheduling:
+while several queues have work each gets slots in proportion to its
+weight, and a slow or empty queue never holds up the others.
+
+Items are claimed with FOR UPDATE SKIP LOCKED under a lease and handled
+one by one. A failed item gets its next attempt time pushed out with
+jittered exponential backoff, or is dead-lettered once it has used its
+attempts; the worker never sleeps.
 """
 
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
-from uuid import UUID
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import random
+import threading
 import time
 
 from sqlalchemy.orm import Session
@@ -31,7 +37,11 @@ from app.services.base.service_result import ServiceError, ErrorCode, ErrorSever
 from app.repositories.notification import NotificationQueueRepository
 from app.repositories.announcement import AnnouncementDeliveryRepository
 from app.repositories.integrations import ThirdPartyRepository
+from app.repositories.base.outbox_repository import OutboxRepository
 from app.models.notification.notification_queue import NotificationQueue
+from app.models.notification.device_token import DeviceToken
+from app.models.common.outbox import OutboxMessage
+from app.schemas.common.enums import NotificationStatus
 from app.core1.logging import get_logger
 
 
@@ -50,17 +60,31 @@ class ProcessingStatus(str, Enum):
     EMPTY = "empty"
 
 
+# Handles one claimed item on the worker's session; raises on failure
+QueueItemHandler = Callable[[Any, Session], None]
+
+
 @dataclass
 class QueueProcessingConfig:
     """Configuration for queue processing."""
     default_batch_size: int = 500
     max_batch_size: int = 2000
-    enable_parallel: bool = False
-    max_workers: int = 3
-    max_retries: int = 3
+    enable_parallel: bool = True
+    max_workers: int = 4
+    queue_weights: Dict[QueueType, int] = field(default_factory=lambda: {
+        QueueType.NOTIFICATION: 5,
+        QueueType.ANNOUNCEMENT: 3,
+        QueueType.WEBHOOK: 2,
+    })
+    queue_concurrency: Dict[QueueType, int] = field(default_factory=lambda: {
+        QueueType.NOTIFICATION: 3,
+        QueueType.ANNOUNCEMENT: 2,
+        QueueType.WEBHOOK: 2,
+    })
+    claim_batch_size: int = 50
+    lease_seconds: int = 300
     retry_delay_seconds: int = 5
-    enable_dead_letter: bool = True
-    dead_letter_threshold: int = 5
+    retry_max_seconds: int = 3600
     processing_timeout_seconds: int = 300
 
 
@@ -80,19 +104,203 @@ class ProcessingMetrics:
     errors: List[str] = field(default_factory=list)
 
 
+class FairShareScheduler:
+    """
+    Weighted fair (stride) scheduler for batch slots across queues.
+
+    Each queue has a pass value advanced by items granted / weight; among
+    queues currently waiting for a slot, the one with the lowest pass goes
+    next. Queues that are busy or drained don't take part, so a slow queue
+    cannot hold back the others, and a queue rejoining after a long batch
+    starts at the current virtual time instead of spending saved credit.
+    """
+
+    def __init__(
+        self,
+        weights: Dict[QueueType, int],
+        limits: Dict[QueueType, int],
+        total_slots: int,
+        item_budget: int,
+    ):
+        self._weights = {queue: max(weight, 1) for queue, weight in weights.items()}
+        self._limits = limits
+        self._total_slots = max(total_slots, 1)
+        self._remaining = item_budget
+
+        self._pass: Dict[QueueType, float] = {queue: 0.0 for queue in weights}
+        self._virtual_time = 0.0
+        self._active: Counter = Counter()
+        self._waiting: Counter = Counter()
+        self._in_use = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, queue_type: QueueType, batch_size: int) -> int:
+        """
+        Wait for a batch slot.
+
+        Returns:
+            Items granted (0 once the item budget is spent)
+        """
+        with self._cond:
+            self._pass[queue_type] = max(self._pass[queue_type], self._virtual_time)
+            self._waiting[queue_type] += 1
+            try:
+                while self._remaining > 0 and not self._may_run(queue_type):
+                    self._cond.wait()
+                if self._remaining <= 0:
+                    return 0
+
+                granted = min(batch_size, self._remaining)
+                self._remaining -= granted
+                self._in_use += 1
+                self._active[queue_type] += 1
+                self._virtual_time = self._pass[queue_type]
+                self._pass[queue_type] += granted / self._weights[queue_type]
+                return granted
+            finally:
+                self._waiting[queue_type] -= 1
+                self._cond.notify_all()
+
+    def release(self, queue_type: QueueType, granted: int, used: int) -> None:
+        """Return a slot, refunding the part of the grant that was not used."""
+        with self._cond:
+            unused = max(granted - used, 0)
+            self._remaining += unused
+            self._pass[queue_type] -= unused / self._weights[queue_type]
+            self._in_use -= 1
+            self._active[queue_type] -= 1
+            self._cond.notify_all()
+
+    def _may_run(self, queue_type: QueueType) -> bool:
+        """Whether a waiter of this queue may take the next slot (lock held)."""
+        if self._in_use >= self._total_slots:
+            return False
+        if self._active[queue_type] >= self._limits.get(queue_type, 1):
+            return False
+        contenders = [
+            queue for queue, waiting in self._waiting.items()
+            if waiting and self._active[queue] < self._limits.get(queue, 1)
+        ]
+        return self._pass[queue_type] <= min(self._pass[queue] for queue in contenders)
+
+
+class _NotificationLane:
+    """Notification queue operations for one worker session."""
+
+    def __init__(self, session: Session, worker_id: str, priority: Optional[str] = None):
+        self.repo = NotificationQueueRepository(session)
+        self.worker_id = worker_id
+        self.priority = priority
+
+    def claim(self, limit: int, lease_seconds: int) -> List[NotificationQueue]:
+        return self.repo.claim_due_items(
+            batch_size=limit,
+            lease_seconds=lease_seconds,
+            worker_id=self.worker_id,
+            priority=self.priority,
+        )
+
+    @staticmethod
+    def describe(item: NotificationQueue) -> Tuple[Any, int]:
+        return item.id, (item.retry_count or 0) + 1
+
+    def succeed(self, item_ids: List[Any]) -> None:
+        self.repo.complete_items(item_ids)
+
+    def fail(self, item: NotificationQueue, item_id: Any, error: str, retry_at: datetime) -> bool:
+        return self.repo.fail_item(
+            item_id,
+            retry_count=item.retry_count or 0,
+            max_retries=item.max_retries,
+            error=error,
+            retry_at=retry_at,
+        )
+
+
+class _AnnouncementLane:
+    """Announcement delivery queue operations for one worker session."""
+
+    def __init__(self, session: Session, worker_id: str, channel: Optional[str] = None):
+        self.session = session
+        self.repo = AnnouncementDeliveryRepository(session)
+        self.channel = channel
+
+    def claim(self, limit: int, lease_seconds: int) -> List[Any]:
+        return self.repo.claim_due_deliveries(
+            batch_size=limit,
+            lease_seconds=lease_seconds,
+            channel=self.channel,
+        )
+
+    @staticmethod
+    def describe(delivery: Any) -> Tuple[Any, int]:
+        return delivery.id, (delivery.retry_count or 0) + 1
+
+    def succeed(self, delivery_ids: List[Any]) -> None:
+        self.repo.complete_deliveries(delivery_ids)
+
+    def fail(self, delivery: Any, delivery_id: Any, error: str, retry_at: datetime) -> bool:
+        delivery = self.repo.mark_failed(delivery_id, failure_reason=error[:2000], retry_at=retry_at)
+        self.session.commit()
+        return delivery.status == 'failed'
+
+
+class _WebhookLane:
+    """Outbox webhook channel operations for one worker session."""
+
+    def __init__(self, session: Session, worker_id: str):
+        self.repo = OutboxRepository(session)
+
+    def claim(self, limit: int, lease_seconds: int) -> List[OutboxMessage]:
+        return self.repo.claim_batch(
+            batch_size=limit,
+            lease_seconds=lease_seconds,
+            channels=[OutboxMessage.CHANNEL_WEBHOOK],
+        )
+
+    @staticmethod
+    def describe(message: OutboxMessage) -> Tuple[Any, int]:
+        # attempts was already incremented by the claim
+        return message.id, message.attempts
+
+    def succeed(self, message_ids: List[Any]) -> None:
+        self.repo.mark_delivered(message_ids)
+
+    def fail(self, message: OutboxMessage, message_id: Any, error: str, retry_at: datetime) -> bool:
+        return self.repo.mark_failed(message, error=error, retry_at=retry_at)
+
+
+def _deliver_outbox_webhook(message: OutboxMessage, session: Session) -> None:
+    """Default webhook handler: deliver through the outbox relay."""
+    from app.services.background.outbox_relay_service import OutboxRelayService
+
+    OutboxRelayService(OutboxRepository(session), session).deliver(message)
+
+
 class QueueProcessorService(BaseService[NotificationQueue, NotificationQueueRepository]):
     """
     Coordinates batch processing for configured queues.
     
     Features:
-    - Multi-queue processing with priority
-    - Batch optimization with configurable limits
-    - Retry mechanism with exponential backoff
-    - Dead letter queue for failed items
-    - Parallel processing support
+    - Concurrent lanes with weighted fair scheduling
+    - Per-queue concurrency limits
+    - Per-item retry with jittered backoff (no sleeping)
+    - Per-item dead-lettering
     - Comprehensive metrics tracking
+
+    Item handlers are registered per queue type and receive the claimed
+    item and the worker's session. By default notifications and
+    announcement deliveries are sent through the core notification
+    providers and webhooks through the outbox relay. Queues without a
+    handler are skipped.
     """
 
+    LANES = {
+        QueueType.NOTIFICATION: _NotificationLane,
+        QueueType.ANNOUNCEMENT: _AnnouncementLane,
+        QueueType.WEBHOOK: _WebhookLane,
+    }
+
     def __init__(
         self,
         notification_queue_repo: NotificationQueueRepository,
@@ -100,13 +308,47 @@ class QueueProcessorService(BaseService[NotificationQueue, NotificationQueueRepo
         third_party_repo: ThirdPartyRepository,
         db_session: Session,
         config: Optional[QueueProcessingConfig] = None,
+        session_factory: Optional[Callable[[], Session]] = None,
+        event_loop: Optional[asyncio.AbstractEventLoop] = None,
     ):
+        """
+        Initialize the queue processor.
+
+        Args:
+            notification_queue_repo: Notification queue repository
+            announcement_delivery_repo: Announcement delivery repository
+            third_party_repo: Third-party integration repository
+            db_session: Database session
+            config: Processing configuration
+            session_factory: Factory for lane worker sessions
+            event_loop: Loop the notification providers were started on;
+                notification and announcement items are only sent while it
+                is running
+        """
         super().__init__(notification_queue_repo, db_session)
         self.notification_queue_repo = notification_queue_repo
         self.announcement_delivery_repo = announcement_delivery_repo
         self.third_party_repo = third_party_repo
         self.config = config or QueueProcessingConfig()
+        self._session_factory = session_factory
+        self.event_loop = event_loop
         self._logger = get_logger(self.__class__.__name__)
+        self._handlers: Dict[QueueType, QueueItemHandler] = {
+            QueueType.NOTIFICATION: self._send_queued_notification,
+            QueueType.ANNOUNCEMENT: self._send_announcement_delivery,
+            QueueType.WEBHOOK: _deliver_outbox_webhook,
+        }
+
+    def register_handler(self, queue_type: QueueType, handler: QueueItemHandler) -> None:
+        """
+        Register or replace the item handler for a queue.
+
+        Args:
+            queue_type: Queue type
+            handler: Callable handling one item on the given session;
+                raises on failure
+        """
+        self._handlers[queue_type] = handler
 
     def process_all(
         self,
@@ -114,55 +356,24 @@ class QueueProcessorService(BaseService[NotificationQueue, NotificationQueueRepo
         queue_priority: Optional[List[QueueType]] = None,
     ) -> ServiceResult[Dict[str, Any]]:
         """
-        Process all supported queues with priority ordering.
+        Process all supported queues concurrently under fair scheduling.
         
         Args:
             max_items: Maximum total items to process
-            queue_priority: Order of queues to process (default: notification, announcement, webhook)
+            queue_priority: Queues to process (default: all); relative
+                priority comes from the configured queue weights
             
         Returns:
             ServiceResult with aggregated processing metrics
         """
         start_time = datetime.utcnow()
         total_limit = max_items or self.config.max_batch_size
-        
-        # Default queue priority
-        if queue_priority is None:
-            queue_priority = [
-                QueueType.NOTIFICATION,
-                QueueType.ANNOUNCEMENT,
-                QueueType.WEBHOOK,
-            ]
+        queue_types = queue_priority or list(self.LANES)
         
         try:
-            all_metrics = []
-            items_processed = 0
-            
-            for queue_type in queue_priority:
-                # Calculate remaining capacity
-                remaining = total_limit - items_processed
-                if remaining <= 0:
-                    break
-                
-                # Process queue
-                batch_size = min(self.config.default_batch_size, remaining)
-                
-                if queue_type == QueueType.NOTIFICATION:
-                    result = self.process_notification_queue(batch_size=batch_size)
-                elif queue_type == QueueType.ANNOUNCEMENT:
-                    result = self.process_announcement_delivery(batch_size=batch_size)
-                elif queue_type == QueueType.WEBHOOK:
-                    result = self.process_webhooks(batch_size=batch_size)
-                else:
-                    continue
-                
-                if result.success and result.data:
-                    all_metrics.append(result.data)
-                    items_processed += result.data.total_processed
+            all_metrics = self._drain(queue_types, total_limit)
             
-            self.db.commit()
-            
-            # Aggregate results
+            items_processed = sum(m.total_processed for m in all_metrics)
             total_successful = sum(m.successful for m in all_metrics)
             total_failed = sum(m.failed for m in all_metrics)
             total_retried = sum(m.retried for m in all_metrics)
@@ -188,6 +399,11 @@ class QueueProcessorService(BaseService[NotificationQueue, NotificationQueueRepo
                         "retried": m.retried,
                         "dlq": m.moved_to_dlq,
                         "duration_seconds": round(m.duration_seconds, 2),
+                        "items_per_second": (
+                            round(m.total_processed / m.duration_seconds, 2)
+                            if m.duration_seconds > 0 else 0.0
+                        ),
+                        "errors": m.errors[:10],
                     }
                     for m in all_metrics
                 ],
@@ -204,11 +420,9 @@ class QueueProcessorService(BaseService[NotificationQueue, NotificationQueueRepo
             )
             
         except SQLAlchemyError as e:
-            self.db.rollback()
             self._logger.error(f"Database error processing queues: {str(e)}")
             return self._handle_exception(e, "process all queues")
         except Exception as e:
-            self.db.rollback()
             return self._handle_exception(e, "process all queues")
 
     def process_notification_queue(
@@ -226,63 +440,12 @@ class QueueProcessorService(BaseService[NotificationQueue, NotificationQueueRepo
         Returns:
             ServiceResult with processing metrics
         """
-        start_time = datetime.utcnow()
-        limit = min(
-            batch_size or self.config.default_batch_size,
-            self.config.max_batch_size
+        return self._process_single(
+            QueueType.NOTIFICATION,
+            batch_size,
+            {"priority": priority} if priority else {},
+            "notifications",
         )
-        
-        try:
-            # Process with retry logic
-            processed, successful, failed, retried, dlq_count = self._process_queue_with_retry(
-                self.notification_queue_repo.process_batch,
-                limit,
-                {"priority": priority} if priority else {}
-            )
-            
-            self.db.flush()
-            
-            duration = (datetime.utcnow() - start_time).total_seconds()
-            
-            # Determine status
-            if processed == 0:
-                status = ProcessingStatus.EMPTY
-            elif failed == 0:
-                status = ProcessingStatus.SUCCESS
-            elif successful > 0:
-                status = ProcessingStatus.PARTIAL
-            else:
-                status = ProcessingStatus.FAILED
-            
-            metrics = ProcessingMetrics(
-                queue_type=QueueType.NOTIFICATION,
-                status=status,
-                total_processed=processed,
-                successful=successful,
-                failed=failed,
-                retried=retried,
-                moved_to_dlq=dlq_count,
-                duration_seconds=duration,
-                started_at=start_time,
-                completed_at=datetime.utcnow(),
-            )
-            
-            self._logger.info(
-                f"Notification queue: processed {processed} "
-                f"({successful} successful, {failed} failed) in {duration:.2f}s"
-            )
-            
-            return ServiceResult.success(
-                metrics,
-                message=f"Processed {processed} notifications"
-            )
-            
-        except Exception as e:
-            return self._handle_queue_exception(
-                e,
-                QueueType.NOTIFICATION,
-                start_time
-            )
 
     def process_announcement_delivery(
         self,
@@ -299,79 +462,40 @@ class QueueProcessorService(BaseService[NotificationQueue, NotificationQueueRepo
         Returns:
             ServiceResult with processing metrics
         """
-        start_time = datetime.utcnow()
-        limit = min(
-            batch_size or self.config.default_batch_size,
-            self.config.max_batch_size
+        return self._process_single(
+            QueueType.ANNOUNCEMENT,
+            batch_size,
+            {"channel": channel} if channel else {},
+            "announcement deliveries",
         )
-        
-        try:
-            # Process with retry logic
-            processed, successful, failed, retried, dlq_count = self._process_queue_with_retry(
-                self.announcement_delivery_repo.execute_pending,
-                limit,
-                {"channel": channel} if channel else {}
-            )
-            
-            self.db.flush()
-            
-            duration = (datetime.utcnow() - start_time).total_seconds()
-            
-            # Determine status
-            if processed == 0:
-                status = ProcessingStatus.EMPTY
-            elif failed == 0:
-                status = ProcessingStatus.SUCCESS
-            elif successful > 0:
-                status = ProcessingStatus.PARTIAL
-            else:
-                status = ProcessingStatus.FAILED
-            
-            metrics = ProcessingMetrics(
-                queue_type=QueueType.ANNOUNCEMENT,
-                status=status,
-                total_processed=processed,
-                successful=successful,
-                failed=failed,
-                retried=retried,
-                moved_to_dlq=dlq_count,
-                duration_seconds=duration,
-                started_at=start_time,
-                completed_at=datetime.utcnow(),
-            )
-            
-            self._logger.info(
-                f"Announcement delivery: processed {processed} "
-                f"({successful} successful, {failed} failed) in {duration:.2f}s"
-            )
-            
-            return ServiceResult.success(
-                metrics,
-                message=f"Processed {processed} announcement deliveries"
-            )
-            
-        except Exception as e:
-            return self._handle_queue_exception(
-                e,
-                QueueType.ANNOUNCEMENT,
-                start_time
-            )
 
     def process_webhooks(
         self,
         batch_size: Optional[int] = None,
-        provider: Optional[str] = None,
     ) -> ServiceResult[ProcessingMetrics]:
         """
-        Consume third-party webhook events.
+        Deliver outbound webhooks from the outbox.
         
         Args:
             batch_size: Number of items to process
-            provider: Filter by specific provider
             
         Returns:
             ServiceResult with processing metrics
         """
+        return self._process_single(QueueType.WEBHOOK, batch_size, {}, "webhooks")
+
+    # -------------------------------------------------------------------------
+    # Lanes
+    # -------------------------------------------------------------------------
+
+    def _process_single(
+        self,
+        queue_type: QueueType,
+        batch_size: Optional[int],
+        filters: Dict[str, Any],
+        label: str,
+    ) -> ServiceResult[ProcessingMetrics]:
+        """Drain one queue and wrap its metrics in a ServiceResult."""
         start_time = datetime.utcnow()
         limit = min(
             batch_size or self.config.default_batch_size,
@@ -379,118 +503,343 @@ class QueueProcessorService(BaseService[NotificationQueue, NotificationQueueRepo
         )
         
         try:
-            # Process with retry logic
-            processed, successful, failed, retried, dlq_count = self._process_queue_with_retry(
-                self.third_party_repo.consume_webhooks,
-                limit,
-                {"provider": provider} if provider else {}
-            )
-            
-            self.db.flush()
-            
-            duration = (datetime.utcnow() - start_time).total_seconds()
-            
-            # Determine status
-            if processed == 0:
-                status = ProcessingStatus.EMPTY
-            elif failed == 0:
-                status = ProcessingStatus.SUCCESS
-            elif successful > 0:
-                status = ProcessingStatus.PARTIAL
-            else:
-                status = ProcessingStatus.FAILED
-            
-            metrics = ProcessingMetrics(
-                queue_type=QueueType.WEBHOOK,
-                status=status,
-                total_processed=processed,
-                successful=successful,
-                failed=failed,
-                retried=retried,
-                moved_to_dlq=dlq_count,
-                duration_seconds=duration,
-                started_at=start_time,
-                completed_at=datetime.utcnow(),
-            )
-            
-            self._logger.info(
-                f"Webhook processing: processed {processed} "
-                f"({successful} successful, {failed} failed) in {duration:.2f}s"
-            )
-            
+            metrics = self._drain([queue_type], limit, {queue_type: filters})
+            if not metrics:
+                return ServiceResult.failure(
+                    error=ServiceError(
+                        code=ErrorCode.INVALID_STATE,
+                        message=f"No handler registered for {queue_type.value} queue",
+                        severity=ErrorSeverity.ERROR,
+                        details={"queue_type": queue_type.value},
+                    )
+                )
             return ServiceResult.success(
-                metrics,
-                message=f"Processed {processed} webhooks"
+                metrics[0],
+                message=f"Processed {metrics[0].total_processed} {label}"
             )
-            
         except Exception as e:
-            return self._handle_queue_exception(
-                e,
-                QueueType.WEBHOOK,
-                start_time
-            )
+            return self._handle_queue_exception(e, queue_type, start_time)
 
-    def _process_queue_with_retry(
+    def _drain(
         self,
-        process_func: callable,
-        limit: int,
-        filters: Dict[str, Any],
-    ) -> Tuple[int, int, int, int, int]:
+        queue_types: List[QueueType],
+        max_items: int,
+        filters: Optional[Dict[QueueType, Dict[str, Any]]] = None,
+    ) -> List[ProcessingMetrics]:
         """
-        Process queue with retry logic and DLQ handling.
-        
-        Returns:
-            Tuple of (total_processed, successful, failed, retried, moved_to_dlq)
+        Run lane workers for the given queues until each is drained, the
+        item budget is spent or the processing timeout passes.
         """
-        total_processed = 0
-        successful = 0
-        failed = 0
-        retried = 0
-        dlq_count = 0
+        lanes = []
+        for queue_type in dict.fromkeys(queue_types):
+            if queue_type not in self._handlers:
+                self._logger.debug(f"No handler registered for {queue_type.value} queue, skipping")
+                continue
+            lanes.append(queue_type)
+        if not lanes:
+            return []
         
-        attempt = 0
-        while attempt <= self.config.max_retries:
-            try:
-                # Execute processing function
-                result = process_func(limit=limit, **filters)
-                
-                # Parse result based on return type
-                if isinstance(result, dict):
-                    total_processed = result.get("processed", 0)
-                    successful = result.get("successful", 0)
-                    failed = result.get("failed", 0)
-                    retried = result.get("retried", 0)
-                    dlq_count = result.get("dlq", 0)
-                elif isinstance(result, int):
-                    total_processed = result
-                    successful = result
-                else:
-                    total_processed = 0
+        concurrency = {
+            queue_type: max(self.config.queue_concurrency.get(queue_type, 1), 1)
+            for queue_type in lanes
+        }
+        scheduler = FairShareScheduler(
+            weights={q: self.config.queue_weights.get(q, 1) for q in lanes},
+            limits=concurrency,
+            total_slots=self.config.max_workers if self.config.enable_parallel else 1,
+            item_budget=max_items,
+        )
+        deadline = time.monotonic() + self.config.processing_timeout_seconds
+        
+        counts: Dict[QueueType, Counter] = defaultdict(Counter)
+        errors: Dict[QueueType, List[str]] = defaultdict(list)
+        started = {queue_type: datetime.utcnow() for queue_type in lanes}
+        finished: Dict[QueueType, datetime] = {}
+        lock = threading.Lock()
+        
+        def run(queue_type: QueueType, worker: int) -> None:
+            lane_counts, lane_errors = self._run_lane(
+                queue_type,
+                f"{queue_type.value}-{worker}",
+                (filters or {}).get(queue_type, {}),
+                scheduler,
+                deadline,
+            )
+            with lock:
+                counts[queue_type].update(lane_counts)
+                errors[queue_type].extend(lane_errors)
+                finished[queue_type] = datetime.utcnow()
+        
+        workers = [
+            (queue_type, worker)
+            for queue_type in lanes
+            for worker in range(concurrency[queue_type])
+        ]
+        with ThreadPoolExecutor(
+            max_workers=len(workers),
+            thread_name_prefix="queue-lane",
+        ) as executor:
+            for future in [executor.submit(run, *worker) for worker in workers]:
+                future.result()
+        
+        return [
+            self._metrics(
+                queue_type,
+                counts[queue_type],
+                started[queue_type],
+                finished.get(queue_type),
+                errors[queue_type],
+            )
+            for queue_type in lanes
+        ]
+
+    def _run_lane(
+        self,
+        queue_type: QueueType,
+        worker_id: str,
+        filters: Dict[str, Any],
+        scheduler: FairShareScheduler,
+        deadline: float,
+    ) -> Tuple[Counter, List[str]]:
+        """One lane worker: claim and handle batches on its own session."""
+        counts: Counter = Counter()
+        errors: List[str] = []
+        handler = self._handlers[queue_type]
+        batch_size = min(self.config.claim_batch_size, self.config.max_batch_size)
+        
+        session = self._new_session()
+        try:
+            lane = self.LANES[queue_type](session, worker_id, **filters)
+            while time.monotonic() < deadline:
+                granted = scheduler.acquire(queue_type, batch_size)
+                if not granted:
+                    break
                 
-                break
+                items: List[Any] = []
+                try:
+                    items = lane.claim(granted, self.config.lease_seconds)
+                    self._handle_batch(lane, handler, session, items, counts, errors)
+                finally:
+                    scheduler.release(queue_type, granted, len(items))
                 
+                if len(items) < granted:
+                    break
+        except Exception as e:
+            session.rollback()
+            errors.append(f"{type(e).__name__}: {e}")
+            self._logger.error(f"{worker_id} stopped: {e}", exc_info=True)
+        finally:
+            session.close()
+        
+        return counts, errors
+
+    def _handle_batch(
+        self,
+        lane: Any,
+        handler: QueueItemHandler,
+        session: Session,
+        items: List[Any],
+        counts: Counter,
+        errors: List[str],
+    ) -> None:
+        """Handle claimed items one by one, retrying or dead-lettering failures."""
+        succeeded = []
+        
+        for item in items:
+            item_id, attempt = lane.describe(item)
+            try:
+                # Savepoint per item so a failure keeps the batch's earlier work
+                with session.begin_nested():
+                    handler(item, session)
+                succeeded.append(item_id)
             except Exception as e:
-                attempt += 1
-                retried += 1
-                
-                if attempt <= self.config.max_retries:
-                    delay = self.config.retry_delay_seconds * (2 ** (attempt - 1))
-                    self._logger.warning(
-                        f"Queue processing failed (attempt {attempt}), "
-                        f"retrying in {delay}s: {str(e)}"
-                    )
-                    time.sleep(delay)
-                else:
-                    failed += 1
-                    self._logger.error(
-                        f"Queue processing failed after {attempt} attempts: {str(e)}"
-                    )
-                    
-                    # Move to DLQ if enabled
-                    if self.config.enable_dead_letter:
-                        dlq_count += 1
+                error = f"{type(e).__name__}: {e}"
+                dead = lane.fail(
+                    item,
+                    item_id,
+                    error,
+                    datetime.utcnow() + self._retry_delay(attempt),
+                )
+                counts["failed"] += 1
+                counts["moved_to_dlq" if dead else "retried"] += 1
+                if len(errors) < 50:
+                    errors.append(error)
+                log = self._logger.error if dead else self._logger.warning
+                log(f"Queue item {item_id} failed (attempt {attempt}): {e}")
         
-        return total_processed, successful, failed, retried, dlq_count
+        if succeeded:
+            lane.succeed(succeeded)
+        counts["processed"] += len(items)
+        counts["successful"] += len(succeeded)
+
+    # -------------------------------------------------------------------------
+    # Default Handlers
+    # -------------------------------------------------------------------------
+
+    def _send_queued_notification(self, item: NotificationQueue, session: Session) -> None:
+        """Send a queued notification to each of its recipient addresses."""
+        notification = item.notification
+        if notification is None:
+            raise LookupError(f"Notification for queue item {item.id} not found")
+        
+        channel = getattr(notification.notification_type, "value", notification.notification_type)
+        if channel == "in_app":
+            # In-app notifications are read from the database; nothing to send
+            recipients = []
+        elif channel == "email":
+            recipients = [notification.recipient_email] if notification.recipient_email else []
+        elif channel == "sms":
+            recipients = [notification.recipient_phone] if notification.recipient_phone else []
+        else:
+            recipients = self._device_tokens(session, notification.recipient_user_id)
+        
+        if channel != "in_app" and not recipients:
+            raise LookupError(f"Notification {notification.id} has no {channel} recipient")
+        
+        for recipient in recipients:
+            self._send(
+                channel,
+                notification_id=notification.id,
+                recipient=recipient,
+                subject=notification.subject,
+                content=notification.message_body,
+            )
+        
+        notification.status = NotificationStatus.SENT
+        notification.sent_at = datetime.utcnow()
+
+    def _send_announcement_delivery(self, delivery: Any, session: Session) -> None:
+        """Send one announcement delivery over its channel."""
+        if delivery.channel == "in_app":
+            return
+        
+        recipient = {
+            "email": delivery.recipient_email,
+            "sms": delivery.recipient_phone,
+            "push": delivery.recipient_device_token,
+        }.get(delivery.channel)
+        if not recipient:
+            raise LookupError(f"Delivery {delivery.id} has no {delivery.channel} recipient")
+        
+        announcement = delivery.announcement
+        self._send(
+            delivery.channel,
+            notification_id=delivery.id,
+            recipient=recipient,
+            subject=announcement.title,
+            content=announcement.content,
+        )
+
+    def _send(
+        self,
+        channel: str,
+        notification_id: Any,
+        recipient: str,
+        subject: Optional[str],
+        content: Optional[str],
+    ) -> None:
+        """
+        Send through the core notification provider for a channel.
+
+        The providers share process-wide clients (the pooled SMTP transport)
+        bound to the application loop, so sends are handed to that loop and
+        never run on a private loop of the lane thread.
+
+        Raises:
+            Exception: Whatever the provider raises, or RuntimeError if it
+                reports the message as not sent or no application loop is
+                running
+        """
+        if self.event_loop is None or not self.event_loop.is_running():
+            raise RuntimeError(
+                f"Cannot send {channel} {notification_id}: no running application event loop"
+            )
+
+        from app.core.notifications import (
+            Notification as OutgoingNotification,
+            NotificationChannel,
+            notification_manager,
+        )
+
+        senders = {
+            "email": notification_manager.email_provider.send_email,
+            "sms": notification_manager.sms_provider.send_sms,
+            "push": notification_manager.push_provider.send_push,
+        }
+        outgoing = OutgoingNotification(
+            id=str(notification_id),
+            recipient=recipient,
+            channel=NotificationChannel(channel),
+            subject=subject or "",
+            content=content or "",
+        )
+        sent = asyncio.run_coroutine_threadsafe(
+            senders[channel](outgoing), self.event_loop
+        ).result(timeout=self.config.processing_timeout_seconds)
+        if not sent:
+            raise RuntimeError(f"{channel} provider did not send {notification_id}")
+
+    @staticmethod
+    def _device_tokens(session: Session, user_id: Any) -> List[str]:
+        if user_id is None:
+            return []
+        rows = session.query(DeviceToken.device_token).filter(
+            DeviceToken.user_id == user_id,
+            DeviceToken.is_active.is_(True),
+            DeviceToken.token_invalid.is_(False),
+        ).all()
+        return [row.device_token for row in rows]
+
+    def _retry_delay(self, attempts: int) -> timedelta:
+        """Exponential backoff with jitter."""
+        ceiling = min(
+            self.config.retry_max_seconds,
+            self.config.retry_delay_seconds * 2 ** max(attempts - 1, 0),
+        )
+        return timedelta(seconds=random.uniform(ceiling / 2, ceiling))
+
+    def _metrics(
+        self,
+        queue_type: QueueType,
+        counts: Counter,
+        started_at: datetime,
+        completed_at: Optional[datetime] = None,
+        errors: Optional[List[str]] = None,
+    ) -> ProcessingMetrics:
+        """Build a queue's processing metrics from its counters."""
+        completed_at = completed_at or datetime.utcnow()
+        processed = counts["processed"]
+        successful = counts["successful"]
+        failed = counts["failed"]
+        
+        if processed == 0:
+            status = ProcessingStatus.FAILED if errors else ProcessingStatus.EMPTY
+        elif failed == 0:
+            status = ProcessingStatus.SUCCESS
+        elif successful > 0:
+            status = ProcessingStatus.PARTIAL
+        else:
+            status = ProcessingStatus.FAILED
+        
+        return ProcessingMetrics(
+            queue_type=queue_type,
+            status=status,
+            total_processed=processed,
+            successful=successful,
+            failed=failed,
+            retried=counts["retried"],
+            moved_to_dlq=counts["moved_to_dlq"],
+            duration_seconds=(completed_at - started_at).total_seconds(),
+            started_at=started_at,
+            completed_at=completed_at,
+            errors=errors or [],
+        )
+
+    def _new_session(self) -> Session:
+        if self._session_factory is None:
+            from app.config.database import SessionLocal
+            self._session_factory = SessionLocal
+        return self._session_factory()
 
     def get_queue_stats(
         self,
@@ -617,7 +966,7 @@ class QueueProcessorService(BaseService[NotificationQueue, NotificationQueueRepo
         
         return ServiceResult.failure(
             error=ServiceError(
-                code=ErrorCode.OPERATION_FAILED,
+                code=ErrorCode.INVALID_STATE,
                 message=f"Failed to process {queue_type.value} queue",
                 severity=ErrorSeverity.ERROR,
                 details={"error": str(exception)},
@@ -5,6 +5,8 @@ Runs due scheduled tasks across domains:
 - Announcements publish schedules (due now)
 - Custom report schedules
 - Subscription billing generation
+- Maintenance analytics rollup refresh
+- Transactional outbox relay (events and notifications)
 
 Performance improvements:
 - Priority-based task execution
@@ -15,7 +17,7 @@ Performance improvements:
 - Task dependency management
 """
 
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
@@ -30,6 +32,9 @@ from app.services.base.service_result import ServiceError, ErrorCode, ErrorSever
 from app.repositories.announcement import AnnouncementSchedulingRepository
 from app.repositories.analytics import CustomReportsRepository
 from app.repositories.subscription import SubscriptionBillingRepository
+from app.repositories.maintenance import MaintenanceAnalyticsRepository
+from app.repositories.base.outbox_repository import OutboxRepository
+from app.models.common.outbox import OutboxMessage
 from app.models.announcement.announcement_scheduling import AnnouncementSchedule
 from app.core1.logging import get_logger
 
@@ -39,6 +44,8 @@ class TaskType(str, Enum):
     ANNOUNCEMENT = "announcement"
     REPORT = "report"
     BILLING = "billing"
+    ANALYTICS = "analytics"
+    OUTBOX = "outbox"
 
 
 class TaskStatus(str, Enum):
@@ -117,11 +124,15 @@ class TaskSchedulerService(BaseService[AnnouncementSchedule, AnnouncementSchedul
         billing_repo: SubscriptionBillingRepository,
         db_session: Session,
         config: Optional[SchedulerConfig] = None,
+        maintenance_analytics_repo: Optional[MaintenanceAnalyticsRepository] = None,
     ):
         super().__init__(announcement_sched_repo, db_session)
         self.announcement_sched_repo = announcement_sched_repo
         self.reports_repo = reports_repo
         self.billing_repo = billing_repo
+        self.maintenance_analytics_repo = (
+            maintenance_analytics_repo or MaintenanceAnalyticsRepository(db_session)
+        )
         self.config = config or SchedulerConfig()
         self._logger = get_logger(self.__class__.__name__)
         self._running_tasks: set = set()
@@ -281,6 +292,24 @@ class TaskSchedulerService(BaseService[AnnouncementSchedule, AnnouncementSchedul
                 self._execute_billing_schedules
             ))
         
+        if TaskType.OUTBOX in task_types:
+            # Post-commit side effects should go out promptly
+            tasks.append((
+                TaskType.OUTBOX,
+                "outbox_relay",
+                TaskPriority.HIGH,
+                self._execute_outbox_relay
+            ))
+        
+        if TaskType.ANALYTICS in task_types:
+            # Rollups only need to keep up between runs
+            tasks.append((
+                TaskType.ANALYTICS,
+                "maintenance_rollups",
+                TaskPriority.LOW,
+                self._execute_maintenance_rollups
+            ))
+        
         # Sort by priority (highest first)
         tasks.sort(key=lambda x: x[2], reverse=True)
         
@@ -487,6 +516,43 @@ class TaskSchedulerService(BaseService[AnnouncementSchedule, AnnouncementSchedul
             self._logger.error(f"Error executing billing schedules: {str(e)}")
             raise
 
+    def _execute_outbox_relay(self) -> int:
+        """
+        Relay outbox events and notifications.
+        
+        Webhook messages are drained by the queue processor's webhook lane.
+        The relay commits as it claims and marks messages, so it runs on its
+        own session rather than the scheduler's shared one.
+        """
+        from app.config.database import SessionLocal
+        from app.services.background.outbox_relay_service import OutboxRelayService
+        
+        session = SessionLocal()
+        try:
+            result = OutboxRelayService(OutboxRepository(session), session).run(
+                channels=[OutboxMessage.CHANNEL_EVENT, OutboxMessage.CHANNEL_NOTIFICATION]
+            )
+        finally:
+            session.close()
+        if not result.is_success:
+            error = result.error.message if result.error else "outbox relay failed"
+            self._logger.error(f"Error relaying outbox: {error}")
+            raise RuntimeError(error)
+        
+        delivered = result.data["delivered"]
+        self._logger.info(f"Relayed {delivered} outbox messages")
+        return delivered
+
+    def _execute_maintenance_rollups(self) -> int:
+        """Fold changed maintenance data into the daily rollups."""
+        try:
+            count = self.maintenance_analytics_repo.refresh_daily_rollups(commit=False)
+            self._logger.info(f"Refreshed {count} maintenance rollups")
+            return count or 0
+        except Exception as e:
+            self._logger.error(f"Error refreshing maintenance rollups: {str(e)}")
+            raise
+
     def get_upcoming_tasks(
         self,
         hours_ahead: int = 24,
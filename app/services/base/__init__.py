@@ -28,7 +28,9 @@ from app.services.base.service_result import (
 
 from app.services.base.base_service import BaseService
 
-from app.services.base.audit_service import AuditService
+from app.services.base.buffered_writer import BufferedWriter
+
+from app.services.base.audit_service import AuditService, AuditLogBuffer
 
 from app.services.base.authorization_service import AuthorizationService
 
@@ -78,6 +80,8 @@ __all__ = [
     
     # Core Services
     "AuditService",
+    "AuditLogBuffer",
+    "BufferedWriter",
     "AuthorizationService",
     "CacheService",
     
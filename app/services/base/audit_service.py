@@ -1,17 +1,131 @@
 """
 Audit logging service.
+
+Audit records are buffered in memory and written by a background thread in
+multi-row INSERTs on its own session, so audited mutations don't pay for a
+second transaction. At most AUDIT_FLUSH_INTERVAL_SECONDS of records can be
+lost if the process dies.
 """
 
-from typing import Optional, Dict, Any, List
-from uuid import UUID
+import atexit
+from collections import deque
+from typing import Optional, Dict, Any, List, Callable, Hashable
+from uuid import UUID, uuid4
 from datetime import datetime, timedelta
 
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.logging import get_logger
 from app.services.base.base_service import BaseService
+from app.services.base.buffered_writer import BufferedWriter
 from app.services.base.service_result import ServiceResult, ServiceError, ErrorCode, ErrorSeverity
 from app.repositories.audit.audit_log_repository import AuditLogRepository
 from app.models.audit.audit_log import AuditLog
+from app.schemas.common.enums import AuditActionCategory
+
+logger = get_logger(__name__)
+
+
+class AuditLogBuffer(BufferedWriter):
+    """
+    Process-wide buffer that writes audit rows in batches.
+
+    The flusher thread wakes every ``flush_interval`` seconds, or as soon
+    as ``batch_size`` rows are waiting. Rows that fail to insert are
+    isolated from their batch, retried on later flushes and dead-lettered
+    after ``max_attempts``; rows arriving while ``max_pending`` rows are
+    waiting are dead-lettered rather than flushed on the caller's thread.
+    """
+
+    thread_name = "audit-log-flusher"
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        flush_interval: float = 2.0,
+        batch_size: int = 500,
+        max_pending: int = 10000,
+        max_attempts: int = 5,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            session_factory: Factory for flush sessions (defaults to SessionLocal)
+            flush_interval: Seconds between flushes; bounds the loss window
+            batch_size: Rows per INSERT, and backlog that triggers an early flush
+            max_pending: Backlog beyond which new rows are dead-lettered
+            max_attempts: Failed inserts after which a row is dead-lettered
+        """
+        super().__init__(
+            session_factory=session_factory,
+            flush_interval=flush_interval,
+            max_pending=max_pending,
+            max_attempts=max_attempts,
+        )
+        self.batch_size = batch_size
+        self._pending: deque = deque()
+        self._stats.update({"buffered": 0, "written": 0})
+
+    def add(self, row: Dict[str, Any]) -> None:
+        """
+        Buffer an audit row for the next flush.
+
+        Args:
+            row: AuditLog column values; every row must have the same keys
+        """
+        with self._lock:
+            accepted = self._has_room()
+            if accepted:
+                self._pending.append(row)
+                self._stats["buffered"] += 1
+            backlog = len(self._pending)
+
+        if not accepted:
+            self._dead_letter(row, "buffer full")
+        self._after_add(wake=backlog >= self.batch_size)
+
+    def flush(self) -> int:
+        """
+        Write every buffered row.
+
+        Returns:
+            Number of rows written
+        """
+        return self._flush_batches().get("written", 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buffer statistics."""
+        with self._lock:
+            return {**self._stats, "pending": len(self._pending)}
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        return [
+            self._pending.popleft()
+            for _ in range(min(self.batch_size, len(self._pending)))
+        ]
+
+    def _restore(self, items: List[Dict[str, Any]]) -> None:
+        self._pending.extendleft(reversed(items))
+
+    def _pending_count(self) -> int:
+        return len(self._pending)
+
+    def _write(self, session: Session, items: List[Dict[str, Any]]) -> Dict[str, int]:
+        return {"written": AuditLogRepository(session).bulk_insert_rows(items)}
+
+    def _item_key(self, item: Dict[str, Any]) -> Hashable:
+        return item["id"]
+
+
+audit_log_buffer = AuditLogBuffer(
+    flush_interval=settings.logging.AUDIT_FLUSH_INTERVAL_SECONDS,
+    batch_size=settings.logging.AUDIT_FLUSH_BATCH_SIZE,
+    max_pending=settings.logging.AUDIT_MAX_PENDING,
+    max_attempts=settings.logging.AUDIT_MAX_WRITE_ATTEMPTS,
+)
+atexit.register(audit_log_buffer.stop)
 
 
 class AuditService(BaseService[AuditLog, AuditLogRepository]):
@@ -19,8 +133,14 @@ class AuditService(BaseService[AuditLog, AuditLogRepository]):
     Convenience wrapper around AuditLogRepository with service-level helpers.
     """
 
-    def __init__(self, repository: AuditLogRepository, db_session: Session):
+    def __init__(
+        self,
+        repository: AuditLogRepository,
+        db_session: Session,
+        buffer: Optional[AuditLogBuffer] = None,
+    ):
         super().__init__(repository, db_session)
+        self.buffer = buffer or audit_log_buffer
 
     def log_action(
         self,
@@ -31,22 +151,20 @@ class AuditService(BaseService[AuditLog, AuditLogRepository]):
         category: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
         status: str = "success",
-    ) -> ServiceResult[AuditLog]:
+    ) -> ServiceResult[Dict[str, Any]]:
         try:
-            record = self.repository.create({
-                "actor_user_id": actor_user_id,
-                "action": action,
-                "entity_type": entity_type,
-                "entity_id": entity_id,
-                "category": category,
-                "context": context or {},
-                "status": status,
-                "timestamp": datetime.utcnow(),
-            })
-            self.db.commit()
-            return ServiceResult.success(record, message="Audit logged")
+            row = self._build_row(
+                actor_user_id,
+                action,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                category=category,
+                context=context,
+                status=status,
+            )
+            self.buffer.add(row)
+            return ServiceResult.success(row, message="Audit logged")
         except Exception as e:
-            self.db.rollback()
             return self._handle_exception(e, "log audit", entity_id or actor_user_id)
 
     def log_change(
@@ -56,27 +174,30 @@ class AuditService(BaseService[AuditLog, AuditLogRepository]):
         entity_id: str,
         changes: Dict[str, Any],
         context: Optional[Dict[str, Any]] = None,
-    ) -> ServiceResult[AuditLog]:
+    ) -> ServiceResult[Dict[str, Any]]:
         try:
-            record = self.repository.create({
-                "actor_user_id": actor_user_id,
-                "action": "update",
-                "entity_type": entity_type,
-                "entity_id": entity_id,
-                "category": "change",
-                "context": {
-                    "changes": changes,
-                    **(context or {}),
-                },
-                "status": "success",
-                "timestamp": datetime.utcnow(),
-            })
-            self.db.commit()
-            return ServiceResult.success(record, message="Change logged")
+            row = self._build_row(
+                actor_user_id,
+                "update",
+                entity_type=entity_type,
+                entity_id=entity_id,
+                category="change",
+                context=context,
+                changes=changes,
+            )
+            self.buffer.add(row)
+            return ServiceResult.success(row, message="Change logged")
         except Exception as e:
-            self.db.rollback()
             return self._handle_exception(e, "log change", entity_id)
 
+    def flush(self) -> ServiceResult[int]:
+        """Write buffered audit records now (e.g. before reading them back)."""
+        try:
+            written = self.buffer.flush()
+            return ServiceResult.success(written, metadata=self.buffer.get_stats())
+        except Exception as e:
+            return self._handle_exception(e, "flush audit logs")
+
     def get_actor_activity(
         self,
         actor_user_id: UUID,
@@ -100,4 +221,85 @@ class AuditService(BaseService[AuditLog, AuditLogRepository]):
             items = self.repository.get_entity_history(entity_type, entity_id, limit=limit)
             return ServiceResult.success(items, metadata={"count": len(items)})
         except Exception as e:
-            return self._handle_exception(e, "get entity history", entity_id)
\ No newline at end of file
+            return self._handle_exception(e, "get entity history", entity_id)
+
+    def archive_logs(
+        self,
+        older_than_days: int = 90,
+        archive_dir: Optional[str] = None,
+    ) -> ServiceResult[int]:
+        """
+        Archive audit logs older than the given age.
+
+        Monthly partitions are detached (and dumped when an archive
+        directory is set); a plain table is dumped to a compressed file
+        and deleted in batches.
+        """
+        try:
+            cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+            archived = self.repository.archive_old_logs(
+                cutoff,
+                archive_dir=archive_dir or settings.logging.AUDIT_ARCHIVE_DIR,
+            )
+            return ServiceResult.success(archived, message=f"Archived {archived} audit logs")
+        except Exception as e:
+            self.db.rollback()
+            return self._handle_exception(e, "archive audit logs")
+
+    def apply_retention(self, default_retention_days: int = 365) -> ServiceResult[int]:
+        """Delete audit logs past their retention period in batches."""
+        try:
+            deleted = self.repository.cleanup_by_retention_policy(default_retention_days)
+            return ServiceResult.success(deleted, message=f"Deleted {deleted} audit logs")
+        except Exception as e:
+            self.db.rollback()
+            return self._handle_exception(e, "apply audit retention")
+
+    @staticmethod
+    def _build_row(
+        actor_user_id: UUID,
+        action: str,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        category: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        status: str = "success",
+        changes: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Build an AuditLog row; every row has the same keys so batches insert together."""
+        try:
+            action_category = AuditActionCategory(category)
+        except ValueError:
+            action_category = AuditActionCategory.OTHER
+
+        # entity_id is a UUID column; keep other references in the metadata
+        # rather than writing a row the database will reject
+        entity_ref = None
+        if entity_id is not None and not isinstance(entity_id, UUID):
+            try:
+                entity_id = UUID(str(entity_id))
+            except ValueError:
+                entity_ref, entity_id = str(entity_id), None
+
+        now = datetime.utcnow()
+        return {
+            "id": uuid4(),
+            "user_id": actor_user_id,
+            "action_type": action,
+            "action_category": action_category,
+            "action_description": " ".join(
+                filter(None, [action, entity_type, str(entity_id or entity_ref or "")])
+            ),
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "old_values": {},
+            "new_values": changes or {},
+            "context_metadata": {
+                **(context or {}),
+                **({"category": category} if category else {}),
+                **({"entity_ref": entity_ref} if entity_ref else {}),
+            },
+            "status": status,
+            "created_at": now,
+            "updated_at": now,
+        }
@@ -175,6 +175,21 @@ class BaseService(ABC, Generic[TModel, TRepo]):
             # Log but don't raise - rollback errors should not mask original error
             self._logger.warning(f"Rollback failed: {e}")
 
+    def _add_outbox_message(
+        self,
+        channel: str,
+        topic: str,
+        payload: Dict[str, Any],
+    ) -> None:
+        """
+        Record a side effect (event, notification, webhook) in the
+        transactional outbox; it is delivered by the outbox relay only if
+        the current transaction commits.
+        """
+        from app.repositories.base.outbox_repository import OutboxRepository
+        
+        OutboxRepository(self.db).add_message(channel, topic, payload)
+
     # -------------------------------------------------------------------------
     # Common CRUD Operations
     # -------------------------------------------------------------------------
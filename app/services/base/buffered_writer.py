@@ -0,0 +1,274 @@
+"""
+Buffered background writers.
+
+Base class for process-wide buffers whose contents are written in batches
+by a background thread on its own session. When a batch fails, it is split
+in halves until the failing items are isolated, so one bad row cannot block
+the rest. Isolated items are retried on later flushes and dead-lettered
+after ``max_attempts``. Connection-level errors re-queue the whole batch,
+because no single item is at fault.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.orm import Session
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class BufferedWriter(ABC):
+    """
+    Base for buffers flushed in batches by a background thread.
+
+    Subclasses own the pending items and implement the hooks below. Hooks
+    marked "lock held" run under ``self._lock``:
+
+    - ``_take_batch``: remove and return the next batch (lock held)
+    - ``_restore``: put items back for a later flush (lock held)
+    - ``_pending_count``: number of buffered items (lock held)
+    - ``_write``: write items on a session without committing; returns
+      counters added to the buffer statistics
+    - ``_item_key``: stable key used to count an item's failed attempts
+
+    Once ``max_pending`` items are waiting, new items are dead-lettered
+    instead of being flushed inline on the caller's thread.
+    """
+
+    thread_name = "buffered-writer"
+
+    # Failures that say nothing about the rows being written
+    TRANSIENT_ERRORS = (OperationalError, InterfaceError)
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        flush_interval: float = 2.0,
+        max_pending: int = 10000,
+        max_attempts: int = 5,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            session_factory: Factory for flush sessions (defaults to SessionLocal)
+            flush_interval: Seconds between flushes; bounds the loss window
+            max_pending: Buffered items beyond which new items are dead-lettered
+            max_attempts: Failed writes after which an item is dead-lettered
+        """
+        self._session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+
+        self._attempts: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._stats: Dict[str, int] = {
+            "flushes": 0,
+            "failed_flushes": 0,
+            "retried": 0,
+            "dead_lettered": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Subclass hooks
+    # ------------------------------------------------------------------
+
+    @abstractmethod
+    def _take_batch(self) -> List[Any]:
+        """Remove and return the next batch (lock held)."""
+
+    @abstractmethod
+    def _restore(self, items: List[Any]) -> None:
+        """Put items back for a later flush (lock held)."""
+
+    @abstractmethod
+    def _pending_count(self) -> int:
+        """Number of buffered items (lock held)."""
+
+    @abstractmethod
+    def _write(self, session: Session, items: List[Any]) -> Dict[str, int]:
+        """Write items on a session without committing."""
+
+    @abstractmethod
+    def _item_key(self, item: Any) -> Hashable:
+        """Stable key used to count an item's failed attempts."""
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def _flush_batches(self) -> Dict[str, int]:
+        """
+        Write buffered items batch by batch until the buffer is empty or a
+        batch leaves items behind for a later attempt.
+
+        Returns:
+            Counters returned by ``_write``, summed over committed writes
+        """
+        totals: Dict[str, int] = {}
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = self._take_batch()
+                if not batch:
+                    return totals
+                if self._write_batch(batch, totals):
+                    # Retry leftovers on the next flush rather than spinning
+                    return totals
+
+    def _write_batch(self, batch: List[Any], totals: Dict[str, int]) -> bool:
+        """
+        Write a batch, bisecting it on failure to isolate failing items.
+
+        Returns:
+            True if any item was put back for a later flush
+        """
+        pending = [batch]
+        requeue: List[Any] = []
+        failed: List[Tuple[Any, Exception]] = []
+        transient: Optional[Exception] = None
+
+        while pending:
+            items = pending.pop()
+            if transient is not None:
+                requeue.extend(items)
+                continue
+            try:
+                counts = self._write_committed(items)
+            except self.TRANSIENT_ERRORS as e:
+                transient = e
+                requeue.extend(items)
+                continue
+            except Exception as e:
+                if len(items) == 1:
+                    failed.append((items[0], e))
+                else:
+                    middle = len(items) // 2
+                    pending.append(items[middle:])
+                    pending.append(items[:middle])
+                continue
+
+            with self._lock:
+                self._stats["flushes"] += 1
+                for name, value in counts.items():
+                    totals[name] = totals.get(name, 0) + value
+                    self._stats[name] = self._stats.get(name, 0) + value
+                if self._attempts:
+                    for item in items:
+                        self._attempts.pop(self._item_key(item), None)
+
+        dead: List[Tuple[Any, Exception]] = []
+        with self._lock:
+            if transient is not None or failed:
+                self._stats["failed_flushes"] += 1
+            for item, error in failed:
+                key = self._item_key(item)
+                attempts = self._attempts.get(key, 0) + 1
+                if attempts >= self.max_attempts:
+                    self._attempts.pop(key, None)
+                    dead.append((item, error))
+                else:
+                    self._attempts[key] = attempts
+                    requeue.append(item)
+            if requeue:
+                self._restore(requeue)
+                self._stats["retried"] += len(requeue)
+
+        if transient is not None:
+            logger.error(
+                f"{self.thread_name} flush failed, {len(requeue)} items re-queued: {transient}"
+            )
+        elif failed:
+            logger.warning(
+                f"{self.thread_name} isolated {len(failed)} failing items, "
+                f"{len(failed) - len(dead)} re-queued: {failed[0][1]}"
+            )
+        for item, error in dead:
+            self._dead_letter(item, f"failed {self.max_attempts} writes: {error}")
+
+        return bool(requeue)
+
+    def _write_committed(self, items: List[Any]) -> Dict[str, int]:
+        session = self._new_session()
+        try:
+            counts = self._write(session, items)
+            session.commit()
+            return counts
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _dead_letter(self, item: Any, reason: str) -> None:
+        """Drop an item that cannot be written, keeping it in the error log."""
+        with self._lock:
+            self._stats["dead_lettered"] += 1
+        logger.error(
+            f"{self.thread_name} dead-lettered an item ({reason})",
+            extra={"dead_letter": repr(item)},
+        )
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background flusher thread."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=self.thread_name, daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the flusher thread and write whatever is still buffered."""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._flush_batches()
+
+    def _has_room(self) -> bool:
+        """Whether another item may be buffered (lock held)."""
+        return self._pending_count() < self.max_pending
+
+    def _after_add(self, wake: bool = False) -> None:
+        """Start the flusher if needed and optionally wake it early."""
+        if self._thread is None or not self._thread.is_alive():
+            self.start()
+        if wake:
+            self._wakeup.set()
+
+    def _run(self) -> None:
+        """Flush loop."""
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            started = time.monotonic()
+            counts = self._flush_batches()
+            if any(counts.values()):
+                logger.debug(
+                    f"{self.thread_name} flushed {counts} in "
+                    f"{(time.monotonic() - started) * 1000:.1f}ms"
+                )
+
+    def _new_session(self) -> Session:
+        if self._session_factory is None:
+            from app.config.database import SessionLocal
+            self._session_factory = SessionLocal
+        return self._session_factory()
@@ -1,13 +1,22 @@
 """
 Cache service with Redis backend for high-performance data caching.
+
+Every stored key embeds the generation numbers of its namespace and of each
+ancestor prefix (``hostel``, ``hostel:42``, ...). Invalidating ``hostel:42:*``
+is a single INCR of that prefix's generation: old entries become
+unreachable at once and age out through their TTL, or are reclaimed earlier
+by the optional SCAN-based sweeper. Generations are read with one MGET and
+memoized for the duration of a request.
 """
 
-from typing import Optional, Callable, Any, Dict, List, TypeVar, Generic
+from typing import Optional, Callable, Any, Dict, List, Sequence, TypeVar, Generic
 import json
 import functools
 import hashlib
+import threading
 from datetime import timedelta
 
+from app.core.cache import cache_generations
 from app.core.logging import get_logger
 from app.config.redis import RedisManager
 
@@ -22,9 +31,12 @@ class CacheService:
     - TTL support
     - Bulk operations
     - Cache warming
-    - Invalidation patterns
+    - O(1) prefix invalidation via generation counters
     """
 
+    GENERATION_MARKER = "__gen__"
+    SWEEP_BATCH_SIZE = 500
+
     def __init__(
         self,
         redis: RedisManager,
@@ -43,6 +55,65 @@ class CacheService:
         self.namespace = namespace
         self.default_ttl = default_ttl
         self._logger = get_logger(self.__class__.__name__)
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweeper_stop = threading.Event()
+
+    # -------------------------------------------------------------------------
+    # Key Generations
+    # -------------------------------------------------------------------------
+
+    def _generation_key(self, scope: str) -> str:
+        """Redis key holding the generation of a key prefix ("" is the namespace)"""
+        return f"{self.namespace}:{self.GENERATION_MARKER}:{scope}"
+
+    @staticmethod
+    def _scopes(key: str) -> List[str]:
+        """Namespace root plus every ancestor prefix of a key"""
+        segments = key.split(":")
+        return [""] + [":".join(segments[:i]) for i in range(1, len(segments))]
+
+    def _generations(self, scopes: Sequence[str]) -> Dict[str, int]:
+        """
+        Current generations for scopes, read with one MGET.
+
+        Inside a request the values are memoized so each generation is
+        fetched once.
+        """
+        memo = cache_generations.get()
+        generation_keys = [self._generation_key(scope) for scope in scopes]
+        missing = [
+            k for k in dict.fromkeys(generation_keys)
+            if memo is None or k not in memo
+        ]
+
+        fetched: Dict[str, int] = {}
+        if missing:
+            values = self.redis.mget(missing)
+            fetched = {k: int(v or 0) for k, v in zip(missing, values)}
+            if memo is not None:
+                memo.update(fetched)
+
+        source = memo if memo is not None else fetched
+        return {scope: source[k] for scope, k in zip(scopes, generation_keys)}
+
+    def _versioned(self, key: str, generations: Dict[str, int]) -> str:
+        version = ".".join(str(generations[scope]) for scope in self._scopes(key))
+        return f"{self.namespace}:{key}@{version}"
+
+    def _keys(self, keys: Sequence[str]) -> List[str]:
+        """Build versioned cache keys for several raw keys with one MGET"""
+        scopes = list(dict.fromkeys(s for key in keys for s in self._scopes(key)))
+        generations = self._generations(scopes)
+        return [self._versioned(key, generations) for key in keys]
+
+    def _bump_generation(self, scope: str) -> int:
+        """Invalidate every key under a prefix by incrementing its generation"""
+        generation_key = self._generation_key(scope)
+        generation = self.redis.incr(generation_key)
+        memo = cache_generations.get()
+        if memo is not None:
+            memo[generation_key] = generation
+        return generation
 
     # -------------------------------------------------------------------------
     # Core Cache Operations
@@ -50,7 +121,7 @@ class CacheService:
 
     def _key(self, key: str) -> str:
         """
-        Build namespaced cache key.
+        Build namespaced, generation-versioned cache key.
         
         Args:
             key: Raw key
@@ -58,7 +129,7 @@ class CacheService:
         Returns:
             Namespaced key
         """
-        return f"{self.namespace}:{key}"
+        return self._keys([key])[0]
 
     def get(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
         """
@@ -210,7 +281,7 @@ class CacheService:
         result = {}
         
         try:
-            namespaced_keys = [self._key(k) for k in keys]
+            namespaced_keys = self._keys(keys)
             values = self.redis.mget(namespaced_keys)
             
             for key, value in zip(keys, values):
@@ -265,7 +336,7 @@ class CacheService:
             if not keys:
                 return 0
             
-            namespaced_keys = [self._key(k) for k in keys]
+            namespaced_keys = self._keys(keys)
             deleted = self.redis.delete(*namespaced_keys)
             
             self._logger.debug(f"Cache delete_many: {deleted}/{len(keys)} deleted")
@@ -283,20 +354,29 @@ class CacheService:
         """
         Delete all keys matching a pattern.
         
+        ``prefix:*`` and ``*`` are invalidated in O(1) by bumping the
+        prefix generation; the orphaned entries expire through their TTL.
+        Other glob patterns are deleted with an incremental SCAN.
+        
         Args:
             pattern: Key pattern (supports wildcards)
             
         Returns:
-            Number of deleted keys
+            Number of keys deleted immediately (0 for generation bumps)
         """
         try:
-            full_pattern = self._key(pattern)
-            keys = self.redis.keys(full_pattern)
+            if pattern == "*":
+                self._bump_generation("")
+                self._logger.info(f"Cache namespace '{self.namespace}' invalidated")
+                return 0
             
-            if not keys:
+            prefix = pattern[:-2] if pattern.endswith(":*") else None
+            if prefix and not any(c in prefix for c in "*?[]"):
+                self._bump_generation(prefix)
+                self._logger.info(f"Cache prefix invalidated: '{prefix}'")
                 return 0
             
-            deleted = self.redis.delete(*keys)
+            deleted = self._scan_delete(f"{self.namespace}:{pattern}@*")
             self._logger.info(f"Cache pattern delete: {deleted} keys for pattern '{pattern}'")
             return deleted
             
@@ -304,15 +384,39 @@ class CacheService:
             self._logger.error(f"Cache delete_pattern error: {e}")
             return 0
 
+    def _scan_delete(self, match: str, predicate: Optional[Callable[[str], bool]] = None) -> int:
+        """
+        Delete keys matching a glob with SCAN + UNLINK in small batches.
+        
+        Args:
+            match: Full Redis glob
+            predicate: Optional extra filter on each scanned key
+            
+        Returns:
+            Number of deleted keys
+        """
+        deleted = 0
+        batch: List[str] = []
+        for key in self.redis.scan_iter(match=match, count=self.SWEEP_BATCH_SIZE):
+            if predicate is not None and not predicate(key):
+                continue
+            batch.append(key)
+            if len(batch) >= self.SWEEP_BATCH_SIZE:
+                deleted += self.redis.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += self.redis.unlink(*batch)
+        return deleted
+
     def invalidate_namespace(self, sub_namespace: str) -> int:
         """
-        Invalidate all keys under a sub-namespace.
+        Invalidate all keys under a sub-namespace with one INCR.
         
         Args:
             sub_namespace: Sub-namespace to invalidate
             
         Returns:
-            Number of invalidated keys
+            Number of keys deleted immediately (always 0)
         """
         pattern = f"{sub_namespace}:*"
         return self.delete_pattern(pattern)
@@ -444,18 +548,80 @@ class CacheService:
             True if successful
         """
         try:
-            pattern = self._key("*")
-            keys = self.redis.keys(pattern)
-            
-            if keys:
-                self.redis.delete(*keys)
-                self._logger.warning(f"Cache cleared: {len(keys)} keys in namespace '{self.namespace}'")
-            
+            self._bump_generation("")
+            self._logger.warning(f"Cache cleared: namespace '{self.namespace}'")
             return True
         except Exception as e:
             self._logger.error(f"Cache clear_all error: {e}")
             return False
 
+    # -------------------------------------------------------------------------
+    # Stale Key Sweeping
+    # -------------------------------------------------------------------------
+
+    def _is_stale(self, full_key: str, generations: Dict[str, int]) -> bool:
+        """Whether a stored key was written under an outdated generation"""
+        body, sep, version = full_key[len(self.namespace) + 1:].rpartition("@")
+        if not sep:
+            return False
+        scopes = self._scopes(body)
+        missing = [scope for scope in scopes if scope not in generations]
+        if missing:
+            generations.update(self._generations(missing))
+        current = ".".join(str(generations[scope]) for scope in scopes)
+        return version != current
+
+    def sweep_stale_keys(self) -> int:
+        """
+        Reclaim memory held by entries of invalidated generations.
+        
+        Walks the namespace with SCAN so the server is never blocked.
+        
+        Returns:
+            Number of deleted keys
+        """
+        generations: Dict[str, int] = {}
+        marker = f"{self.namespace}:{self.GENERATION_MARKER}:"
+        try:
+            deleted = self._scan_delete(
+                f"{self.namespace}:*",
+                predicate=lambda key: (
+                    not key.startswith(marker) and self._is_stale(key, generations)
+                ),
+            )
+            if deleted:
+                self._logger.info(f"Cache sweep removed {deleted} stale keys")
+            return deleted
+        except Exception as e:
+            self._logger.error(f"Cache sweep error: {e}")
+            return 0
+
+    def start_sweeper(self, interval_seconds: int = 600) -> None:
+        """
+        Run sweep_stale_keys periodically on a daemon thread.
+        
+        Args:
+            interval_seconds: Pause between sweeps
+        """
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        self._sweeper_stop.clear()
+
+        def run() -> None:
+            while not self._sweeper_stop.wait(interval_seconds):
+                self.sweep_stale_keys()
+
+        self._sweeper = threading.Thread(
+            target=run,
+            name=f"cache-sweeper-{self.namespace}",
+            daemon=True,
+        )
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        """Stop the background sweeper"""
+        self._sweeper_stop.set()
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics.
@@ -464,19 +630,33 @@ class CacheService:
             Dictionary with cache stats
         """
         try:
-            pattern = self._key("*")
-            keys = self.redis.keys(pattern)
-            
+            marker = f"{self.namespace}:{self.GENERATION_MARKER}:"
+            total_keys = 0
             total_size = 0
-            for key in keys:
-                try:
-                    total_size += len(self.redis.get(key) or b'')
-                except:
-                    pass
+            batch: List[str] = []
+            
+            def measure(keys: List[str]) -> int:
+                pipe = self.redis.pipeline(transaction=False)
+                for key in keys:
+                    pipe.strlen(key)
+                return sum(pipe.execute())
+            
+            for key in self.redis.scan_iter(
+                match=f"{self.namespace}:*", count=self.SWEEP_BATCH_SIZE
+            ):
+                if key.startswith(marker):
+                    continue
+                total_keys += 1
+                batch.append(key)
+                if len(batch) >= self.SWEEP_BATCH_SIZE:
+                    total_size += measure(batch)
+                    batch = []
+            if batch:
+                total_size += measure(batch)
             
             return {
                 "namespace": self.namespace,
-                "total_keys": len(keys),
+                "total_keys": total_keys,
                 "total_size_bytes": total_size,
                 "default_ttl": self.default_ttl,
             }
@@ -4,10 +4,11 @@ Transaction manager utilities for service layer operations.
 
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Iterator, Optional, Callable, Any, List
+from typing import Iterator, Optional, Callable, Any, Dict, List
 from datetime import datetime
 from uuid import uuid4
 
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -25,6 +26,7 @@ class TransactionContext:
     completed_at: Optional[datetime] = None
     error: Optional[Exception] = None
     savepoints: List[str] = field(default_factory=list)
+    outbox: List[Dict[str, Any]] = field(default_factory=list)
     
     @property
     def duration_ms(self) -> Optional[float]:
@@ -48,6 +50,7 @@ class TransactionManager:
     - Transaction monitoring
     - Error handling and logging
     - Transaction hooks
+    - Transactional outbox for post-commit side effects
     """
 
     def __init__(self, db_session: Session):
@@ -65,6 +68,10 @@ class TransactionManager:
         self._before_commit_hooks: List[Callable[[TransactionContext], None]] = []
         self._after_commit_hooks: List[Callable[[TransactionContext], None]] = []
         self._on_rollback_hooks: List[Callable[[TransactionContext, Exception], None]] = []
+        
+        # Staged outbox messages are written from the session's own
+        # before_commit event, so a direct db.commit() writes them too
+        self._outbox_listening = False
 
     # -------------------------------------------------------------------------
     # Core Transaction Management
@@ -80,7 +87,9 @@ class TransactionManager:
         Start a new transaction.
         
         Args:
-            auto_commit: Automatically commit on success
+            auto_commit: Automatically commit on success; otherwise staged
+                outbox messages are flushed into the open transaction when
+                the block exits, for the caller to commit
             isolation_level: Transaction isolation level
             
         Yields:
@@ -112,6 +121,11 @@ class TransactionManager:
             
             if auto_commit and not ctx.committed and not ctx.rolled_back:
                 self._commit(ctx)
+            elif ctx.outbox:
+                # The caller commits later, after ctx is gone; write the
+                # staged messages into the open transaction now
+                self._stage_outbox(self.db, ctx)
+                self.db.flush()
                 
         except Exception as exc:
             ctx.error = exc
@@ -249,6 +263,78 @@ class TransactionManager:
                 exc_info=True
             )
 
+    # -------------------------------------------------------------------------
+    # Transactional Outbox
+    # -------------------------------------------------------------------------
+
+    def add_outbox_message(
+        self,
+        channel: str,
+        topic: str,
+        payload: Dict[str, Any],
+        available_at: Optional[datetime] = None,
+        max_attempts: int = 10,
+    ) -> None:
+        """
+        Schedule a side effect to be delivered after the current transaction
+        commits.
+        
+        The message is written to the outbox table in the same transaction,
+        so it is delivered at least once if and only if the transaction
+        commits.
+        
+        Args:
+            channel: Delivery channel ("event", "notification", "webhook")
+            topic: Event type or routing key
+            payload: JSON-serializable payload
+            available_at: Earliest delivery time
+            max_attempts: Attempts before dead-lettering
+            
+        Raises:
+            RuntimeError: If no transaction is active
+        """
+        if not self._active_transactions:
+            raise RuntimeError("add_outbox_message requires an active transaction")
+        
+        if not self._outbox_listening:
+            event.listen(self.db, "before_commit", self._write_outbox)
+            event.listen(self.db, "after_rollback", self._discard_outbox)
+            self._outbox_listening = True
+        
+        self._active_transactions[-1].outbox.append({
+            "channel": channel,
+            "topic": topic,
+            "payload": payload,
+            "available_at": available_at,
+            "max_attempts": max_attempts,
+        })
+
+    def _write_outbox(self, session: Session) -> None:
+        """
+        Write staged outbox messages into the committing transaction.
+        
+        Runs on the session's before_commit event; an error here aborts the
+        commit, so the messages commit if and only if the transaction does.
+        """
+        for ctx in self._active_transactions:
+            if ctx.outbox:
+                self._stage_outbox(session, ctx)
+    
+    def _stage_outbox(self, session: Session, ctx: TransactionContext) -> None:
+        """Add a transaction's staged outbox messages to the session."""
+        from app.repositories.base.outbox_repository import OutboxRepository
+        
+        OutboxRepository(session).add_messages(ctx.outbox)
+        self._logger.debug(
+            f"Wrote {len(ctx.outbox)} outbox message(s) for transaction {ctx.transaction_id}"
+        )
+        ctx.outbox.clear()
+    
+    def _discard_outbox(self, session: Session) -> None:
+        """Drop staged outbox messages when the transaction rolls back."""
+        for ctx in self._active_transactions:
+            ctx.outbox.clear()
+
     # -------------------------------------------------------------------------
     # Hook Management
     # -------------------------------------------------------------------------
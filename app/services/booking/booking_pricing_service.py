@@ -7,6 +7,7 @@ Enhanced with:
 - Tax calculation
 - Price breakdown
 - Quote caching
+- Compiled per-hostel pricing rules (no queries per quote once warm)
 """
 
 from typing import Optional, Dict, Any, List
@@ -19,7 +20,11 @@ from sqlalchemy.orm import Session
 
 from app.services.base import BaseService, ServiceResult, ServiceError, ErrorCode, ErrorSeverity
 from app.repositories.booking import BookingRepository
-from app.repositories.fee_structure import FeeStructureRepository, FeeCalculationRepository
+from app.repositories.fee_structure import (
+    FeeStructureRepository,
+    FeeCalculationRepository,
+    pricing_rules,
+)
 from app.models.booking.booking import Booking as BookingModel
 from app.schemas.booking.booking_base import BookingCreate
 from app.schemas.fee_structure import FeeCalculation
@@ -109,10 +114,12 @@ class BookingPricingService(BaseService[BookingModel, BookingRepository]):
         check_in_date: date,
         duration_months: int,
         student_id: Optional[UUID] = None,
+        rule_set_version: Optional[int] = None,
     ) -> str:
         """Generate cache key for quote."""
         key_parts = [
             str(hostel_id),
+            str(rule_set_version),
             room_type,
             str(check_in_date),
             str(duration_months)
@@ -155,9 +162,11 @@ class BookingPricingService(BaseService[BookingModel, BookingRepository]):
             keys_to_remove = [k for k in self._quote_cache.keys() if k.startswith(str(hostel_id))]
             for key in keys_to_remove:
                 del self._quote_cache[key]
+            pricing_rules.invalidate([hostel_id])
             self._logger.info(f"Cleared pricing cache for hostel {hostel_id}")
         else:
             self._quote_cache.clear()
+            pricing_rules.invalidate()
             self._logger.info("Cleared all pricing cache")
 
     # -------------------------------------------------------------------------
@@ -173,10 +182,14 @@ class BookingPricingService(BaseService[BookingModel, BookingRepository]):
         student_id: Optional[UUID] = None,
         discount_code: Optional[str] = None,
         use_cache: bool = True,
+        is_new_student: bool = False,
     ) -> ServiceResult[Dict[str, Any]]:
         """
         Calculate a quote for given inputs, using current fee structure and rules.
         
+        Quotes are priced from the hostel's compiled pricing rule set, so
+        no queries are issued once the rule set is warm.
+        
         Args:
             hostel_id: UUID of hostel
             room_type: Type of room
@@ -185,6 +198,7 @@ class BookingPricingService(BaseService[BookingModel, BookingRepository]):
             student_id: Optional student ID for special pricing
             discount_code: Optional discount code
             use_cache: Whether to use cached quotes
+            is_new_student: Whether new-student discounts apply
             
         Returns:
             ServiceResult containing quote details or error
@@ -197,12 +211,16 @@ class BookingPricingService(BaseService[BookingModel, BookingRepository]):
             if validation_error:
                 return ServiceResult.failure(validation_error)
 
-            # Check cache (only if no discount code)
+            rule_set = pricing_rules.get(self.db, hostel_id)
+
+            # Check cache (only if no discount code); keyed by rule set
+            # version so rule changes never serve stale quotes
             cache_key = None
             if use_cache and not discount_code:
                 cache_key = self._get_cache_key(
-                    hostel_id, room_type, check_in_date, duration_months, student_id
-                )
+                    hostel_id, room_type, check_in_date, duration_months,
+                    student_id, rule_set.version
+                ) + f":{int(is_new_student)}"
                 cached_quote = self._get_from_cache(cache_key)
                 if cached_quote is not None:
                     return ServiceResult.success(
@@ -223,12 +241,15 @@ class BookingPricingService(BaseService[BookingModel, BookingRepository]):
 
             start_time = datetime.utcnow()
 
-            # Find applicable fee structure
-            structure = self.fee_structure_repo.find_applicable(
-                hostel_id, room_type, check_in_date
+            calc = rule_set.quote(
+                room_type,
+                check_in_date,
+                duration_months,
+                is_new_student=is_new_student,
+                discount_code=discount_code
             )
 
-            if not structure:
+            if calc is None:
                 return ServiceResult.failure(
                     ServiceError(
                         code=ErrorCode.NOT_FOUND,
@@ -242,15 +263,6 @@ class BookingPricingService(BaseService[BookingModel, BookingRepository]):
                     )
                 )
 
-            # Calculate quote
-            calc = self.fee_calc_repo.calculate_quote(
-                structure,
-                check_in_date,
-                duration_months,
-                student_id=student_id,
-                discount_code=discount_code
-            )
-
             # Cache result (if applicable)
             if cache_key and use_cache and not discount_code:
                 self._set_cache(cache_key, calc)
@@ -478,15 +490,20 @@ class BookingPricingService(BaseService[BookingModel, BookingRepository]):
         room_types: List[str],
         check_in_date: date,
         duration_months: int,
+        is_new_student: bool = False,
     ) -> ServiceResult[Dict[str, Any]]:
         """
         Compare prices across multiple room types.
         
+        All room types are priced from one compiled rule set in a single
+        pass rather than one quote round trip per room type.
+        
         Args:
             hostel_id: UUID of hostel
             room_types: List of room types to compare
             check_in_date: Check-in date
             duration_months: Duration in months
+            is_new_student: Whether new-student discounts apply
             
         Returns:
             ServiceResult containing price comparison
@@ -519,28 +536,30 @@ class BookingPricingService(BaseService[BookingModel, BookingRepository]):
                 }
             )
 
+            for room_type in room_types:
+                validation_error = self._validate_quote_params(
+                    hostel_id, room_type, check_in_date, duration_months
+                )
+                if validation_error:
+                    return ServiceResult.failure(validation_error)
+
+            rule_set = pricing_rules.get(self.db, hostel_id)
+            quotes = rule_set.quote_many(
+                room_types, check_in_date, duration_months, is_new_student=is_new_student
+            )
+
             comparison = {
                 "hostel_id": str(hostel_id),
                 "check_in_date": str(check_in_date),
                 "duration_months": duration_months,
-                "room_types": []
+                "rule_set_version": rule_set.version,
+                "room_types": [
+                    {"room_type": room_type, "pricing": pricing}
+                    for room_type, pricing in quotes.items()
+                    if pricing is not None
+                ]
             }
 
-            for room_type in room_types:
-                quote_result = self.quote(
-                    hostel_id,
-                    room_type,
-                    check_in_date,
-                    duration_months,
-                    use_cache=True
-                )
-
-                if quote_result.success:
-                    comparison["room_types"].append({
-                        "room_type": room_type,
-                        "pricing": quote_result.data
-                    })
-
             return ServiceResult.success(comparison)
 
         except Exception as e:
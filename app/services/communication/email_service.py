@@ -26,6 +26,7 @@ from app.schemas.notification.email_notification import (
     EmailSchedule,
 )
 from app.schemas.notification.notification_template import TemplatePreview, TemplateResponse
+from app.services.notification.email_notification_service import EmailNotificationService
 
 
 logger = logging.getLogger(__name__)
@@ -55,6 +56,7 @@ class EmailService(BaseService[EmailNotificationModel, EmailNotificationReposito
     MAX_RECIPIENTS_PER_EMAIL = 50
     MAX_SUBJECT_LENGTH = 255
     MAX_BULK_BATCH_SIZE = 10000
+    BULK_DISPATCH_SIZE = 1000
 
     def __init__(
         self,
@@ -64,6 +66,7 @@ class EmailService(BaseService[EmailNotificationModel, EmailNotificationReposito
     ):
         super().__init__(repository, db_session)
         self.template_repo = template_repo
+        self.email_notifications = EmailNotificationService(repository)
         self._logger = logger
 
     def send(
@@ -144,13 +147,24 @@ class EmailService(BaseService[EmailNotificationModel, EmailNotificationReposito
         )
 
         try:
-            stats = self.repository.send_bulk(request)
-            self.db.commit()
+            # Rows are created and committed per chunk, then sent directly
+            # over the pooled SMTP transport when it is running
+            email_ids: List[UUID] = []
+            for start in range(0, len(request.recipients), self.BULK_DISPATCH_SIZE):
+                chunk = request.model_copy(update={
+                    "recipients": request.recipients[start:start + self.BULK_DISPATCH_SIZE]
+                })
+                email_ids.extend(
+                    self.email_notifications.send_bulk_email(self.db, chunk)
+                )
             
-            payload = self._serialize_stats(stats)
+            payload = {
+                "total_queued": len(email_ids),
+                "email_ids": [str(email_id) for email_id in email_ids],
+            }
             
             self._logger.info(
-                f"Bulk email queued: {payload.get('total_queued', 0)} messages"
+                f"Bulk email queued: {payload['total_queued']} messages"
             )
             
             return ServiceResult.success(
@@ -22,6 +22,7 @@ from app.services.base import (
     ErrorSeverity
 )
 from app.repositories.hostel import HostelPolicyRepository
+from app.models.common.outbox import OutboxMessage
 from app.models.hostel.hostel_policy import (
     HostelPolicy as HostelPolicyModel,
     PolicyAcknowledgment as PolicyAcknowledgmentModel,
@@ -594,11 +595,11 @@ class HostelPolicyService(BaseService[HostelPolicyModel, HostelPolicyRepository]
                 violation.metadata['violation_count'] = violation_count
                 violation.metadata['is_repeat_offender'] = violation_count > 1
             
-            self.db.commit()
-            
-            # Trigger notifications if enabled
+            # Notify through the outbox so the event commits with the violation
             if auto_notify:
-                self._notify_violation(violation)
+                self._notify_violation(violation, violation_count)
+            
+            self.db.commit()
             
             logger.info(f"Policy violation recorded: {violation.id}")
             return ServiceResult.success(violation, message=SUCCESS_VIOLATION_RECORDED)
@@ -847,14 +848,24 @@ class HostelPolicyService(BaseService[HostelPolicyModel, HostelPolicyRepository]
             logger.error(f"Error counting violations: {str(e)}")
             return 0
 
-    def _notify_violation(self, violation: PolicyViolationModel) -> None:
-        """Send notifications for a violation."""
-        try:
-            # This is a placeholder for notification logic
-            # Integrate with your notification service
-            logger.info(f"Sending violation notifications for: {violation.id}")
-        except Exception as e:
-            logger.error(f"Error sending violation notifications: {str(e)}")
+    def _notify_violation(
+        self,
+        violation: PolicyViolationModel,
+        violation_count: int,
+    ) -> None:
+        """Stage a violation event in the outbox for post-commit delivery."""
+        self._add_outbox_message(
+            OutboxMessage.CHANNEL_EVENT,
+            "policy.violation_recorded",
+            {
+                "violation_id": str(violation.id),
+                "policy_id": str(violation.policy_id),
+                "hostel_id": str(violation.hostel_id),
+                "student_id": str(violation.student_id),
+                "severity": violation.severity,
+                "violation_count": violation_count,
+            },
+        )
 
     def _not_found_error(
         self,
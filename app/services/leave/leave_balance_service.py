@@ -11,7 +11,7 @@ Manages leave balances, quotas, and usage analytics including:
 Version: 2.0.0
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from uuid import UUID
 from datetime import date
 import logging
@@ -538,6 +538,129 @@ class LeaveBalanceService(BaseService[LeaveBalanceModel, LeaveBalanceRepository]
             )
             return self._handle_exception(e, "get hostel quotas", hostel_id)
 
+    def rollover_academic_year(
+        self,
+        from_year_start: date,
+        to_year_start: date,
+        hostel_id: Optional[UUID] = None,
+        leave_types: Optional[List[str]] = None,
+        max_carry_forward_days: Optional[int] = None,
+        expiry_months: Optional[int] = None,
+        processed_by: Optional[UUID] = None,
+        after_student_id: Optional[UUID] = None,
+        chunk_size: int = 500,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> ServiceResult[Dict[str, Any]]:
+        """
+        Roll leave balances over to the next academic year.
+        
+        Students are processed in chunks ordered by id, each chunk in its
+        own transaction. The last completed student is reported after
+        every chunk (and logged on failure); pass it back as
+        after_student_id to resume. Re-running a chunk is harmless.
+        
+        Args:
+            from_year_start: Source academic year start
+            to_year_start: Target academic year start
+            hostel_id: Restrict to one hostel (default: all hostels)
+            leave_types: Restrict to these leave types
+            max_carry_forward_days: Cap overriding the hostel quota's cap
+            expiry_months: Months after which carried days expire
+            processed_by: UUID of the user running the rollover
+            after_student_id: Resume after this student
+            chunk_size: Students per chunk/transaction
+            progress_callback: Called with running totals after each chunk
+            
+        Returns:
+            ServiceResult containing rollover totals and the resume cursor
+        """
+        if to_year_start <= from_year_start:
+            return ServiceResult.failure(
+                ServiceError(
+                    code=ErrorCode.VALIDATION_ERROR,
+                    message="Target year must start after the source year",
+                    severity=ErrorSeverity.WARNING,
+                    details={
+                        "from_year_start": from_year_start.isoformat(),
+                        "to_year_start": to_year_start.isoformat()
+                    }
+                )
+            )
+        
+        progress: Dict[str, Any] = {
+            "students": 0,
+            "chunks": 0,
+            "carry_forwards": 0,
+            "balances": 0,
+            "last_student_id": after_student_id,
+        }
+        
+        try:
+            self._logger.info(
+                f"Rolling leave balances over from {from_year_start} to "
+                f"{to_year_start} (hostel={hostel_id}, after={after_student_id})"
+            )
+            
+            while True:
+                student_ids = self.repository.get_rollover_student_ids(
+                    from_year_start,
+                    hostel_id=hostel_id,
+                    after_student_id=progress["last_student_id"],
+                    limit=chunk_size
+                )
+                if not student_ids:
+                    break
+                
+                counts = self.repository.bulk_rollover(
+                    student_ids,
+                    from_year_start,
+                    to_year_start,
+                    leave_types=leave_types,
+                    max_carry_forward_days=max_carry_forward_days,
+                    expiry_months=expiry_months,
+                    processed_by=processed_by
+                )
+                self.db.commit()
+                
+                progress["students"] += len(student_ids)
+                progress["chunks"] += 1
+                progress["carry_forwards"] += counts["carry_forwards"]
+                progress["balances"] += counts["balances"]
+                progress["last_student_id"] = student_ids[-1]
+                
+                self._logger.debug(f"Leave rollover progress: {progress}")
+                if progress_callback:
+                    progress_callback(dict(progress))
+            
+            self._logger.info(f"Leave rollover completed: {progress}")
+            
+            return ServiceResult.success(
+                progress,
+                message="Academic year rollover completed"
+            )
+            
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            self._logger.error(
+                f"Database error during leave rollover after student "
+                f"{progress['last_student_id']}: {str(e)}",
+                exc_info=True
+            )
+            return self._handle_exception(
+                e, "roll over leave balances", progress["last_student_id"]
+            )
+            
+        except Exception as e:
+            self.db.rollback()
+            self._logger.error(
+                f"Unexpected error during leave rollover after student "
+                f"{progress['last_student_id']}: {str(e)}",
+                exc_info=True
+            )
+            return self._handle_exception(
+                e, "roll over leave balances", progress["last_student_id"]
+            )
+
     # -------------------------------------------------------------------------
     # Private Validation Methods
     # -------------------------------------------------------------------------
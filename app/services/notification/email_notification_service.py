@@ -18,7 +18,10 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.repositories.notification import EmailNotificationRepository
+from app.repositories.notification import (
+    EmailNotificationRepository,
+    NotificationTemplateRepository,
+)
 from app.schemas.notification import (
     EmailRequest,
     BulkEmailRequest,
@@ -26,6 +29,12 @@ from app.schemas.notification import (
 )
 from app.core1.exceptions import ValidationException, DatabaseException
 from app.core1.logging import LoggingContext
+from app.core.smtp_transport import (
+    PooledSMTPTransport,
+    SMTPSendResult,
+    build_bulk_messages,
+    get_smtp_transport,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,12 +43,18 @@ class EmailNotificationService:
     """
     Enhanced orchestration of email notification creation and scheduling.
 
-    Delivery to external providers is handled by background workers.
+    Bulk sends are delivered directly over the pooled SMTP transport while
+    it is running; all other delivery is handled by background workers.
     Enhanced with validation, error handling, and performance optimizations.
     """
 
-    def __init__(self, email_repo: EmailNotificationRepository) -> None:
+    def __init__(
+        self,
+        email_repo: EmailNotificationRepository,
+        transport: Optional[PooledSMTPTransport] = None,
+    ) -> None:
         self.email_repo = email_repo
+        self.transport = transport or get_smtp_transport()
         self._max_bulk_size = 1000  # Maximum bulk email size
 
     def _validate_email_request(self, request: EmailRequest) -> None:
@@ -217,6 +232,7 @@ class EmailNotificationService:
                     f"Bulk email campaign created successfully, "
                     f"total notifications: {len(all_ids)}"
                 )
+                self._dispatch_bulk(db, request, all_ids)
                 return all_ids
                 
             except SQLAlchemyError as e:
@@ -228,6 +244,90 @@ class EmailNotificationService:
                 db.rollback()
                 raise
 
+    def _dispatch_bulk(
+        self,
+        db: Session,
+        request: BulkEmailRequest,
+        email_ids: List[UUID],
+    ) -> bool:
+        """
+        Send committed bulk email through the pooled SMTP transport.
+
+        The queued rows are claimed before the messages are submitted so
+        background workers do not deliver them a second time. Rows are
+        marked sent only once the SMTP server accepts their message, and
+        marked failed otherwise, when the transport reports back.
+
+        Returns:
+            True if the messages were submitted for direct delivery
+        """
+        if self.transport is None or not self.transport.is_started:
+            return False
+
+        if len(email_ids) != len(request.recipients):
+            logger.warning(
+                "Bulk email rows do not line up with recipients, "
+                "leaving delivery to workers"
+            )
+            return False
+
+        subject, body = request.subject, request.body_html
+        variables = request.recipient_variables
+        if request.template_code:
+            template = NotificationTemplateRepository(db).find_by_code(request.template_code)
+            if template is None:
+                logger.warning(
+                    f"Template {request.template_code} not found, "
+                    f"leaving delivery to workers"
+                )
+                return False
+            subject = template.subject or subject
+            body = template.body_template
+            variables = variables or {}
+
+        messages = build_bulk_messages(request.recipients, subject, body, variables)
+
+        self.email_repo.claim_emails_for_delivery(email_ids)
+        future = self.transport.submit_bulk(
+            messages,
+            on_complete=lambda results: self._record_bulk_results(email_ids, results),
+        )
+        if future is None:
+            # Transport stopped after the check; hand the rows back to workers
+            self.email_repo.release_emails(email_ids)
+            return False
+        return True
+
+    @staticmethod
+    def _record_bulk_results(
+        email_ids: List[UUID],
+        results: List[SMTPSendResult],
+    ) -> None:
+        """Record the outcome of direct delivery (runs off the request path)."""
+        sent = [
+            email_id
+            for email_id, result in zip(email_ids, results)
+            if result.success
+        ]
+        failures = {
+            email_id: result.error or "SMTP delivery failed"
+            for email_id, result in zip(email_ids, results)
+            if not result.success
+        }
+
+        from app.config.database import SessionLocal
+
+        session = SessionLocal()
+        try:
+            repo = EmailNotificationRepository(session)
+            repo.mark_emails_sent(sent)
+            repo.mark_emails_failed(failures)
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"Failed to record bulk email results: {str(e)}")
+        finally:
+            session.close()
+
     # -------------------------------------------------------------------------
     # Enhanced stats with caching
     # -------------------------------------------------------------------------
@@ -103,19 +103,12 @@ class StudentAggregateService:
             # Calculate date range for the period
             period_dates = self._calculate_period_dates(period)
 
-            # Gather all dashboard components
-            attendance_summary = self._get_attendance_summary(
-                db, student_id, period_dates
-            )
-            payment_summary = self._get_payment_summary(
-                db, student_id, period_dates
-            )
-            complaints_summary = self._get_complaints_summary(
-                db, student_id, period_dates
-            )
-            leave_summary = self._get_leave_summary(
-                db, student_id, period_dates
-            )
+            # All period counters come back from a single query
+            counters = self._get_dashboard_counters(student_id, period_dates)
+            attendance_summary = self._get_attendance_summary(counters)
+            payment_summary = self._get_payment_summary(counters)
+            complaints_summary = self._get_complaints_summary(counters)
+            leave_summary = self._get_leave_summary(counters)
             room_info = self._get_room_info(db, student_id)
             recent_notifications = self._get_recent_notifications(
                 db, student_id, limit=5
@@ -198,98 +191,56 @@ class StudentAggregateService:
     # Helper Methods for Dashboard Components
     # -------------------------------------------------------------------------
 
-    def _get_attendance_summary(
+    def _get_dashboard_counters(
         self,
-        db: Session,
         student_id: UUID,
         period_dates: PeriodDates,
-    ) -> AttendanceSummary:
-        """Get attendance summary for the period."""
+    ) -> Dict[str, Any]:
+        """Get all dashboard counters for the period in one round trip."""
         try:
-            data = self.aggregate_repo.get_attendance_summary(
-                db, student_id, period_dates.start_date, period_dates.end_date
-            )
-            
-            return AttendanceSummary(
-                total_days=data.get("total_days", 0),
-                present_days=data.get("present_days", 0),
-                absent_days=data.get("absent_days", 0),
-                late_arrivals=data.get("late_arrivals", 0),
-                attendance_percentage=data.get("attendance_percentage", 0.0),
-                recent_records=data.get("recent_records", []),
-            )
-        except Exception as e:
-            logger.warning(f"Error fetching attendance summary: {e}")
-            return AttendanceSummary()
-
-    def _get_payment_summary(
-        self,
-        db: Session,
-        student_id: UUID,
-        period_dates: PeriodDates,
-    ) -> PaymentSummary:
-        """Get payment summary for the period."""
-        try:
-            data = self.aggregate_repo.get_payment_summary(
-                db, student_id, period_dates.start_date, period_dates.end_date
-            )
-            
-            return PaymentSummary(
-                total_due=data.get("total_due", 0.0),
-                paid_amount=data.get("paid_amount", 0.0),
-                pending_amount=data.get("pending_amount", 0.0),
-                overdue_amount=data.get("overdue_amount", 0.0),
-                next_due_date=data.get("next_due_date"),
-                payment_status=data.get("payment_status", "unknown"),
-                recent_payments=data.get("recent_payments", []),
-            )
-        except Exception as e:
-            logger.warning(f"Error fetching payment summary: {e}")
-            return PaymentSummary()
-
-    def _get_complaints_summary(
-        self,
-        db: Session,
-        student_id: UUID,
-        period_dates: PeriodDates,
-    ) -> ComplaintsSummary:
-        """Get complaints summary for the period."""
-        try:
-            data = self.aggregate_repo.get_complaints_summary(
-                db, student_id, period_dates.start_date, period_dates.end_date
-            )
-            
-            return ComplaintsSummary(
-                total_complaints=data.get("total_complaints", 0),
-                resolved_complaints=data.get("resolved_complaints", 0),
-                pending_complaints=data.get("pending_complaints", 0),
-                recent_complaints=data.get("recent_complaints", []),
-            )
-        except Exception as e:
-            logger.warning(f"Error fetching complaints summary: {e}")
-            return ComplaintsSummary()
-
-    def _get_leave_summary(
-        self,
-        db: Session,
-        student_id: UUID,
-        period_dates: PeriodDates,
-    ) -> LeaveSummary:
-        """Get leave summary for the period."""
-        try:
-            data = self.aggregate_repo.get_leave_summary(
-                db, student_id, period_dates.start_date, period_dates.end_date
-            )
-            
-            return LeaveSummary(
-                available_balance=data.get("available_balance", 0),
-                used_days=data.get("used_days", 0),
-                pending_applications=data.get("pending_applications", 0),
-                recent_applications=data.get("recent_applications", []),
+            return self.aggregate_repo.get_student_dashboard_counters(
+                student_id, period_dates.start_date, period_dates.end_date
             )
         except Exception as e:
-            logger.warning(f"Error fetching leave summary: {e}")
-            return LeaveSummary()
+            logger.warning(f"Error fetching dashboard counters: {e}")
+            return {}
+
+    def _get_attendance_summary(self, data: Dict[str, Any]) -> AttendanceSummary:
+        """Build attendance summary from dashboard counters."""
+        return AttendanceSummary(
+            total_days=data.get("total_days", 0),
+            present_days=data.get("present_days", 0),
+            absent_days=data.get("absent_days", 0),
+            late_arrivals=data.get("late_arrivals", 0),
+            attendance_percentage=data.get("attendance_percentage", 0.0),
+        )
+
+    def _get_payment_summary(self, data: Dict[str, Any]) -> PaymentSummary:
+        """Build payment summary from dashboard counters."""
+        return PaymentSummary(
+            total_due=data.get("total_due", 0.0),
+            paid_amount=data.get("paid_amount", 0.0),
+            pending_amount=data.get("pending_amount", 0.0),
+            overdue_amount=data.get("overdue_amount", 0.0),
+            next_due_date=data.get("next_due_date"),
+            payment_status=data.get("payment_status", "unknown"),
+        )
+
+    def _get_complaints_summary(self, data: Dict[str, Any]) -> ComplaintsSummary:
+        """Build complaints summary from dashboard counters."""
+        return ComplaintsSummary(
+            total_complaints=data.get("total_complaints", 0),
+            resolved_complaints=data.get("resolved_complaints", 0),
+            pending_complaints=data.get("pending_complaints", 0),
+        )
+
+    def _get_leave_summary(self, data: Dict[str, Any]) -> LeaveSummary:
+        """Build leave summary from dashboard counters."""
+        return LeaveSummary(
+            available_balance=data.get("available_balance", 0),
+            used_days=data.get("used_days", 0),
+            pending_applications=data.get("pending_applications", 0),
+        )
 
     def _get_room_info(
         self,
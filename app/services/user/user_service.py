@@ -30,6 +30,7 @@ from app.core.exceptions import (
     BusinessLogicError,
     NotFoundError,
 )
+from app.core.security.principal_cache import principal_cache
 from app.utils.string_utils import StringHelper
 from app.utils.password_utils import PasswordHelper
 
@@ -197,6 +198,7 @@ class UserService:
                 update_dict["full_name"] = self._normalize_name(update_dict["full_name"])
 
             updated = self.user_repo.update(db, user, update_dict)
+            principal_cache.invalidate_user(user_id)
 
             logger.info(f"Updated user {user_id}")
 
@@ -240,6 +242,7 @@ class UserService:
                 raise BusinessLogicError("User is already deactivated")
 
             self.user_repo.deactivate_user(db, user, reason)
+            principal_cache.invalidate_user(user_id)
 
             logger.info(
                 f"Deactivated user {user_id}" + (f" - Reason: {reason}" if reason else "")
@@ -277,6 +280,7 @@ class UserService:
                 raise BusinessLogicError("User is already active")
 
             self.user_repo.activate_user(db, user)
+            principal_cache.invalidate_user(user_id)
 
             logger.info(f"Activated user {user_id}")
 
@@ -318,6 +322,8 @@ class UserService:
                 self.user_repo.delete(db, user)
                 logger.info(f"Hard deleted user {user_id}")
 
+            principal_cache.invalidate_user(user_id)
+
         except NotFoundError:
             raise
         except SQLAlchemyError as e:
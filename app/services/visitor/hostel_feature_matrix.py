@@ -0,0 +1,463 @@
+"""
+Hostel Feature Matrix
+
+In-memory, column-oriented view of the hostel catalogue used to score
+recommendation candidates with NumPy instead of per-candidate dicts.
+
+Each hostel is one row:
+- amenities as a bitmask (one bit per amenity in a growing vocabulary)
+- city as an integer code
+- price, rating, availability and review count as float columns
+- latitude/longitude for distance scoring
+
+The matrix is refreshed incrementally from hostels updated since the last
+refresh; a periodic full rebuild compacts removed rows. Each refresh is
+built on a private copy and published as a new immutable snapshot, so
+scoring never sees rows renumbered underneath it.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.models.hostel.hostel import Hostel
+
+logger = logging.getLogger(__name__)
+
+# Per-byte popcount lookup; np.bitwise_count is NumPy 2.x only
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+_EARTH_RADIUS_KM = 6371.0
+
+
+def popcount(masks: np.ndarray) -> np.ndarray:
+    """
+    Count set bits per row of a (rows, words) uint64 bitmask array.
+
+    Args:
+        masks: Bitmask array
+
+    Returns:
+        int array of set-bit counts per row
+    """
+    bitwise_count = getattr(np, "bitwise_count", None)
+    if bitwise_count is not None:
+        return bitwise_count(masks).sum(axis=1, dtype=np.int64)
+    as_bytes = np.ascontiguousarray(masks).view(np.uint8).reshape(masks.shape[0], -1)
+    return _POPCOUNT_TABLE[as_bytes].sum(axis=1, dtype=np.int64)
+
+
+class FeatureSnapshot:
+    """
+    One consistent version of the hostel feature matrix.
+
+    Published snapshots are never modified: the matrix builds each refresh
+    on a private copy and swaps it in with a single reference assignment,
+    so row positions taken from a snapshot always index its own arrays.
+    Score a request against one snapshot from HostelFeatureMatrix.snapshot().
+    """
+
+    # Columns of the float feature matrix
+    PRICE = 0
+    RATING = 1
+    AVAILABILITY = 2
+    REVIEWS = 3
+    LATITUDE = 4
+    LONGITUDE = 5
+    NUM_FEATURES = 6
+
+    def __init__(self) -> None:
+        self._ids: List[UUID] = []
+        self._names: List[str] = []
+        self._cities: List[Optional[str]] = []
+        self._amenities: List[List[str]] = []
+        self._index: Dict[UUID, int] = {}
+
+        self._amenity_bits: Dict[str, int] = {}
+        self._city_codes: Dict[str, int] = {}
+
+        self.features = np.zeros((0, self.NUM_FEATURES), dtype=np.float64)
+        self.amenity_masks = np.zeros((0, 1), dtype=np.uint64)
+        self.city_codes = np.zeros(0, dtype=np.int32)
+        self.active = np.zeros(0, dtype=bool)
+
+    def copy(self) -> "FeatureSnapshot":
+        """Private, writable copy to build the next snapshot on."""
+        clone = FeatureSnapshot.__new__(FeatureSnapshot)
+        clone._ids = list(self._ids)
+        clone._names = list(self._names)
+        clone._cities = list(self._cities)
+        clone._amenities = list(self._amenities)
+        clone._index = dict(self._index)
+        clone._amenity_bits = dict(self._amenity_bits)
+        clone._city_codes = dict(self._city_codes)
+        clone.features = self.features.copy()
+        clone.amenity_masks = self.amenity_masks.copy()
+        clone.city_codes = self.city_codes.copy()
+        clone.active = self.active.copy()
+        return clone
+
+    # -------------------------------------------------------------------------
+    # Building (private copies only)
+    # -------------------------------------------------------------------------
+
+    def apply(self, rows: List[Any]) -> None:
+        """Upsert hostel rows; inactive or non-public rows are tombstoned."""
+        self._append_rows([
+            row.id for row in rows
+            if row.is_active and row.is_public and row.id not in self._index
+        ])
+
+        for row in rows:
+            position = self._index.get(row.id)
+            if not (row.is_active and row.is_public):
+                if position is not None:
+                    self.active[position] = False
+                continue
+
+            amenities = list(row.amenities or [])
+            self._names[position] = row.name
+            self._cities[position] = row.city
+            self._amenities[position] = amenities
+            self.amenity_masks[position] = self.mask_for(amenities, grow=True)
+            self.city_codes[position] = self.city_code(row.city, grow=True)
+
+            total_beds = row.total_beds or 0
+            self.features[position] = (
+                float(row.starting_price_monthly) if row.starting_price_monthly is not None else np.nan,
+                float(row.average_rating or 0),
+                (row.available_beds or 0) / total_beds if total_beds else 0.0,
+                float(row.total_reviews or 0),
+                float(row.latitude) if row.latitude is not None else np.nan,
+                float(row.longitude) if row.longitude is not None else np.nan,
+            )
+            self.active[position] = True
+
+    def _append_rows(self, hostel_ids: List[UUID]) -> None:
+        """Append empty (inactive) rows for new hostels in one allocation."""
+        hostel_ids = list(dict.fromkeys(hostel_ids))
+        if not hostel_ids:
+            return
+        start = len(self._ids)
+        count = len(hostel_ids)
+        for offset, hostel_id in enumerate(hostel_ids):
+            self._index[hostel_id] = start + offset
+        self._ids.extend(hostel_ids)
+        self._names.extend([""] * count)
+        self._cities.extend([None] * count)
+        self._amenities.extend([] for _ in range(count))
+
+        self.features = np.vstack([self.features, np.zeros((count, self.NUM_FEATURES))])
+        self.amenity_masks = np.vstack([
+            self.amenity_masks,
+            np.zeros((count, self.amenity_masks.shape[1]), dtype=np.uint64),
+        ])
+        self.city_codes = np.concatenate([self.city_codes, np.full(count, -1, dtype=np.int32)])
+        self.active = np.concatenate([self.active, np.zeros(count, dtype=bool)])
+
+    # -------------------------------------------------------------------------
+    # Encoding
+    # -------------------------------------------------------------------------
+
+    def mask_for(self, amenities: Iterable[str], grow: bool = False) -> np.ndarray:
+        """
+        Encode amenities as a bitmask row.
+
+        Args:
+            amenities: Amenity names
+            grow: Add unknown amenities to the vocabulary (private copies
+                only); otherwise they are ignored since no hostel can
+                match them
+
+        Returns:
+            uint64 array of one row's mask words
+        """
+        bits = []
+        for amenity in amenities:
+            key = str(amenity).strip().lower()
+            bit = self._amenity_bits.get(key)
+            if bit is None and grow:
+                bit = self._amenity_bits[key] = len(self._amenity_bits)
+                words = bit // 64 + 1
+                if words > self.amenity_masks.shape[1]:
+                    self.amenity_masks = np.hstack([
+                        self.amenity_masks,
+                        np.zeros(
+                            (self.amenity_masks.shape[0], words - self.amenity_masks.shape[1]),
+                            dtype=np.uint64,
+                        ),
+                    ])
+            if bit is not None:
+                bits.append(bit)
+
+        mask = np.zeros(self.amenity_masks.shape[1], dtype=np.uint64)
+        for bit in bits:
+            mask[bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+        return mask
+
+    def city_code(self, city: Optional[str], grow: bool = False) -> int:
+        """Encode a city as an integer code (-1 if unknown)."""
+        if not city:
+            return -1
+        key = city.strip().lower()
+        code = self._city_codes.get(key)
+        if code is None:
+            if not grow:
+                return -1
+            code = self._city_codes[key] = len(self._city_codes)
+        return code
+
+    def city_codes_for(self, cities: Iterable[str]) -> np.ndarray:
+        """Encode cities, dropping ones no hostel is in."""
+        codes = [self.city_code(city) for city in cities]
+        return np.array([code for code in codes if code >= 0], dtype=np.int32)
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def positions(self, hostel_ids: Sequence[UUID]) -> np.ndarray:
+        """
+        Map hostel ids to row positions (-1 for unknown or inactive hostels).
+        """
+        positions = np.fromiter(
+            (self._index.get(hostel_id, -1) for hostel_id in hostel_ids),
+            dtype=np.int64,
+            count=len(hostel_ids),
+        )
+        known = np.flatnonzero(positions >= 0)
+        positions[known[~self.active[positions[known]]]] = -1
+        return positions
+
+    def active_positions(self) -> np.ndarray:
+        """Row positions of all active hostels."""
+        return np.flatnonzero(self.active)
+
+    def describe(self, position: int) -> Dict[str, Any]:
+        """Candidate dict for a matrix row."""
+        price = self.features[position, self.PRICE]
+        return {
+            "hostel_id": self._ids[position],
+            "name": self._names[position],
+            "city": self._cities[position],
+            "amenities": self._amenities[position],
+            "price": None if math.isnan(price) else float(price),
+            "rating": float(self.features[position, self.RATING]),
+        }
+
+    def __len__(self) -> int:
+        return int(self.active.sum())
+
+    # -------------------------------------------------------------------------
+    # Vectorized scoring primitives
+    # -------------------------------------------------------------------------
+
+    def amenity_overlap(self, positions: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """Number of amenities in ``mask`` each row has."""
+        if not mask.any():
+            return np.zeros(len(positions), dtype=np.int64)
+        return popcount(self.amenity_masks[positions] & mask)
+
+    def in_cities(self, positions: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """Whether each row's city is one of ``codes``."""
+        return np.isin(self.city_codes[positions], codes)
+
+    def normalized(self, positions: np.ndarray, column: int) -> np.ndarray:
+        """
+        Min-max normalize a feature column over all active rows, then
+        return the values for ``positions``. Missing values map to 0.
+        """
+        values = self.features[self.active, column]
+        values = values[~np.isnan(values)]
+        selected = self.features[positions, column]
+        if not len(values):
+            return np.zeros(len(positions))
+        low, high = values.min(), values.max()
+        if high == low:
+            return np.where(np.isnan(selected), 0.0, 1.0)
+        return np.nan_to_num((selected - low) / (high - low), nan=0.0)
+
+    def proximity(
+        self,
+        positions: np.ndarray,
+        latitude: float,
+        longitude: float,
+        scale_km: float = 10.0,
+    ) -> np.ndarray:
+        """
+        Proximity score in (0, 1] from haversine distance to a point;
+        rows without coordinates score 0.
+        """
+        lat = np.radians(self.features[positions, self.LATITUDE])
+        lng = np.radians(self.features[positions, self.LONGITUDE])
+        origin_lat, origin_lng = math.radians(latitude), math.radians(longitude)
+
+        a = (
+            np.sin((lat - origin_lat) / 2) ** 2
+            + math.cos(origin_lat) * np.cos(lat) * np.sin((lng - origin_lng) / 2) ** 2
+        )
+        distance_km = 2 * _EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+        return np.nan_to_num(1.0 / (1.0 + distance_km / scale_km), nan=0.0)
+
+
+class HostelFeatureMatrix:
+    """
+    Cached feature matrix over active, public hostels.
+
+    Rows are never reordered between rebuilds: updated hostels are
+    overwritten in place, new hostels appended, and deactivated hostels
+    tombstoned until the next full rebuild. Writers serialize on the lock
+    and publish a new FeatureSnapshot; readers never take the lock.
+    """
+
+    def __init__(
+        self,
+        refresh_interval: float = 60.0,
+        rebuild_interval: float = 3600.0,
+    ) -> None:
+        """
+        Initialize an empty matrix.
+
+        Args:
+            refresh_interval: Seconds between incremental refreshes
+            rebuild_interval: Seconds between full rebuilds
+        """
+        self.refresh_interval = refresh_interval
+        self.rebuild_interval = rebuild_interval
+
+        self._lock = threading.RLock()
+        self._snapshot = FeatureSnapshot()
+        self._watermark: Optional[datetime] = None
+        self._last_refresh = 0.0
+        self._last_rebuild = 0.0
+
+    def snapshot(self) -> FeatureSnapshot:
+        """The current snapshot; score one request against a single snapshot."""
+        return self._snapshot
+
+    # -------------------------------------------------------------------------
+    # Refresh
+    # -------------------------------------------------------------------------
+
+    def refresh(self, db: Session, force: bool = False) -> int:
+        """
+        Bring the matrix up to date if the refresh interval has elapsed.
+
+        Loads only hostels updated since the previous refresh, unless the
+        rebuild interval has elapsed, in which case the matrix is rebuilt.
+
+        Args:
+            db: Database session
+            force: Refresh regardless of the interval
+
+        Returns:
+            Number of hostel rows applied
+        """
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_refresh < self.refresh_interval:
+                return 0
+
+            rebuild = (
+                self._watermark is None
+                or now - self._last_rebuild >= self.rebuild_interval
+            )
+            since = None if rebuild else self._watermark
+
+            query = db.query(
+                Hostel.id,
+                Hostel.name,
+                Hostel.city,
+                Hostel.amenities,
+                Hostel.starting_price_monthly,
+                Hostel.average_rating,
+                Hostel.available_beds,
+                Hostel.total_beds,
+                Hostel.total_reviews,
+                Hostel.latitude,
+                Hostel.longitude,
+                Hostel.is_active,
+                Hostel.is_public,
+                Hostel.updated_at,
+            )
+            if since is not None:
+                query = query.filter(Hostel.updated_at >= since)
+            else:
+                query = query.filter(Hostel.is_active.is_(True), Hostel.is_public.is_(True))
+
+            rows = query.all()
+
+            if rebuild:
+                # Built from empty off to the side; readers keep the old
+                # snapshot until the swap in apply()
+                self._watermark = None
+                self._last_rebuild = now
+            applied = self.apply(rows, base=FeatureSnapshot() if rebuild else None)
+            self._last_refresh = now
+
+            if applied:
+                logger.debug(
+                    f"Hostel feature matrix {'rebuilt' if rebuild else 'refreshed'}: "
+                    f"{applied} rows applied, {len(self._snapshot)} active"
+                )
+            return applied
+
+    def invalidate(self) -> None:
+        """Force the next refresh to run."""
+        with self._lock:
+            self._last_refresh = 0.0
+
+    def apply(self, rows: Iterable[Any], base: Optional[FeatureSnapshot] = None) -> int:
+        """
+        Upsert hostel rows and publish the result as the current snapshot.
+
+        Rows for inactive or non-public hostels tombstone any existing row.
+
+        Args:
+            rows: Hostel rows with the columns selected by refresh()
+            base: Snapshot to build on (default: a copy of the current one)
+
+        Returns:
+            Number of rows applied
+        """
+        with self._lock:
+            rows = list(rows)
+            snapshot = base if base is not None else self._snapshot.copy()
+            snapshot.apply(rows)
+
+            for row in rows:
+                if row.updated_at and (self._watermark is None or row.updated_at > self._watermark):
+                    self._watermark = row.updated_at
+
+            self._snapshot = snapshot
+        return len(rows)
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first.
+
+    Uses argpartition so only the selected k are sorted.
+    """
+    if k <= 0 or not len(scores):
+        return np.zeros(0, dtype=np.int64)
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    selected = np.argpartition(-scores, k - 1)[:k]
+    return selected[np.argsort(-scores[selected], kind="stable")]
+
+
+# Process-wide matrix shared by recommendation service instances
+hostel_feature_matrix = HostelFeatureMatrix()
@@ -13,6 +13,7 @@ from uuid import UUID
 from datetime import datetime, timedelta
 from collections import Counter
 
+import numpy as np
 from sqlalchemy.orm import Session
 
 from app.repositories.visitor import (
@@ -28,6 +29,12 @@ from app.core1.exceptions import (
     ServiceException,
 )
 from app.core1.caching import cache_result
+from app.services.visitor.hostel_feature_matrix import (
+    FeatureSnapshot,
+    HostelFeatureMatrix,
+    hostel_feature_matrix,
+    top_k,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +72,7 @@ class VisitorRecommendationService:
         favorite_repo: VisitorFavoriteRepository,
         aggregate_repo: VisitorAggregateRepository,
         recommended_repo: RecommendedHostelRepository,
+        feature_matrix: Optional[HostelFeatureMatrix] = None,
     ) -> None:
         """
         Initialize the recommendation service.
@@ -74,11 +82,13 @@ class VisitorRecommendationService:
             favorite_repo: Repository for favorite operations
             aggregate_repo: Repository for aggregated visitor data
             recommended_repo: Repository for recommendation storage
+            feature_matrix: Hostel feature matrix (defaults to the shared one)
         """
         self.visitor_repo = visitor_repo
         self.favorite_repo = favorite_repo
         self.aggregate_repo = aggregate_repo
         self.recommended_repo = recommended_repo
+        self.feature_matrix = feature_matrix or hostel_feature_matrix
 
     # -------------------------------------------------------------------------
     # Main Recommendation Methods
@@ -159,11 +169,9 @@ class VisitorRecommendationService:
             else:
                 candidates = self._generate_hybrid_recommendations(db, context, limit * 3)
 
-            # Score and rank candidates
-            scored_candidates = self._score_candidates(context, candidates)
-
-            # Take top N
-            top_candidates = scored_candidates[:limit]
+            # Score candidates and take top N
+            self.feature_matrix.refresh(db)
+            top_candidates = self._score_candidates(context, candidates, limit)
 
             # Store recommendations
             recommendations = self.recommended_repo.store_recommendations_for_visitor(
@@ -522,44 +530,177 @@ class VisitorRecommendationService:
         self,
         context: Dict[str, Any],
         candidates: List[Dict[str, Any]],
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Score and rank candidates using hybrid scoring.
 
+        Component scores for all candidates are computed at once from the
+        hostel feature matrix and combined with WEIGHTS in a single dot
+        product; only the top ``limit`` are sorted. Candidates missing from
+        the matrix keep the component scores they were generated with. If
+        there are no candidates, every active hostel is scored.
+
         Args:
             context: Visitor context data
             candidates: List of hostel candidates
+            limit: Number of candidates to return (all if None)
 
         Returns:
-            Sorted list of candidates by final score
-        """
-        for candidate in candidates:
-            # Normalize individual scores
-            behavioral_score = candidate.get("behavioral_score", 0.0)
-            preference_score = candidate.get("preference_score", 0.0)
-            popularity_score = candidate.get("popularity_score", 0.0)
-
-            # Calculate novelty score (inverse of familiarity)
-            novelty_score = self._calculate_novelty_score(candidate, context)
-
-            # Weighted combination
-            final_score = (
-                self.WEIGHTS["behavioral"] * behavioral_score +
-                self.WEIGHTS["preference"] * preference_score +
-                self.WEIGHTS["popularity"] * popularity_score +
-                self.WEIGHTS["novelty"] * novelty_score
+            Top candidates by final score, best first
+        """
+        # One snapshot per request keeps positions and arrays consistent
+        # while a refresh publishes a new version
+        matrix = self.feature_matrix.snapshot()
+
+        if candidates:
+            positions = matrix.positions([c["hostel_id"] for c in candidates])
+        else:
+            positions = matrix.active_positions()
+            excluded = matrix.positions(list(context.get("excluded_hostel_ids", set())))
+            positions = positions[~np.isin(positions, excluded)]
+
+        room_types = [c.get("room_type") for c in candidates] or [None] * len(positions)
+        components = np.zeros((len(positions), 4))
+
+        known = positions >= 0
+        if known.any():
+            components[known] = self._matrix_component_scores(
+                matrix,
+                context,
+                positions[known],
+                [room_type for room_type, hit in zip(room_types, known) if hit],
+            )
+        for i in np.flatnonzero(~known):
+            candidate = candidates[i]
+            components[i] = (
+                candidate.get("behavioral_score", 0.0),
+                candidate.get("preference_score", 0.0),
+                candidate.get("popularity_score", 0.0),
+                self._calculate_novelty_score(candidate, context),
             )
 
-            candidate["final_score"] = final_score
+        # Explicit popularity from the popular-hostels source wins
+        for i, candidate in enumerate(candidates):
+            if "popularity_score" in candidate:
+                components[i, 2] = candidate["popularity_score"]
+
+        weights = np.array([
+            self.WEIGHTS["behavioral"],
+            self.WEIGHTS["preference"],
+            self.WEIGHTS["popularity"],
+            self.WEIGHTS["novelty"],
+        ])
+        final_scores = components @ weights
+
+        ranked = []
+        for i in top_k(final_scores, len(final_scores) if limit is None else limit):
+            candidate = candidates[i] if candidates else matrix.describe(positions[i])
+            behavioral, preference, popularity, novelty = components[i].tolist()
+            candidate["final_score"] = float(final_scores[i])
             candidate["score_breakdown"] = {
-                "behavioral": behavioral_score,
-                "preference": preference_score,
-                "popularity": popularity_score,
-                "novelty": novelty_score,
+                "behavioral": behavioral,
+                "preference": preference,
+                "popularity": popularity,
+                "novelty": novelty,
             }
+            ranked.append(candidate)
+
+        return ranked
+
+    def _matrix_component_scores(
+        self,
+        matrix: FeatureSnapshot,
+        context: Dict[str, Any],
+        positions: np.ndarray,
+        room_types: List[Optional[str]],
+    ) -> np.ndarray:
+        """
+        Compute behavioral, preference, popularity and novelty scores for
+        matrix rows.
+
+        Vectorized equivalent of _calculate_behavioral_score,
+        _calculate_preference_score and _calculate_novelty_score, plus a
+        proximity term when preferences include a location.
+
+        Args:
+            matrix: Feature matrix snapshot the positions come from
+            context: Visitor context data
+            positions: Feature matrix row positions
+            room_types: Candidate room type per position, if known
+
+        Returns:
+            (len(positions), 4) array of component scores
+        """
+        behavioral_data = context.get("behavioral_summary", {}) or {}
+        preferences = context.get("preferences", {}) or {}
+
+        top_room_types = set(behavioral_data.get("top_room_types", []))
+        viewed_room_types = set(context.get("viewed_room_types", []))
+        room_match = np.fromiter(
+            (room_type in top_room_types for room_type in room_types),
+            dtype=bool, count=len(room_types),
+        )
+        room_viewed = np.fromiter(
+            (room_type in viewed_room_types for room_type in room_types),
+            dtype=bool, count=len(room_types),
+        )
+
+        # Behavioral: city, room type and amenity overlap (max 1 point each)
+        behavioral_overlap = matrix.amenity_overlap(
+            positions, matrix.mask_for(behavioral_data.get("top_amenities", []))
+        )
+        behavioral = (
+            matrix.in_cities(
+                positions, matrix.city_codes_for(behavioral_data.get("top_cities", []))
+            ).astype(float)
+            + room_match
+            + np.minimum(1.0, behavioral_overlap / 5)
+        ) / 3.0
+
+        # Preference: city 1.5, price range 1.0, amenity ratio 0.5, proximity 0.5
+        preference = 1.5 * matrix.in_cities(
+            positions, matrix.city_codes_for(preferences.get("preferred_cities", []))
+        )
+        max_score = 3.0
+
+        price_range = preferences.get("price_range", {})
+        if price_range:
+            price = np.nan_to_num(matrix.features[positions, matrix.PRICE], nan=0.0)
+            preference += 1.0 * (
+                (price >= price_range.get("min", 0))
+                & (price <= price_range.get("max", float("inf")))
+            )
+
+        preferred_amenities = {
+            str(amenity).strip().lower() for amenity in preferences.get("amenities", [])
+        }
+        if preferred_amenities:
+            overlap = matrix.amenity_overlap(positions, matrix.mask_for(preferred_amenities))
+            preference += 0.5 * overlap / len(preferred_amenities)
+
+        location = preferences.get("location") or {}
+        if location.get("latitude") is not None and location.get("longitude") is not None:
+            preference += 0.5 * matrix.proximity(
+                positions, float(location["latitude"]), float(location["longitude"])
+            )
+            max_score += 0.5
+
+        preference = np.minimum(1.0, preference / max_score)
+
+        # Popularity: rating and review volume relative to the catalogue
+        popularity = (
+            0.5 * matrix.normalized(positions, matrix.RATING)
+            + 0.5 * matrix.normalized(positions, matrix.REVIEWS)
+        )
+
+        # Novelty: new city 1.0, new room type 0.7, familiar 0.3
+        city_viewed = matrix.in_cities(
+            positions, matrix.city_codes_for(context.get("viewed_cities", []))
+        )
+        novelty = np.where(~city_viewed, 1.0, np.where(~room_viewed, 0.7, 0.3))
 
-        # Sort by final score
-        return sorted(candidates, key=lambda x: x["final_score"], reverse=True)
+        return np.column_stack([behavioral, preference, popularity, novelty])
 
     def _calculate_behavioral_score(
         self,
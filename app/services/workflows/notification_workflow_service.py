@@ -32,6 +32,8 @@ from app.core1.config import settings
 from app.services.external.email_service import EmailService
 from app.services.external.sms_service import SMSService
 from app.services.external.push_service import PushNotificationService
+from app.repositories.base.outbox_repository import OutboxRepository
+from app.models.common.outbox import OutboxMessage
 
 
 class DeliveryStrategy(str, Enum):
@@ -720,9 +722,23 @@ class NotificationWorkflowService:
                     "scheduled_for": notification.scheduled_for.isoformat()
                 })
             else:
-                # Immediate delivery
-                delivery_result = await self._deliver_notification(db, notification)
-                delivery_results.append(delivery_result)
+                # Delivered off the request path: the outbox relay enqueues
+                # it once this transaction commits
+                OutboxRepository(db).add_message(
+                    OutboxMessage.CHANNEL_NOTIFICATION,
+                    f"notification.{getattr(notification.channel, 'value', notification.channel)}",
+                    {
+                        "notification_id": str(notification.id),
+                        "priority": getattr(template.priority, 'value', template.priority),
+                    },
+                )
+                delivery_results.append({
+                    "notification_id": str(notification.id),
+                    "channel": notification.channel,
+                    "status": "queued",
+                })
+        
+        db.commit()
         
         return {
             "notification_id": str(notifications[0].id) if notifications else None,
@@ -95,6 +95,7 @@ from .email_utils import (
 
 from .sms_utils import (
     SMSHelper,
+    BulkSMSDispatcher,
     MessageOptimizer,
     NumberValidator,
     DeliveryTracker
@@ -157,7 +158,7 @@ __all__ = [
     
     # Communication
     'EmailHelper', 'TemplateRenderer', 'AttachmentHandler',
-    'SMSHelper', 'MessageOptimizer', 'NumberValidator', 'DeliveryTracker',
+    'SMSHelper', 'BulkSMSDispatcher', 'MessageOptimizer', 'NumberValidator', 'DeliveryTracker',
     
     # Location
     'GeoLocationHelper', 'DistanceCalculator', 'AddressGeocoder', 'RegionDetector',
@@ -2,8 +2,6 @@
 Email utilities for hostel management system
 """
 
-import smtplib
-import ssl
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
@@ -20,6 +18,8 @@ import base64
 import mimetypes
 from dataclasses import dataclass
 
+from app.core.smtp_transport import PooledSMTPTransport, SMTPTransportConfig
+
 @dataclass
 class EmailConfig:
     """Email configuration dataclass"""
@@ -47,43 +47,26 @@ class EmailHelper:
     
     def __init__(self, config: EmailConfig):
         self.config = config
-        self.smtp_connection = None
-        
-    def connect(self) -> bool:
-        """Establish SMTP connection"""
-        try:
-            if self.config.use_ssl:
-                self.smtp_connection = smtplib.SMTP_SSL(
-                    self.config.smtp_server,
-                    self.config.smtp_port,
-                    timeout=self.config.timeout
-                )
-            else:
-                self.smtp_connection = smtplib.SMTP(
-                    self.config.smtp_server,
-                    self.config.smtp_port,
-                    timeout=self.config.timeout
-                )
-                if self.config.use_tls:
-                    self.smtp_connection.starttls()
-            
-            self.smtp_connection.login(self.config.username, self.config.password)
-            return True
-            
-        except Exception as e:
-            print(f"Failed to connect to SMTP server: {e}")
-            return False
+        self.transport = PooledSMTPTransport(SMTPTransportConfig(
+            host=config.smtp_server,
+            port=config.smtp_port,
+            username=config.username,
+            password=config.password,
+            use_tls=config.use_ssl,
+            start_tls=config.use_tls,
+            timeout=config.timeout,
+        ))
+        
+    async def connect(self) -> bool:
+        """Bind the pooled SMTP transport to the running event loop"""
+        await self.transport.start()
+        return True
     
-    def disconnect(self):
-        """Close SMTP connection"""
-        if self.smtp_connection:
-            try:
-                self.smtp_connection.quit()
-            except:
-                pass
-            self.smtp_connection = None
+    async def disconnect(self):
+        """Close pooled SMTP connections"""
+        await self.transport.close()
     
-    def send_email(self, 
+    async def send_email(self, 
                    to: Union[str, EmailAddress, List[Union[str, EmailAddress]]],
                    subject: str,
                    body: str,
@@ -96,65 +79,63 @@ class EmailHelper:
         """Send email with attachments and formatting options"""
         
         try:
-            if not self.smtp_connection:
-                if not self.connect():
-                    return False
-            
-            # Create message
-            msg = MIMEMultipart('alternative')
-            
-            # Set headers
-            msg['Subject'] = subject
-            msg['From'] = str(from_address or EmailAddress(self.config.username))
-            
-            # Handle recipients
-            to_list = self._normalize_email_list(to)
-            msg['To'] = ', '.join([str(addr) for addr in to_list])
-            
-            if cc:
-                cc_list = self._normalize_email_list(cc)
-                msg['Cc'] = ', '.join([str(addr) for addr in cc_list])
-            else:
-                cc_list = []
-            
-            if bcc:
-                bcc_list = self._normalize_email_list(bcc)
-            else:
-                bcc_list = []
-            
-            # Set priority
-            if priority.lower() == 'high':
-                msg['X-Priority'] = '1'
-                msg['X-MSMail-Priority'] = 'High'
-            elif priority.lower() == 'low':
-                msg['X-Priority'] = '5'
-                msg['X-MSMail-Priority'] = 'Low'
-            
-            # Add body
-            if html:
-                msg.attach(MIMEText(body, 'html', 'utf-8'))
-            else:
-                msg.attach(MIMEText(body, 'plain', 'utf-8'))
-            
-            # Add attachments
-            if attachments:
-                for file_path in attachments:
-                    self._add_attachment(msg, file_path)
-            
-            # Send email
-            all_recipients = [addr.email for addr in (to_list + cc_list + bcc_list)]
-            self.smtp_connection.sendmail(
-                self.config.username,
-                all_recipients,
-                msg.as_string()
+            msg = self._build_message(
+                to, subject, body, from_address, cc, bcc, attachments, html, priority
             )
-            
-            return True
+            result = await self.transport.send_message(msg)
+            if not result.success:
+                print(f"Failed to send email: {result.error}")
+            return result.success
             
         except Exception as e:
             print(f"Failed to send email: {e}")
             return False
     
+    def _build_message(self,
+                       to: Union[str, EmailAddress, List[Union[str, EmailAddress]]],
+                       subject: str,
+                       body: str,
+                       from_address: Union[str, EmailAddress] = None,
+                       cc: Union[str, EmailAddress, List[Union[str, EmailAddress]]] = None,
+                       bcc: Union[str, EmailAddress, List[Union[str, EmailAddress]]] = None,
+                       attachments: List[str] = None,
+                       html: bool = False,
+                       priority: str = 'normal') -> MIMEMultipart:
+        """Build a MIME message; Bcc recipients are stripped by the transport"""
+        msg = MIMEMultipart('alternative')
+        
+        # Set headers
+        msg['Subject'] = subject
+        msg['From'] = str(from_address or EmailAddress(self.config.username))
+        msg['To'] = ', '.join([str(addr) for addr in self._normalize_email_list(to)])
+        
+        if cc:
+            msg['Cc'] = ', '.join([str(addr) for addr in self._normalize_email_list(cc)])
+        
+        if bcc:
+            msg['Bcc'] = ', '.join([addr.email for addr in self._normalize_email_list(bcc)])
+        
+        # Set priority
+        if priority.lower() == 'high':
+            msg['X-Priority'] = '1'
+            msg['X-MSMail-Priority'] = 'High'
+        elif priority.lower() == 'low':
+            msg['X-Priority'] = '5'
+            msg['X-MSMail-Priority'] = 'Low'
+        
+        # Add body
+        if html:
+            msg.attach(MIMEText(body, 'html', 'utf-8'))
+        else:
+            msg.attach(MIMEText(body, 'plain', 'utf-8'))
+        
+        # Add attachments
+        if attachments:
+            for file_path in attachments:
+                self._add_attachment(msg, file_path)
+        
+        return msg
+    
     def _normalize_email_list(self, emails: Union[str, EmailAddress, List[Union[str, EmailAddress]]]) -> List[EmailAddress]:
         """Normalize email input to list of EmailAddress objects"""
         if isinstance(emails, (str, EmailAddress)):
@@ -204,16 +185,13 @@ class EmailHelper:
         except Exception as e:
             print(f"Failed to add attachment {file_path}: {e}")
     
-    def send_bulk_email(self, 
+    async def send_bulk_email(self, 
                        recipients: List[Union[str, EmailAddress]],
                        subject: str,
                        body: str,
                        batch_size: int = 50,
-                       delay_between_batches: int = 1,
                        **kwargs) -> Dict[str, Any]:
-        """Send email to multiple recipients in batches"""
-        import time
-        
+        """Send email to multiple recipients in batches over pooled connections"""
         results = {
             'total_recipients': len(recipients),
             'successful': 0,
@@ -221,40 +199,40 @@ class EmailHelper:
             'errors': []
         }
         
-        # Split recipients into batches
-        for i in range(0, len(recipients), batch_size):
-            batch = recipients[i:i + batch_size]
-            
+        # One message per batch; the transport spreads them across its pool
+        batches = [recipients[i:i + batch_size] for i in range(0, len(recipients), batch_size)]
+        messages = []
+        for batch in batches:
             try:
-                success = self.send_email(
-                    to=batch,
-                    subject=subject,
-                    body=body,
-                    **kwargs
-                )
-                
-                if success:
-                    results['successful'] += len(batch)
-                else:
-                    results['failed'] += len(batch)
-                    results['errors'].append(f"Failed to send batch {i//batch_size + 1}")
-                
+                messages.append(self._build_message(batch, subject, body, **kwargs))
             except Exception as e:
+                messages.append(e)
+        
+        sent = await self.transport.send_bulk(
+            [msg for msg in messages if not isinstance(msg, Exception)]
+        )
+        outcomes = iter(sent)
+        for number, (batch, msg) in enumerate(zip(batches, messages), start=1):
+            if isinstance(msg, Exception):
                 results['failed'] += len(batch)
-                results['errors'].append(f"Error in batch {i//batch_size + 1}: {str(e)}")
+                results['errors'].append(f"Error in batch {number}: {str(msg)}")
+                continue
             
-            # Delay between batches to avoid rate limiting
-            if i + batch_size < len(recipients):
-                time.sleep(delay_between_batches)
+            outcome = next(outcomes)
+            if outcome.success:
+                results['successful'] += len(batch)
+            else:
+                results['failed'] += len(batch)
+                results['errors'].append(f"Failed to send batch {number}: {outcome.error}")
         
         return results
     
-    def __enter__(self):
-        self.connect()
+    async def __aenter__(self):
+        await self.connect()
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.disconnect()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.disconnect()
 
 class TemplateRenderer:
     """Email template rendering utilities"""
@@ -669,7 +647,7 @@ class EmailQueueManager:
         self.queue.append(email_data)
         return True
     
-    def process_queue(self, email_helper: EmailHelper, batch_size: int = 50) -> Dict[str, Any]:
+    async def process_queue(self, email_helper: EmailHelper, batch_size: int = 50) -> Dict[str, Any]:
         """Process email queue in batches"""
         results = {
             'processed': 0,
@@ -683,7 +661,7 @@ class EmailQueueManager:
             results['processed'] += 1
             
             try:
-                success = email_helper.send_email(**email_data)
+                success = await email_helper.send_email(**email_data)
                 
                 if success:
                     results['successful'] += 1
@@ -703,7 +681,7 @@ class EmailQueueManager:
         
         return results
     
-    def retry_failed_emails(self, email_helper: EmailHelper) -> Dict[str, Any]:
+    async def retry_failed_emails(self, email_helper: EmailHelper) -> Dict[str, Any]:
         """Retry sending failed emails"""
         if not self.failed_emails:
             return {'message': 'No failed emails to retry'}
@@ -723,7 +701,7 @@ class EmailQueueManager:
                 # Remove error status for retry
                 email_data.pop('error', None)
                 
-                success = email_helper.send_email(**email_data)
+                success = await email_helper.send_email(**email_data)
                 
                 if success:
                     retry_results['successful'] += 1
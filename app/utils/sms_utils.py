@@ -2,16 +2,15 @@
 SMS utilities for hostel management system
 """
 
-import requests
+import asyncio
 import json
 from typing import List, Dict, Any, Optional, Union, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+import httpx
 import re
+import threading
 import time
-from urllib.parse import urlencode
-import hashlib
-import hmac
 
 @dataclass
 class SMSConfig:
@@ -32,35 +31,175 @@ class SMSMessage:
     priority: str = 'normal'  # 'low', 'normal', 'high'
     scheduled_at: Optional[datetime] = None
 
+class SMSProviderAPI:
+    """Provider requests and response parsing
+    
+    Shared by the blocking SMSHelper.send_sms and the async
+    BulkSMSDispatcher, so both talk to a provider the same way. HTTP
+    providers describe a request that either an httpx.Client or an
+    httpx.AsyncClient sends; AWS SNS publishes through a shared boto3
+    client. Providers with multi-number endpoints (MSG91, TextLocal)
+    accept several numbers per request.
+    """
+    
+    PROVIDERS = {'twilio', 'msg91', 'textlocal', 'aws_sns'}
+    BATCH_PROVIDERS = {'msg91', 'textlocal'}
+    
+    def __init__(self, config: SMSConfig):
+        self.config = config
+        self._sns_client = None
+        self._sns_lock = threading.Lock()
+    
+    @property
+    def supported(self) -> bool:
+        return self.config.provider in self.PROVIDERS
+    
+    @property
+    def uses_http(self) -> bool:
+        return self.config.provider != 'aws_sns'
+    
+    @property
+    def supports_batch(self) -> bool:
+        return self.config.provider in self.BATCH_PROVIDERS
+    
+    def request(self, numbers: List[str], message: str,
+                sender_id: str) -> Dict[str, Any]:
+        """Keyword arguments for httpx ``client.request`` sending one message"""
+        provider = self.config.provider
+        if provider == 'twilio':
+            return {
+                'method': 'POST',
+                'url': (
+                    f"https://api.twilio.com/2010-04-01/Accounts/"
+                    f"{self.config.api_key}/Messages.json"
+                ),
+                'data': {'Body': message, 'From': sender_id, 'To': numbers[0]},
+                'auth': (self.config.api_key, self.config.api_secret)
+            }
+        if provider == 'msg91':
+            return {
+                'method': 'GET',
+                'url': "https://control.msg91.com/api/sendhttp.php",
+                'params': {
+                    'authkey': self.config.api_key,
+                    'mobiles': ','.join(n.replace('+', '') for n in numbers),
+                    'message': message,
+                    'sender': sender_id,
+                    'route': '4',  # Transactional route
+                    'country': '91'
+                }
+            }
+        if provider == 'textlocal':
+            return {
+                'method': 'POST',
+                'url': "https://api.textlocal.in/send/",
+                'data': {
+                    'apikey': self.config.api_key,
+                    'numbers': ','.join(n.replace('+', '') for n in numbers),
+                    'message': message,
+                    'sender': sender_id
+                }
+            }
+        raise ValueError(f'Unsupported SMS provider: {provider}')
+    
+    def parse(self, response: httpx.Response) -> Dict[str, Any]:
+        """Convert a provider response into a send outcome"""
+        provider = self.config.provider
+        ok_statuses = (200, 201) if provider == 'twilio' else (200,)
+        if response.status_code not in ok_statuses:
+            return {
+                'success': False,
+                'message_id': None,
+                'error': f'HTTP error: {response.status_code}'
+            }
+        
+        if provider == 'twilio':
+            return {'success': True, 'message_id': response.json().get('sid'), 'error': None}
+        
+        if provider == 'msg91':
+            result = response.text.strip()
+            if result.startswith('5'):  # Success response starts with 5
+                return {'success': True, 'message_id': result, 'error': None}
+            return {'success': False, 'message_id': None, 'error': f'MSG91 error: {result}'}
+        
+        result = response.json()
+        if result.get('status') == 'success':
+            return {'success': True, 'message_id': result.get('batch_id'), 'error': None}
+        return {
+            'success': False,
+            'message_id': None,
+            'error': result.get('errors', [{}])[0].get('message', 'Unknown error')
+        }
+    
+    def publish_sns(self, phone_number: str, message: str,
+                    sender_id: str) -> Dict[str, Any]:
+        """Send one SMS via AWS SNS (blocking)"""
+        response = self._sns().publish(
+            PhoneNumber=phone_number,
+            Message=message,
+            MessageAttributes={
+                'AWS.SNS.SMS.SenderID': {
+                    'DataType': 'String',
+                    'StringValue': sender_id
+                },
+                'AWS.SNS.SMS.SMSType': {
+                    'DataType': 'String',
+                    'StringValue': 'Transactional'
+                }
+            }
+        )
+        return {'success': True, 'message_id': response['MessageId'], 'error': None}
+    
+    def _sns(self):
+        with self._sns_lock:
+            if self._sns_client is None:
+                import boto3
+                
+                self._sns_client = boto3.client(
+                    'sns',
+                    aws_access_key_id=self.config.api_key,
+                    aws_secret_access_key=self.config.api_secret,
+                    region_name=self.config.base_url or 'us-east-1'
+                )
+            return self._sns_client
+
 class SMSHelper:
     """Main SMS sending utilities"""
     
     def __init__(self, config: SMSConfig):
         self.config = config
-        self.provider_handlers = {
-            'twilio': self._send_twilio,
-            'msg91': self._send_msg91,
-            'textlocal': self._send_textlocal,
-            'aws_sns': self._send_aws_sns
-        }
+        self.api = SMSProviderAPI(config)
+        self._client: Optional[httpx.Client] = None
+        self._dispatcher: Optional['BulkSMSDispatcher'] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def dispatcher(self) -> 'BulkSMSDispatcher':
+        """Bulk dispatcher shared by every bulk send through this helper"""
+        with self._lock:
+            if self._dispatcher is None:
+                self._dispatcher = BulkSMSDispatcher(self)
+            return self._dispatcher
+    
+    def validate(self, phone_number: str, message: str) -> Tuple[Optional[str], Optional[str]]:
+        """Normalize a recipient and message, returning (phone number, error)"""
+        if not self.api.supported:
+            return None, f'Unsupported SMS provider: {self.config.provider}'
+        normalized_phone = self._normalize_phone_number(phone_number or '')
+        if not normalized_phone:
+            return None, 'Invalid phone number format'
+        if not (message or '').strip():
+            return None, 'Message cannot be empty'
+        return normalized_phone, None
     
     def send_sms(self, phone_number: str, message: str, 
                  sender_id: str = None, priority: str = 'normal') -> Dict[str, Any]:
         """Send SMS message"""
-        # Validate phone number
-        normalized_phone = self._normalize_phone_number(phone_number)
-        if not normalized_phone:
+        normalized_phone, error = self.validate(phone_number, message)
+        if error:
             return {
                 'success': False,
-                'error': 'Invalid phone number format',
-                'message_id': None
-            }
-        
-        # Validate message
-        if not message.strip():
-            return {
-                'success': False,
-                'error': 'Message cannot be empty',
+                'error': error,
                 'message_id': None
             }
         
@@ -70,17 +209,13 @@ class SMSHelper:
         # Get sender ID
         sender_id = sender_id or self.config.sender_id
         
-        # Send via configured provider
-        handler = self.provider_handlers.get(self.config.provider)
-        if not handler:
-            return {
-                'success': False,
-                'error': f'Unsupported SMS provider: {self.config.provider}',
-                'message_id': None
-            }
-        
         try:
-            return handler(normalized_phone, optimized_message, sender_id, priority)
+            if not self.api.uses_http:
+                return self.api.publish_sns(normalized_phone, optimized_message, sender_id)
+            response = self._http_client().request(
+                **self.api.request([normalized_phone], optimized_message, sender_id)
+            )
+            return self.api.parse(response)
         except Exception as e:
             return {
                 'success': False,
@@ -91,53 +226,51 @@ class SMSHelper:
     def send_bulk_sms(self, recipients: List[Dict[str, str]], 
                      message: str, sender_id: str = None,
                      batch_size: int = 100) -> Dict[str, Any]:
-        """Send SMS to multiple recipients"""
-        results = {
-            'total_recipients': len(recipients),
-            'successful': 0,
-            'failed': 0,
-            'results': [],
-            'errors': []
-        }
+        """Send SMS to multiple recipients from synchronous code
+        
+        Runs the concurrent bulk send to completion on a private event loop
+        and closes the dispatcher's client before the loop is torn down.
+        Coroutines must await send_bulk_sms_async instead.
+        
+        Raises:
+            RuntimeError: If called from a thread running an event loop
+        """
+        async def send_and_close():
+            try:
+                return await self.send_bulk_sms_async(
+                    recipients, message, sender_id, batch_size
+                )
+            finally:
+                await self.dispatcher.aclose()
         
-        # Process in batches
-        for i in range(0, len(recipients), batch_size):
-            batch = recipients[i:i + batch_size]
-            
-            for recipient in batch:
-                phone_number = recipient.get('phone_number')
-                personalized_message = message
-                
-                # Replace variables in message if provided
-                if recipient.get('variables'):
-                    for key, value in recipient['variables'].items():
-                        personalized_message = personalized_message.replace(
-                            f"{{{key}}}", str(value)
-                        )
-                
-                result = self.send_sms(phone_number, personalized_message, sender_id)
-                
-                results['results'].append({
-                    'phone_number': phone_number,
-                    'success': result['success'],
-                    'message_id': result.get('message_id'),
-                    'error': result.get('error')
-                })
-                
-                if result['success']:
-                    results['successful'] += 1
-                else:
-                    results['failed'] += 1
-                    results['errors'].append(f"{phone_number}: {result.get('error')}")
-                
-                # Small delay between messages to avoid rate limiting
-                time.sleep(0.1)
-            
-            # Longer delay between batches
-            if i + batch_size < len(recipients):
-                time.sleep(1)
-        
-        return results
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(send_and_close())
+        raise RuntimeError(
+            "send_bulk_sms cannot run inside an event loop; await send_bulk_sms_async"
+        )
+    
+    async def send_bulk_sms_async(self, recipients: List[Dict[str, str]],
+                                  message: str, sender_id: str = None,
+                                  batch_size: int = 100) -> Dict[str, Any]:
+        """Send SMS to multiple recipients without blocking the event loop"""
+        return await self.dispatcher.send_bulk(
+            recipients, message, sender_id, batch_size=batch_size
+        )
+    
+    def close(self):
+        """Close the blocking HTTP client"""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+    
+    def _http_client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(timeout=self.config.timeout)
+            return self._client
     
     def _normalize_phone_number(self, phone_number: str) -> Optional[str]:
         """Normalize phone number to international format"""
@@ -179,164 +312,228 @@ class SMSHelper:
         # Truncate with ellipsis if too long
         return message[:limit-3] + '...'
     
-    def _send_twilio(self, phone_number: str, message: str, 
-                    sender_id: str, priority: str) -> Dict[str, Any]:
-        """Send SMS via Twilio"""
-        from twilio.rest import Client
-        
-        try:
-            client = Client(self.config.api_key, self.config.api_secret)
-            
-            sms = client.messages.create(
-                body=message,
-                from_=sender_id,
-                to=phone_number
+class TokenBucket:
+    """Token bucket rate limiter
+    
+    Safe to share across threads and event loops: state is guarded by a
+    thread lock that is never held while waiting.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    async def acquire(self, tokens: float = 1.0):
+        """Wait until the requested tokens are available and consume them"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            await asyncio.sleep(wait)
+
+# Requests per second allowed by default for each provider
+PROVIDER_RATE_LIMITS = {
+    'twilio': 30.0,
+    'msg91': 20.0,
+    'textlocal': 10.0,
+    'aws_sns': 20.0
+}
+
+_rate_limiters: Dict[str, TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+def get_rate_limiter(provider: str) -> TokenBucket:
+    """Process-wide token bucket for a provider's account-level rate limit"""
+    with _rate_limiters_lock:
+        bucket = _rate_limiters.get(provider)
+        if bucket is None:
+            bucket = _rate_limiters[provider] = TokenBucket(
+                PROVIDER_RATE_LIMITS.get(provider, 10.0)
             )
-            
-            return {
-                'success': True,
-                'message_id': sms.sid,
-                'status': sms.status,
-                'error': None
-            }
-            
-        except Exception as e:
-            return {
-                'success': False,
-                'message_id': None,
-                'error': str(e)
-            }
+        return bucket
+
+class CompiledSMSTemplate:
+    """SMS template parsed once into literal and placeholder segments"""
     
-    def _send_msg91(self, phone_number: str, message: str, 
-                   sender_id: str, priority: str) -> Dict[str, Any]:
-        """Send SMS via MSG91"""
-        url = "https://control.msg91.com/api/sendhttp.php"
-        
-        params = {
-            'authkey': self.config.api_key,
-            'mobiles': phone_number.replace('+', ''),
-            'message': message,
-            'sender': sender_id,
-            'route': '4',  # Transactional route
-            'country': '91'
-        }
-        
-        try:
-            response = requests.get(url, params=params, timeout=self.config.timeout)
-            
-            if response.status_code == 200:
-                result = response.text.strip()
-                
-                if result.startswith('5'):  # Success response starts with 5
-                    return {
-                        'success': True,
-                        'message_id': result,
-                        'error': None
-                    }
-                else:
-                    return {
-                        'success': False,
-                        'message_id': None,
-                        'error': f'MSG91 error: {result}'
-                    }
+    PLACEHOLDER_PATTERN = re.compile(r'\{(\w+)\}')
+    
+    def __init__(self, content: str):
+        self.content = content
+        self.segments: List[Tuple[bool, str]] = []
+        position = 0
+        for match in self.PLACEHOLDER_PATTERN.finditer(content):
+            if match.start() > position:
+                self.segments.append((False, content[position:match.start()]))
+            self.segments.append((True, match.group(1)))
+            position = match.end()
+        if position < len(content):
+            self.segments.append((False, content[position:]))
+        self.variables = [value for is_var, value in self.segments if is_var]
+    
+    @property
+    def is_static(self) -> bool:
+        """Whether the template has no placeholders"""
+        return not self.variables
+    
+    def render(self, variables: Optional[Dict[str, Any]] = None) -> str:
+        """Render template; unknown placeholders are left untouched"""
+        if not variables or self.is_static:
+            return self.content
+        parts = []
+        for is_var, value in self.segments:
+            if is_var:
+                parts.append(str(variables[value]) if value in variables else f"{{{value}}}")
             else:
-                return {
-                    'success': False,
-                    'message_id': None,
-                    'error': f'HTTP error: {response.status_code}'
-                }
-                
-        except Exception as e:
-            return {
-                'success': False,
-                'message_id': None,
-                'error': str(e)
-            }
+                parts.append(value)
+        return ''.join(parts)
+
+class BulkSMSDispatcher:
+    """Concurrent bulk SMS dispatcher
+    
+    Sends over a pooled async HTTP client with bounded concurrency and the
+    provider's process-wide token bucket. Identical messages to batch
+    providers (MSG91, TextLocal) go out as a single multi-number request;
+    Twilio and SNS are sent per message. One dispatcher serves every bulk
+    send of its SMSHelper; the HTTP client and concurrency limit are bound
+    to the event loop that uses them and recreated for a new loop.
+    """
     
-    def _send_textlocal(self, phone_number: str, message: str, 
-                       sender_id: str, priority: str) -> Dict[str, Any]:
-        """Send SMS via TextLocal"""
-        url = "https://api.textlocal.in/send/"
+    def __init__(self, helper: SMSHelper, max_concurrency: int = 20,
+                 rate_limiter: Optional[TokenBucket] = None):
+        self.helper = helper
+        self.config = helper.config
+        self.api = helper.api
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter or get_rate_limiter(self.config.provider)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _bind(self) -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._client is None or self._client.is_closed:
+            # Clients and semaphores belong to the loop that created them
+            self._client = httpx.AsyncClient(
+                timeout=self.config.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                )
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._client, self._semaphore
+    
+    async def aclose(self):
+        """Close the pooled HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+    
+    async def send_bulk(self, recipients: List[Dict[str, Any]], message: str,
+                        sender_id: str = None, batch_size: int = 100) -> Dict[str, Any]:
+        """Send SMS to multiple recipients concurrently
+        
+        Results are reported in the order of ``recipients``.
+        """
+        sender_id = sender_id or self.config.sender_id
+        template = CompiledSMSTemplate(message or '')
         
-        data = {
-            'apikey': self.config.api_key,
-            'numbers': phone_number.replace('+', ''),
-            'message': message,
-            'sender': sender_id
+        results = {
+            'total_recipients': len(recipients),
+            'successful': 0,
+            'failed': 0,
+            'results': [],
+            'errors': []
         }
         
-        try:
-            response = requests.post(url, data=data, timeout=self.config.timeout)
-            
-            if response.status_code == 200:
-                result = response.json()
-                
-                if result.get('status') == 'success':
-                    return {
-                        'success': True,
-                        'message_id': result.get('messages', [{}])[0].get('id'),
-                        'error': None
-                    }
-                else:
-                    return {
-                        'success': False,
-                        'message_id': None,
-                        'error': result.get('errors', [{}])[0].get('message', 'Unknown error')
-                    }
+        # Outcome per recipient position, as (phone number, outcome)
+        slots: List[Optional[Tuple[str, Dict[str, Any]]]] = [None] * len(recipients)
+        
+        # Render once per recipient and group identical texts for batching
+        groups: Dict[str, List[Tuple[int, str]]] = {}
+        for index, recipient in enumerate(recipients):
+            phone_number = recipient.get('phone_number')
+            text = template.render(recipient.get('variables'))
+            normalized, error = self.helper.validate(phone_number, text)
+            if error:
+                slots[index] = (phone_number, {'success': False, 'error': error})
+                continue
+            text = self.helper._optimize_message_length(text)
+            groups.setdefault(text, []).append((index, normalized))
+        
+        jobs = []
+        for text, entries in groups.items():
+            if self.api.supports_batch:
+                for i in range(0, len(entries), batch_size):
+                    jobs.append((entries[i:i + batch_size], text))
             else:
+                jobs.extend(([entry], text) for entry in entries)
+        
+        if jobs:
+            client, semaphore = self._bind()
+            outcomes = await asyncio.gather(
+                *(
+                    self._dispatch(
+                        client, semaphore, [number for _, number in entries], text, sender_id
+                    )
+                    for entries, text in jobs
+                )
+            )
+            for (entries, _), outcome in zip(jobs, outcomes):
+                for index, number in entries:
+                    slots[index] = (number, outcome)
+        
+        for phone_number, outcome in slots:
+            self._record(results, phone_number, outcome)
+        
+        return results
+    
+    async def _dispatch(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                        numbers: List[str], message: str,
+                        sender_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            await self.rate_limiter.acquire()
+            try:
+                if not self.api.uses_http:
+                    return await asyncio.to_thread(
+                        self.api.publish_sns, numbers[0], message, sender_id
+                    )
+                response = await client.request(
+                    **self.api.request(numbers, message, sender_id)
+                )
+                return self.api.parse(response)
+            except Exception as e:
                 return {
                     'success': False,
                     'message_id': None,
-                    'error': f'HTTP error: {response.status_code}'
+                    'error': f'SMS sending failed: {str(e)}'
                 }
-                
-        except Exception as e:
-            return {
-                'success': False,
-                'message_id': None,
-                'error': str(e)
-            }
     
-    def _send_aws_sns(self, phone_number: str, message: str, 
-                     sender_id: str, priority: str) -> Dict[str, Any]:
-        """Send SMS via AWS SNS"""
-        try:
-            import boto3
-            
-            sns = boto3.client(
-                'sns',
-                aws_access_key_id=self.config.api_key,
-                aws_secret_access_key=self.config.api_secret,
-                region_name=self.config.base_url or 'us-east-1'
-            )
-            
-            response = sns.publish(
-                PhoneNumber=phone_number,
-                Message=message,
-                MessageAttributes={
-                    'AWS.SNS.SMS.SenderID': {
-                        'DataType': 'String',
-                        'StringValue': sender_id
-                    },
-                    'AWS.SNS.SMS.SMSType': {
-                        'DataType': 'String',
-                        'StringValue': 'Transactional'
-                    }
-                }
-            )
-            
-            return {
-                'success': True,
-                'message_id': response['MessageId'],
-                'error': None
-            }
-            
-        except Exception as e:
-            return {
-                'success': False,
-                'message_id': None,
-                'error': str(e)
-            }
+    @staticmethod
+    def _record(results: Dict[str, Any], phone_number: str, outcome: Dict[str, Any]):
+        results['results'].append({
+            'phone_number': phone_number,
+            'success': outcome['success'],
+            'message_id': outcome.get('message_id'),
+            'error': outcome.get('error')
+        })
+        if outcome['success']:
+            results['successful'] += 1
+        else:
+            results['failed'] += 1
+            results['errors'].append(f"{phone_number}: {outcome.get('error')}")
 
 class MessageOptimizer:
     """SMS message optimization utilities"""
@@ -683,6 +880,7 @@ class SMSTemplateManager:
         """Add SMS template"""
         self.templates[name] = {
             'content': content,
+            'compiled': CompiledSMSTemplate(content),
             'variables': variables or [],
             'created_at': datetime.now(),
             'usage_count': 0
@@ -698,12 +896,7 @@ class SMSTemplateManager:
         if not template:
             raise ValueError(f"Template '{name}' not found")
         
-        content = template['content']
-        
-        # Replace variables
-        for var_name, var_value in variables.items():
-            placeholder = f"{{{var_name}}}"
-            content = content.replace(placeholder, str(var_value))
+        content = template['compiled'].render(variables)
         
         # Increment usage count
         template['usage_count'] += 1
@@ -0,0 +1,121 @@
+"""
+Benchmark per-request overhead of the core middleware.
+
+Drives ASGI apps in-process with synthetic requests (no server or network)
+and reports the mean cost per request for:
+- the bare endpoint
+- the endpoint behind CoreMiddleware
+- the endpoint behind four BaseHTTPMiddleware layers, mirroring the
+  previous RequestID/SecurityHeaders/Timing/ErrorLogging stack
+
+Usage:
+    python -m scripts.benchmark_middleware [--requests 20000]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
+
+from app.core.middleware import CoreMiddleware
+
+
+async def endpoint(scope, receive, send) -> None:
+    response = PlainTextResponse("ok")
+    await response(scope, receive, send)
+
+
+class _PassThroughMiddleware(BaseHTTPMiddleware):
+    """BaseHTTPMiddleware layer that sets one header, like the old stack."""
+
+    def __init__(self, app, header: str):
+        super().__init__(app)
+        self.header = header
+
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        response.headers[self.header] = "1"
+        return response
+
+
+def build_legacy_stack(app):
+    for header in ("X-Request-ID", "X-Content-Type-Options", "X-Process-Time", "X-Error"):
+        app = _PassThroughMiddleware(app, header)
+    return app
+
+
+def make_scope() -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/bench",
+        "raw_path": b"/bench",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+
+
+def make_receive():
+    # Report a disconnect once the body has been read, as servers do;
+    # BaseHTTPMiddleware keeps polling receive() until it sees one
+    body_sent = False
+
+    async def receive() -> dict:
+        nonlocal body_sent
+        if body_sent:
+            return {"type": "http.disconnect"}
+        body_sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    return receive
+
+
+async def run(app, requests: int) -> float:
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(make_scope(), make_receive(), send)
+    return (time.perf_counter() - start) / requests
+
+
+async def main(requests: int) -> None:
+    # Completion logs would dominate the measurement
+    logging.disable(logging.CRITICAL)
+
+    apps = {
+        "bare endpoint": endpoint,
+        "CoreMiddleware": CoreMiddleware(endpoint),
+        "4x BaseHTTPMiddleware": build_legacy_stack(endpoint),
+    }
+
+    # Warm up
+    for app in apps.values():
+        await run(app, min(requests, 500))
+
+    baseline = await run(endpoint, requests)
+    print(f"{'stack':<24}{'us/request':>12}{'overhead us':>14}")
+    for name, app in apps.items():
+        per_request = baseline if app is endpoint else await run(app, requests)
+        print(
+            f"{name:<24}{per_request * 1e6:>12.1f}"
+            f"{(per_request - baseline) * 1e6:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
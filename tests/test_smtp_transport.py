@@ -0,0 +1,249 @@
+"""
+Tests for the pooled SMTP transport against a local stub SMTP server.
+"""
+
+import asyncio
+from email.message import EmailMessage
+from typing import List, Optional
+
+import pytest
+
+pytest.importorskip("aiosmtplib")
+
+from app.core.smtp_transport import PooledSMTPTransport, SMTPTransportConfig
+
+
+class StubSMTPServer:
+    """
+    Minimal asyncio SMTP server.
+
+    Accepts every message except those addressed to ``reject_recipients``,
+    and closes a session after ``drop_after`` messages when set.
+    """
+
+    def __init__(self, reject_recipients=(), drop_after: Optional[int] = None):
+        self.reject_recipients = set(reject_recipients)
+        self.drop_after = drop_after
+        self.messages: List[bytes] = []
+        self.sessions = 0
+        self.port: Optional[int] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.sessions += 1
+        sent_in_session = 0
+
+        async def reply(line: str):
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        await reply("220 stub ESMTP")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                command = line.decode().strip()
+                verb = command.split(" ", 1)[0].upper()
+
+                if verb in ("EHLO", "HELO"):
+                    await reply("250-stub")
+                    await reply("250 8BITMIME")
+                elif verb == "MAIL":
+                    await reply("250 OK")
+                elif verb == "RCPT":
+                    address = command.split(":", 1)[1].strip().strip("<>")
+                    if address in self.reject_recipients:
+                        await reply("550 No such user")
+                    else:
+                        await reply("250 OK")
+                elif verb == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    data = b""
+                    while True:
+                        chunk = await reader.readline()
+                        if chunk in (b".\r\n", b""):
+                            break
+                        data += chunk
+                    self.messages.append(data)
+                    sent_in_session += 1
+                    await reply("250 Queued")
+                    if self.drop_after and sent_in_session >= self.drop_after:
+                        return
+                elif verb in ("RSET", "NOOP"):
+                    await reply("250 OK")
+                elif verb == "QUIT":
+                    await reply("221 Bye")
+                    return
+                else:
+                    await reply("502 Command not implemented")
+        finally:
+            writer.close()
+
+
+def make_transport(port: int, pool_size: int = 2) -> PooledSMTPTransport:
+    return PooledSMTPTransport(SMTPTransportConfig(
+        host="127.0.0.1",
+        port=port,
+        start_tls=False,
+        timeout=5.0,
+        pool_size=pool_size,
+    ))
+
+
+def make_messages(count: int, rejected: Optional[str] = None) -> List[EmailMessage]:
+    messages = []
+    for index in range(count):
+        msg = EmailMessage()
+        msg["From"] = "noreply@hostel.test"
+        msg["To"] = rejected if rejected and index == 0 else f"student{index}@hostel.test"
+        msg["Subject"] = f"Notice {index}"
+        msg.set_content("Hello")
+        messages.append(msg)
+    return messages
+
+
+def test_send_bulk_reuses_pooled_connections():
+    async def scenario():
+        async with StubSMTPServer() as server:
+            transport = make_transport(server.port, pool_size=2)
+            results = await transport.send_bulk(make_messages(10))
+            status = transport.get_status()
+            await transport.close()
+            return server, results, status
+
+    server, results, status = asyncio.run(scenario())
+
+    assert [r.success for r in results] == [True] * 10
+    assert [r.recipient for r in results] == [f"student{i}@hostel.test" for i in range(10)]
+    assert len(server.messages) == 10
+    assert server.sessions == 2
+    assert status["pool"]["connections_opened"] == 2
+
+
+def test_rejected_recipient_fails_only_its_message():
+    async def scenario():
+        async with StubSMTPServer(reject_recipients={"gone@hostel.test"}) as server:
+            transport = make_transport(server.port, pool_size=1)
+            results = await transport.send_bulk(make_messages(3, rejected="gone@hostel.test"))
+            await transport.close()
+            return server, results
+
+    server, results = asyncio.run(scenario())
+
+    assert [r.success for r in results] == [False, True, True]
+    assert results[0].error
+    assert len(server.messages) == 2
+    assert server.sessions == 1
+
+
+def test_dropped_connection_is_reestablished():
+    async def scenario():
+        async with StubSMTPServer(drop_after=2) as server:
+            transport = make_transport(server.port, pool_size=1)
+            results = await transport.send_bulk(make_messages(5))
+            await transport.close()
+            return server, results
+
+    server, results = asyncio.run(scenario())
+
+    assert all(r.success for r in results)
+    assert len(server.messages) == 5
+    assert server.sessions >= 3
+
+
+def test_submit_bulk_reports_results_after_delivery():
+    async def scenario():
+        async with StubSMTPServer(reject_recipients={"gone@hostel.test"}) as server:
+            transport = make_transport(server.port)
+            await transport.start()
+            delivered_at_callback = []
+            reported = []
+
+            def on_complete(results):
+                delivered_at_callback.append(len(server.messages))
+                reported.extend(results)
+
+            future = transport.submit_bulk(
+                make_messages(4, rejected="gone@hostel.test"), on_complete=on_complete
+            )
+            await asyncio.wrap_future(future)
+            await transport.close()
+            return delivered_at_callback, reported
+
+    delivered_at_callback, reported = asyncio.run(scenario())
+
+    assert delivered_at_callback == [3]
+    assert [r.success for r in reported] == [False, True, True, True]
+
+
+def test_submit_bulk_without_started_transport_returns_none():
+    transport = make_transport(port=25)
+    assert transport.submit_bulk(make_messages(1)) is None
+
+
+def test_bulk_dispatch_marks_rows_sent_only_after_delivery(monkeypatch):
+    from types import SimpleNamespace
+
+    pytest.importorskip("jinja2")
+    email_module = pytest.importorskip("app.services.notification.email_notification_service")
+    service_cls = email_module.EmailNotificationService
+
+    class RecordingRepo:
+        def __init__(self):
+            self.calls = []
+
+        def claim_emails_for_delivery(self, email_ids):
+            self.calls.append(("claim", list(email_ids)))
+
+        def release_emails(self, email_ids):
+            self.calls.append(("release", list(email_ids)))
+
+        def mark_emails_sent(self, email_ids):
+            self.calls.append(("sent", list(email_ids)))
+
+    async def scenario():
+        async with StubSMTPServer(reject_recipients={"gone@hostel.test"}) as server:
+            transport = make_transport(server.port)
+            await transport.start()
+            repo = RecordingRepo()
+            service = service_cls(repo, transport=transport)
+            reported = asyncio.get_running_loop().create_future()
+            loop = asyncio.get_running_loop()
+
+            def record(email_ids, results):
+                repo.calls.append(("delivered", len(server.messages)))
+                loop.call_soon_threadsafe(reported.set_result, list(zip(email_ids, results)))
+
+            monkeypatch.setattr(service_cls, "_record_bulk_results", staticmethod(record))
+
+            request = SimpleNamespace(
+                recipients=["gone@hostel.test", "a@hostel.test", "b@hostel.test"],
+                subject="Water outage",
+                body_html="<p>No water tonight</p>",
+                recipient_variables=None,
+                template_code=None,
+            )
+            submitted = service._dispatch_bulk(None, request, ["e1", "e2", "e3"])
+            calls_at_submit = list(repo.calls)
+            outcome = await reported
+            await transport.close()
+            return submitted, calls_at_submit, repo.calls, outcome
+
+    submitted, calls_at_submit, calls, outcome = asyncio.run(scenario())
+
+    assert submitted is True
+    assert calls_at_submit == [("claim", ["e1", "e2", "e3"])]
+    assert calls[-1] == ("delivered", 2)
+    assert [(email_id, result.success) for email_id, result in outcome] == [
+        ("e1", False), ("e2", True), ("e3", True)
+    ]